@@ -3,7 +3,6 @@ Generator service for handling generator operations
 """
 import importlib.util
 import sys
-import json
 import traceback
 from pathlib import Path
 from typing import List, Optional, Dict, Any
@@ -18,6 +17,10 @@ class GeneratorService:
     def __init__(self):
         self.generators_path = settings.GENERATORS_PATH
         self.generator_cache = {}
+        # Generators import the shared helpers (random_pools, event_clock, ...) by plain name
+        shared_path = str(self.generators_path / "shared")
+        if shared_path not in sys.path:
+            sys.path.insert(0, shared_path)
         self._load_generator_metadata()
     
     def _load_generator_metadata(self):
@@ -221,21 +224,14 @@ class GeneratorService:
             
             generator_func = getattr(module, function_name)
             
-            # Generate events
-            events = []
-            for _ in range(count):
-                event = generator_func()
-                
-                # Ensure event is a dict
-                if isinstance(event, str):
-                    try:
-                        event = json.loads(event)
-                    except:
-                        event = {"raw": event}
-                
-                events.append(event)
+            # Generate events (in one call when the module defines <function>_batch)
+            from batch_generation import generate_batch
+            from generator_output import output_kind, to_object
             
-            return events
+            # Ensure each event is a dict: only output declared (or detected) as JSON is
+            # parsed, key=value/CSV/syslog/CEF lines are returned as {"raw": line}
+            kind = output_kind(generator_func)
+            return [to_object(event, kind) for event in generate_batch(generator_func, count)]
             
         except Exception as e:
             raise RuntimeError(f"Failed to execute generator {generator_id}: {str(e)}")
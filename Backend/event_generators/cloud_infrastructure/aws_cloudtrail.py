@@ -14,19 +14,26 @@ Example
 """
 
 from __future__ import annotations
-from datetime import datetime, timezone, timedelta
-from ipaddress import IPv4Address
+from datetime import timedelta
 import json
 import random
-import uuid
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # ────────────────────── AI‑SIEM attributes ─────────────────────
 # These attributes are injected by hec_sender.py under the `fields`
 # envelope key so the CloudTrail parser can populate constant values.
 # ───────────────────────── helpers ─────────────────────────
-_NOW   = lambda: datetime.now(timezone.utc)
-_ISO   = lambda dt: dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-_IP    = lambda: str(IPv4Address(random.getrandbits(32)))
+_NOW   = lambda: event_clock.utcnow()
+_ISO   = lambda dt: event_clock.stamp("iso", dt)
+_IP    = lambda: random_pools.external_ipv4()
 
 # AWS regions
 _REGIONS   = ["us-east-1", "us-west-2", "eu-central-1", "ap-southeast-2", "us-west-1", "eu-west-1"]
@@ -264,7 +271,7 @@ def _get_api_extra(api_name, bucket_list):
         "AssumeRole": {
             "requestParameters": {
                 "roleArn": f"arn:aws:iam::{random.choice(['123456789012', '987654321098'])}:role/{random.choice(['corporate-admin', 'security-analyst', 'compliance-auditor'])}",
-                "roleSessionName": f"{random.choice(['analysis', 'monitoring', 'audit'])}-session-{uuid.uuid4().hex[:8]}",
+                "roleSessionName": f"{random.choice(['analysis', 'monitoring', 'audit'])}-session-{random_pools.hex_string(8)}",
                 "durationSeconds": random.choice([900, 1800, 3600]),
             }
         }
@@ -304,7 +311,7 @@ def _template() -> dict:
         "eventSource": svc,
         "eventTime": _ISO(now),
         "eventVersion": "1.09",
-        "eventID": str(uuid.uuid4()),
+        "eventID": random_pools.uuid4(),
         "eventType": "AwsApiCall",
         "awsRegion": random.choice(_REGIONS),
         "readOnly": random.choice([True, False]),
@@ -329,7 +336,7 @@ def _template() -> dict:
             "principalId": f"AIDA{user_info['department'].upper().replace('-', '')}{random.randint(1000, 9999)}",
             "arn": f"arn:aws:iam::{user_info['account']}:user/{user_info['name']}",
             "accountId": user_info["account"],
-            "accessKeyId": "AKIA" + uuid.uuid4().hex[:16].upper(),
+            "accessKeyId": "AKIA" + random_pools.hex_string(16).upper(),
             "userName": user_info["name"],
             "sessionContext": {
                 "sessionIssuer": {
@@ -347,12 +354,12 @@ def _template() -> dict:
         },
 
         # Request / response
-        "requestID": str(uuid.uuid4()),
+        "requestID": random_pools.uuid4(),
         "requestParameters": {
             "durationSeconds": 900,
             "roleArn": f"arn:aws:iam::{user_info['account']}:role/{user_info['role']}",
             "roleSessionName": f"{user_info['department']}-session",
-            "externalId": str(uuid.uuid4()),
+            "externalId": random_pools.uuid4(),
         },
         "responseElements": {
             "assumedRoleUser": {
@@ -360,16 +367,16 @@ def _template() -> dict:
                 "arn": f"arn:aws:sts::{user_info['account']}:assumed-role/{user_info['role']}/{user_info['department']}-session",
             },
             "credentials": {
-                "accessKeyId": "ASIA" + uuid.uuid4().hex[:16].upper(),
-                "sessionToken": "IQoJb3JpZ2luX2VjEJ7//////////wEaCXVzLWVhc3QtMSJHMEUCIQD" + uuid.uuid4().hex,
+                "accessKeyId": "ASIA" + random_pools.hex_string(16).upper(),
+                "sessionToken": "IQoJb3JpZ2luX2VjEJ7//////////wEaCXVzLWVhc3QtMSJHMEUCIQD" + random_pools.hex_string(32),
                 "expiration": _ISO(now + timedelta(hours=1)),
             },
             "sourceIdentity": user_info["name"],
         },
 
         # Extra structures referenced by the parser
-        "sharedEventID": str(uuid.uuid4()),
-        "vpcEndpointId": f"vpce-{user_info['department'].replace('-', '')[:8]}-{uuid.uuid4().hex[:9]}",
+        "sharedEventID": random_pools.uuid4(),
+        "vpcEndpointId": f"vpce-{user_info['department'].replace('-', '')[:8]}-{random_pools.hex_string(9)}",
 
         "resources": [
             {
@@ -385,7 +392,7 @@ def _template() -> dict:
             "bytesTransferredIn": 0,
             "bytesTransferredOut": random.randint(512, 10240),
             "AuthenticationMethod": "AuthHeader",
-            "x-amz-id-2": uuid.uuid4().hex,
+            "x-amz-id-2": random_pools.hex_string(32),
         },
 
         # A human-readable message
@@ -8,7 +8,14 @@ Produces events compatible with SentinelOne AWS ELB parser
 import random
 import time
 import json
-from datetime import datetime, timezone
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 def aws_elasticloadbalancer_log():
     """Generate a synthetic AWS Elastic Load Balancer access log event."""
@@ -61,7 +68,7 @@ def aws_elasticloadbalancer_log():
     ]
     
     # Generate timestamp in ISO format (recent)
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     timestamp = now.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     
     # Generate ALB-specific event
@@ -1,6 +1,15 @@
 from __future__ import annotations
-import json, random, time, uuid
+import json, random
 from typing import Dict, Any
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Metadata used by hec_sender.py
 def _ipv4() -> str:
@@ -9,16 +18,16 @@ def _ipv4() -> str:
 
 def _ts_iso() -> str:
     """Return current UTC time in ISO format."""
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    return event_clock.stamp("iso")
 
 def _sample_finding() -> Dict[str, Any]:
     """
     Return a minimal yet valid GuardDuty finding that matches the parser
     expectations. Only the fields required by the parser are included.
     """
-    finding_id   = str(uuid.uuid4())
+    finding_id   = random_pools.uuid4()
     account_id   = str(random.randint(111111111111, 999999999999))
-    detector_id  = uuid.uuid4().hex
+    detector_id  = random_pools.hex_string(32)
     region       = random.choice(["us-east-1", "us-west-2", "ap-south-1"])
     now          = _ts_iso()
 
@@ -42,11 +51,11 @@ def _sample_finding() -> Dict[str, Any]:
         "resource": {
             "resourceType": "Instance",
             "instanceDetails": {
-                "instanceId": f"i-{uuid.uuid4().hex[:8]}",
+                "instanceId": f"i-{random_pools.hex_string(8)}",
                 "instanceType": "m5.large",
                 "platform": None,
                 "networkInterfaces": [{
-                    "networkInterfaceId": f"eni-{uuid.uuid4().hex[:8]}",
+                    "networkInterfaceId": f"eni-{random_pools.hex_string(8)}",
                     "privateIpAddress": _ipv4(),
                     "publicIp": _ipv4(),
                     "ipv6Addresses": [],
@@ -5,7 +5,16 @@ Generates synthetic AWS Route 53 DNS query logs in JSON format
 """
 import random
 import json
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 # DNS query types
@@ -47,11 +56,11 @@ EDGE_LOCATIONS = [
 
 def generate_client_ip() -> str:
     """Generate client IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def aws_route53_log(overrides: dict = None) -> dict:
     """Generate a single AWS Route 53 DNS event log as dict that can be formatted for parser"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
     domain = random.choice(DOMAINS)
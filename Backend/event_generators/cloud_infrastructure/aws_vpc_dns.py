@@ -6,8 +6,17 @@ Generates synthetic AWS VPC DNS query logs
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # DNS query types
 QUERY_TYPES = ["A", "AAAA", "MX", "NS", "PTR", "SOA", "TXT", "CNAME", "SRV"]
@@ -44,7 +53,7 @@ def generate_vpc_ip() -> str:
 
 def aws_vpc_dns_log() -> Dict:
     """Generate a single AWS VPC DNS event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     domain = random.choice(DOMAINS)
@@ -73,7 +82,7 @@ def aws_vpc_dns_log() -> Dict:
         "query_type": query_type,
         "query_class": "IN",
         "rcode": response_code,
-        "rdata": f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}" if response_code == "NOERROR" and query_type == "A" else "",
+        "rdata": random_pools.external_ipv4() if response_code == "NOERROR" and query_type == "A" else "",
         "answers": random.randint(0, 5) if response_code == "NOERROR" else 0,
         "transport": "UDP",
         "vpc_id": f"vpc-{random.randint(10000000, 99999999):08x}",
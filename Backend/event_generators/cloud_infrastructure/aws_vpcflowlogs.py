@@ -3,22 +3,32 @@
 AWS VPC Flow Log record generator
 """
 from __future__ import annotations
-import json, random, time, uuid
-from typing import Dict
+import json, random
+from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import bulk_random  # event_generators/shared, NumPy-backed when installed
+import random_pools
+import event_clock
+
+OUTPUT_KIND = "json"
 
 def _flow_record() -> dict:
     """
     Create one VPC Flow Log record in JSON format matching parser expectations.
     Parser expects JSON with fields like srcaddr, dstaddr, start, end, etc.
     """
-    now = int(time.time())
+    now = int(event_clock.now())
     start_time = now - random.randint(10, 60)
     end_time = now
     
     return {
         "version": "2",
         "account_id": f"{random.randint(10**11, 10**12 - 1)}",
-        "interface_id": "eni-" + uuid.uuid4().hex[:17],
+        "interface_id": "eni-" + random_pools.hex_string(17),
         "srcaddr": f"10.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}",
         "dstaddr": f"203.0.113.{random.randint(1,254)}",
         "srcport": random.randint(1024, 65535),
@@ -30,9 +40,9 @@ def _flow_record() -> dict:
         "end": end_time,
         "action": random.choice(["ACCEPT", "REJECT"]),
         "flowlogstatus": "OK",
-        "vpc_id": f"vpc-{uuid.uuid4().hex[:8]}",
-        "subnet_id": f"subnet-{uuid.uuid4().hex[:8]}",
-        "instance_id": f"i-{uuid.uuid4().hex[:8]}",
+        "vpc_id": f"vpc-{random_pools.hex_string(8)}",
+        "subnet_id": f"subnet-{random_pools.hex_string(8)}",
+        "instance_id": f"i-{random_pools.hex_string(8)}",
         "region": random.choice(["us-east-1", "us-west-2", "eu-central-1"]),
         "az_id": random.choice(["use1-az1", "use1-az2", "usw2-az1"]),
     }
@@ -42,4 +52,50 @@ def vpcflow_log() -> dict:
     Generate a VPC Flow Log record in JSON format matching parser expectations.
     Returns a dict with VPC flow log fields that the parser can extract.
     """
-    return _flow_record()
\ No newline at end of file
+    return _flow_record()
+
+def vpcflow_log_batch(n: int) -> List[dict]:
+    """``n`` records shaped like ``vpcflow_log()``, every random column drawn in one call."""
+    now = int(event_clock.now())
+    hex8 = bulk_random.hex_strings(3 * n, 8)
+    columns = zip(
+        bulk_random.integers(n, 10**11, 10**12 - 1),
+        bulk_random.hex_strings(n, 17),
+        bulk_random.ipv4(n, 10, (0, 255), (0, 255), (1, 254)),
+        bulk_random.ipv4(n, 203, 0, 113, (1, 254)),
+        bulk_random.integers(n, 1024, 65535),
+        bulk_random.choice([22, 53, 80, 443, 3389], n),
+        bulk_random.choice([6, 17], n),
+        bulk_random.integers(n, 1, 500),
+        bulk_random.integers(n, 40, 50000),
+        bulk_random.integers(n, 10, 60),
+        bulk_random.choice(["ACCEPT", "REJECT"], n),
+        bulk_random.choice(["us-east-1", "us-west-2", "eu-central-1"], n),
+        bulk_random.choice(["use1-az1", "use1-az2", "usw2-az1"], n),
+        range(0, 3 * n, 3),
+    )
+    return [
+        {
+            "version": "2",
+            "account_id": str(account),
+            "interface_id": "eni-" + eni,
+            "srcaddr": src,
+            "dstaddr": dst,
+            "srcport": sport,
+            "dstport": dport,
+            "protocol": proto,
+            "packets": packets,
+            "bytes": nbytes,
+            "start": now - age,
+            "end": now,
+            "action": action,
+            "flowlogstatus": "OK",
+            "vpc_id": "vpc-" + hex8[k],
+            "subnet_id": "subnet-" + hex8[k + 1],
+            "instance_id": "i-" + hex8[k + 2],
+            "region": region,
+            "az_id": az,
+        }
+        for (account, eni, src, dst, sport, dport, proto, packets, nbytes,
+             age, action, region, az, k) in columns
+    ]
@@ -2,13 +2,19 @@
 
 import json
 import random
-from datetime import datetime, timedelta
-import uuid
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 def aws_waf_log():
-    current_time = datetime.utcnow()
-    
     actions = ["ALLOW", "BLOCK", "CAPTCHA", "COUNT"]
     rule_groups = ["Default", "SQLInjectionRules", "XSSRules", "BotControlRules", "RateLimitRules", "CustomRules"]
     terminating_types = ["", "BLOCK", "CAPTCHA", "RATE_BASED", "CUSTOM"]
@@ -59,7 +65,7 @@ def aws_waf_log():
         headers.append({"name": "X-Forwarded-For", "value": f"{random.randint(1,255)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,255)}"})
     
     log_entry = {
-        "timestamp": current_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": event_clock.stamp("iso"),
         "formatVersion": "1.0",
         "webaclId": f"arn:aws:wafv2:us-east-1:{random.randint(100000000000, 999999999999)}:regional/webacl/ExampleWebACL-{random.randint(1000,9999)}",
         "ruleGroupId": rule_group,
@@ -77,7 +83,7 @@ def aws_waf_log():
     }
     
     if random.random() > 0.8:
-        log_entry["requestId"] = str(uuid.uuid4())
+        log_entry["requestId"] = random_pools.uuid4()
     
     if action == "BLOCK" and random.random() > 0.5:
         log_entry["labels"] = [
@@ -6,8 +6,17 @@ Generates synthetic Google Cloud DNS query and audit events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # DNS query types
 QUERY_TYPES = ["A", "AAAA", "MX", "NS", "PTR", "SOA", "TXT", "CNAME", "SRV", "CAA"]
@@ -40,11 +49,11 @@ LOCATIONS = ["us-central1", "us-east1", "europe-west1", "asia-southeast1"]
 
 def generate_ip() -> str:
     """Generate a random IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def google_cloud_dns_log() -> Dict:
     """Generate a single Google Cloud DNS event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     query_name = random.choice(DOMAINS)
@@ -6,9 +6,17 @@ Generates synthetic Google Workspace admin and user activity events
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Event types by service
 EVENT_TYPES = {
@@ -79,11 +87,11 @@ def generate_ip() -> str:
     if random.random() < 0.8:  # 80% internal
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:  # 20% external
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def google_workspace_log() -> Dict:
     """Generate a single Google Workspace event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     # Use recent timestamps (last 10 minutes)
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
@@ -103,7 +111,7 @@ def google_workspace_log() -> Dict:
             "applicationName": service,
             "customerId": "C01NCC1701"
         },
-        "etag": f'"{uuid.uuid4().hex}"',
+        "etag": f'"{random_pools.hex_string(32)}"',
         "actor": {
             "email": actor["email"],
             "profileId": str(random.randint(100000000000000000, 999999999999999999))
@@ -140,7 +148,7 @@ def google_workspace_log() -> Dict:
         
     elif service == "drive":
         parameters.extend([
-            {"name": "doc_id", "value": uuid.uuid4().hex},
+            {"name": "doc_id", "value": random_pools.hex_string(32)},
             {"name": "doc_title", "value": random.choice(["Starfleet Q4 Report.xlsx", "Enterprise Mission Plan.docx", "Starfleet Budget 2378.xlsx", "Bridge Presentation.pptx", "Senior Staff Meeting Notes.doc"])},
             {"name": "doc_type", "value": random.choice(["document", "spreadsheet", "presentation", "folder"])},
             {"name": "visibility", "value": random.choice(["private", "people_with_link", "public"])},
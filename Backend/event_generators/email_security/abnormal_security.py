@@ -6,8 +6,16 @@ Generates synthetic Abnormal Security email security events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 # Threat types detected by Abnormal
 THREAT_TYPES = [
@@ -46,7 +54,7 @@ ATTACK_STRATEGIES = [
 
 def abnormal_security_log() -> Dict:
     """Generate a single Abnormal Security event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     # Use recent timestamps (last 10 minutes)
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
@@ -6,9 +6,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Threat types and verdicts
 THREAT_TYPES = ["Phish", "Malware", "Spam", "Bulk", "None"]
@@ -59,7 +67,7 @@ def _generate_ip(internal=False):
     if internal:
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_email_address(internal=True, suspicious=False):
     """Generate email address"""
@@ -79,7 +87,7 @@ def microsoft_defender_email_log(overrides: dict | None = None) -> Dict:
     Pass `overrides` to force any field to a specific value:
         microsoft_defender_email_log({"ThreatTypes": "Phish"})
     """
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     timestamp = now - timedelta(seconds=random.randint(0, 300))
     
     # Determine threat type and associated details
@@ -101,31 +109,31 @@ def microsoft_defender_email_log(overrides: dict | None = None) -> Dict:
     # Base record structure
     record = {
         "time": now.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-        "resourceId": f"/subscriptions/{uuid.uuid4()}/resourcegroups/rg-security/providers/microsoft.operationalinsights/workspaces/security-workspace",
+        "resourceId": f"/subscriptions/{random_pools.uuid4()}/resourcegroups/rg-security/providers/microsoft.operationalinsights/workspaces/security-workspace",
         "operationName": "EmailEvents",
         "operationVersion": "1.0",
         "category": "EmailEvents",
-        "tenantId": str(uuid.uuid4()),
+        "tenantId": random_pools.uuid4(),
         "resultType": "Success",
         "resultSignature": "EmailProcessed",
         "callerIpAddress": _generate_ip(internal=False),
-        "correlationId": str(uuid.uuid4()),
+        "correlationId": random_pools.uuid4(),
         "identity": "System",
         "Level": 4,
         "location": "Global",
         "Tenant": "company.onmicrosoft.com",
         "properties": {
-            "ReportId": str(uuid.uuid4()),
-            "NetworkMessageId": f"<{uuid.uuid4()}@{sender_email.split('@')[1]}>",
-            "InternetMessageId": f"<{uuid.uuid4()}@mail.protection.outlook.com>",
+            "ReportId": random_pools.uuid4(),
+            "NetworkMessageId": f"<{random_pools.uuid4()}@{sender_email.split('@')[1]}>",
+            "InternetMessageId": f"<{random_pools.uuid4()}@mail.protection.outlook.com>",
             "Timestamp": timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-            "EmailClusterId": str(uuid.uuid4()),
+            "EmailClusterId": random_pools.uuid4(),
             "SenderIPv4": _generate_ip(internal=False),
             "SenderIPv6": None,
             "SenderMailFromAddress": sender_email,
             "SenderFromAddress": sender_email,
             "SenderDisplayName": sender_email.split('@')[0].replace('.', ' ').title(),
-            "SenderObjectId": str(uuid.uuid4()) if random.random() > 0.5 else None,
+            "SenderObjectId": random_pools.uuid4() if random.random() > 0.5 else None,
             "SenderMailFromDomain": sender_email.split('@')[1],
             "SenderFromDomain": sender_email.split('@')[1],
             "Subject": subject,
@@ -133,7 +141,7 @@ def microsoft_defender_email_log(overrides: dict | None = None) -> Dict:
             "DeliveryAction": random.choice(DELIVERY_ACTIONS),
             "DeliveryLocation": random.choice(["Inbox", "JunkEmailFolder", "DeletedItems", "Quarantine", "External", "Failed", "Dropped", "Forwarded"]),
             "RecipientEmailAddress": recipient_email,
-            "RecipientObjectId": str(uuid.uuid4()),
+            "RecipientObjectId": random_pools.uuid4(),
             "AuthenticationDetails": json.dumps({
                 "SPF": random.choice(["Pass", "Fail", "SoftFail", "Neutral", "None"]),
                 "DKIM": random.choice(["Pass", "Fail", "None"]),
@@ -142,7 +150,7 @@ def microsoft_defender_email_log(overrides: dict | None = None) -> Dict:
             }),
             "ConnectorIndex": random.randint(0, 10),
             "EmailActionPolicy": random.choice(["Standard preset security policy", "Strict preset security policy", "Custom policy"]),
-            "EmailActionPolicyGuid": str(uuid.uuid4()),
+            "EmailActionPolicyGuid": random_pools.uuid4(),
             "EmailLanguage": random.choice(["en", "es", "fr", "de", "zh", "ja"]),
             "ThreatTypes": threat_type,
             "DetectionMethods": random.choice(DETECTION_METHODS) if is_malicious else None,
@@ -164,7 +172,7 @@ def microsoft_defender_email_log(overrides: dict | None = None) -> Dict:
                 "CustomDomain": random.choice([True, False]),
                 "IsReadReceiptRequested": random.choice([True, False]),
                 "HasAttachments": random.choice([True, False]),
-                "MessageTraceId": str(uuid.uuid4())
+                "MessageTraceId": random_pools.uuid4()
             })
         }
     }
@@ -175,7 +183,7 @@ def microsoft_defender_email_log(overrides: dict | None = None) -> Dict:
         record["properties"]["MalwareFilterVerdict"] = "Malware"
         record["properties"]["FileName"] = f"document_{random.randint(1000, 9999)}{random.choice(MALICIOUS_FILE_TYPES)}"
         record["properties"]["FileType"] = random.choice(MALICIOUS_FILE_TYPES)[1:]
-        record["properties"]["SHA256"] = uuid.uuid4().hex + uuid.uuid4().hex
+        record["properties"]["SHA256"] = random_pools.hex_string(64)
         record["properties"]["ThreatNames"] = [random.choice(MALWARE_FAMILIES)]
         
     elif threat_type == "Phish":
@@ -6,9 +6,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List, Optional
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Mimecast log types
 LOG_TYPES = {
@@ -120,7 +128,7 @@ def _generate_email_address(internal=True, suspicious=False):
 def _generate_message_id():
     """Generate a message ID"""
     domain = random.choice(INTERNAL_DOMAINS + EXTERNAL_DOMAINS)
-    return f"<{uuid.uuid4()}@{domain}>"
+    return f"<{random_pools.uuid4()}@{domain}>"
 
 def _generate_file_info(malicious=False):
     """Generate file information"""
@@ -161,7 +169,7 @@ def mimecast_log(overrides: dict | None = None) -> Dict:
 
 def _generate_audit_log(overrides: dict | None = None) -> str:
     """Generate Mimecast audit log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     event = {
         "identifier": LOG_TYPES["audit"],
@@ -170,7 +178,7 @@ def _generate_audit_log(overrides: dict | None = None) -> str:
             "auditType": random.choice(AUDIT_TYPES),
             "category": random.choice(AUDIT_CATEGORIES),
             "eventInfo": f"User {random.choice(USERS)} performed {random.choice(AUDIT_TYPES)} action",
-            "id": str(uuid.uuid4()),
+            "id": random_pools.uuid4(),
             "user": _generate_email_address(internal=True),
             "source": random.choice(["Web UI", "API", "Mobile App", "Outlook Plugin"]),
             "sourceIp": f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}",
@@ -190,7 +198,7 @@ def _generate_audit_log(overrides: dict | None = None) -> str:
 
 def _generate_dlp_log(overrides: dict | None = None) -> str:
     """Generate Mimecast DLP log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     policy = random.choice(DLP_POLICIES)
     action = random.choice(DLP_ACTIONS)
     
@@ -233,7 +241,7 @@ def _generate_dlp_log(overrides: dict | None = None) -> str:
 
 def _generate_ttp_attachment_log(overrides: dict | None = None) -> str:
     """Generate Mimecast TTP Attachment Protection log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     result = random.choice(TTP_RESULTS)
     action = random.choice(TTP_ACTIONS)
     
@@ -275,7 +283,7 @@ def _generate_ttp_attachment_log(overrides: dict | None = None) -> str:
 
 def _generate_ttp_url_log(overrides: dict | None = None) -> str:
     """Generate Mimecast TTP URL Protection log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     result = random.choice(TTP_RESULTS)
     action = random.choice(TTP_ACTIONS)
     
@@ -284,7 +292,7 @@ def _generate_ttp_url_log(overrides: dict | None = None) -> str:
     # Generate URL based on threat level
     if is_malicious:
         domain = random.choice(["suspicious-site.com", "phishing-domain.net", "malware-host.org"])
-        url = f"https://{domain}/click?id={uuid.uuid4()}"
+        url = f"https://{domain}/click?id={random_pools.uuid4()}"
     else:
         domain = random.choice(["microsoft.com", "google.com", "github.com", "stackoverflow.com"])
         url = f"https://{domain}/path/to/resource"
@@ -324,7 +332,7 @@ def _generate_ttp_url_log(overrides: dict | None = None) -> str:
 
 def _generate_ttp_impersonation_log(overrides: dict | None = None) -> str:
     """Generate Mimecast TTP Impersonation Protection log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     # Impersonation types
     impersonation_types = ["Display Name", "Similar Domain", "Newly Observed Domain", "Internal Name"]
@@ -370,7 +378,7 @@ def _generate_ttp_impersonation_log(overrides: dict | None = None) -> str:
 
 def _generate_siem_log(overrides: dict | None = None) -> str:
     """Generate Mimecast SIEM log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     # SIEM events are typically security-focused aggregations
     event_types = ["Email Security Alert", "Policy Violation", "Threat Detection", "User Activity"]
@@ -6,10 +6,18 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
 import base64
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List, Optional
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Email domains
 SAFE_DOMAINS = ["starfleet.corp", "gmail.com", "outlook.com", "yahoo.com", "federation.gov", "enterprise.starfleet"]
@@ -109,7 +117,7 @@ def _generate_ip():
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:
         # External IP
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_message_parts(threat_type):
     """Generate message parts based on threat type"""
@@ -121,8 +129,8 @@ def _generate_message_parts(threat_type):
             # Malicious attachment
             parts.append({
                 "disposition": "attached",
-                "sha256": uuid.uuid4().hex + uuid.uuid4().hex,
-                "md5": uuid.uuid4().hex,
+                "sha256": random_pools.hex_string(64),
+                "md5": random_pools.hex_string(32),
                 "filename": random.choice([
                     "invoice.pdf.exe", "document.doc", "scan.pdf", 
                     "payment_details.xlsx", "urgent.docm", "report.zip"
@@ -140,7 +148,7 @@ def _generate_message_parts(threat_type):
                 "isUnsupported": False,
                 "urls": [
                     {
-                        "url": f"http://{random.choice(SUSPICIOUS_DOMAINS).format(random.randint(1, 100))}/click?id={uuid.uuid4()}",
+                        "url": f"http://{random.choice(SUSPICIOUS_DOMAINS).format(random.randint(1, 100))}/click?id={random_pools.uuid4()}",
                         "isRewritten": True,
                         "threatStatus": "malicious"
                     }
@@ -202,7 +210,7 @@ def proofpoint_log(overrides: dict | None = None) -> Dict:
     recipient_email = _generate_email_address(malicious=False)
     
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     message_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Calculate scores
@@ -231,10 +239,10 @@ def proofpoint_log(overrides: dict | None = None) -> Dict:
     
     # Build event
     event = {
-        "GUID": str(uuid.uuid4()),
+        "GUID": random_pools.uuid4(),
         "QID": f"Q{random.randint(100000, 999999)}",
-        "id": str(uuid.uuid4()),
-        "messageID": f"<{uuid.uuid4()}@{sender_email.split('@')[1]}>",
+        "id": random_pools.uuid4(),
+        "messageID": f"<{random_pools.uuid4()}@{sender_email.split('@')[1]}>",
         "messageTime": message_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
         "messageSize": random.randint(1024, 1048576),  # 1KB to 1MB
         "subject": subject,
@@ -259,7 +267,7 @@ def proofpoint_log(overrides: dict | None = None) -> Dict:
         threat_info = {
             "threat": random.choice(THREAT_NAMES.get(threat_type, ["Unknown"])),
             "threatType": threat_type,
-            "threatID": str(uuid.uuid4()),
+            "threatID": random_pools.uuid4(),
             "threatStatus": "active",
             "classification": threat_type,
             "threatTime": message_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
@@ -287,7 +295,7 @@ def proofpoint_log(overrides: dict | None = None) -> Dict:
     ])
     
     if is_malicious and random.random() > 0.5:
-        event["campaignId"] = f"campaign_{uuid.uuid4().hex[:8]}"
+        event["campaignId"] = f"campaign_{random_pools.hex_string(8)}"
     
     # Apply any overrides
     if overrides:
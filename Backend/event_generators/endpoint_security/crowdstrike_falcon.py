@@ -5,10 +5,18 @@ CrowdStrike Falcon endpoint event generator (CEF format)
 from __future__ import annotations
 import json
 import random
-import time
-import hashlib
 from datetime import datetime, timezone, timedelta
-from typing import Dict
+from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import bulk_random  # event_generators/shared, NumPy-backed when installed
+import random_pools
+import event_clock
+
+OUTPUT_KIND = "cef"
 
 # Event types with their details
 EVENT_TYPES = [
@@ -110,21 +118,21 @@ FILE_PATHS = [
 def _generate_hash(hash_type="SHA256"):
     """Generate a random hash"""
     if hash_type == "SHA256":
-        return hashlib.sha256(str(random.random()).encode()).hexdigest()
+        return random_pools.sha256()
     elif hash_type == "MD5":
-        return hashlib.md5(str(random.random()).encode()).hexdigest()
-    return hashlib.sha1(str(random.random()).encode()).hexdigest()
+        return random_pools.md5()
+    return random_pools.sha1()
 
 def _generate_ip():
     """Generate a random IP address"""
     if random.random() < 0.7:  # 70% internal IPs
         return f"10.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}"
     else:  # 30% external IPs
-        return f"{random.randint(1,223)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}"
+        return random_pools.external_ipv4()
 
 def _timestamp_ms():
     """Generate current timestamp in milliseconds"""
-    return int(time.time() * 1000)
+    return event_clock.now_ns() // 1_000_000
 
 def crowdstrike_log(overrides: dict | None = None) -> str:
     """
@@ -139,20 +147,14 @@ def crowdstrike_log(overrides: dict | None = None) -> str:
     domain = random.choice(DOMAINS)
     
     # CEF header fields
-    version = "0"
-    device_vendor = "CrowdStrike"
-    device_product = "Falcon"
-    device_version = "6.35.15406.0"
     signature_id = str(random.randint(1000, 9999))
-    name = event_type["name"]
-    severity = event_type["severity"]
     
     # CEF extension fields (key=value pairs)
     extensions = {}
     
     # Base fields
     extensions.update({
-        "rt": int(time.time() * 1000),  # Receipt time
+        "rt": _timestamp_ms(),  # Receipt time
         "start": _timestamp_ms() - random.randint(60000, 3600000),  # Process start time
         "end": 0,  # Process end time
         "dvchost": hostname,
@@ -182,8 +184,18 @@ def crowdstrike_log(overrides: dict | None = None) -> str:
     })
     
     # Add event-specific fields
+    extensions.update(_category_fields(event_type, hostname, domain))
+    
+    # Apply any overrides to extensions
+    if overrides:
+        _apply_overrides(extensions, overrides)
+    
+    return _format_cef(signature_id, event_type, extensions)
+
+def _category_fields(event_type: dict, hostname: str, domain: str) -> dict:
+    """Extension fields specific to the event's category (empty for the rest)"""
     if event_type["category"] == "malware":
-        extensions.update({
+        return {
             "cs3": "Prevention, process killed.",
             "cs3Label": "PatternDisposition",
             "cs4": random.choice(MALWARE_FAMILIES),
@@ -193,10 +205,10 @@ def crowdstrike_log(overrides: dict | None = None) -> str:
             "cat": "Malicious File",
             "cs6": "T1204.002",
             "cs6Label": "TechniqueId"
-        })
+        }
     
     elif event_type["category"] == "credential_access":
-        extensions.update({
+        return {
             "cat": "Credential Dumping",
             "cs3": "T1003",
             "cs3Label": "TechniqueId",
@@ -204,20 +216,20 @@ def crowdstrike_log(overrides: dict | None = None) -> str:
             "cs4Label": "CredentialAccessType",
             "duser": "Administrator",
             "dntdom": domain
-        })
+        }
     
     elif event_type["category"] == "network":
-        extensions.update({
+        return {
             "cs3": random.choice(["Outgoing", "Incoming"]),
             "cs3Label": "ConnectionDirection",
             "cs4": random.choice(["Public", "Private"]),
             "cs4Label": "RemoteAddressType",
             "request": f"suspicious-{random.randint(1, 1000)}.{random.choice(['com', 'net', 'org', 'io'])}",
             "app": random.choice(["HTTP", "HTTPS", "DNS", "SMB", "RDP"])
-        })
+        }
     
     elif event_type["category"] == "ransomware":
-        extensions.update({
+        return {
             "cs3": random.choice(["Ryuk", "REvil", "Conti", "LockBit"]),
             "cs3Label": "RansomwareFamily",
             "cnt": random.randint(10, 1000),
@@ -226,10 +238,10 @@ def crowdstrike_log(overrides: dict | None = None) -> str:
             "cat": "Data Encrypted for Impact",
             "cs5": "T1486",
             "cs5Label": "TechniqueId"
-        })
+        }
     
     elif event_type["category"] == "lateral_movement":
-        extensions.update({
+        return {
             "shost": hostname,
             "dhost": f"SERVER-{random.randint(1, 50):02d}",
             "cs3": random.choice(["PSExec", "WMI", "RDP", "SMB"]),
@@ -241,36 +253,40 @@ def crowdstrike_log(overrides: dict | None = None) -> str:
             "cat": "Remote Services",
             "cs6": "T1021",
             "cs6Label": "TechniqueId"
-        })
-    
-    # Apply any overrides to extensions
-    if overrides:
-        # Map common field names to CEF extension fields
-        override_mappings = {
-            "ThreatFamily": ("cs4", "cs4Label", "ThreatFamily"),
-            "ThreatName": ("cs5", "cs5Label", "ThreatName"),
-            "Severity": None,  # Severity is handled in CEF header
-            "UserName": "duser",
-            "HostName": "dvchost",
-            "CommandLine": "cs1"
         }
-        
-        for key, value in overrides.items():
-            if key in override_mappings:
-                mapping = override_mappings[key]
-                if mapping is None:
-                    continue  # Skip fields handled elsewhere
-                elif isinstance(mapping, tuple):
-                    # Handle labeled fields (e.g., cs4 and cs4Label)
-                    extensions[mapping[0]] = value
-                    extensions[mapping[1]] = mapping[2]
-                else:
-                    # Direct mapping
-                    extensions[mapping] = value
-            else:
-                # Pass through unmapped overrides
-                extensions[key] = value
     
+    return {}
+
+def _apply_overrides(extensions: dict, overrides: dict):
+    """Map common field names onto CEF extension keys and apply them in place"""
+    # Map common field names to CEF extension fields
+    override_mappings = {
+        "ThreatFamily": ("cs4", "cs4Label", "ThreatFamily"),
+        "ThreatName": ("cs5", "cs5Label", "ThreatName"),
+        "Severity": None,  # Severity is handled in CEF header
+        "UserName": "duser",
+        "HostName": "dvchost",
+        "CommandLine": "cs1"
+    }
+
+    for key, value in overrides.items():
+        if key in override_mappings:
+            mapping = override_mappings[key]
+            if mapping is None:
+                continue  # Skip fields handled elsewhere
+            elif isinstance(mapping, tuple):
+                # Handle labeled fields (e.g., cs4 and cs4Label)
+                extensions[mapping[0]] = value
+                extensions[mapping[1]] = mapping[2]
+            else:
+                # Direct mapping
+                extensions[mapping] = value
+        else:
+            # Pass through unmapped overrides
+            extensions[key] = value
+
+def _format_cef(signature_id: str, event_type: dict, extensions: dict) -> str:
+    """Render the CEF header and escaped key=value extension string"""
     # Build CEF extension string
     extension_pairs = []
     for key, value in extensions.items():
@@ -284,10 +300,81 @@ def crowdstrike_log(overrides: dict | None = None) -> str:
     extension_str = " ".join(extension_pairs)
     
     # Build full CEF message
-    cef_message = f"CEF:{version}|{device_vendor}|{device_product}|{device_version}|{signature_id}|{name}|{severity}|{extension_str}"
+    cef_message = f"CEF:0|CrowdStrike|Falcon|6.35.15406.0|{signature_id}|{event_type['name']}|{event_type['severity']}|{extension_str}"
     
     return cef_message
 
+def crowdstrike_log_batch(n: int, overrides: dict | None = None) -> List[str]:
+    """``n`` events like ``crowdstrike_log()``; the base fields are drawn in bulk,
+    the few category-specific ones per event."""
+    now_ms = _timestamp_ms()
+    event_types = bulk_random.choice(EVENT_TYPES, n)
+    users = bulk_random.choice(USERS, n)
+    hostnames = bulk_random.choice(HOSTNAMES, n)
+    domains = bulk_random.choice(DOMAINS, n)
+    sid_parts = bulk_random.integers(2 * n, 100000000, 999999999)
+    rid_parts = bulk_random.integers(2 * n, 1000, 9999)
+    hashes = zip(bulk_random.hex_strings(n, 64), bulk_random.hex_strings(n, 40),
+                 bulk_random.hex_strings(n, 32), bulk_random.hex_strings(n, 16))
+    dst_internal = iter(bulk_random.ipv4(n, 10, (0, 255), (0, 255), (1, 254)))
+    dst_external = iter(bulk_random.external_ipv4(n))
+
+    columns = zip(
+        event_types, users, hostnames, domains, hashes,
+        bulk_random.integers(n, 1000, 9999),
+        bulk_random.integers(n, 60000, 3600000),
+        bulk_random.integers(n, 100000000000, 999999999999),
+        bulk_random.choice(SUSPICIOUS_PROCESSES, n),
+        bulk_random.choice(FILE_PATHS, n),
+        bulk_random.ipv4(n, 10, (0, 255), (0, 255), (1, 254)),
+        bulk_random.chance(n, 0.7),
+        bulk_random.choice([80, 443, 445, 3389, 22, 8080, 8443], n),
+        bulk_random.choice(["TCP", "UDP"], n),
+        bulk_random.integers(n, 49152, 65535),
+        bulk_random.choice(["0", "1"], n),
+        bulk_random.integers(n, 1000, 9999),
+        bulk_random.choice(SUSPICIOUS_PROCESSES, n),
+        range(0, 2 * n, 2),
+    )
+    events = []
+    for (event_type, user, hostname, domain, (sha256, sha1, md5, ldt), signature_id, age,
+         detection_id, fname, file_path, src, internal, dpt, proto, spt, direction, pid,
+         process_name, k) in columns:
+        extensions = {
+            "rt": now_ms,
+            "start": now_ms - age,
+            "end": 0,
+            "dvchost": hostname,
+            "duser": user,
+            "suid": f"S-1-5-21-{sid_parts[k]}-{sid_parts[k + 1]}-{rid_parts[k]}-{rid_parts[k + 1]}",
+            "externalId": f"ldt:{ldt}:{detection_id}",
+            "msg": f"Suspicious activity detected: {event_type['name']}",
+            "fname": fname,
+            "filePath": file_path.replace("{user}", user),
+            "cs1": _generate_command_line(event_type),
+            "cs1Label": "CommandLine",
+            "fileHash": sha256,
+            "oldFileHash": sha1,
+            "fileHashMd5": md5,
+            "dntdom": domain,
+            "src": src,
+            "dst": next(dst_internal) if internal else next(dst_external),
+            "dpt": dpt,
+            "proto": proto,
+            "spt": spt,
+            "deviceDirection": direction,
+            "cs2": event_type["event_simpleName"],
+            "cs2Label": "EventSimpleName",
+            "deviceProcessId": pid,
+            "deviceProcessName": process_name,
+            "act": "detected"
+        }
+        extensions.update(_category_fields(event_type, hostname, domain))
+        if overrides:
+            _apply_overrides(extensions, overrides)
+        events.append(_format_cef(str(signature_id), event_type, extensions))
+    return events
+
 def _get_severity_name(severity: int) -> str:
     """Convert numeric severity to name"""
     if severity <= 3:
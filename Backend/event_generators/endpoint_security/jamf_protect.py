@@ -4,7 +4,15 @@ Jamf Protect event generator
 Generates synthetic Jamf Protect endpoint security events in syslog format
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "kv"
 
 # SentinelOne AI-SIEM specific field attributes
 # Event types (matching parser expectations)
@@ -87,7 +95,7 @@ MESSAGES = [
 
 def jamf_protect_log() -> str:
     """Generate a single Jamf Protect event log in syslog format"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     # Generate events from last 10 minutes for recent timestamps
     event_time = now - timedelta(seconds=random.randint(0, 600))
     
@@ -6,8 +6,17 @@ Generates synthetic Linux authentication logs from /var/log/auth.log
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Process names
 PROCESS_NAMES = ["sshd", "sudo", "su", "login", "gdm-session-worker", "polkit"]
@@ -35,7 +44,7 @@ AUTH_EVENTS = [
 
 def generate_ip() -> str:
     """Generate IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def generate_process_id() -> int:
     """Generate process ID"""
@@ -47,7 +56,7 @@ def generate_session_id() -> str:
 
 def linux_auth_log() -> Dict:
     """Generate a single Linux authentication event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     process_name = random.choice(PROCESS_NAMES)
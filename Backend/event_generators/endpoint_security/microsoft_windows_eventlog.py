@@ -6,8 +6,16 @@ Generates synthetic Windows Event Log events (Security, System, Application)
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, Any
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "text"
 
 # Common Windows Event IDs by category
 SECURITY_EVENTS = [
@@ -83,7 +91,7 @@ def generate_ip() -> str:
 
 def microsoft_windows_eventlog_log() -> str:
     """Generate a single Windows Event Log entry that matches parser patterns exactly"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 10))  # Last 10 minutes only
     
     # Choose event type - focus on Security events for the parser
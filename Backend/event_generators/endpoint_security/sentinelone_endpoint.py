@@ -8,10 +8,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import hashlib
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Endpoint types and platforms
 ENDPOINT_TYPES = ["server", "workstation", "laptop", "kubernetes"]
@@ -191,7 +198,7 @@ def generate_endpoint_name(endpoint_type: str, os_info: Dict) -> str:
 
 def generate_sha256() -> str:
     """Generate a realistic SHA256 hash"""
-    return hashlib.sha256(str(random.random()).encode()).hexdigest()
+    return random_pools.sha256()
 
 def generate_ip_address() -> str:
     """Generate internal or external IP addresses"""
@@ -215,12 +222,12 @@ def sentinelone_endpoint_log(custom_fields: Dict = None) -> Dict:
     process_info = random.choice(PROCESSES)
     
     # Generate base event structure
-    event_time = datetime.now(timezone.utc) - timedelta(minutes=random.randint(0, 1440))
+    event_time = event_clock.utcnow() - timedelta(minutes=random.randint(0, 1440))
     endpoint_name = generate_endpoint_name(endpoint_type, os_info)
     
     event = {
         # Core event fields
-        "event.id": str(uuid.uuid4()),
+        "event.id": random_pools.uuid4(),
         "event.time": format_timestamp(event_time),
         "event.category": event_info["category"],
         "event.type": event_info["eventType"],
@@ -232,13 +239,13 @@ def sentinelone_endpoint_log(custom_fields: Dict = None) -> Dict:
         "endpoint.type": endpoint_type,
         
         # Agent information
-        "agent.uuid": str(uuid.uuid4()),
+        "agent.uuid": random_pools.uuid4(),
         "agent.version": f"22.{random.randint(1,4)}.{random.randint(1,10)}.{random.randint(100,999)}",
         
         # Site and account information
-        "site.id": str(uuid.uuid4()),
+        "site.id": random_pools.uuid4(),
         "site.name": "FinanceCorp Main Site",
-        "account.id": str(uuid.uuid4()),
+        "account.id": random_pools.uuid4(),
         "account.name": "FinanceCorp",
         
         # Data source information
@@ -255,7 +262,7 @@ def sentinelone_endpoint_log(custom_fields: Dict = None) -> Dict:
         # Source process information (following actual field structure)
         "src.process.name": process_info["name"],
         "src.process.pid": random.randint(1000, 65535),
-        "src.process.uid": str(uuid.uuid4()),
+        "src.process.uid": random_pools.uuid4(),
         "src.process.user": user,
         "src.process.cmdline": process_info["cmdline"],
         "src.process.displayName": process_info["name"],
@@ -266,20 +273,20 @@ def sentinelone_endpoint_log(custom_fields: Dict = None) -> Dict:
         "src.process.sessionId": random.randint(0, 10),
         "src.process.signedStatus": random.choice(["Signed", "Unsigned", "Invalid"]),
         "src.process.subsystem": random.choice(["Windows CUI", "Windows GUI", "POSIX CUI"]),
-        "src.process.storyline.id": str(uuid.uuid4()),
+        "src.process.storyline.id": random_pools.uuid4(),
         
         # Source process image information
         "src.process.image.path": process_info["path"],
-        "src.process.image.sha1": hashlib.sha1(str(random.random()).encode()).hexdigest(),
+        "src.process.image.sha1": random_pools.sha1(),
         "src.process.image.sha256": generate_sha256(),
         "src.process.image.size": random.randint(10240, 52428800),  # 10KB to 50MB
-        "src.process.image.uid": str(uuid.uuid4()),
+        "src.process.image.uid": random_pools.uuid4(),
         "src.process.image.type": random.choice(["Executable", "DLL", "Script"]),
         
         # Parent process information
         "src.process.parent.name": random.choice(["explorer.exe", "services.exe", "svchost.exe", "systemd", "init"]),
         "src.process.parent.pid": random.randint(100, 999),
-        "src.process.parent.uid": str(uuid.uuid4()),
+        "src.process.parent.uid": random_pools.uuid4(),
         "src.process.parent.cmdline": random.choice([
             "C:\\Windows\\explorer.exe",
             "C:\\Windows\\System32\\services.exe",
@@ -293,10 +300,10 @@ def sentinelone_endpoint_log(custom_fields: Dict = None) -> Dict:
             "C:\\Windows\\System32\\svchost.exe",
             "/lib/systemd/systemd"
         ]),
-        "src.process.parent.image.sha1": hashlib.sha1(str(random.random()).encode()).hexdigest(),
+        "src.process.parent.image.sha1": random_pools.sha1(),
         "src.process.parent.image.sha256": generate_sha256(),
         "src.process.parent.image.size": random.randint(10240, 52428800),
-        "src.process.parent.image.uid": str(uuid.uuid4()),
+        "src.process.parent.image.uid": random_pools.uuid4(),
         "src.process.parent.image.type": "Executable",
         "src.process.parent.integrityLevel": random.choice(["Medium", "High", "System"]),
         "src.process.parent.isNative64Bit": True,
@@ -304,7 +311,7 @@ def sentinelone_endpoint_log(custom_fields: Dict = None) -> Dict:
         "src.process.parent.sessionId": random.randint(0, 10),
         "src.process.parent.signedStatus": "Signed",
         "src.process.parent.startTime": format_timestamp(event_time - timedelta(seconds=random.randint(3600, 86400))),
-        "src.process.parent.storyline.id": str(uuid.uuid4()),
+        "src.process.parent.storyline.id": random_pools.uuid4(),
         "src.process.parent.subsystem": random.choice(["Windows CUI", "Windows GUI"]),
         
         # Process counters (behavioral analytics)
@@ -441,7 +448,7 @@ def sentinelone_endpoint_log(custom_fields: Dict = None) -> Dict:
     # Add target process information for some events
     if event_info["eventType"] in ["Process Creation", "Code Injection"]:
         event.update({
-            "tgt.process.uid": str(uuid.uuid4()),
+            "tgt.process.uid": random_pools.uuid4(),
             "tgt.process.cmdline": random.choice([
                 "notepad.exe document.txt",
                 "calc.exe",
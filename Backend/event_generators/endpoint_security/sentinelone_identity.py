@@ -8,10 +8,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import hashlib
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Identity event types
 IDENTITY_EVENT_TYPES = [
@@ -140,10 +147,10 @@ def sentinelone_identity_log(custom_fields: Dict = None) -> Dict:
     domain_controller = random.choice(DOMAIN_CONTROLLERS)
     
     # Generate base event structure
-    event_time = datetime.now(timezone.utc) - timedelta(minutes=random.randint(0, 1440))
+    event_time = event_clock.utcnow() - timedelta(minutes=random.randint(0, 1440))
     
     event = {
-        "event.id": str(uuid.uuid4()),
+        "event.id": random_pools.uuid4(),
         "event.time": format_timestamp(event_time),
         "event.category": event_info["category"],
         "event.type": event_info["eventType"],
@@ -163,8 +170,8 @@ def sentinelone_identity_log(custom_fields: Dict = None) -> Dict:
         "src.process.pid": random.randint(1000, 65535),
         "src.process.user": user_info["username"],
         "src.process.cmdline": "",
-        "src.process.uid": str(uuid.uuid4()),
-        "src.process.parent.uid": str(uuid.uuid4()),
+        "src.process.uid": random_pools.uuid4(),
+        "src.process.parent.uid": random_pools.uuid4(),
         
         # Network information
         "src.ip.address": generate_ip_address(),
@@ -173,11 +180,11 @@ def sentinelone_identity_log(custom_fields: Dict = None) -> Dict:
         "dst.port.number": random.choice([139, 445, 135, 3389, 88, 389, 636]),
         
         # Agent and site information
-        "agent.uuid": str(uuid.uuid4()),
+        "agent.uuid": random_pools.uuid4(),
         "agent.version": f"22.{random.randint(1,4)}.{random.randint(1,10)}.{random.randint(100,999)}",
-        "site.id": str(uuid.uuid4()),
+        "site.id": random_pools.uuid4(),
         "site.name": "FinanceCorp Main Site",
-        "account.id": str(uuid.uuid4()),
+        "account.id": random_pools.uuid4(),
         "account.name": "FinanceCorp",
         
         # Data source information
@@ -6,9 +6,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "syslog"
 
 # Event types
 EVENT_TYPES = [
@@ -83,7 +91,7 @@ def _generate_ip():
 
 def _generate_session_id():
     """Generate a session ID"""
-    return f"sess_{uuid.uuid4().hex[:16]}"
+    return f"sess_{random_pools.hex_string(16)}"
 
 def _generate_request_id():
     """Generate a request ID"""
@@ -97,7 +105,7 @@ def beyondtrust_passwordsafe_log(overrides: dict | None = None) -> str:
         beyondtrust_passwordsafe_log({"EventType": "AccountCheckout"})
     """
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Select event details
@@ -110,7 +118,7 @@ def beyondtrust_passwordsafe_log(overrides: dict | None = None) -> str:
     event = {
         "EventTime": event_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "EventType": event_type,
-        "EventId": str(uuid.uuid4()),
+        "EventId": random_pools.uuid4(),
         "UserId": user_id,
         "UserName": user_name,
         "UserDisplayName": user_name,
@@ -123,11 +131,11 @@ def beyondtrust_passwordsafe_log(overrides: dict | None = None) -> str:
             "BeyondTrust Mobile App 3.1"
         ]),
         "SessionId": _generate_session_id(),
-        "AccountId": str(uuid.uuid4()),
+        "AccountId": random_pools.uuid4(),
         "AccountName": account_name,
         "AccountType": account_type,
         "AccountDescription": account_full_name,
-        "SystemId": str(uuid.uuid4()),
+        "SystemId": random_pools.uuid4(),
         "SystemName": system_name,
         "SystemDescription": system_desc,
         "SystemType": system_os,
@@ -137,7 +145,7 @@ def beyondtrust_passwordsafe_log(overrides: dict | None = None) -> str:
         "Severity": random.choice(["Low", "Medium", "High", "Critical"]),
         "Category": random.choice(["Access", "Administration", "Audit", "Security"]),
         "RequestId": _generate_request_id(),
-        "WorkflowId": str(uuid.uuid4()) if random.random() > 0.5 else None,
+        "WorkflowId": random_pools.uuid4() if random.random() > 0.5 else None,
         "Duration": random.randint(1, 3600),  # seconds
         "BytesTransferred": random.randint(0, 1000000) if event_type in ["SessionStart", "AssetAccess"] else 0,
         "RecordsAffected": random.randint(1, 100) if "password" in event_type.lower() else 1,
@@ -269,15 +277,15 @@ def beyondtrust_passwordsafe_log(overrides: dict | None = None) -> str:
             "ModifiedBy": user_id,
             "ModifiedTime": event_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
             "Version": "1.0",
-            "Hash": f"sha256:{uuid.uuid4().hex + uuid.uuid4().hex}"
+            "Hash": f"sha256:{random_pools.hex_string(64)}"
         },
         "Metadata": {
-            "TenantId": str(uuid.uuid4()),
-            "OrganizationId": str(uuid.uuid4()),
+            "TenantId": random_pools.uuid4(),
+            "OrganizationId": random_pools.uuid4(),
             "ProductVersion": "21.2.5",
             "ApiVersion": "v1.0",
-            "CorrelationId": str(uuid.uuid4()),
-            "TraceId": str(uuid.uuid4())
+            "CorrelationId": random_pools.uuid4(),
+            "TraceId": random_pools.uuid4()
         }
     })
     
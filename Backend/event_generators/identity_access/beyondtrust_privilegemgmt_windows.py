@@ -6,8 +6,16 @@ Generates endpoint privilege management events in CSV format
 from __future__ import annotations
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "csv"
 
 # Event types and activities
 ACTIVITY_IDS = [
@@ -96,7 +104,7 @@ def beyondtrust_privilegemgmt_windows_log(overrides: dict | None = None) -> str:
     Pass `overrides` to force any field to a specific value:
         beyondtrust_privilegemgmt_windows_log({"activity_id": "EPM_BLOCK"})
     """
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Select application and event details
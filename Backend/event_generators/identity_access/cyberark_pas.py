@@ -3,12 +3,20 @@
 CyberArk PAS (Privileged Access Security) event generator (JSON format)
 """
 from __future__ import annotations
-import json
 import random
 import time
-import hashlib
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+from hec_json import dumps as json_dumps, dumps_bytes as json_dumps_bytes  # orjson-backed when installed
+
+OUTPUT_KIND = "json"
 
 # Policy names and categories
 POLICIES = [
@@ -72,13 +80,12 @@ THREAT_ACTIONS = ["Block", "Allow", "Quarantine", "Delete", "Monitor", "Alert"]
 
 def _generate_hash(hash_type="SHA256"):
     """Generate a random hash"""
-    random_data = str(random.random()).encode()
     if hash_type == "MD5":
-        return hashlib.md5(random_data).hexdigest()
+        return random_pools.md5()
     elif hash_type == "SHA1":
-        return hashlib.sha1(random_data).hexdigest()
+        return random_pools.sha1()
     else:
-        return hashlib.sha256(random_data).hexdigest()
+        return random_pools.sha256()
 
 def _generate_sid():
     """Generate a Windows-style SID"""
@@ -86,15 +93,10 @@ def _generate_sid():
 
 def _iso_timestamp():
     """Generate ISO format timestamp"""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return event_clock.stamp("iso_us")
 
-def cyberark_pas_log(overrides: dict | None = None) -> str:
-    """
-    Return a single CyberArk PAS event as JSON string.
-    
-    Pass `overrides` to force any field to a specific value:
-        cyberark_pas_log({"userName": "specific_user"})
-    """
+def _build_event(overrides: dict | None = None) -> Dict:
+    """Event dict behind ``cyberark_pas_log()``."""
     # Select random attributes (allow overrides)
     policy_name, policy_category = random.choice(POLICIES)
     event_type = random.choice(EVENT_TYPES)
@@ -111,7 +113,7 @@ def cyberark_pas_log(overrides: dict | None = None) -> str:
         user = overrides["userName"]
     
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     first_event_time = now - timedelta(hours=random.randint(1, 24))
     last_event_time = now
     
@@ -263,7 +265,20 @@ def cyberark_pas_log(overrides: dict | None = None) -> str:
     if overrides:
         event.update(overrides)
     
-    return json.dumps(event)
+    return event
+
+def cyberark_pas_log(overrides: dict | None = None) -> str:
+    """
+    Return a single CyberArk PAS event as JSON string.
+    
+    Pass `overrides` to force any field to a specific value:
+        cyberark_pas_log({"userName": "specific_user"})
+    """
+    return json_dumps(_build_event(overrides))
+
+def cyberark_pas_log_bytes(overrides: dict | None = None) -> bytes:
+    """``cyberark_pas_log()`` as UTF-8 JSON bytes, without the intermediate ``str``."""
+    return json_dumps_bytes(_build_event(overrides))
 
 if __name__ == "__main__":
     # Generate a few sample logs
@@ -3,12 +3,20 @@
 HashiCorp Vault event generator (JSON format)
 """
 from __future__ import annotations
-import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+from hec_json import dumps as json_dumps, dumps_bytes as json_dumps_bytes  # orjson-backed when installed
+
+OUTPUT_KIND = "json"
 
 # Vault operations
 OPERATIONS = [
@@ -80,21 +88,16 @@ def _generate_ip():
 
 def _generate_token():
     """Generate a Vault token"""
-    return f"hvs.{uuid.uuid4().hex}"
+    return f"hvs.{random_pools.hex_string(32)}"
 
 def _generate_lease_id():
     """Generate a lease ID"""
-    return f"{random.choice(SECRET_ENGINES)}/creds/{uuid.uuid4().hex[:8]}/{uuid.uuid4().hex}"
+    return f"{random.choice(SECRET_ENGINES)}/creds/{random_pools.hex_string(8)}/{random_pools.hex_string(32)}"
 
-def hashicorp_vault_log(overrides: dict | None = None) -> str:
-    """
-    Return a single HashiCorp Vault audit log event as JSON string.
-    
-    Pass `overrides` to force any field to a specific value:
-        hashicorp_vault_log({"type": "request"})
-    """
+def _build_event(overrides: dict | None = None) -> Dict:
+    """Event dict behind ``hashicorp_vault_log()``."""
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     timestamp = now - timedelta(seconds=random.randint(0, 300))
     
     # Select operation and user
@@ -121,10 +124,10 @@ def hashicorp_vault_log(overrides: dict | None = None) -> str:
     # Generate request/response details
     if log_type == "request":
         http_status = None
-        request_id = str(uuid.uuid4())
+        request_id = random_pools.uuid4()
     else:
         http_status = random.choice(HTTP_STATUSES)
-        request_id = str(uuid.uuid4())
+        request_id = random_pools.uuid4()
     
     # Base audit log structure
     event = {
@@ -132,7 +135,7 @@ def hashicorp_vault_log(overrides: dict | None = None) -> str:
         "type": log_type,
         "auth": {
             "client_token": _generate_token(),
-            "accessor": f"acc_{uuid.uuid4().hex[:16]}",
+            "accessor": f"acc_{random_pools.hex_string(16)}",
             "display_name": user_name,
             "policies": random.sample(POLICIES, random.randint(1, 3)),
             "token_policies": random.sample(POLICIES, random.randint(1, 2)),
@@ -140,7 +143,7 @@ def hashicorp_vault_log(overrides: dict | None = None) -> str:
                 "username": user_name if entity_type == "human" else None,
                 "service": user_name if entity_type == "service" else None,
             },
-            "entity_id": str(uuid.uuid4()),
+            "entity_id": random_pools.uuid4(),
             "token_type": random.choice(["service", "batch", "recovery"]),
             "token_ttl": random.randint(3600, 86400),  # 1 hour to 1 day
             "token_issue_time": timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
@@ -150,7 +153,7 @@ def hashicorp_vault_log(overrides: dict | None = None) -> str:
             "operation": operation,
             "mount_type": random.choice(SECRET_ENGINES) if operation not in ["seal", "unseal"] else "",
             "client_token": _generate_token(),
-            "client_token_accessor": f"acc_{uuid.uuid4().hex[:16]}",
+            "client_token_accessor": f"acc_{random_pools.hex_string(16)}",
             "namespace": {
                 "id": "root",
                 "path": ""
@@ -198,30 +201,43 @@ def hashicorp_vault_log(overrides: dict | None = None) -> str:
         if operation == "login" and http_status == 200:
             event["response"]["auth"] = {
                 "client_token": _generate_token(),
-                "accessor": f"acc_{uuid.uuid4().hex[:16]}",
+                "accessor": f"acc_{random_pools.hex_string(16)}",
                 "policies": random.sample(POLICIES, random.randint(1, 3)),
                 "token_policies": random.sample(POLICIES, random.randint(1, 2)),
                 "lease_duration": random.randint(3600, 86400),
                 "renewable": True,
-                "entity_id": str(uuid.uuid4()),
+                "entity_id": random_pools.uuid4(),
                 "token_type": "service",
                 "orphan": False
             }
     
     # Add Vault cluster information
     event.update({
-        "cluster_id": str(uuid.uuid4()),
+        "cluster_id": random_pools.uuid4(),
         "version": "1.12.0",
         "build_date": "2023-10-20T09:15:00Z",
         "hostname": f"vault-{random.randint(1, 3)}.company.com",
-        "node_id": f"node_{uuid.uuid4().hex[:8]}"
+        "node_id": f"node_{random_pools.hex_string(8)}"
     })
     
     # Apply any overrides
     if overrides:
         event.update(overrides)
     
-    return json.dumps(event)
+    return event
+
+def hashicorp_vault_log(overrides: dict | None = None) -> str:
+    """
+    Return a single HashiCorp Vault audit log event as JSON string.
+    
+    Pass `overrides` to force any field to a specific value:
+        hashicorp_vault_log({"type": "request"})
+    """
+    return json_dumps(_build_event(overrides))
+
+def hashicorp_vault_log_bytes(overrides: dict | None = None) -> bytes:
+    """``hashicorp_vault_log()`` as UTF-8 JSON bytes, without the intermediate ``str``."""
+    return json_dumps_bytes(_build_event(overrides))
 
 def _generate_request_data(operation: str, path: str) -> Dict:
     """Generate request data based on operation"""
@@ -229,7 +245,7 @@ def _generate_request_data(operation: str, path: str) -> Dict:
         return {
             "data": {
                 "username": f"user_{random.randint(1000, 9999)}",
-                "password": f"pass_{uuid.uuid4().hex[:16]}"
+                "password": f"pass_{random_pools.hex_string(16)}"
             },
             "options": {},
             "version": random.randint(1, 10)
@@ -261,12 +277,12 @@ def _generate_response_data(operation: str, path: str, status_code: int) -> Dict
         return {
             "data": {
                 "username": f"user_{random.randint(1000, 9999)}",
-                "password": f"pass_{uuid.uuid4().hex[:16]}",
-                "created_time": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                "password": f"pass_{random_pools.hex_string(16)}",
+                "created_time": event_clock.stamp("iso_us"),
                 "version": random.randint(1, 10)
             },
             "metadata": {
-                "created_time": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                "created_time": event_clock.stamp("iso_us"),
                 "custom_metadata": None,
                 "deletion_time": "",
                 "destroyed": False,
@@ -285,7 +301,7 @@ def _generate_response_data(operation: str, path: str, status_code: int) -> Dict
             "progress": random.randint(0, 3) if operation == "unseal" else 0,
             "version": "1.12.0",
             "cluster_name": "vault-cluster-1",
-            "cluster_id": str(uuid.uuid4())
+            "cluster_id": random_pools.uuid4()
         }
     else:
         return {}
@@ -4,7 +4,15 @@ HYPR authentication event generator
 Generates synthetic HYPR FIDO2 and passwordless authentication events in syslog format
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 # Event types
 EVENT_TYPES = ["REGISTRATION", "AUTHENTICATION", "VERIFICATION", "ENROLLMENT", "REVOCATION"]
@@ -33,7 +41,7 @@ MESSAGES = [
 
 def hypr_auth_log() -> dict:
     """Generate a single HYPR authentication event log in syslog format"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     timestamp = event_time.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -6,8 +6,17 @@ Generates synthetic M365 SharePoint/OneDrive activity logs
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Operations
 OPERATIONS = [
@@ -90,7 +99,7 @@ def generate_object_id() -> str:
 
 def microsoft_365_collaboration_log(overrides: dict = None) -> Dict:
     """Generate a single Microsoft 365 Collaboration event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
     operation = random.choice(OPERATIONS)
@@ -130,7 +139,7 @@ def microsoft_365_collaboration_log(overrides: dict = None) -> Dict:
             "Microsoft Office/16.0 (Microsoft OneDrive for Business)",
             "Microsoft SharePoint Online"
         ]),
-        "ClientIP": f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}",
+        "ClientIP": random_pools.external_ipv4(),
         "Workload": "SharePoint" if "sharepoint" in site_url else "OneDrive",
         "RecordType": random.choice([6, 14, 25]),  # SharePoint/OneDrive record types
         "Version": "1"
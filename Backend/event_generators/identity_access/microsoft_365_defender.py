@@ -6,8 +6,17 @@ Generates synthetic Microsoft 365 Defender endpoint security logs
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Action types
 ACTION_TYPES = [
@@ -99,11 +108,11 @@ def generate_md5() -> str:
 
 def generate_ip() -> str:
     """Generate IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def microsoft_365_defender_log(overrides: dict = None) -> Dict:
     """Generate a single Microsoft 365 Defender event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
     action_type = random.choice(ACTION_TYPES)
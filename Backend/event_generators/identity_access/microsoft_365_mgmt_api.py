@@ -6,9 +6,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List, Optional
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Activity group names for security alerts
 ACTIVITY_GROUPS = [
@@ -84,7 +92,7 @@ def _generate_ip(internal=True):
     if internal:
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_user_states():
     """Generate user state information"""
@@ -93,12 +101,12 @@ def _generate_user_states():
     
     return [
         {
-            "aadUserId": str(uuid.uuid4()),
+            "aadUserId": random_pools.uuid4(),
             "accountName": user,
             "domainName": domain,
             "emailRole": random.choice(["sender", "recipient", "cc", "bcc"]),
             "isVpn": random.choice(["true", "false"]),
-            "logonDateTime": (datetime.now(timezone.utc) - timedelta(hours=random.randint(0, 24))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "logonDateTime": (event_clock.utcnow() - timedelta(hours=random.randint(0, 24))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
             "logonId": str(random.randint(100000, 999999)),
             "logonIp": _generate_ip(internal=random.choice([True, False])),
             "logonLocation": random.choice(["Seattle, WA", "New York, NY", "London, UK", "Unknown", "Remote"]),
@@ -148,7 +156,7 @@ def _generate_network_connections():
             "destinationPort": str(random.choice([80, 443, 8080, 8443, 53, 993])),
             "destinationUrl": f"https://{'suspicious-' if random.random() > 0.7 else ''}domain-{random.randint(1, 100)}.com/api/data",
             "direction": random.choice(["Inbound", "Outbound"]),
-            "domainRegisteredDateTime": (datetime.now(timezone.utc) - timedelta(days=random.randint(1, 365))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "domainRegisteredDateTime": (event_clock.utcnow() - timedelta(days=random.randint(1, 365))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
             "localDnsName": f"workstation-{random.randint(100, 999)}.{random.choice(DOMAINS)}",
             "natDestinationAddress": _generate_ip(internal=False),
             "natDestinationPort": str(random.randint(10000, 65535)),
@@ -173,16 +181,16 @@ def _generate_processes():
         process_name, process_path = random.choice(PROCESSES)
         processes.append({
             "accountName": random.choice(USERS),
-            "commandLine": f"{process_path} {random.choice(['-enc', '/c', '-Command', '-ExecutionPolicy Bypass'])} {uuid.uuid4().hex[:16]}",
-            "createdDateTime": (datetime.now(timezone.utc) - timedelta(minutes=random.randint(1, 60))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "commandLine": f"{process_path} {random.choice(['-enc', '/c', '-Command', '-ExecutionPolicy Bypass'])} {random_pools.hex_string(16)}",
+            "createdDateTime": (event_clock.utcnow() - timedelta(minutes=random.randint(1, 60))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
             "fileHash": {
                 "hashType": "sha256",
-                "hashValue": uuid.uuid4().hex + uuid.uuid4().hex
+                "hashValue": random_pools.hex_string(64)
             },
             "integrityLevel": random.choice(["Low", "Medium", "High", "System"]),
             "isElevated": random.choice(["true", "false"]),
             "name": process_name,
-            "parentProcessCreatedDateTime": (datetime.now(timezone.utc) - timedelta(minutes=random.randint(2, 120))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "parentProcessCreatedDateTime": (event_clock.utcnow() - timedelta(minutes=random.randint(2, 120))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
             "parentProcessId": random.randint(100, 9999),
             "parentProcessName": "explorer.exe",
             "path": process_path,
@@ -236,7 +244,7 @@ def microsoft_365_mgmt_api_log(overrides: dict | None = None) -> Dict:
         microsoft_365_mgmt_api_log({"category": "ThreatIntelligence"})
     """
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     created_time = now - timedelta(minutes=random.randint(1, 60))
     event_time = created_time + timedelta(minutes=random.randint(0, 30))
     
@@ -246,9 +254,9 @@ def microsoft_365_mgmt_api_log(overrides: dict | None = None) -> Dict:
     
     # Generate base event
     event = {
-        "id": str(uuid.uuid4()),
-        "azureSubscriptionId": str(uuid.uuid4()),
-        "azureTenantId": str(uuid.uuid4()),
+        "id": random_pools.uuid4(),
+        "azureSubscriptionId": random_pools.uuid4(),
+        "azureTenantId": random_pools.uuid4(),
         "activityGroupName": activity_group,
         "assignedTo": random.choice(["unassigned", "soc_analyst", "incident_response", "security_admin"]),
         "category": category,
@@ -261,10 +269,10 @@ def microsoft_365_mgmt_api_log(overrides: dict | None = None) -> Dict:
         "confidence": random.randint(1, 100),
         "createdDateTime": created_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "description": f"Microsoft 365 security alert: {activity_group}. This alert indicates potential {category.lower()} activity detected in your environment.",
-        "detectionIds": [str(uuid.uuid4()) for _ in range(random.randint(1, 3))],
+        "detectionIds": [random_pools.uuid4() for _ in range(random.randint(1, 3))],
         "eventDateTime": event_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "feedback": random.choice(["unknown", "truePositive", "falsePositive", "benignPositive"]),
-        "incidentIds": [str(uuid.uuid4())] if random.random() > 0.5 else [],
+        "incidentIds": [random_pools.uuid4()] if random.random() > 0.5 else [],
         "lastEventDateTime": (event_time + timedelta(minutes=random.randint(0, 30))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "lastModifiedDateTime": now.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "malwareStates": _generate_malware_states(),
@@ -280,8 +288,8 @@ def microsoft_365_mgmt_api_log(overrides: dict | None = None) -> Dict:
         "securityResources": random.sample(SECURITY_RESOURCES, random.randint(1, 3)),
         "severity": random.choice(["low", "medium", "high", "critical"]),
         "sourceMaterials": [
-            f"https://security.microsoft.com/alerts/{uuid.uuid4()}",
-            f"https://portal.office.com/adminportal/home#/MessageCenter/:/messages/{uuid.uuid4()}"
+            f"https://security.microsoft.com/alerts/{random_pools.uuid4()}",
+            f"https://portal.office.com/adminportal/home#/MessageCenter/:/messages/{random_pools.uuid4()}"
         ],
         "status": random.choice(["newAlert", "inProgress", "resolved", "dismissed"]),
         "tags": [category.lower(), "m365", "security", "automated"],
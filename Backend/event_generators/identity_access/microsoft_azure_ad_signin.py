@@ -6,9 +6,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List, Optional
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Azure AD Applications
 AZURE_APPLICATIONS = [
@@ -114,14 +122,14 @@ def _generate_ip(internal=True):
     if internal:
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_device_info():
     """Generate device information"""
     os = random.choice(OPERATING_SYSTEMS)
     browser = random.choice(BROWSERS)
     
-    device_id = str(uuid.uuid4()) if random.random() > 0.3 else None
+    device_id = random_pools.uuid4() if random.random() > 0.3 else None
     is_managed = random.choice([True, False]) if device_id else False
     is_compliant = is_managed and random.choice([True, False])
     
@@ -163,7 +171,7 @@ def _generate_conditional_access_policies():
     for i in range(num_policies):
         policy_name = random.choice(policy_names)
         policies.append({
-            "id": str(uuid.uuid4()),
+            "id": random_pools.uuid4(),
             "displayName": policy_name,
             "enforcedGrantControls": random.choice([["mfa"], ["compliantDevice"], ["approvedApplication"], []]),
             "enforcedSessionControls": [],
@@ -182,7 +190,7 @@ def _generate_authentication_details():
         succeeded = random.choice([True, False]) if i == 0 else True  # First step can fail
         
         details.append({
-            "authenticationStepDateTime": (datetime.now(timezone.utc) - timedelta(seconds=random.randint(1, 30))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "authenticationStepDateTime": (event_clock.utcnow() - timedelta(seconds=random.randint(1, 30))).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
             "authenticationMethod": method,
             "authenticationMethodDetail": f"{method} via mobile app" if "app" in method.lower() else method,
             "succeeded": succeeded,
@@ -200,7 +208,7 @@ def microsoft_azure_ad_signin_log(overrides: dict | None = None) -> Dict:
         microsoft_azure_ad_signin_log({"resultType": 0})
     """
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     created_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Select user and application (allow override of user)
@@ -237,26 +245,26 @@ def microsoft_azure_ad_signin_log(overrides: dict | None = None) -> Dict:
     # Base event structure (Azure EventHub format)
     record = {
         "time": now.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-        "resourceId": f"/tenants/{uuid.uuid4()}/providers/Microsoft.aadiam",
+        "resourceId": f"/tenants/{random_pools.uuid4()}/providers/Microsoft.aadiam",
         "operationName": "Sign-in activity",
         "operationVersion": "1.0",
         "category": "SignInLogs",
-        "tenantId": str(uuid.uuid4()),
+        "tenantId": random_pools.uuid4(),
         "resultType": str(result_type),
         "resultSignature": "None" if is_success else f"Error_{result_type}",
         "resultDescription": "Success" if is_success else f"Sign-in failure: {result_type}",
         "durationMs": random.randint(100, 5000),
         "callerIpAddress": caller_ip,
-        "correlationId": str(uuid.uuid4()),
+        "correlationId": random_pools.uuid4(),
         "identity": user_email,
         "Level": 4 if is_success else 3,  # Informational vs Warning
         "location": location["countryOrRegion"],
         "properties": {
-            "id": str(uuid.uuid4()),
+            "id": random_pools.uuid4(),
             "createdDateTime": created_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
             "userDisplayName": user_display_name,
             "userPrincipalName": user_email,
-            "userId": str(uuid.uuid4()),
+            "userId": random_pools.uuid4(),
             "appId": app_id,
             "appDisplayName": app_name,
             "resourceDisplayName": app_name,
@@ -270,7 +278,7 @@ def microsoft_azure_ad_signin_log(overrides: dict | None = None) -> Dict:
                 "BAV2ROPC"  # Basic Auth
             ]),
             "conditionalAccessStatus": random.choice(CA_STATUSES),
-            "originalRequestId": str(uuid.uuid4()),
+            "originalRequestId": random_pools.uuid4(),
             "isInteractive": random.choice([True, False]),
             "tokenIssuerName": random.choice(["Azure AD", "ADFS", "External IdP"]),
             "tokenIssuerType": random.choice(["AzureAD", "ADFederationServices", "External"]),
@@ -281,16 +289,16 @@ def microsoft_azure_ad_signin_log(overrides: dict | None = None) -> Dict:
             "servicePrincipalName": None,
             "statusCode": result_type,
             "statusMessage": "Success" if is_success else f"Sign-in error {result_type}",
-            "uniqueTokenIdentifier": str(uuid.uuid4()),
-            "requestId": str(uuid.uuid4()),
+            "uniqueTokenIdentifier": random_pools.uuid4(),
+            "requestId": random_pools.uuid4(),
             "authenticationProtocol": random.choice(["oAuth2", "saml", "wsFed", "unknownFutureValue"]),
             "incomingTokenType": random.choice(["none", "primaryRefreshToken", "saml11", "saml20", "unknownFutureValue"]),
             "flaggedForReview": False,
             "isTenantRestricted": False,
             "autonomousSystemNumber": random.randint(1000, 99999),
             "crossTenantAccessType": random.choice(["none", "b2bCollaboration", "b2bDirectConnect", "microsoftSupport", "serviceProvider", "unknownFutureValue"]),
-            "homeTenantId": str(uuid.uuid4()),
-            "uniqueTokenIdentifier": str(uuid.uuid4()),
+            "homeTenantId": random_pools.uuid4(),
+            "uniqueTokenIdentifier": random_pools.uuid4(),
             "riskDetail": risk_detail,
             "riskLevelAggregated": risk_level,
             "riskLevelDuringSignIn": risk_level,
@@ -299,7 +307,7 @@ def microsoft_azure_ad_signin_log(overrides: dict | None = None) -> Dict:
             "authenticationDetails": _generate_authentication_details(),
             "authenticationRequirementPolicies": [],
             "authenticationStrengths": {
-                "id": str(uuid.uuid4()),
+                "id": random_pools.uuid4(),
                 "displayName": "Built-in Multi-factor authentication",
                 "allowedCombinations": ["password,sms", "password,voice", "password,microsoftAuthenticatorPush"]
             } if random.random() > 0.5 else None
@@ -43,17 +43,23 @@ from __future__ import annotations
 
 import json
 import random
-import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from typing import Dict, Any, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # SOURCETYPE = "azure_entra_id"
 
 # --------------------------------------------------------------------------- #
 #  Static pools                                                               #
 # --------------------------------------------------------------------------- #
-_NOW = datetime.now(tz=timezone.utc)
-
 _USERS = [
     {
         "userPrincipalName": "jean.picard@starfleet.corp",
@@ -152,14 +158,14 @@ _MALICIOUS_APIS: List[Dict[str, Any]] = [
 def _random_dt() -> str:
     """Random ISO‑8601 timestamp within the past 12 hours."""
     delta = timedelta(seconds=random.randint(0, 12 * 3600))
-    return (_NOW - delta).isoformat(timespec="seconds")
+    return (event_clock.utcnow() - delta).isoformat(timespec="seconds")
 
 def _base_event() -> Dict[str, Any]:
     """Common skeleton."""
     return {
         "activityDateTime": _random_dt(),
-        "correlationId": str(uuid.uuid4()),
-        "id": str(uuid.uuid4()),
+        "correlationId": random_pools.uuid4(),
+        "id": random_pools.uuid4(),
         # The parser flattens initiatedBy.* into initiatedByUserId etc.
         "initiatedBy": {},
         # Placeholder; filled later
@@ -176,7 +182,7 @@ def _build_target(res_type: str, display: str) -> Dict[str, Any]:
     """Simple targetResources entry."""
     return {
         "displayName": display,
-        "id": str(uuid.uuid4()),
+        "id": random_pools.uuid4(),
         "type": res_type,
         "modifiedProperties": [],
         "userPrincipalName": None,
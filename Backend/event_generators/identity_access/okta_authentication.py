@@ -27,12 +27,18 @@ sending data to the SentinelOne ingestion endpoint.  See
 
 from __future__ import annotations
 
-import json
 import random
-import uuid
-from datetime import datetime, timezone
-from ipaddress import IPv4Address
 from typing import Dict, Any, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+from hec_json import dumps as json_dumps, dumps_bytes as json_dumps_bytes  # orjson-backed when installed
+
+OUTPUT_KIND = "json"
 
 # --------------------------------------------------------------------------- #
 #  Static fields
@@ -42,9 +48,9 @@ from typing import Dict, Any, List
 #: expected by the SentinelOne AI‑SIEM Okta parser and identify
 #: the source of the data.  Update vendor/product names as needed.
 # Helper lambdas for brevity
-_NOW = lambda: datetime.now(timezone.utc)
+_NOW = lambda: event_clock.utcnow()
 _ISO = lambda dt: dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-_IP = lambda: str(IPv4Address(random.getrandbits(32)))
+_IP = lambda: random_pools.external_ipv4()
 
 # Possible outcome statuses and reasons
 _OUTCOMES: List[Dict[str, str]] = [
@@ -81,12 +87,9 @@ def _random_user() -> Dict[str, Any]:
         A dictionary with ``id``, ``type`` and ``displayName`` fields.
     """
     # Import starfleet characters
-    import sys
-    import os
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
     from starfleet_characters import get_random_user, get_display_name_from_email
     
-    user_id = str(uuid.uuid4())
+    user_id = random_pools.uuid4()
     username = get_random_user()
     return {
         "id": user_id,
@@ -125,11 +128,8 @@ def _random_client() -> Dict[str, Any]:
         "ipAddress": _IP(),
     }
 
-def okta_authentication_log() -> str:
-    """
-    Return a single synthetic Okta System Log event in JSON format
-    that matches what the parser expects (native Okta JSON format).
-    """
+def _build_event() -> Dict:
+    """Event dict behind ``okta_authentication_log()``."""
     now = _NOW()
     original_time = _ISO(now)
     user = _random_user()
@@ -138,7 +138,7 @@ def okta_authentication_log() -> str:
     event_type = random.choice(_EVENT_TYPES)
     
     event = {
-        "uuid": str(uuid.uuid4()),
+        "uuid": random_pools.uuid4(),
         "published": original_time,
         "eventType": event_type,
         "version": "0",
@@ -173,11 +173,11 @@ def okta_authentication_log() -> str:
         },
         "transaction": {
             "type": random.choice(_AUTH_CONTEXTS),
-            "id": str(uuid.uuid4())
+            "id": random_pools.uuid4()
         },
         "debugContext": {
             "debugData": {
-                "requestId": str(uuid.uuid4()),
+                "requestId": random_pools.uuid4(),
                 "requestUri": f"/api/v1/{event_type.replace('.', '/')}",
                 "threatSuspected": str(random.choice([True, False])).lower(),
                 "url": f"/api/v1/{event_type.replace('.', '/')}?limit=20"
@@ -185,8 +185,8 @@ def okta_authentication_log() -> str:
         },
         "authenticationContext": {
             "authenticationStep": random.randint(0, 2),
-            "externalSessionId": str(uuid.uuid4()),
-            "rootSessionId": str(uuid.uuid4())
+            "externalSessionId": random_pools.uuid4(),
+            "rootSessionId": random_pools.uuid4()
         },
         "securityContext": {
             "asNumber": random.randint(100, 999),
@@ -200,13 +200,24 @@ def okta_authentication_log() -> str:
     # Add targets for some event types
     if "session" in event_type:
         event["target"] = [{
-            "id": str(uuid.uuid4()),
+            "id": random_pools.uuid4(),
             "type": "AppInstance",
             "alternateId": f"app_{random.randint(1000, 9999)}",
             "displayName": random.choice(["Salesforce", "Office 365", "Google Workspace", "Slack"])
         }]
     
-    return json.dumps(event)
+    return event
+
+def okta_authentication_log() -> str:
+    """
+    Return a single synthetic Okta System Log event in JSON format
+    that matches what the parser expects (native Okta JSON format).
+    """
+    return json_dumps(_build_event())
+
+def okta_authentication_log_bytes() -> bytes:
+    """``okta_authentication_log()`` as UTF-8 JSON bytes, without the intermediate ``str``."""
+    return json_dumps_bytes(_build_event())
 
 if __name__ == "__main__":  # pragma: no cover
     # Simple demo: print a few sample events to stdout
@@ -6,8 +6,17 @@ Generates synthetic PingFederate authentication and provisioning logs
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Log levels
 LOG_LEVELS = ["INFO", "WARN", "ERROR", "DEBUG"]
@@ -54,7 +63,7 @@ PROV_OPERATIONS = ["createUser", "updateUser", "deleteUser", "createGroup", "upd
 
 def generate_ip() -> str:
     """Generate IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def generate_session_id() -> str:
     """Generate session ID"""
@@ -66,7 +75,7 @@ def generate_transaction_id() -> str:
 
 def pingfederate_log() -> Dict:
     """Generate a single PingFederate authentication event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     operation = random.choice(OPERATIONS)
@@ -4,8 +4,16 @@ PingOne MFA event generator
 Generates synthetic PingOne MFA authentication events
 """
 import random
-from datetime import datetime, timezone, timedelta
-import uuid
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 USERS = ["jane.doe@example.com", "john.doe@example.com", "admin@example.com", "service@example.com"]
 ACTION_TYPES = ["MFA.AUTHENTICATE", "MFA.ENROLL"]
@@ -17,7 +25,7 @@ def get_random_ip():
 
 def pingone_mfa_log() -> dict:
     """Generate a single PingOne MFA event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 60))
     
     user = random.choice(USERS)
@@ -25,7 +33,7 @@ def pingone_mfa_log() -> dict:
     action_type = random.choice(ACTION_TYPES)
     factor = random.choice(FACTORS)
     status = random.choice(STATUSES)
-    session_id = str(uuid.uuid4())
+    session_id = random_pools.uuid4()
     
     timestamp = event_time.isoformat().replace('+00:00', 'Z')
     recorded_at = timestamp
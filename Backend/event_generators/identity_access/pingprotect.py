@@ -4,11 +4,19 @@ PingProtect event generator
 Generates synthetic PingProtect authentication and security events
 """
 import random
-from datetime import datetime, timezone, timedelta
-import uuid
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 CLIENT_IDS = ["adminui", "auth-service", "mobile-app"]
-USER_IDS = [str(uuid.uuid4()) for _ in range(5)]
+USER_IDS = [random_pools.uuid4() for _ in range(5)]
 ACTION_TYPES = ["SECRET.READ", "ROLE_ASSIGNMENT.DELETED", "MFA.CHALLENGE"]
 STATUSES = ["SUCCESS", "FAILURE"]
 
@@ -17,7 +25,7 @@ def get_random_ip():
 
 def pingprotect_log() -> dict:
     """Generate a single PingProtect event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 60))
     
     client_id = random.choice(CLIENT_IDS)
@@ -42,7 +50,7 @@ def pingprotect_log() -> dict:
     
     if action_type == "SECRET.READ":
         description = "Secret Read"
-        app_id = str(uuid.uuid4())
+        app_id = random_pools.uuid4()
         log_dict["action.description"] = description
         log_dict["resources.application.id"] = app_id
         
@@ -53,7 +61,7 @@ def pingprotect_log() -> dict:
     
     elif action_type == "ROLE_ASSIGNMENT.DELETED":
         description = "Role Assignment Deleted" 
-        app_id = str(uuid.uuid4())
+        app_id = random_pools.uuid4()
         log_dict["action.description"] = description
         log_dict["resources.application.id"] = app_id
         
@@ -4,7 +4,15 @@ RSA Adaptive Authentication event generator
 Generates synthetic RSA Adaptive risk-based authentication events
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 USERS = ["carol@example.com", "dan@example.com", "eve@example.com", "admin@example.com"]
 DEVICES = ["iOS", "Android", "Windows", "Web", "Mac"]
@@ -33,7 +41,7 @@ def generate_risk_score_and_decision():
 
 def rsa_adaptive_log() -> dict:
     """Generate a single RSA Adaptive Authentication event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 60))
     
     user = random.choice(USERS)
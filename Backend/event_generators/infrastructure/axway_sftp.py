@@ -4,7 +4,16 @@ Axway SFTP event generator
 Generates synthetic Axway SFTP file transfer events in syslog format
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "kv"
 
 # SFTP event types
 EVENTS = ["LOGIN", "UPLOAD", "DOWNLOAD", "DELETE", "RENAME", "LOGOUT"]
@@ -28,11 +37,11 @@ MESSAGES = [
 
 def generate_ip() -> str:
     """Generate IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def axway_sftp_log() -> str:
     """Generate a single Axway SFTP event log in syslog format"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     timestamp = event_time.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -6,9 +6,17 @@ Generates synthetic Buildkite audit and pipeline events
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Event types in Buildkite
 EVENT_TYPES = [
@@ -51,19 +59,19 @@ USERS = ["alice.dev", "bob.builder", "charlie.admin", "diana.devops", "evan.engi
 
 def buildkite_log() -> Dict:
     """Generate a single Buildkite event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     event_type = random.choice(EVENT_TYPES)
     
     # Base event structure
     event = {
-        "id": str(uuid.uuid4()),
+        "id": random_pools.uuid4(),
         "type": event_type,
         "occurredAt": event_time.isoformat(),
-        "organizationUuid": f"org_{uuid.uuid4().hex[:8]}",
+        "organizationUuid": f"org_{random_pools.hex_string(8)}",
         "organizationSlug": "acme-corp",
-        "actorUuid": f"user_{uuid.uuid4().hex[:8]}",
+        "actorUuid": f"user_{random_pools.hex_string(8)}",
         "actorName": random.choice(USERS),
         "actorType": "User"
     }
@@ -71,11 +79,11 @@ def buildkite_log() -> Dict:
     # Add event-specific fields
     if "pipeline" in event_type:
         event.update({
-            "pipelineUuid": f"pipeline_{uuid.uuid4().hex[:8]}",
+            "pipelineUuid": f"pipeline_{random_pools.hex_string(8)}",
             "pipelineSlug": random.choice(PIPELINES),
             "subject": {
                 "type": "Pipeline",
-                "uuid": f"pipeline_{uuid.uuid4().hex[:8]}",
+                "uuid": f"pipeline_{random_pools.hex_string(8)}",
                 "name": random.choice(PIPELINES)
             }
         })
@@ -83,16 +91,16 @@ def buildkite_log() -> Dict:
     elif "build" in event_type:
         pipeline = random.choice(PIPELINES)
         event.update({
-            "buildUuid": f"build_{uuid.uuid4().hex[:8]}",
+            "buildUuid": f"build_{random_pools.hex_string(8)}",
             "buildNumber": random.randint(1, 1000),
             "buildState": random.choice(BUILD_STATES),
             "pipelineSlug": pipeline,
             "branch": random.choice(["main", "develop", "feature/new-feature", "hotfix/bug-fix"]),
-            "commit": uuid.uuid4().hex[:7],
+            "commit": random_pools.hex_string(7),
             "message": f"Update {pipeline} configuration",
             "subject": {
                 "type": "Build",
-                "uuid": f"build_{uuid.uuid4().hex[:8]}",
+                "uuid": f"build_{random_pools.hex_string(8)}",
                 "number": random.randint(1, 1000),
                 "url": f"https://buildkite.com/acme-corp/{pipeline}/builds/{random.randint(1, 1000)}"
             }
@@ -100,12 +108,12 @@ def buildkite_log() -> Dict:
         
     elif "agent" in event_type:
         event.update({
-            "agentUuid": f"agent_{uuid.uuid4().hex[:8]}",
+            "agentUuid": f"agent_{random_pools.hex_string(8)}",
             "agentName": f"build-agent-{random.randint(1, 10)}",
             "agentHostname": f"agent-{random.randint(1, 10)}.buildkite.local",
             "subject": {
                 "type": "Agent",
-                "uuid": f"agent_{uuid.uuid4().hex[:8]}",
+                "uuid": f"agent_{random_pools.hex_string(8)}",
                 "name": f"build-agent-{random.randint(1, 10)}"
             }
         })
@@ -118,12 +126,12 @@ def buildkite_log() -> Dict:
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
                 "Mozilla/5.0 (X11; Linux x86_64)"
             ]),
-            "sessionUuid": f"session_{uuid.uuid4().hex[:8]}"
+            "sessionUuid": f"session_{random_pools.hex_string(8)}"
         })
     
     elif "api_key" in event_type:
         event.update({
-            "apiKeyUuid": f"key_{uuid.uuid4().hex[:8]}",
+            "apiKeyUuid": f"key_{random_pools.hex_string(8)}",
             "apiKeyDescription": random.choice([
                 "CI/CD Integration",
                 "Monitoring Dashboard",
@@ -132,13 +140,13 @@ def buildkite_log() -> Dict:
             ]),
             "subject": {
                 "type": "APIKey",
-                "uuid": f"key_{uuid.uuid4().hex[:8]}"
+                "uuid": f"key_{random_pools.hex_string(8)}"
             }
         })
     
     # Add context data
     event["context"] = {
-        "requestId": str(uuid.uuid4()),
+        "requestId": random_pools.uuid4(),
         "userAgent": "buildkite-webhook/1.0"
     }
     
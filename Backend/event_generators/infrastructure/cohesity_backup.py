@@ -4,7 +4,15 @@ Cohesity backup event generator
 Generates synthetic Cohesity backup system events in syslog format
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "kv"
 
 # SentinelOne AI-SIEM specific field attributes
 # Job names
@@ -35,7 +43,7 @@ MESSAGES = [
 
 def cohesity_backup_log() -> str:
     """Generate a single Cohesity backup event log in syslog format"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     timestamp = event_time.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -4,7 +4,16 @@ GitHub audit log event generator
 Generates synthetic GitHub audit logs in syslog format
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 # Actions
@@ -43,11 +52,11 @@ USERS = [
 
 def generate_ip() -> str:
     """Generate IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def github_audit_log():
     """Generate a single GitHub audit event in JSON format for parse=gron"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     timestamp = event_time.strftime("%Y-%m-%dT%H:%M:%SZ")
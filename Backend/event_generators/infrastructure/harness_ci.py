@@ -4,7 +4,15 @@ Harness CI/CD event generator
 Generates synthetic Harness CI/CD pipeline events in syslog format
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "kv"
 
 # Pipelines
 PIPELINES = ["pipeline-123", "pipeline-456", "pipeline-789", "frontend-build", "backend-deploy"]
@@ -29,7 +37,7 @@ MESSAGES = [
 
 def harness_ci_log():
     """Generate a single Harness CI/CD event log in syslog format"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     timestamp = event_time.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -6,8 +6,17 @@ Generates synthetic IIS web server logs
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # HTTP methods
 HTTP_METHODS = ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH"]
@@ -54,7 +63,7 @@ COMPUTER_NAMES = ["WEB01", "WEB02", "IIS-PROD", "IIS-TEST"]
 
 def generate_ip() -> str:
     """Generate IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def generate_server_ip() -> str:
     """Generate server IP address (usually private)"""
@@ -73,7 +82,7 @@ def generate_query_string() -> str:
 
 def iis_w3c_log() -> Dict:
     """Generate a single Microsoft IIS W3C log event"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     method = random.choice(HTTP_METHODS)
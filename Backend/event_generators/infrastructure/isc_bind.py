@@ -4,7 +4,15 @@ ISC BIND DNS event generator
 Generates synthetic ISC BIND DNS query logs
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 HOSTNAMES = [
     "www.akamai.com", "mail.example.org", "update.example.org", 
@@ -30,7 +38,7 @@ def generate_connection_uid():
 
 def isc_bind_log() -> dict:
     """Generate a single ISC BIND DNS query log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(seconds=random.randint(0, 3600))
     
     # Generate log components
@@ -4,7 +4,16 @@ ISC DHCP event generator
 Generates synthetic ISC DHCP server logs
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 DHCP_TYPES = ["DHCPDISCOVER", "DHCPOFFER", "DHCPREQUEST", "DHCPACK", "DHCPRELEASE"]
 INTERFACES = ["eth0", "eth1", "wlan0", "br0"]
@@ -12,7 +21,7 @@ HOSTNAMES = ["desktop01", "laptop02", "printer01", "phone03", "tablet01", None]
 
 def generate_mac():
     """Generate a MAC address."""
-    return f"{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}"
+    return random_pools.mac()
 
 def generate_ip():
     """Generate an IP address in 192.168.1.x range."""
@@ -20,7 +29,7 @@ def generate_ip():
 
 def isc_dhcp_log() -> dict:
     """Generate a single ISC DHCP server log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(seconds=random.randint(0, 3600))
     
     # Generate DHCP sequence (DISCOVER -> OFFER -> REQUEST -> ACK)
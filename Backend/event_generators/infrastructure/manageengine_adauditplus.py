@@ -7,14 +7,21 @@ Generates synthetic Manageengine Adauditplus Logs security events for testing
 import random
 import time
 import json
-from datetime import datetime, timezone
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 def manageengine_adauditplus_log():
     """Generate a synthetic Manageengine Adauditplus Logs log event."""
     
     # Timestamp 
-    timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    timestamp = event_clock.stamp("iso_us")
     
     # Base event structure
     event = {
@@ -6,8 +6,16 @@ Generates synthetic ManageEngine IT management and security events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 # ManageEngine products
 PRODUCTS = [
@@ -93,7 +101,7 @@ def generate_ip() -> str:
 
 def manageengine_general_log() -> Dict:
     """Generate a single ManageEngine event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     product = random.choice(PRODUCTS)
@@ -6,8 +6,16 @@ Generates synthetic SAP ERP, HANA, and security audit events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 # SAP modules and transaction codes
 SAP_MODULES = {
@@ -69,7 +77,7 @@ def generate_ip() -> str:
 
 def sap_log() -> Dict:
     """Generate a single SAP event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     event_info = random.choice(EVENT_TYPES)
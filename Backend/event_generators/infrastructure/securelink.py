@@ -6,8 +6,17 @@ Generates synthetic SecureLink privileged remote access events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Event types
 EVENT_TYPES = [
@@ -51,11 +60,11 @@ RISK_LEVELS = ["Low", "Medium", "High", "Critical"]
 
 def generate_ip() -> str:
     """Generate a random IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def securelink_log() -> Dict:
     """Generate a single SecureLink event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     event_info = random.choice(EVENT_TYPES)
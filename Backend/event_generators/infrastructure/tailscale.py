@@ -7,9 +7,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Event types
 EVENT_TYPES = ["configuration", "network"]
@@ -91,15 +99,15 @@ def _generate_ip(internal: bool = True) -> str:
         # Tailscale CGNAT range
         return f"100.{random.randint(64, 127)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_node_id() -> str:
     """Generate a Tailscale node ID"""
-    return f"n{uuid.uuid4().hex[:16]}CNTRL"
+    return f"n{random_pools.hex_string(16)}CNTRL"
 
 def _generate_user_id() -> str:
     """Generate a Tailscale user ID"""
-    return f"u{uuid.uuid4().hex[:16]}CNTRL"
+    return f"u{random_pools.hex_string(16)}CNTRL"
 
 def _generate_tailnet() -> str:
     """Generate a tailnet name"""
@@ -129,7 +137,7 @@ def tailscale_log(overrides: dict | None = None) -> Dict:
 
 def _generate_config_event() -> Dict:
     """Generate a configuration/audit event"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Select action and target
@@ -147,7 +155,7 @@ def _generate_config_event() -> Dict:
         }
     elif actor_type == "apikey":
         actor = {
-            "id": f"api_{uuid.uuid4().hex[:8]}",
+            "id": f"api_{random_pools.hex_string(8)}",
             "loginName": "API Key",
             "displayName": f"API Key - {random.choice(['CI/CD', 'Monitoring', 'Automation'])}",
             "type": "apikey"
@@ -162,7 +170,7 @@ def _generate_config_event() -> Dict:
     
     # Generate target based on type
     target = {
-        "id": _generate_node_id() if target_type == "machine" else str(uuid.uuid4()),
+        "id": _generate_node_id() if target_type == "machine" else random_pools.uuid4(),
         "name": _generate_target_name(target_type),
         "type": target_type
     }
@@ -172,7 +180,7 @@ def _generate_config_event() -> Dict:
         target["property"] = random.choice(PROPERTIES)
     
     event = {
-        "eventGroupID": str(uuid.uuid4()),
+        "eventGroupID": random_pools.uuid4(),
         "tailnet": _generate_tailnet(),
         "action": action,
         "actor": actor,
@@ -188,9 +196,9 @@ def _generate_config_event() -> Dict:
     # Add additional fields based on target type
     if target_type == "machine" and action in ["CREATE", "UPDATE"]:
         event["info"] = {
-            "nodeKey": f"nodekey:{uuid.uuid4().hex}",
-            "machineKey": f"mkey:{uuid.uuid4().hex}",
-            "discoKey": f"discokey:{uuid.uuid4().hex}",
+            "nodeKey": f"nodekey:{random_pools.hex_string(32)}",
+            "machineKey": f"mkey:{random_pools.hex_string(32)}",
+            "discoKey": f"discokey:{random_pools.hex_string(32)}",
             "ephemeral": random.random() < 0.1,
             "tags": _generate_tags()
         }
@@ -199,7 +207,7 @@ def _generate_config_event() -> Dict:
 
 def _generate_network_event() -> Dict:
     """Generate a network flow log event"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     start_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Determine if this is exit traffic or regular traffic
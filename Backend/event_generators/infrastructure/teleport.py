@@ -6,9 +6,17 @@ Generates synthetic Teleport audit and session events
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Teleport event types
 EVENT_TYPES = [
@@ -50,7 +58,7 @@ K8S_NAMESPACES = ["default", "production", "staging", "development", "kube-syste
 
 def teleport_log() -> Dict:
     """Generate a single Teleport event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     event_type = random.choice(EVENT_TYPES)
@@ -58,7 +66,7 @@ def teleport_log() -> Dict:
     # Base event structure
     event = {
         "event": event_type,
-        "uid": str(uuid.uuid4()),
+        "uid": random_pools.uuid4(),
         "time": event_time.isoformat() + "Z",
         "user": random.choice(USERS),
         "cluster_name": "teleport.company.com"
@@ -66,11 +74,11 @@ def teleport_log() -> Dict:
     
     # Add event-specific fields
     if "session" in event_type:
-        session_id = str(uuid.uuid4())
+        session_id = random_pools.uuid4()
         event.update({
             "sid": session_id,
             "namespace": "default",
-            "server_id": str(uuid.uuid4()),
+            "server_id": random_pools.uuid4(),
             "server_hostname": random.choice(NODES),
             "server_addr": f"10.0.{random.randint(1, 10)}.{random.randint(1, 254)}:22",
             "session_recording": "node",
@@ -110,7 +118,7 @@ def teleport_log() -> Dict:
     
     elif event_type == "exec":
         event.update({
-            "sid": str(uuid.uuid4()),
+            "sid": random_pools.uuid4(),
             "server_hostname": random.choice(NODES),
             "command": random.choice([
                 "ls -la",
@@ -184,7 +192,7 @@ def teleport_log() -> Dict:
     # Add metadata
     event["metadata"] = {
         "origin": random.choice(["web", "cli", "api"]),
-        "session_id": str(uuid.uuid4()) if "session" not in event_type else event.get("sid")
+        "session_id": random_pools.uuid4() if "session" not in event_type else event.get("sid")
     }
     
     return event
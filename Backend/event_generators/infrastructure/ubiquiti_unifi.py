@@ -6,8 +6,17 @@ Generates synthetic UniFi network equipment events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Device types
 DEVICE_TYPES = ["UAP", "USW", "UDM", "USG", "UCK"]
@@ -35,7 +44,7 @@ SSIDS = ["HomeWiFi", "GuestNetwork", "IoT", "Office", "Staff"]
 
 def generate_mac() -> str:
     """Generate a random MAC address"""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+    return random_pools.mac()
 
 def generate_ip() -> str:
     """Generate a random IP address"""
@@ -43,7 +52,7 @@ def generate_ip() -> str:
 
 def ubiquiti_unifi_log() -> Dict:
     """Generate a single UniFi event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     event_info = random.choice(EVENT_TYPES)
@@ -103,14 +112,14 @@ def ubiquiti_unifi_log() -> Dict:
             "gw": f"UDM-{random.choice(['Pro', 'Base', 'SE'])}",
             "gw_name": f"Gateway-{random.randint(1, 5)}",
             "gw_mac": generate_mac(),
-            "wan_ip": f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}",
+            "wan_ip": random_pools.external_ipv4(),
             "lan_ip": generate_ip()
         })
     
     # Add security event specific fields
     if event_info["category"] == "security":
         event.update({
-            "source_ip": generate_ip() if random.choice([True, False]) else f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}",
+            "source_ip": generate_ip() if random.choice([True, False]) else random_pools.external_ipv4(),
             "dest_ip": generate_ip(),
             "source_port": random.randint(1024, 65535),
             "dest_port": random.choice([22, 23, 80, 443, 53, 25, 993, 995]),
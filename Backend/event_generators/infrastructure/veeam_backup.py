@@ -4,8 +4,16 @@ Veeam Backup event generator
 Generates synthetic Veeam backup system events
 """
 import random
-from datetime import datetime, timezone, timedelta
-import uuid
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 JOB_NAMES = [
     "Daily_Exchange_Backup", "Weekly_SQL_Backup", "VMware_Prod_Backup",
@@ -23,7 +31,7 @@ ERROR_MESSAGES = [
 ]
 
 def generate_session_id():
-    return str(uuid.uuid4())
+    return random_pools.uuid4()
 
 def generate_duration():
     hours = random.randint(0, 8)
@@ -38,7 +46,7 @@ def generate_size():
 
 def veeam_backup_log() -> dict:
     """Generate a single Veeam backup event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 480))
     
     job_id = random.randint(1, 10)
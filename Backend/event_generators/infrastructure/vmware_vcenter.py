@@ -2,8 +2,13 @@
 """Generate synthetic VMware vCenter logs."""
 import json
 import random
-from datetime import datetime, timezone, timedelta
 import time
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
 
 # VMware vCenter event types and components
 COMPONENTS = ["vpxd", "vapi-endpoint", "eam", "sso-adminserver", "envoy", "content-library", "vpxd-svcs", "vsan-health"]
@@ -42,7 +47,7 @@ def generate_chain_id():
 
 def generate_vpxd_log():
     """Generate a vpxd (vCenter Server) log entry."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_type = random.choice(EVENT_TYPES)
     
     # Map event types to descriptions
@@ -83,7 +88,7 @@ def generate_vpxd_log():
 
 def generate_vapi_endpoint_log():
     """Generate a vAPI endpoint access log."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     # HTTP access log format
     ip = get_random_ip()
@@ -117,7 +122,7 @@ def generate_vapi_endpoint_log():
 
 def generate_sso_log():
     """Generate an SSO admin server log."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     messages = [
         "User authentication successful",
@@ -144,7 +149,7 @@ def generate_sso_log():
 
 def generate_envoy_access_log():
     """Generate an Envoy proxy access log matching parser format."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     # Match parser format: envoy-access-1 format
     # .*$createdTime=tzPattern$ $severity$ $process_name$[$process_id$] [$originater_id$ sub=$sub$] $request_timestamp=tzPattern$ $method$ $uri{parse=uri}$ $protocol$ $status$ $code_details$ $flags$ $bytes_received$ $bytes_sent$ $duration$ $resp_upstream_service_time=number$ $x_forwarded_for$ $upstream_host$ $upstream_local_address$ $downstream_local_address$ $downstream_remote_address$ $req_server_name$ $route_name$
@@ -192,7 +197,7 @@ def generate_envoy_access_log():
 
 def vmware_vcenter_log(overrides: dict | None = None) -> str:
     """Generate a single VMware vCenter log entry."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     # Select component and generate appropriate log
     component = random.choices(
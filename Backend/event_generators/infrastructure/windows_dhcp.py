@@ -6,8 +6,15 @@ Generates DHCP server log events in CSV format
 from __future__ import annotations
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timezone, timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
 
 # DHCP Event IDs and descriptions
 DHCP_EVENTS = {
@@ -77,7 +84,7 @@ def _generate_ipv6() -> str:
 
 def _generate_mac() -> str:
     """Generate MAC address"""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+    return random_pools.mac()
 
 def _generate_transaction_id() -> str:
     """Generate DHCP transaction ID"""
@@ -94,7 +101,7 @@ def windows_dhcp_log(overrides: dict | None = None) -> str:
     Pass `overrides` to force any field to a specific value:
         windows_dhcp_log({"eventId": "10"})
     """
-    now = datetime.now()
+    now = event_clock.utcnow()
     event_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Select event type
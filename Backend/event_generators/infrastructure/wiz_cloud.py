@@ -4,10 +4,17 @@ Wiz Cloud Security event generator
 """
 from __future__ import annotations
 import random
-import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 def wiz_cloud_log() -> Dict:
     """Generate Wiz Cloud Security audit event"""
@@ -119,10 +126,10 @@ def wiz_cloud_log() -> Dict:
     ]
     
     # Generate event data
-    event_id = str(uuid.uuid4())
-    request_id = str(uuid.uuid4())
+    event_id = random_pools.uuid4()
+    request_id = random_pools.uuid4()
     # Generate events from last 10 minutes for recent timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(seconds=random.randint(0, 600))
     timestamp = event_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ')[:-3] + 'Z'
     action_info = random.choice(actions)
@@ -178,7 +185,7 @@ def wiz_cloud_log() -> Dict:
     # Create the body content with OCSF-compliant event
     body_content = {
         "timestamp": timestamp,
-        "time": int(time.time() * 1000),
+        "time": int(event_clock.now() * 1000),
         "class_uid": 8002,
         "class_name": "Cloud Activity",
         "category_uid": 8,
@@ -14,11 +14,18 @@ Usage examples
 >>> print(zscaler_log({"protocol": "FTP"}))    # override any field
 """
 
-from datetime import datetime, timezone
-from ipaddress import IPv4Address
-import json
 import random
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+from hec_json import dumps as json_dumps, dumps_bytes as json_dumps_bytes  # orjson-backed when installed
+
+OUTPUT_KIND = "json"
 
 # ────────────────── threat & auxiliary lookup tables ────────────────────
 _THREATS = [
@@ -35,11 +42,11 @@ _UNSCANNABLES = ["", "Corrupted archive", "Encrypted file",
 # ───────────────────────── helpers ──────────────────────────
 def _now_iso() -> str:
     """Return current UTC time in Zscaler/ISO format."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return event_clock.stamp("iso")
 
 def _rand_ip() -> str:
     """Return a pseudo‑random IPv4 address."""
-    return str(IPv4Address(random.getrandbits(32)))
+    return random_pools.external_ipv4()
 
 # ───────────────────── base template ───────────────────────
 _ZS_TEMPLATE: dict[str, object] = {
@@ -112,13 +119,8 @@ _BAD_URLS = [
 ]
 
 # ───────────────────── public factory ──────────────────────
-def zscaler_log(overrides: dict | None = None) -> str:
-    """
-    Return a single Zscaler NSS‑Web event as a JSON string.
-
-    Pass a dict of overrides to customise any field:
-        zscaler_log({"protocol": "FTP", "action": "Blocked"})
-    """
+def _build_event(overrides: dict | None = None) -> Dict:
+    """Event dict behind ``zscaler_log()``."""
     record = {**_ZS_TEMPLATE, "datetime": _now_iso()}
     if overrides:
         record.update(overrides)
@@ -168,7 +170,20 @@ def zscaler_log(overrides: dict | None = None) -> str:
     if random.random() < 0.10:
         record["bwthrottle"] = "Throttled"
 
-    return json.dumps(record)
+    return record
+
+def zscaler_log(overrides: dict | None = None) -> str:
+    """
+    Return a single Zscaler NSS‑Web event as a JSON string.
+
+    Pass a dict of overrides to customise any field:
+        zscaler_log({"protocol": "FTP", "action": "Blocked"})
+    """
+    return json_dumps(_build_event(overrides))
+
+def zscaler_log_bytes(overrides: dict | None = None) -> bytes:
+    """``zscaler_log()`` as UTF-8 JSON bytes, without the intermediate ``str``."""
+    return json_dumps_bytes(_build_event(overrides))
 
 def zscaler_nss_log(overrides: dict | None = None) -> str:
     """
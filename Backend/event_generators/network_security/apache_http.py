@@ -2,7 +2,15 @@
 """Generate synthetic Apache HTTP Server access logs."""
 import json
 import random
-from datetime import datetime, timezone
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "text"
 
 # Apache Common Log Format (CLF) / Combined Log Format
 
@@ -44,7 +52,7 @@ def get_random_ip():
     if random.random() < 0.8:  # 80% internal IPs
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:  # 20% external IPs
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def get_response_size(status_code, path):
     """Get appropriate response size based on status and path."""
@@ -61,7 +69,7 @@ def get_response_size(status_code, path):
 
 def apache_http_log(overrides: dict | None = None) -> str:
     """Generate a single Apache HTTP access log entry in Common Log Format."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     # Select status code based on weights
     status_code = random.choices(
@@ -7,9 +7,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "syslog"
 
 # Event types
 EVENT_TYPES = [
@@ -89,11 +97,11 @@ def _generate_ip(internal: bool = True) -> str:
             f"192.168.{random.randint(0, 255)}.{random.randint(1, 254)}"
         ])
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_mac() -> str:
     """Generate a MAC address"""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+    return random_pools.mac()
 
 def _generate_device_id() -> str:
     """Generate an Armis device ID"""
@@ -107,7 +115,7 @@ def armis_log(overrides: dict | None = None) -> str:
         armis_log({"type": "Alert", "severity": "Critical"})
     """
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     timestamp = now - timedelta(seconds=random.randint(0, 300))
     
     # Select event type
@@ -115,7 +123,7 @@ def armis_log(overrides: dict | None = None) -> str:
     
     # Generate base event
     event = {
-        "id": str(uuid.uuid4()),
+        "id": random_pools.uuid4(),
         "type": event_type,
         "_time": timestamp.isoformat() + "Z",
         "time": int(timestamp.timestamp()),
@@ -2,7 +2,13 @@
 """Generate synthetic Aruba ClearPass Policy Manager logs."""
 import json
 import random
-from datetime import datetime, timezone
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
 
 # ClearPass log types and categories
 LOG_TYPES = [
@@ -27,7 +33,7 @@ def get_random_ip():
 
 def get_random_mac():
     """Generate a random MAC address."""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+    return random_pools.mac()
 
 def generate_session_log():
     """Generate a Common Session Log entry."""
@@ -82,7 +88,7 @@ def generate_audit_log():
 
 def aruba_clearpass_log(overrides: dict | None = None) -> str:
     """Generate a single Aruba ClearPass log entry in expected syslog format."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     log_type = random.choice(LOG_TYPES)
     
     # Generate syslog format matching parser expectations
@@ -2,9 +2,17 @@
 """Generate synthetic Check Point Firewall logs in JSON format for marketplace parser."""
 import json
 import random
-from datetime import datetime, timezone
 import time
-import uuid
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import bulk_random  # event_generators/shared, NumPy-backed when installed
+import random_pools
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 # Check Point log fields and values
@@ -16,6 +24,19 @@ PRODUCTS = ["VPN-1 & FireWall-1", "Threat Prevention", "URL Filtering", "Applica
 BLADES = ["fw", "ips", "urlf", "appi", "av", "ab", "dlp", "vpn"]
 ORIGINS = ["fw01", "fw02", "cluster-1", "sg80", "sg5000", "mgmt-server"]
 THREAT_TYPES = ["Malware", "Trojan", "Botnet", "Phishing", "SQL Injection", "XSS", "DDoS", "Ransomware"]
+ATTACKS = [
+    "Malformed Packet", "Port Scan", "SQL Injection",
+    "Cross Site Scripting", "Buffer Overflow", "Malware",
+    "Trojan", "Botnet Communication", "Brute Force"
+]
+ALLOWED_ACTIONS = {"Accept", "Allow", "Encrypt", "Monitor"}
+BLOCKED_ACTIONS = {"Drop", "Block", "Reject"}
+TCP_SERVICES = {"http", "https", "ssh", "ftp", "smtp", "rdp", "smb", "ldap"}
+SERVICE_PORTS = {
+    "http": 80, "https": 443, "ssh": 22, "ftp": 21, "smtp": 25,
+    "dns": 53, "telnet": 23, "rdp": 3389, "smb": 445, "ldap": 389,
+    "ntp": 123, "snmp": 161
+}
 
 def get_random_ip(internal_probability=0.5):
     """Generate a random IP address."""
@@ -28,24 +49,19 @@ def get_random_ip(internal_probability=0.5):
         ])
     else:
         # External IP
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def get_port_for_service(service):
     """Get standard port for a service."""
-    port_map = {
-        "http": 80, "https": 443, "ssh": 22, "ftp": 21, "smtp": 25,
-        "dns": 53, "telnet": 23, "rdp": 3389, "smb": 445, "ldap": 389,
-        "ntp": 123, "snmp": 161
-    }
-    return port_map.get(service, random.randint(1024, 65535))
+    return SERVICE_PORTS.get(service, random.randint(1024, 65535))
 
 def checkpoint_log(overrides: dict | None = None) -> dict:
     """Generate a single Check Point Firewall log entry in JSON format."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     # Determine action and related fields
     action = random.choice(ACTIONS)
-    is_allowed = action in ["Accept", "Allow", "Encrypt", "Monitor"]
+    is_allowed = action in ALLOWED_ACTIONS
     
     # Generate source and destination IPs
     src_ip = get_random_ip(internal_probability=0.7 if is_allowed else 0.3)
@@ -53,7 +69,7 @@ def checkpoint_log(overrides: dict | None = None) -> dict:
     
     # Select service and protocol
     service = random.choice(SERVICES)
-    proto = "tcp" if service in ["http", "https", "ssh", "ftp", "smtp", "rdp", "smb", "ldap"] else random.choice(PROTOCOLS)
+    proto = "tcp" if service in TCP_SERVICES else random.choice(PROTOCOLS)
     
     # Generate ports
     if proto in ["tcp", "udp"]:
@@ -78,13 +94,13 @@ def checkpoint_log(overrides: dict | None = None) -> dict:
         "s_port": src_port,
         "d_port": dst_port if dst_port else 0,
         "rule": random.choice(RULES),
-        "rule_uid": f"{uuid.uuid4()}",
+        "rule_uid": f"{random_pools.uuid4()}",
         "rule_name": random.choice(RULES),
         "product": random.choice(PRODUCTS),
         "blade": random.choice(BLADES),
         "ifdir": random.choice(["inbound", "outbound"]),
         "ifname": random.choice(["eth0", "eth1", "eth2", "bond0", "Internal", "External"]),
-        "loguid": f"{uuid.uuid4()}",
+        "loguid": f"{random_pools.uuid4()}",
         "version": "5",
         "fw_subproduct": "VPN-1",
         "policy_id_tag": "Standard",
@@ -101,13 +117,9 @@ def checkpoint_log(overrides: dict | None = None) -> dict:
     }
     
     # Add threat-specific fields for certain actions
-    if action in ["Drop", "Block", "Reject"] and random.random() < 0.5:
+    if action in BLOCKED_ACTIONS and random.random() < 0.5:
         log_entry.update({
-            "attack": random.choice([
-                "Malformed Packet", "Port Scan", "SQL Injection", 
-                "Cross Site Scripting", "Buffer Overflow", "Malware",
-                "Trojan", "Botnet Communication", "Brute Force"
-            ]),
+            "attack": random.choice(ATTACKS),
             "severity": random.choice(["Critical", "High", "Medium", "Low"]),
             "confidence_level": random.randint(1, 5),
             "protection_type": "IPS",
@@ -122,6 +134,117 @@ def checkpoint_log(overrides: dict | None = None) -> dict:
     
     return log_entry
 
+def checkpoint_log_batch(n: int, overrides: dict | None = None) -> list[dict]:
+    """``n`` entries shaped like ``checkpoint_log()``, every random column drawn in one call."""
+    now = event_clock.utcnow()
+    time_str = now.isoformat()
+    timestamp = int(now.timestamp() * 1000)
+
+    actions = bulk_random.choice(ACTIONS, n)
+    allowed = [action in ALLOWED_ACTIONS for action in actions]
+    rolls = bulk_random.uniform(n, 0.0, 1.0)
+    src_ips = bulk_random.ipv4_where([r < (0.7 if ok else 0.3) for r, ok in zip(rolls, allowed)])
+    rolls = bulk_random.uniform(n, 0.0, 1.0)
+    dst_ips = bulk_random.ipv4_where([r < (0.3 if ok else 0.7) for r, ok in zip(rolls, allowed)])
+    services = bulk_random.choice(SERVICES, n)
+    protos = [
+        "tcp" if service in TCP_SERVICES else proto
+        for service, proto in zip(services, bulk_random.choice(PROTOCOLS, n))
+    ]
+    uids = bulk_random.uuid4_strings(2 * n)
+    nat = zip(bulk_random.chance(n, 0.3), bulk_random.integers(n, 1, 100))
+    threat = [
+        action in BLOCKED_ACTIONS and hit
+        for action, hit in zip(actions, bulk_random.chance(n, 0.5))
+    ]
+
+    columns = zip(
+        actions, allowed, src_ips, dst_ips, services, protos,
+        bulk_random.integers(n, 1024, 65535),
+        bulk_random.choice(ORIGINS, n),
+        bulk_random.choice(RULES, n),
+        bulk_random.choice(RULES, n),
+        bulk_random.choice(PRODUCTS, n),
+        bulk_random.choice(BLADES, n),
+        bulk_random.choice(["inbound", "outbound"], n),
+        bulk_random.choice(["eth0", "eth1", "eth2", "bond0", "Internal", "External"], n),
+        nat,
+        bulk_random.integers(n, 100, 1000000),
+        bulk_random.integers(n, 40, 1500),
+        bulk_random.integers(n, 1, 1000),
+        bulk_random.integers(n, 1, 10),
+        bulk_random.integers(n, 0, 300),
+        bulk_random.integers(n, 1, 5),
+        bulk_random.integers(n, 1, 1000000),
+        range(0, 2 * n, 2),
+    )
+    logs = []
+    for (action, is_allowed, src_ip, dst_ip, service, proto, src_port, origin, rule, rule_name,
+         product, blade, ifdir, ifname, (nat_hit, nat_num), allowed_bytes, blocked_bytes,
+         allowed_packets, blocked_packets, elapsed, host, seq, k) in columns:
+        if proto in ("tcp", "udp"):
+            dst_port = SERVICE_PORTS[service]
+        else:
+            dst_port = src_port = 0
+        logs.append({
+            "time": time_str,
+            "timestamp": timestamp,
+            "orig": src_ip,
+            "origin": origin,
+            "action": action,
+            "src": src_ip,
+            "dst": dst_ip,
+            "proto": proto,
+            "service": service,
+            "service_id": str(dst_port) if dst_port else "",
+            "s_port": src_port,
+            "d_port": dst_port,
+            "rule": rule,
+            "rule_uid": uids[k],
+            "rule_name": rule_name,
+            "product": product,
+            "blade": blade,
+            "ifdir": ifdir,
+            "ifname": ifname,
+            "loguid": uids[k + 1],
+            "version": "5",
+            "fw_subproduct": "VPN-1",
+            "policy_id_tag": "Standard",
+            "nat_rulenum": nat_num if nat_hit else 0,
+            "nat_addtnl_rulenum": 0,
+            "bytes": allowed_bytes if is_allowed else blocked_bytes,
+            "packets": allowed_packets if is_allowed else blocked_packets,
+            "elapsed": elapsed if is_allowed else 0,
+            "hostname": f"checkpoint-{host}.company.com",
+            "sequencenum": seq,
+            "type": "log",
+            "vendor": "Check Point",
+            "product_family": "Network Security"
+        })
+
+    # Threat fields, drawn only for the blocked entries that get them
+    hits = [log for log, flag in zip(logs, threat) if flag]
+    for log, attack, severity, confidence, name in zip(
+            hits,
+            bulk_random.choice(ATTACKS, len(hits)),
+            bulk_random.choice(["Critical", "High", "Medium", "Low"], len(hits)),
+            bulk_random.integers(len(hits), 1, 5),
+            bulk_random.choice(THREAT_TYPES, len(hits))):
+        log.update({
+            "attack": attack,
+            "severity": severity,
+            "confidence_level": confidence,
+            "protection_type": "IPS",
+            "malware_action": "Blocked",
+            "threat_prevention": True,
+            "threat_name": name
+        })
+
+    if overrides:
+        for log in logs:
+            log.update(overrides)
+    return logs
+
 if __name__ == "__main__":
     # Generate sample logs in JSON format
     print("Check Point NGFW JSON Format Examples:")
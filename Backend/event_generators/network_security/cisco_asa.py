@@ -3,9 +3,17 @@
 Cisco ASA syslog event generator (flattened for S1 parser)
 """
 from __future__ import annotations
-import random, time
-from datetime import datetime, timezone
+import random
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+from field_template import compile_text  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "syslog"
 
 _PRI = "<166>"                       # local4.info
 _HOST = "asa-demo"
@@ -27,9 +35,8 @@ _LOG_TEMPLATES = [
     ),
 ]
 
-def _iso(t: float) -> str:
-    # Include the 4‑digit year so the output matches the parser’s tsPattern (MMM DD YYYY HH:MM:SS)
-    return datetime.fromtimestamp(t, timezone.utc).strftime("%b %d %Y %H:%M:%S")
+# Whole lines, syslog header included, compiled once
+_LINES = [compile_text(f"{_PRI}{{ts}} {_HOST} : {tag}: {body}") for tag, body in _LOG_TEMPLATES]
 
 def asa_log() -> str:
     """
@@ -37,8 +44,8 @@ def asa_log() -> str:
     This lets downstream pipelines feed the line directly into the
     SentinelOne ASA parser without needing a payloadSelector.
     """
-    now = time.time()
-    ts_str = _iso(now)
+    # Include the 4‑digit year so the output matches the parser’s tsPattern (MMM DD YYYY HH:MM:SS)
+    ts_str = event_clock.stamp("cef")
 
     # Example addresses/ports — swap for real or larger pools as desired
     src_ip = "192.0.2.10"
@@ -47,15 +54,11 @@ def asa_log() -> str:
     dst_port = 443
     conn_id = random.randint(100000, 999999)
 
-    tag, body_template = random.choice(_LOG_TEMPLATES)
-    syslog_msg = (
-        f"{_PRI}{ts_str} {_HOST} : {tag}: "
-        + body_template.format(
-            conn_id=conn_id,
-            src_ip=src_ip,
-            src_port=src_port,
-            dst_ip=dst_ip,
-            dst_port=dst_port,
-        )
-    )
-    return syslog_msg
\ No newline at end of file
+    return random.choice(_LINES).render_map({
+        "ts": ts_str,
+        "conn_id": conn_id,
+        "src_ip": src_ip,
+        "src_port": src_port,
+        "dst_ip": dst_ip,
+        "dst_port": dst_port,
+    })
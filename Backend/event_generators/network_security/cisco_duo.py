@@ -5,9 +5,15 @@ Cisco Duo MFA event generator
 from __future__ import annotations
 import json
 import random
-import time
-from datetime import datetime, timezone
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 def cisco_duo_log() -> Dict:
     """Generate Cisco Duo MFA authentication event"""
@@ -51,7 +57,7 @@ def cisco_duo_log() -> Dict:
     ]
     
     # Generate event data
-    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    timestamp = event_clock.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
     username = random.choice(usernames)
     factor = random.choice(factors)
     result = random.choices(results, weights=[r["weight"] for r in results], k=1)[0]
@@ -92,7 +98,7 @@ def cisco_duo_log() -> Dict:
     # Create OCSF-compliant event
     event = {
         "timestamp": timestamp,
-        "time": int(time.time() * 1000),
+        "time": int(event_clock.now() * 1000),
         "class_uid": 3002,
         "class_name": "Authentication",
         "category_uid": 3,
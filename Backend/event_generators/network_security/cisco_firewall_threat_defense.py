@@ -7,8 +7,15 @@ Generates synthetic Cisco FTD syslog events matching official SentinelOne parser
 import random
 import time
 import json
-import uuid
-from datetime import datetime, timezone
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 def cisco_firewall_threat_defense_log():
@@ -47,7 +54,7 @@ def cisco_firewall_threat_defense_log():
     event_type = random.choice(event_types)
     
     # Generate timestamp in syslog format
-    timestamp = datetime.now().strftime("%b %d %H:%M:%S")
+    timestamp = event_clock.stamp("%b %d %H:%M:%S")
     
     # Generate hostname
     hostname = f"ftd-{random.randint(100,999)}"
@@ -55,7 +62,7 @@ def cisco_firewall_threat_defense_log():
     # Generate field values for template
     field_values = {
         "priority": random.choice(["High", "Medium", "Low"]),
-        "device_uuid": str(uuid.uuid4()),
+        "device_uuid": random_pools.uuid4(),
         "src_ip": f"192.168.{random.randint(1,254)}.{random.randint(1,254)}",
         "dst_ip": f"203.0.113.{random.randint(1,254)}",
         "src_port": random.randint(1024, 65535),
@@ -85,7 +92,7 @@ def cisco_firewall_threat_defense_log():
     # Return in format expected by HEC sender
     return {
         "raw": raw_log,
-        "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        "timestamp": event_clock.stamp("iso_us"),
         "vendor": "Cisco",
         "product": "Firewall Threat Defense",
         "event_type": event_type["name"],
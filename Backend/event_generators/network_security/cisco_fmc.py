@@ -6,8 +6,17 @@ Generates synthetic Cisco FMC security and management events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Event types
 EVENT_TYPES = [
@@ -49,11 +58,11 @@ IPS_SIGNATURES = [
 
 def generate_ip() -> str:
     """Generate a random IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def cisco_fmc_log(overrides: dict = None) -> Dict:
     """Generate a single Cisco FMC event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
     event_info = random.choice(EVENT_TYPES)
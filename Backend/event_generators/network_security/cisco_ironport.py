@@ -5,7 +5,16 @@ Generates synthetic Cisco IronPort ESA security logs in JSON format
 """
 import json
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Anti-spam verdicts
 ANTISPAM_VERDICTS = ["Negative", "Positive", "Suspected spam", "Bulk mail", "Marketing"]
@@ -55,7 +64,7 @@ def generate_email() -> str:
 
 def generate_ip() -> str:
     """Generate IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def generate_message_id() -> str:
     """Generate message ID"""
@@ -63,7 +72,7 @@ def generate_message_id() -> str:
 
 def cisco_ironport_log() -> dict:
     """Generate a single Cisco IronPort email security event log in JSON format"""
-    now = datetime.now(timezone.utc) 
+    now = event_clock.utcnow() 
     # Use recent timestamps (last 10 minutes)
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
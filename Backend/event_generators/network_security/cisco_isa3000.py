@@ -6,8 +6,16 @@ Generates synthetic Cisco ISA3000 industrial network security events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 # Event types specific to industrial environments
 EVENT_TYPES = [
@@ -55,7 +63,7 @@ def generate_ip() -> str:
 
 def cisco_isa3000_log() -> Dict:
     """Generate a single Cisco ISA3000 event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     event_info = random.choice(EVENT_TYPES)
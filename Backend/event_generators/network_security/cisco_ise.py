@@ -3,12 +3,21 @@
 Cisco ISE (Identity Services Engine) event generator
 Generates synthetic Cisco ISE authentication and authorization events
 """
-import json
 import random
 import time
 import hashlib
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+from hec_json import dumps as json_dumps, dumps_bytes as json_dumps_bytes  # orjson-backed when installed
+
+OUTPUT_KIND = "json"
 
 # Authentication results
 AUTH_RESULTS = [
@@ -39,15 +48,15 @@ LOCATIONS = ["HQ-Building-A", "HQ-Building-B", "Branch-NYC", "Branch-LON", "Remo
 
 def generate_mac_address() -> str:
     """Generate a random MAC address"""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+    return random_pools.mac()
 
 def generate_ip() -> str:
     """Generate a random IP address"""
     return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
 
-def cisco_ise_log() -> str:
-    """Generate a single Cisco ISE event log"""
-    now = datetime.now(timezone.utc)
+def _build_event() -> Dict:
+    """Event dict behind ``cisco_ise_log()``."""
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     # Select authentication result
@@ -98,7 +107,15 @@ def cisco_ise_log() -> str:
         event["FailedAttempts"] = random.randint(1, 10)
         event["ThreatLevel"] = "High" if event["FailedAttempts"] > 5 else "Medium"
     
-    return json.dumps(event)
+    return event
+
+def cisco_ise_log() -> str:
+    """Generate a single Cisco ISE event log"""
+    return json_dumps(_build_event())
+
+def cisco_ise_log_bytes() -> bytes:
+    """``cisco_ise_log()`` as UTF-8 JSON bytes, without the intermediate ``str``."""
+    return json_dumps_bytes(_build_event())
 
 if __name__ == "__main__":
     # Generate sample events
@@ -3,8 +3,16 @@
 Cisco Meraki MX syslog event generator (vpn_firewall, ip_flow, flows)
 """
 from __future__ import annotations
-import random, time, uuid
+import random, uuid
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 _PRI = "<134>"       # local0.notice
 _DEV = "meraki-mx64"
@@ -21,7 +29,7 @@ def cisco_meraki_log(log_type: str | None = None) -> dict:
     Pass `log_type` to force a specific format, otherwise one is chosen at random.
     """
     log_type = log_type or random.choice(["vpn_firewall", "ip_flow", "flows"])
-    now_unix = int(time.time())
+    now_unix = int(event_clock.now())
     host = _DEV
     priority_code = random.choice([134, 135])  # informational / notice
 
@@ -34,7 +42,7 @@ def cisco_meraki_log(log_type: str | None = None) -> dict:
 
     # Base log structure
     log_entry = {
-        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now_unix)),
+        "timestamp": event_clock.stamp("iso", now_unix),
         "syslog_priority": priority_code,
         "unix_timestamp": now_unix,
         "hostname": host,
@@ -3,11 +3,20 @@
 Cisco Umbrella synthetic log generator
 """
 import json
-import csv, io, random, time, uuid
+import csv, io, random
 from datetime import datetime, timezone, timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "csv"
 
 def _ts():
-    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+    return event_clock.stamp("%Y-%m-%d %H:%M:%S")
 
 def umbrella_proxy_log():
     row = [
@@ -17,7 +26,7 @@ def umbrella_proxy_log():
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
         str(random.choice([200, 302, 403])), str(random.randint(200, 2000)),
         str(random.randint(500, 50000)), str(random.randint(100, 48000)),
-        uuid.uuid4().hex,
+        random_pools.hex_string(32),
         random.choice(["Malware", "Phishing", "None"]),
         str(random.randint(0, 3)), str(random.randint(0, 2)),
         random.choice(["Malicious", "Clean"]),
@@ -53,7 +62,7 @@ def umbrella_dns_log():
 
 def umbrella_audit_log():
     row = [
-        str(uuid.uuid4()), _ts(),
+        random_pools.uuid4(), _ts(),
         f"user{random.randint(1000,9999)}@example.com",
         random.choice(["alice", "bob", "charlie"]),
         random.choice(["LOGIN", "POLICY_UPDATE"]),
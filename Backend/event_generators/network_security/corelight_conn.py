@@ -6,10 +6,18 @@ Generates Zeek/Corelight network connection events
 from __future__ import annotations
 import json
 import random
-import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import bulk_random  # event_generators/shared, NumPy-backed when installed
+import random_pools
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Connection states
 CONN_STATES = [
@@ -65,6 +73,18 @@ COMMON_PORTS = {
     "kafka": 9092
 }
 
+UID_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+UDP_SERVICES = {"dns", "dhcp", "ntp", "snmp"}
+FAILED_STATES = {"S0", "REJ", "RSTOS0"}
+
+# (orig_bytes, resp_bytes) ranges by traffic class, as in corelight_conn_log
+BYTE_RANGES = {
+    "failed": ((40, 200), (0, 100)),
+    "web": ((200, 5000), (500, 500000)),
+    "dns": ((40, 200), (60, 500)),
+    "other": ((40, 50000), (40, 50000)),
+}
+
 def _generate_ip(internal: bool = True) -> str:
     """Generate an IP address"""
     if internal:
@@ -76,7 +96,7 @@ def _generate_ip(internal: bool = True) -> str:
         ])
     else:
         # External IPs
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_uid() -> str:
     """Generate a Zeek connection UID"""
@@ -91,7 +111,7 @@ def corelight_conn_log(overrides: dict | None = None) -> Dict:
         corelight_conn_log({"service": "ssh"})
     """
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     start_time = now - timedelta(seconds=random.randint(0, 300))
     duration = random.uniform(0.001, 120.0)  # Connection duration in seconds
     
@@ -175,8 +195,8 @@ def corelight_conn_log(overrides: dict | None = None) -> Dict:
     
     # Add optional fields
     if protocol == "tcp" and conn_state == "SF":
-        event["orig_l2_addr"] = f"{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}"
-        event["resp_l2_addr"] = f"{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}"
+        event["orig_l2_addr"] = random_pools.mac()
+        event["resp_l2_addr"] = random_pools.mac()
     
     # Apply any overrides
     if overrides:
@@ -184,6 +204,98 @@ def corelight_conn_log(overrides: dict | None = None) -> Dict:
     
     return event
 
+def _traffic_class(service: str, conn_state: str) -> str:
+    if conn_state in FAILED_STATES:
+        return "failed"
+    if service in ("http", "https"):
+        return "web"
+    return "dns" if service == "dns" else "other"
+
+def corelight_conn_log_batch(n: int, overrides: dict | None = None) -> List[Dict]:
+    """``n`` events shaped like ``corelight_conn_log()``, every random column drawn in one call."""
+    now = event_clock.now()
+    services = bulk_random.choice(SERVICES, n)
+    any_protocol = bulk_random.choice(PROTOCOLS, n)
+    any_port = bulk_random.integers(n, 1, 65535)
+    protocols = [
+        proto if service == "-" else ("udp" if service in UDP_SERVICES else "tcp")
+        for service, proto in zip(services, any_protocol)
+    ]
+    dst_ports = [
+        COMMON_PORTS.get(service, port) for service, port in zip(services, any_port)
+    ]
+
+    web_states = bulk_random.choice(["SF", "S1", "S0", "REJ"], n, weights=[0.8, 0.1, 0.05, 0.05])
+    ssh_states = bulk_random.choice(["SF", "S1", "S0", "REJ", "RSTO"], n,
+                                    weights=[0.6, 0.1, 0.1, 0.15, 0.05])
+    other_states = bulk_random.choice(CONN_STATES, n)
+    conn_states = [
+        web if service in ("http", "https", "dns") else ssh if service == "ssh" else other
+        for service, web, ssh, other in zip(services, web_states, ssh_states, other_states)
+    ]
+
+    ranges = [BYTE_RANGES[_traffic_class(s, c)] for s, c in zip(services, conn_states)]
+    orig_bytes = bulk_random.integers_in([r[0][0] for r in ranges], [r[0][1] for r in ranges])
+    resp_bytes = bulk_random.integers_in([r[1][0] for r in ranges], [r[1][1] for r in ranges])
+    resp_bytes = [0 if state == "S0" else b for state, b in zip(conn_states, resp_bytes)]
+
+    is_internal = bulk_random.chance(n, 0.3)
+    uid_chars = bulk_random.choice(UID_CHARS, 17 * n)
+    needs_l2 = [p == "tcp" and c == "SF" for p, c in zip(protocols, conn_states)]
+    macs = iter(bulk_random.mac_addresses(2 * sum(needs_l2)))
+
+    columns = zip(
+        bulk_random.integers(n, 0, 300),
+        bulk_random.uniform(n, 0.001, 120.0),
+        services, protocols,
+        bulk_random.integers(n, 1024, 65535),
+        dst_ports, conn_states, orig_bytes, resp_bytes,
+        bulk_random.integers(n, 40, 1500),
+        bulk_random.integers(n, 40, 1500),
+        is_internal,
+        bulk_random.internal_ipv4(n),
+        bulk_random.ipv4_where(is_internal),
+        needs_l2,
+        range(0, 17 * n, 17),
+    )
+    events = []
+    for (age, duration, service, protocol, src_port, dst_port, conn_state, o_bytes, r_bytes,
+         o_div, r_div, internal, orig_h, resp_h, l2, k) in columns:
+        orig_pkts = max(1, o_bytes // o_div)
+        resp_pkts = max(0 if r_bytes == 0 else 1, r_bytes // r_div)
+        event = {
+            "ts": now - age,
+            "uid": "C" + "".join(uid_chars[k:k + 17]),
+            "id": {
+                "orig_h": orig_h,
+                "orig_p": src_port,
+                "resp_h": resp_h,
+                "resp_p": dst_port
+            },
+            "proto": protocol,
+            "service": service if service != "-" else None,
+            "duration": round(duration, 6),
+            "orig_bytes": o_bytes,
+            "resp_bytes": r_bytes,
+            "conn_state": conn_state,
+            "local_orig": True,
+            "local_resp": internal,
+            "missed_bytes": 0,
+            "history": _generate_history(conn_state),
+            "orig_pkts": orig_pkts,
+            "orig_ip_bytes": o_bytes + (orig_pkts * 40),
+            "resp_pkts": resp_pkts,
+            "resp_ip_bytes": r_bytes + (resp_pkts * 40),
+            "tunnel_parents": []
+        }
+        if l2:
+            event["orig_l2_addr"] = next(macs)
+            event["resp_l2_addr"] = next(macs)
+        if overrides:
+            event.update(overrides)
+        events.append(event)
+    return events
+
 def _generate_history(conn_state: str) -> str:
     """Generate connection history string based on state"""
     history_map = {
@@ -7,9 +7,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # TLS versions
 TLS_VERSIONS = [
@@ -93,7 +101,7 @@ def _generate_ip(internal: bool = True) -> str:
             f"192.168.{random.randint(0, 255)}.{random.randint(1, 254)}"
         ])
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_uid() -> str:
     """Generate a Zeek connection UID"""
@@ -113,7 +121,7 @@ def corelight_ssl_log(overrides: dict | None = None) -> Dict:
         corelight_ssl_log({"version": "TLSv1.3", "established": True})
     """
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     timestamp = now - timedelta(seconds=random.randint(0, 300))
     
     # Select server name and determine if internal
@@ -210,8 +218,8 @@ def corelight_ssl_log(overrides: dict | None = None) -> Dict:
     
     # Add JA3 fingerprints for established connections
     if established and random.random() < 0.7:
-        event["ja3"] = f"{uuid.uuid4().hex}"[:32]
-        event["ja3s"] = f"{uuid.uuid4().hex}"[:32]
+        event["ja3"] = f"{random_pools.hex_string(32)}"[:32]
+        event["ja3s"] = f"{random_pools.hex_string(32)}"[:32]
     
     # Apply any overrides
     if overrides:
@@ -5,10 +5,17 @@ Darktrace event generator (JSON format)
 from __future__ import annotations
 import json
 import random
-import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Model breach types and descriptions
 MODEL_BREACHES = [
@@ -127,7 +134,7 @@ def _generate_ip(internal=True):
     if internal:
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_device():
     """Generate device information"""
@@ -138,7 +145,7 @@ def _generate_device():
     return {
         "hostname": hostname,
         "ip": _generate_ip(internal=True),
-        "mac": ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)]),
+        "mac": random_pools.mac(),
         "type": device_type,
         "os": random.choice(["Windows 10", "Windows 11", "Ubuntu 20.04", "macOS 12.0", "Unknown"])
     }
@@ -148,8 +155,8 @@ def _generate_triggered_components(breach_type):
     components = []
     
     base_component = {
-        "time": int(time.time() * 1000),
-        "uid": str(uuid.uuid4()),
+        "time": int(event_clock.now() * 1000),
+        "uid": random_pools.uuid4(),
         "pid": random.randint(1000, 9999),
         "detail": {}
     }
@@ -168,7 +175,7 @@ def _generate_triggered_components(breach_type):
         component = base_component.copy()
         component["detail"] = {
             "fileName": random.choice(["update.exe", "svchost_new.exe", "chrome_update.exe", "document.exe"]),
-            "fileHash": uuid.uuid4().hex,
+            "fileHash": random_pools.hex_string(32),
             "fileSize": random.randint(50000, 5000000),
             "downloadSource": f"http://{random.choice(SUSPICIOUS_DOMAINS).format(random.randint(1, 100))}/download"
         }
@@ -232,7 +239,7 @@ def _generate_model_breach(overrides: dict | None = None) -> str:
     score = max(0.0, min(1.0, score))  # Clamp between 0 and 1
     
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     creation_time = now - timedelta(seconds=random.randint(0, 300))
     
     event = {
@@ -243,9 +250,9 @@ def _generate_model_breach(overrides: dict | None = None) -> str:
             "description": breach["description"],
             "id": random.randint(100, 999),
             "version": random.randint(1, 5),
-            "uuid": str(uuid.uuid4())
+            "uuid": random_pools.uuid4()
         },
-        "breachUrl": f"https://darktrace-{uuid.uuid4().hex[:8]}-0001-01/#modelbreach/{random.randint(10000, 99999)}",
+        "breachUrl": f"https://darktrace-{random_pools.hex_string(8)}-0001-01/#modelbreach/{random.randint(10000, 99999)}",
         "pbid": random.randint(1000000, 9999999),
         "score": round(score, 3),
         "device": device,
@@ -285,7 +292,7 @@ def _generate_ai_analyst(overrides: dict | None = None) -> str:
     devices = [_generate_device() for _ in range(random.randint(1, 3))]
     
     for i in range(num_breaches):
-        breach_time = int((time.time() - random.randint(0, 3600)) * 1000)
+        breach_time = int((event_clock.now() - random.randint(0, 3600)) * 1000)
         related_breaches.append({
             "modelName": random.choice(MODEL_BREACHES)["name"],
             "pbid": random.randint(1000000, 9999999),
@@ -297,16 +304,16 @@ def _generate_ai_analyst(overrides: dict | None = None) -> str:
     # Sort breaches by time
     related_breaches.sort(key=lambda x: x["time"])
     
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     event = {
         "time": int(now.timestamp() * 1000),
-        "incidentId": str(uuid.uuid4()),
+        "incidentId": random_pools.uuid4(),
         "title": incident["title"],
         "summary": incident["summary"],
         "category": incident["category"],
         "groupSeverity": incident["group_severity"],
-        "incidentUrl": f"https://darktrace-{uuid.uuid4().hex[:8]}-0001-01/saas#aiincident/{random.randint(10000, 99999)}",
+        "incidentUrl": f"https://darktrace-{random_pools.hex_string(8)}-0001-01/saas#aiincident/{random.randint(10000, 99999)}",
         "startTime": related_breaches[0]["time"],
         "endTime": related_breaches[-1]["time"],
         "devices": devices,
@@ -7,9 +7,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Detection types
 DETECTION_TYPES = [
@@ -106,7 +114,7 @@ def _generate_ip(internal: bool = True) -> str:
             f"192.168.{random.randint(0, 255)}.{random.randint(1, 254)}"
         ])
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_device_id() -> str:
     """Generate a device ID"""
@@ -124,7 +132,7 @@ def extrahop_log(overrides: dict | None = None) -> Dict:
         extrahop_log({"type": "sql_injection", "risk_score": 90})
     """
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     start_time = now - timedelta(minutes=random.randint(5, 300))
     update_time = start_time + timedelta(minutes=random.randint(1, 60))
     mod_time = update_time
@@ -245,7 +253,7 @@ def _generate_participants(detection_type: str) -> List[Dict]:
 def _generate_properties(detection_type: str, participants: List[Dict]) -> Dict:
     """Generate properties based on detection type"""
     properties = {
-        "detection_id": str(uuid.uuid4()),
+        "detection_id": random_pools.uuid4(),
         "severity": _get_severity_label(detection_type),
         "confidence": random.randint(70, 99)
     }
@@ -6,8 +6,17 @@ Generates synthetic Extreme Networks switch and access point events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # Device types
 DEVICE_TYPES = ["Switch", "Access Point", "Router", "Controller"]
@@ -39,7 +48,7 @@ USERS = ["admin", "netadmin", "operator", "guest", "service"]
 
 def generate_mac() -> str:
     """Generate a random MAC address"""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+    return random_pools.mac()
 
 def generate_ip() -> str:
     """Generate a random IP address"""
@@ -47,7 +56,7 @@ def generate_ip() -> str:
 
 def extreme_networks_log() -> Dict:
     """Generate a single Extreme Networks event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     device_type = random.choice(DEVICE_TYPES)
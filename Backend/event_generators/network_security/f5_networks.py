@@ -6,8 +6,16 @@ Generates synthetic F5 BIG-IP load balancer and security events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "kv"
 
 # Module types
 MODULES = ["LTM", "GTM", "ASM", "APM", "AFM", "AVR", "DNS"]
@@ -60,11 +68,11 @@ ATTACK_TYPES = [
 
 def generate_ip() -> str:
     """Generate a random IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def f5_networks_log() -> str:
     """Generate a single F5 Networks event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now  # Use current time instead of random past time
     
     module = random.choice(list(EVENT_TYPES.keys()))
@@ -4,7 +4,16 @@ F5 VPN event generator
 Generates synthetic F5 VPN session events in syslog format
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # VPN events
 EVENTS = ["SESSION_START", "SESSION_END", "LOGIN", "LOGOUT", "CONNECTION_FAILED", "AUTH_SUCCESS", "AUTH_FAILURE"]
@@ -24,11 +33,11 @@ MESSAGES = [
 
 def generate_ip() -> str:
     """Generate IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def f5_vpn_log() -> dict:
     """Generate a single F5 VPN event log in syslog format"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     timestamp = event_time.strftime("%Y-%m-%dT%H:%M:%SZ")
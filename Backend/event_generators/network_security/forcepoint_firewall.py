@@ -6,8 +6,15 @@ Generates firewall security events in CEF format
 from __future__ import annotations
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
 
 # Firewall actions and verdicts
 ACTIONS = ["Allow", "Block", "Drop", "Reject", "Deny", "Permit"]
@@ -88,7 +95,7 @@ def _generate_ip(internal: bool = True) -> str:
             f"192.168.{random.randint(0, 255)}.{random.randint(1, 254)}"
         ])
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def forcepoint_firewall_log(overrides: dict | None = None) -> str:
     """
@@ -97,7 +104,7 @@ def forcepoint_firewall_log(overrides: dict | None = None) -> str:
     Pass `overrides` to force any field to a specific value:
         forcepoint_firewall_log({"act": "Block"})
     """
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Select signature and determine action
@@ -177,8 +184,8 @@ def forcepoint_firewall_log(overrides: dict | None = None) -> str:
         "dpriv": random.choice(["Administrator", "User", "Guest"]) if random.random() < 0.5 else "",
         "suser": f"user_{random.randint(1, 100)}" if random.random() < 0.4 else "",
         "duser": f"target_user_{random.randint(1, 100)}" if random.random() < 0.3 else "",
-        "smac": f"{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}",
-        "dmac": f"{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}:{random.randint(0, 255):02x}",
+        "smac": random_pools.mac(),
+        "dmac": random_pools.mac(),
         "cn1": random.randint(1, 1000000),
         "cn1Label": "ConnectionCount",
         "cn2": random.randint(1, 3600),
@@ -7,7 +7,14 @@ Generates synthetic FortiManager management and audit events for testing
 import random
 import time
 import json
-from datetime import datetime, timezone
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 def fortimanager_log():
@@ -79,7 +86,7 @@ def fortimanager_log():
     log_message = event_type["template"].format(**field_values)
     
     # Generate FortiManager syslog format
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = event_clock.stamp("%Y-%m-%d %H:%M:%S")
     hostname = f"FortiManager-{random.randint(10,99)}"
     
     # FortiManager log format: timestamp hostname FortiManager: log_message
@@ -87,7 +94,7 @@ def fortimanager_log():
     
     return {
         "raw": raw_log,
-        "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        "timestamp": event_clock.stamp("iso_us"),
         "vendor": "Fortinet",
         "product": "FortiManager",
         "event_type": event_type["type"],
@@ -2,32 +2,37 @@
 #WORKING
 
 """Generate FortiGate-style log lines for SentinelOne demos."""
-from datetime import datetime
-from ipaddress import IPv4Address
-from time import time_ns
-import random
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+from field_template import compile_kv  # event_generators/shared
+import random_pools
+import event_clock
+
+OUTPUT_KIND = "kv"
 
 # ───────────────────────── static OCSF attribute block ────────────────────
 # ───────────────────────── helpers ──────────────────────────
-def _eventtime() -> str:
+def _eventtime(ns=None) -> str:
     """19-digit epoch-microseconds string."""
-    return f"{time_ns() // 1_000:019d}"
+    return event_clock.stamp("epoch_us", ns).zfill(19)
 
 def _rand_ip() -> str:
-    return str(IPv4Address(random.getrandbits(32)))
+    return random_pools.external_ipv4()
 
 def _rand_mac() -> str:
-    return ":".join(f"{random.randint(0, 255):02x}" for _ in range(6))
+    return random_pools.mac()
 
-def _ts() -> dict[str, str]:
-    now = datetime.utcnow()
-    return {"date": now.strftime("%Y-%m-%d"), "time": now.strftime("%H:%M:%S")}
+# date/time/eventtime follow the template keys, as in {**template, **fresh}
+_TS_SLOTS = ("date", "time", "eventtime")
 
-def _line(template: dict, overrides=None) -> str:
-    rec = {**template, **_ts(), "eventtime": _eventtime()}
-    if overrides:
-        rec.update(overrides)
-    return " ".join(f"{k}={v}" for k, v in rec.items())
+def _line(template, overrides=None) -> str:
+    """Render a compiled template (see ``field_template.compile_kv``)."""
+    ns = event_clock.now_ns()
+    return template.render_overrides(
+        overrides, event_clock.stamp("%Y-%m-%d", ns), event_clock.stamp("%H:%M:%S", ns), _eventtime(ns))
 
 # ───────────────────── base templates ──────────────────────
 BASE_IDS = {
@@ -164,12 +169,18 @@ VIRUS = {
     "msg": "\"Malware detected and blocked\"",
 }
 
+_LOCAL   = compile_kv(TRAFFIC_LOCAL,   _TS_SLOTS)
+_FORWARD = compile_kv(TRAFFIC_FORWARD, _TS_SLOTS)
+_RESTAPI = compile_kv(RESTAPI,         _TS_SLOTS)
+_VPN     = compile_kv(VPN,             _TS_SLOTS)
+_VIRUS   = compile_kv(VIRUS,           _TS_SLOTS)
+
 # ───────────────────── public helpers ──────────────────────
-def local_log(ov=None):    return _line(TRAFFIC_LOCAL,   ov)
-def forward_log(ov=None):  return _line(TRAFFIC_FORWARD, ov)
-def rest_api_log(ov=None): return _line(RESTAPI,         ov)
-def vpn_log(ov=None):      return _line(VPN,             ov)
-def virus_log(ov=None):    return _line(VIRUS,           ov)
+def local_log(ov=None):    return _line(_LOCAL,   ov)
+def forward_log(ov=None):  return _line(_FORWARD, ov)
+def rest_api_log(ov=None): return _line(_RESTAPI, ov)
+def vpn_log(ov=None):      return _line(_VPN,     ov)
+def virus_log(ov=None):    return _line(_VIRUS,   ov)
 
 if __name__ == "__main__":
     print(local_log())
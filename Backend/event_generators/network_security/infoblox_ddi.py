@@ -7,7 +7,15 @@ Generates synthetic Infoblox DNS/DHCP/IP management events for testing
 import random
 import time
 import json
-from datetime import datetime, timezone
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 def infoblox_ddi_log():
@@ -55,7 +63,7 @@ def infoblox_ddi_log():
     event_type = random.choice(event_types)
     
     # Generate timestamp
-    timestamp = datetime.now().strftime("%d-%b-%Y %H:%M:%S.%f")[:-3]
+    timestamp = event_clock.stamp("%d-%b-%Y %H:%M:%S.%f")[:-3]
     
     # Generate common field values
     field_values = {
@@ -63,7 +71,7 @@ def infoblox_ddi_log():
         "client_port": random.randint(32768, 65535),
         "server_ip": f"10.0.{random.randint(1,10)}.{random.randint(1,10)}",
         "assigned_ip": f"192.168.100.{random.randint(1,254)}",
-        "mac_address": ":".join([f"{random.randint(0,255):02x}" for _ in range(6)]),
+        "mac_address": random_pools.mac(),
         "response_ip": f"203.0.113.{random.randint(1,254)}"
     }
     
@@ -84,7 +92,7 @@ def infoblox_ddi_log():
     
     return {
         "raw": raw_log,
-        "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        "timestamp": event_clock.stamp("iso_us"),
         "vendor": "Infoblox",
         "product": "DDI",
         "event_type": event_type["type"],
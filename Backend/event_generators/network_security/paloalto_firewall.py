@@ -2,8 +2,18 @@
 """Generate synthetic Palo Alto Networks firewall logs (CSV format)."""
 import json
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 import time
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+from field_template import Slot, compile_delimited  # event_generators/shared
+import random_pools
+import event_clock
+
+OUTPUT_KIND = "csv"
 
 # Palo Alto log types
 LOG_TYPES = ["TRAFFIC", "THREAT", "SYSTEM", "CONFIG", "HIP-MATCH", "GLOBALPROTECT", "USERID", "URL"]
@@ -17,6 +27,114 @@ THREAT_CATEGORIES = ["brute-force", "sql-injection", "command-injection", "code-
                      "cross-site-scripting", "vulnerability", "spyware", "virus", "botnet"]
 SEVERITIES = ["critical", "high", "medium", "low", "informational"]
 
+# CSV layout for TRAFFIC logs (PAN-OS 10.x format); Slot columns vary per event
+_TRAFFIC_LOG = compile_delimited([
+    "",  # future_use_1
+    Slot("receive_time"),
+    Slot("serial_number"),
+    "TRAFFIC",  # type
+    Slot("subtype"),
+    "",  # future_use_2
+    Slot("time_generated"),
+    Slot("src"),
+    Slot("dst"),
+    Slot("natsrc"),
+    Slot("natdst"),
+    Slot("rule"),
+    Slot("srcuser"),
+    "",  # dstuser
+    Slot("app"),
+    "vsys1",  # vsys
+    Slot("from"),
+    Slot("to"),
+    Slot("inbound_if"),
+    Slot("outbound_if"),
+    "FORWARD",  # logset
+    "",  # future_use_3
+    Slot("sessionid"),
+    "1",  # repeatcnt
+    Slot("sport"),
+    Slot("dport"),
+    Slot("natsport"),
+    Slot("natdport"),
+    "0x0",  # flags
+    Slot("proto"),
+    Slot("action"),
+    Slot("bytes"),
+    Slot("bytes_sent"),
+    Slot("bytes_received"),
+    Slot("packets"),
+    Slot("start"),
+    Slot("elapsed"),
+    Slot("category"),
+    "",  # future_use_4
+    Slot("seqno"),
+    "0x0",  # actionflags
+    Slot("srcloc"),
+    Slot("dstloc"),
+    "",  # future_use_5
+    Slot("pkts_sent"),
+    Slot("pkts_received"),
+    Slot("session_end_reason"),
+])
+
+# CSV layout for THREAT logs
+_THREAT_LOG = compile_delimited([
+    "",  # future_use_1
+    Slot("receive_time"),
+    Slot("serial_number"),
+    "THREAT",  # type
+    Slot("subtype"),
+    "",  # future_use_2
+    Slot("time_generated"),
+    Slot("src"),
+    Slot("dst"),
+    Slot("natsrc"),
+    Slot("natdst"),
+    "block-threats",  # rule
+    "",  # srcuser
+    "",  # dstuser
+    Slot("app"),
+    "vsys1",  # vsys
+    Slot("from"),
+    Slot("to"),
+    Slot("inbound_if"),
+    Slot("outbound_if"),
+    "FORWARD",  # logset
+    "",  # future_use_3
+    Slot("sessionid"),
+    "1",  # repeatcnt
+    Slot("sport"),
+    Slot("dport"),
+    Slot("natsport"),
+    Slot("natdport"),
+    "0x80000000",  # flags
+    "tcp",  # proto
+    Slot("action"),
+    "(9999)",  # threat/content name
+    Slot("category"),
+    Slot("severity"),
+    "client-to-server",  # direction
+    Slot("seqno"),
+    "0x0",  # actionflags
+    Slot("srcloc"),
+    Slot("dstloc"),
+    "",  # future_use_5
+    "",  # contenttype
+    "",  # pcap_id
+    "",  # filedigest
+    "",  # cloud
+    "",  # url_idx
+    "",  # user_agent
+    "",  # filetype
+    "",  # xff
+    "",  # referer
+    "",  # sender
+    "",  # subject
+    "",  # recipient
+    "",  # reportid
+])
+
 def get_random_ip(internal_probability=0.5):
     """Generate a random IP address."""
     if random.random() < internal_probability:
@@ -26,7 +144,7 @@ def get_random_ip(internal_probability=0.5):
             f"192.168.{random.randint(0, 255)}.{random.randint(1, 254)}"
         ])
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def generate_serial_number():
     """Generate a firewall serial number."""
@@ -38,8 +156,10 @@ def generate_session_id():
 
 def generate_traffic_log():
     """Generate a TRAFFIC log entry."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     start_time = now - timedelta(seconds=random.randint(1, 300))
+    received = event_clock.stamp("%Y/%m/%d %H:%M:%S", now)
+    started = start_time.strftime("%Y/%m/%d %H:%M:%S")
     
     # Generate IPs and ports
     src_ip = get_random_ip(internal_probability=0.7)
@@ -75,62 +195,48 @@ def generate_traffic_log():
     bytes_sent = int(bytes_total * random.uniform(0.3, 0.7))
     bytes_recv = bytes_total - bytes_sent
     
-    # CSV fields for TRAFFIC log (PAN-OS 10.x format)
-    fields = [
-        "",  # future_use_1
-        now.strftime("%Y/%m/%d %H:%M:%S"),  # receive_time
+    return _TRAFFIC_LOG.render(
+        received,  # receive_time
         generate_serial_number(),  # serial_number
-        "TRAFFIC",  # type
         random.choice(["start", "end", "drop", "deny"]),  # subtype
-        "",  # future_use_2
-        start_time.strftime("%Y/%m/%d %H:%M:%S"),  # time_generated
+        started,  # time_generated
         src_ip,  # src
         dst_ip,  # dst
         src_ip,  # natsrc
         dst_ip,  # natdst
         f"allow-{app}" if action == "allow" else f"block-{random.choice(['threats', 'malware', 'default'])}",  # rule
         random.choice([f"domain\\user{random.randint(1, 100)}", ""]),  # srcuser
-        "",  # dstuser
         app,  # app
-        "vsys1",  # vsys
         random.choice(ZONES),  # from
         random.choice(ZONES),  # to
         f"ethernet1/{random.randint(1, 8)}",  # inbound_if
         f"ethernet1/{random.randint(1, 8)}",  # outbound_if
-        "FORWARD",  # logset
-        "",  # future_use_3
         generate_session_id(),  # sessionid
-        "1",  # repeatcnt
         str(src_port),  # sport
         str(dst_port),  # dport
         str(src_port),  # natsport
         str(dst_port),  # natdport
-        "0x0",  # flags
         protocol,  # proto
         action,  # action
         str(bytes_total),  # bytes
         str(bytes_sent),  # bytes_sent
         str(bytes_recv),  # bytes_received
         str(packets),  # packets
-        start_time.strftime("%Y/%m/%d %H:%M:%S"),  # start
+        started,  # start
         str(random.randint(1, 300)),  # elapsed
         random.choice(["internet-communications", "business-systems", "networking", ""]),  # category
-        "",  # future_use_4
         str(random.randint(1, 1000000)),  # seqno
-        "0x0",  # actionflags
         random.choice(["US", "CN", "RU", "DE", "GB", "FR", ""]),  # srcloc
         random.choice(["US", "CN", "RU", "DE", "GB", "FR", ""]),  # dstloc
-        "",  # future_use_5
         str(int(packets * 0.6)),  # pkts_sent
         str(int(packets * 0.4)),  # pkts_received
         random.choice(["aged-out", "tcp-fin", "tcp-rst", "policy-deny", ""]) if action != "allow" else "aged-out",  # session_end_reason
-    ]
-    
-    return ",".join(fields)
+    )
 
 def generate_threat_log():
     """Generate a THREAT log entry."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
+    received = event_clock.stamp("%Y/%m/%d %H:%M:%S", now)
     
     # Generate IPs and ports
     src_ip = get_random_ip(internal_probability=0.3)  # More external threats
@@ -141,64 +247,32 @@ def generate_threat_log():
     threat_cat = random.choice(THREAT_CATEGORIES)
     severity = random.choice(SEVERITIES)
     
-    # CSV fields for THREAT log
-    fields = [
-        "",  # future_use_1
-        now.strftime("%Y/%m/%d %H:%M:%S"),  # receive_time
+    return _THREAT_LOG.render(
+        received,  # receive_time
         generate_serial_number(),  # serial_number
-        "THREAT",  # type
         random.choice(["url", "virus", "spyware", "vulnerability", "file"]),  # subtype
-        "",  # future_use_2
-        now.strftime("%Y/%m/%d %H:%M:%S"),  # time_generated
+        received,  # time_generated
         src_ip,  # src
         dst_ip,  # dst
         src_ip,  # natsrc
         dst_ip,  # natdst
-        "block-threats",  # rule
-        "",  # srcuser
-        "",  # dstuser
         random.choice(["web-browsing", "ssl", "ftp", "smtp"]),  # app
-        "vsys1",  # vsys
         random.choice(ZONES),  # from
         random.choice(ZONES),  # to
         f"ethernet1/{random.randint(1, 8)}",  # inbound_if
         f"ethernet1/{random.randint(1, 8)}",  # outbound_if
-        "FORWARD",  # logset
-        "",  # future_use_3
         generate_session_id(),  # sessionid
-        "1",  # repeatcnt
         str(src_port),  # sport
         str(dst_port),  # dport
         str(src_port),  # natsport
         str(dst_port),  # natdport
-        "0x80000000",  # flags
-        "tcp",  # proto
         random.choice(["alert", "block", "continue"]),  # action
-        f"(9999)",  # threat/content name
         threat_cat,  # category
         severity,  # severity
-        "client-to-server",  # direction
         str(random.randint(1, 1000000)),  # seqno
-        "0x0",  # actionflags
         random.choice(["US", "CN", "RU", "DE", "GB", "FR"]),  # srcloc
         random.choice(["US", "CN", "RU", "DE", "GB", "FR"]),  # dstloc
-        "",  # future_use_5
-        "",  # contenttype
-        "",  # pcap_id
-        "",  # filedigest
-        "",  # cloud
-        "",  # url_idx
-        "",  # user_agent
-        "",  # filetype
-        "",  # xff
-        "",  # referer
-        "",  # sender
-        "",  # subject
-        "",  # recipient
-        "",  # reportid
-    ]
-    
-    return ",".join(fields)
+    )
 
 def paloalto_firewall_log(overrides: dict | None = None) -> str:
     """Generate a single Palo Alto Networks firewall log entry."""
@@ -7,9 +7,17 @@ from __future__ import annotations
 import json
 import random
 import time
-import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from typing import Dict, List
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "syslog"
 
 # Detection categories
 DETECTION_CATEGORIES = [
@@ -80,7 +88,7 @@ def _generate_ip(internal: bool = True) -> str:
             f"192.168.{random.randint(0, 255)}.{random.randint(1, 254)}"
         ])
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_detection_id() -> int:
     """Generate a detection ID"""
@@ -94,7 +102,7 @@ def _generate_account_uid() -> str:
 
 def _generate_host_id() -> str:
     """Generate a host ID"""
-    return f"host-{uuid.uuid4().hex[:8]}"
+    return f"host-{random_pools.hex_string(8)}"
 
 def vectra_ai_log(overrides: dict | None = None) -> str:
     """
@@ -104,7 +112,7 @@ def vectra_ai_log(overrides: dict | None = None) -> str:
         vectra_ai_log({"category": "Exfiltration", "threat": 90})
     """
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     timestamp = now - timedelta(seconds=random.randint(0, 300))
     
     # Determine event type
@@ -359,8 +367,8 @@ def _generate_grouped_details(detection_type: str) -> List[Dict]:
     
     for _ in range(num_groups):
         detail = {
-            "first_timestamp": (datetime.now(timezone.utc) - timedelta(hours=random.randint(1, 72))).isoformat() + "Z",
-            "last_timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "first_timestamp": (event_clock.utcnow() - timedelta(hours=random.randint(1, 72))).isoformat() + "Z",
+            "last_timestamp": event_clock.utcnow().isoformat() + "Z",
             "count": random.randint(1, 100),
             "source_ip": _generate_ip(),
             "destination": _generate_ip(internal=False) if random.random() < 0.5 else f"external-site-{random.randint(1, 100)}.com"
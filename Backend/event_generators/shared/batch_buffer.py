@@ -0,0 +1,148 @@
+"""Streaming-compressed batch buffers for hec_sender.py.
+
+Each per-(endpoint, product) batch buffer owns a streaming compressor from its
+codec (gzip by default, see hec_codecs.py). Encoded events are appended to a
+small staging ``bytearray`` (newline separators included, no per-event
+``bytes`` concatenation) and the compressor is fed ``memoryview`` slices of it
+every ``STAGE_BYTES``, which also saves a compressor call per event. Output
+is kept as one chunk per stage, so when a size or time threshold fires the
+payload only needs its final ``flush()`` and a single join before it can be
+POSTed. Memory per batch is the compressed output plus at
+most one stage of uncompressed events.
+
+The rare paths that need individual lines back (connection bootstrap, splitting
+a batch the collector rejected with 413) decompress the finished body.
+
+``BatchShard`` holds the open batch for one key behind its own small lock, so
+producers of different products never contend, and a full batch is detached
+under the lock but finished and sent by the caller after releasing it.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from hec_codecs import Codec, GzipCodec  # type: ignore
+
+_DEFAULT_CODEC = GzipCodec()
+STAGE_BYTES = 64 * 1024  # uncompressed bytes staged per compressor call
+
+
+class CompressedBatch:
+    """One HEC batch body, encoded incrementally as events are added."""
+
+    __slots__ = ("codec", "count", "bytes", "last", "body", "_z", "_stage", "_out", "_compressed")
+
+    def __init__(self, codec: Optional[Codec] = None):
+        self.codec = codec or _DEFAULT_CODEC
+        self.count = 0
+        self.bytes = 0  # uncompressed payload size, including newline separators
+        self.last = time.time()  # when the batch was started (flush-interval clock)
+        self.body = None  # encoded payload once finished
+        self._z = self.codec.compressor()
+        self._stage = bytearray()  # events not yet fed to the compressor
+        self._out: List[bytes] = []  # compressor output, one chunk per stage
+        self._compressed = 0
+
+    def add(self, data: bytes):
+        """Append one newline-delimited event."""
+        stage = self._stage
+        if self.count:
+            stage += b"\n"
+            self.bytes += 1
+        stage += data
+        self.count += 1
+        self.bytes += len(data)
+        if len(stage) >= STAGE_BYTES:
+            self._feed()
+
+    def _feed(self):
+        with memoryview(self._stage) as view:
+            out = self._z.compress(view)
+        if out:
+            self._out.append(out)
+            self._compressed += len(out)
+        del self._stage[:]
+
+    @property
+    def compressed(self) -> int:
+        """Encoded bytes emitted so far (staged events and the final flush add more)."""
+        return len(self.body) if self.body is not None else self._compressed
+
+    def finish(self) -> "CompressedBatch":
+        """Flush the compressor; ``body`` holds the complete payload afterwards."""
+        if self.body is None:
+            if self._stage:
+                self._feed()
+            self._out.append(self._z.flush())
+            self.body = b"".join(self._out)
+            self._out = self._stage = None
+            self._z = None
+        return self
+
+    def lines(self) -> List[str]:
+        """Decode a finished batch back into its event lines."""
+        return self.codec.decompress(self.finish().body).decode("utf-8").split("\n")
+
+    @classmethod
+    def from_lines(cls, lines: List[str], codec: Optional[Codec] = None) -> "CompressedBatch":
+        batch = cls(codec)
+        for line in lines:
+            batch.add(line.encode("utf-8"))
+        return batch.finish()
+
+    @classmethod
+    def from_body(cls, body: bytes, codec: Optional[Codec] = None) -> "CompressedBatch":
+        """Wrap an already-encoded payload (e.g. one replayed from the spool)."""
+        batch = cls(codec)
+        batch._z = batch._stage = batch._out = None
+        batch.body = body
+        data = batch.codec.decompress(body)
+        batch.count = data.count(b"\n") + 1 if data else 0
+        batch.bytes = len(data)
+        return batch
+
+    def split(self) -> Tuple["CompressedBatch", "CompressedBatch"]:
+        """Halve the batch (for 413 Payload Too Large)."""
+        lines = self.lines()
+        mid = len(lines) // 2
+        return self.from_lines(lines[:mid], self.codec), self.from_lines(lines[mid:], self.codec)
+
+
+class BatchShard:
+    """The open batch for one (endpoint, product) key, guarded by its own lock."""
+
+    __slots__ = ("codec", "batch", "_lock")
+
+    def __init__(self, codec: Optional[Codec] = None):
+        self.codec = codec or _DEFAULT_CODEC
+        self.batch: Optional[CompressedBatch] = None
+        self._lock = threading.Lock()
+
+    def add(self, data: bytes, max_bytes: int) -> Tuple[Optional[CompressedBatch], Optional[CompressedBatch]]:
+        """Add one event. Returns ``(started, full)``.
+
+        ``started`` is the batch this event opened (so the caller can schedule its
+        flush deadline); ``full`` is a batch detached because it reached
+        ``max_bytes``, for the caller to finish and send outside the lock.
+        """
+        with self._lock:
+            batch = self.batch
+            started = None
+            if batch is None:
+                batch = started = self.batch = CompressedBatch(self.codec)
+            batch.add(data)
+            if batch.bytes < max_bytes:
+                return started, None
+            self.batch = None
+            return started, batch
+
+    def detach(self, expected: Optional[CompressedBatch] = None) -> Optional[CompressedBatch]:
+        """Take the open batch, or None. With ``expected``, only if it is still that batch."""
+        with self._lock:
+            batch = self.batch
+            if batch is None or not batch.count or (expected is not None and batch is not expected):
+                return None
+            self.batch = None
+            return batch
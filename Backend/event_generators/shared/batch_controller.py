@@ -0,0 +1,112 @@
+"""Batch size / flush interval controllers for hec_sender.py batching.
+
+``BatchController`` holds the static S1_HEC_BATCH_MAX_BYTES / S1_HEC_BATCH_FLUSH_MS
+thresholds. ``AdaptiveBatchController`` adjusts them from the outcome of every
+batch POST using AIMD (additive increase, multiplicative decrease):
+
+- congestion (429/503/5xx, transport errors, latency over target) halves the
+  batch size and stretches the flush interval so fewer requests are made;
+- 413 halves the batch size and caps future growth below the rejected size;
+- healthy responses grow the batch size by a fixed step when batches fill by
+  size or the send queue backs up. Size-filled batches also move the flush
+  interval towards its minimum; tiny time-triggered batches (request-heavy)
+  stretch it.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+KB = 1024
+MB = 1024 * 1024
+
+
+class BatchController:
+    """Fixed batch thresholds; ``record`` is a no-op."""
+
+    adaptive = False
+
+    def __init__(self, max_bytes: int, flush_ms: int):
+        self.max_bytes = int(max_bytes)
+        self.flush_ms = int(flush_ms)
+
+    def record(self, latency_s: float | None, status_code: int | None, payload_bytes: int,
+               queue_ratio: float = 0.0) -> None:
+        """Feed back the outcome of one batch POST (``status_code`` None on transport error)."""
+
+    def describe(self) -> str:
+        return f"batch {self.max_bytes // KB}KB/{self.flush_ms}ms"
+
+
+class AdaptiveBatchController(BatchController):
+    """AIMD controller tuning batch size and flush interval from POST feedback."""
+
+    adaptive = True
+
+    def __init__(self, max_bytes: int, flush_ms: int,
+                 min_bytes: int = 64 * KB, ceiling_bytes: int = 8 * MB,
+                 min_flush_ms: int = 100, max_flush_ms: int = 2000,
+                 target_latency_ms: int = 1000,
+                 step_bytes: int = 64 * KB, step_ms: int = 50, cooldown_s: float = 1.0):
+        super().__init__(max_bytes, flush_ms)
+        self.min_bytes = min_bytes
+        self.ceiling_bytes = ceiling_bytes
+        self.min_flush_ms = min_flush_ms
+        self.max_flush_ms = max_flush_ms
+        self.target_latency_s = target_latency_ms / 1000.0
+        self.step_bytes = step_bytes
+        self.step_ms = step_ms
+        self.latency_ewma: float | None = None
+        self.decreases = 0
+        # One decrease per cooldown, so concurrent failures count as one event
+        self.cooldown_s = cooldown_s
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._clamp()
+
+    def _clamp(self):
+        self.max_bytes = int(min(max(self.max_bytes, self.min_bytes), self.ceiling_bytes))
+        self.flush_ms = int(min(max(self.flush_ms, self.min_flush_ms), self.max_flush_ms))
+
+    def record(self, latency_s, status_code, payload_bytes, queue_ratio=0.0):
+        with self._lock:
+            if latency_s is not None:
+                self.latency_ewma = latency_s if self.latency_ewma is None else \
+                    0.8 * self.latency_ewma + 0.2 * latency_s
+
+            now = time.monotonic()
+            cooled = now - self._last_decrease >= self.cooldown_s
+            if status_code == 413:
+                # Payload too large: never grow past what was just rejected
+                self.ceiling_bytes = max(self.min_bytes, min(self.ceiling_bytes, payload_bytes // 2))
+                if cooled:
+                    self.max_bytes //= 2
+                    self.decreases += 1
+                    self._last_decrease = now
+            elif status_code is None or status_code in (429, 503) or status_code >= 500 \
+                    or (latency_s is not None and latency_s > self.target_latency_s):
+                # Congestion: back off multiplicatively and make fewer requests
+                if cooled:
+                    self.max_bytes //= 2
+                    self.flush_ms = int(self.flush_ms * 1.5)
+                    self.decreases += 1
+                    self._last_decrease = now
+            elif status_code < 400:
+                size_triggered = payload_bytes >= 0.9 * self.max_bytes
+                if size_triggered or queue_ratio > 0.75:
+                    # Batches fill on size or the sender is falling behind:
+                    # bigger batches amortise per-request overhead
+                    self.max_bytes += self.step_bytes
+                if size_triggered:
+                    # The interval never fires, so shorten it for latency
+                    self.flush_ms -= self.step_ms
+                elif payload_bytes < 0.25 * self.max_bytes:
+                    # Time flushes are shipping tiny batches (request-heavy)
+                    self.flush_ms += self.step_ms
+            self._clamp()
+
+    def describe(self) -> str:
+        text = f"batch {self.max_bytes // KB}KB/{self.flush_ms}ms"
+        if self.latency_ewma is not None:
+            text += f" ({self.latency_ewma * 1000:.0f}ms POST)"
+        return text
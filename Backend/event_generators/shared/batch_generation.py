@@ -0,0 +1,65 @@
+"""Batch protocol for event generators.
+
+A generator module may pair its scalar function ``foo_log()`` with
+``foo_log_batch(n)``, returning a list of ``n`` events of the same shape
+drawn in bulk (see ``bulk_random``). ``generate_batch`` uses the companion
+when the module defines one and loops the scalar function otherwise, so
+callers never need to know which generators are vectorised.
+
+The companion is found through the function's own globals rather than
+``sys.modules``, so it also works for modules loaded with
+``spec_from_file_location`` (the API) or under another name.
+"""
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+
+BATCH_SUFFIX = "_batch"
+DEFAULT_CHUNK = 256
+
+
+def batch_function(func: Callable) -> Optional[Callable[[int], list]]:
+    """The ``<name>_batch`` companion of ``func``, or None."""
+    namespace = getattr(func, "__globals__", None)
+    name = getattr(func, "__name__", None)
+    if namespace is None or name is None:
+        return None
+    companion = namespace.get(name + BATCH_SUFFIX)
+    return companion if callable(companion) else None
+
+
+def generate_batch(func: Callable, n: int) -> List:
+    """``n`` events from ``func``, vectorised when its module supports it."""
+    if n <= 0:
+        return []
+    companion = batch_function(func)
+    if companion is not None:
+        return companion(n)
+    return [func() for _ in range(n)]
+
+
+class BatchSource:
+    """Drop-in replacement for a zero-argument generator that refills in chunks.
+
+    Each call returns one event; every ``chunk`` calls the buffer is refilled
+    with a single ``generate_batch``. Events are generated up to ``chunk``
+    calls ahead of use, so timestamps can lag by ``chunk / eps`` seconds —
+    only use it where that is negligible (the sender's high-rate loop).
+    """
+
+    __slots__ = ("func", "chunk", "_buffer")
+
+    def __init__(self, func: Callable, chunk: int = DEFAULT_CHUNK):
+        self.func = func
+        self.chunk = chunk
+        self._buffer: list = []
+
+    @property
+    def vectorised(self) -> bool:
+        return batch_function(self.func) is not None
+
+    def __call__(self):
+        if not self._buffer:
+            self._buffer = generate_batch(self.func, self.chunk)
+            self._buffer.reverse()
+        return self._buffer.pop()
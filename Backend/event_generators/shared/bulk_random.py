@@ -0,0 +1,190 @@
+"""Vectorised random draws for generator ``*_batch`` functions.
+
+Each helper returns a list of ``n`` plain Python values (``int``, ``float``,
+``str``), so the results go straight into event dicts and any JSON backend.
+With NumPy installed the numbers come from one ``numpy.random.Generator``
+call per column; without it the stdlib fallback still draws a whole column
+per call (``random.choices`` over a ``range``), which is several times
+cheaper than ``n`` separate ``random.randint`` calls.
+
+Hex strings, MAC addresses and UUIDs are cut from a single ``os.urandom``
+buffer in both modes.
+"""
+from __future__ import annotations
+
+import os
+import random
+from typing import List, Optional, Sequence, Tuple, Union
+
+try:  # optional: pip install numpy
+    import numpy as _np
+    _RNG = _np.random.default_rng()
+    BACKEND = "numpy"
+except ImportError:  # pragma: no cover - depends on environment
+    _np = None
+    _RNG = None
+    BACKEND = "random"
+
+Octet = Union[int, Tuple[int, int]]
+
+_OCTETS = [str(i) for i in range(256)]
+
+# Same address plans the scalar generators use
+INTERNAL_PREFIXES = (
+    (10, (0, 255), (0, 255), (1, 254)),
+    (172, (16, 31), (0, 255), (1, 254)),
+    (192, 168, (0, 255), (1, 254)),
+)
+EXTERNAL = ((1, 223), (0, 255), (0, 255), (1, 254))
+# Non-public first octets, and (first, second) ranges carved out of the rest:
+# RFC 1918, loopback, link-local and CGNAT (100.64.0.0/10)
+_NON_PUBLIC_FIRST = frozenset((10, 127))
+_PUBLIC_FIRST = [o for o in range(EXTERNAL[0][0], EXTERNAL[0][1] + 1) if o not in _NON_PUBLIC_FIRST]
+_NON_PUBLIC_SECOND = {172: range(16, 32), 192: range(168, 169), 169: range(254, 255), 100: range(64, 128)}
+
+
+def seed(value: Optional[int] = None):
+    """Seed both the NumPy generator (when present) and ``random``."""
+    global _RNG
+    random.seed(value)
+    if _np is not None:
+        _RNG = _np.random.default_rng(value)
+
+
+def _reseed_after_fork():
+    # Forked sender workers would otherwise draw the parent's NumPy stream
+    global _RNG
+    if _np is not None:
+        _RNG = _np.random.default_rng()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
+
+
+def integers(n: int, low: int, high: int) -> List[int]:
+    """``n`` ints in ``[low, high]`` (inclusive, like ``random.randint``)."""
+    if _RNG is not None:
+        return _RNG.integers(low, high + 1, size=n).tolist()
+    return random.choices(range(low, high + 1), k=n)
+
+
+def integers_in(lows: Sequence[int], highs: Sequence[int]) -> List[int]:
+    """One int per ``(low, high)`` pair, each inclusive; for columns whose range varies by row."""
+    if _RNG is not None:
+        return _RNG.integers(lows, _np.asarray(highs) + 1).tolist()
+    rand = random.random
+    return [low + int(rand() * (high - low + 1)) for low, high in zip(lows, highs)]
+
+
+def uniform(n: int, low: float, high: float) -> List[float]:
+    """``n`` floats in ``[low, high)``."""
+    if _RNG is not None:
+        return _RNG.uniform(low, high, size=n).tolist()
+    span = high - low
+    rand = random.random
+    return [low + span * rand() for _ in range(n)]
+
+
+def chance(n: int, probability: float) -> List[bool]:
+    """``n`` booleans, each True with ``probability``."""
+    if _RNG is not None:
+        return (_RNG.random(n) < probability).tolist()
+    rand = random.random
+    return [rand() < probability for _ in range(n)]
+
+
+def choice(seq: Sequence, n: int, weights: Optional[Sequence[float]] = None) -> list:
+    """``n`` items drawn from ``seq`` with replacement, optionally weighted."""
+    if _RNG is not None:
+        p = None
+        if weights is not None:
+            total = float(sum(weights))
+            p = [w / total for w in weights]
+        return [seq[i] for i in _RNG.choice(len(seq), size=n, p=p).tolist()]
+    return random.choices(seq, weights=weights, k=n)
+
+
+def _octet_column(octet: Octet, n: int) -> List[str]:
+    if isinstance(octet, int):
+        return [_OCTETS[octet]] * n
+    low, high = octet
+    return [_OCTETS[v] for v in integers(n, low, high)]
+
+
+def ipv4(n: int, *octets: Octet) -> List[str]:
+    """``n`` dotted quads; each octet is a fixed int or an inclusive ``(low, high)`` range.
+
+    ``ipv4(n, 10, (0, 255), (0, 255), (1, 254))`` draws from 10.0.0.1-10.255.255.254.
+    """
+    if len(octets) != 4:
+        raise ValueError("ipv4 needs four octets")
+    return list(map(".".join, zip(*(_octet_column(o, n) for o in octets))))
+
+
+def internal_ipv4(n: int) -> List[str]:
+    """RFC 1918 addresses, the three private ranges equally likely."""
+    ranges = integers(n, 0, len(INTERNAL_PREFIXES) - 1)
+    pools = [iter(ipv4(ranges.count(idx), *plan)) for idx, plan in enumerate(INTERNAL_PREFIXES)]
+    return [next(pools[idx]) for idx in ranges]
+
+
+def external_ipv4(n: int) -> List[str]:
+    """Unicast addresses from 1.0.0.1-223.255.255.254 (may include private space)."""
+    return ipv4(n, *EXTERNAL)
+
+
+def public_ipv4(n: int) -> List[str]:
+    """Unicast addresses outside private, loopback, link-local and CGNAT space."""
+    pairs: List[Tuple[int, int]] = []
+    while len(pairs) < n:
+        # ~2% of draws land in a carved-out range; redraw just the shortfall
+        want = n - len(pairs)
+        firsts = choice(_PUBLIC_FIRST, want)
+        seconds = integers(want, 0, 255)
+        pairs.extend((a, b) for a, b in zip(firsts, seconds)
+                     if a not in _NON_PUBLIC_SECOND or b not in _NON_PUBLIC_SECOND[a])
+    octets = _OCTETS
+    return [f"{octets[a]}.{octets[b]}.{c}.{d}" for (a, b), c, d in
+            zip(pairs, _octet_column(EXTERNAL[2], n), _octet_column(EXTERNAL[3], n))]
+
+
+def ipv4_where(internal: Sequence[bool]) -> List[str]:
+    """One address per flag: internal where the flag is set, external elsewhere."""
+    count = sum(internal)
+    inside = iter(internal_ipv4(count))
+    outside = iter(external_ipv4(len(internal) - count))
+    return [next(inside) if flag else next(outside) for flag in internal]
+
+
+def mixed_ipv4(n: int, internal_probability: float) -> List[str]:
+    """Internal addresses with ``internal_probability``, external otherwise."""
+    return ipv4_where(chance(n, internal_probability))
+
+
+def hex_strings(n: int, length: int) -> List[str]:
+    """``n`` random lowercase hex strings of ``length`` characters."""
+    step = length + (length & 1)
+    blob = os.urandom(n * step // 2).hex()
+    return [blob[k:k + length] for k in range(0, n * step, step)]
+
+
+def mac_addresses(n: int) -> List[str]:
+    """``n`` colon-separated MAC addresses."""
+    blob = os.urandom(n * 6).hex()
+    return [":".join((blob[k:k + 2], blob[k + 2:k + 4], blob[k + 4:k + 6],
+                      blob[k + 6:k + 8], blob[k + 8:k + 10], blob[k + 10:k + 12]))
+            for k in range(0, n * 12, 12)]
+
+
+# RFC 4122 variant: the top two bits of clock_seq_hi are 10
+_UUID_VARIANT = {c: "89ab"[int(c, 16) & 3] for c in "0123456789abcdef"}
+
+
+def uuid4_strings(n: int) -> List[str]:
+    """``n`` version-4 UUID strings, formatted straight from one hex blob."""
+    blob = os.urandom(n * 16).hex()
+    variant = _UUID_VARIANT
+    return [f"{blob[k:k + 8]}-{blob[k + 8:k + 12]}-4{blob[k + 13:k + 16]}-"
+            f"{variant[blob[k + 16]]}{blob[k + 17:k + 20]}-{blob[k + 20:k + 32]}"
+            for k in range(0, n * 32, 32)]
@@ -0,0 +1,82 @@
+"""Persistent HEC endpoint-discovery cache for hec_sender.py.
+
+The first send of a process probes up to four ingest bases, three TLS
+combinations and two auth schemes until one works. The working combination
+(event/raw base, verify, tls_low, auth scheme) is stored here so the next
+process - the frontend starts one per run - connects on its first request.
+
+Entries are keyed by a SHA-256 of the token plus the configured URL, never the
+token itself, and expire after a TTL. The file is small JSON, rewritten
+atomically; a missing, unreadable or corrupt file just means a fresh probe.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+
+DEFAULT_TTL = 24 * 3600
+_FIELDS = ("event_base", "raw_base", "verify", "tls_low", "auth_scheme")
+
+
+def default_path() -> str:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "jarvis_coding", "hec_endpoints.json")
+
+
+def cache_key(token: str, url_spec: str) -> str:
+    """Stable key for one token + URL configuration (the token is only hashed)."""
+    return hashlib.sha256(f"{token}\0{url_spec}".encode("utf-8")).hexdigest()
+
+
+class EndpointCache:
+    """JSON file of ``{key: {event_base, raw_base, verify, tls_low, auth_scheme, saved_at}}``."""
+
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL):
+        self.path = path or default_path()
+        self.ttl = ttl
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: dict):
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".hec_endpoints.", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # read-only home etc.: the cache is an optimisation only
+
+    def load(self, key: str) -> Optional[dict]:
+        """The cached config for ``key``, or None when missing or older than the TTL."""
+        entry = self._read().get(key)
+        if not isinstance(entry, dict) or not all(f in entry for f in _FIELDS):
+            return None
+        if time.time() - float(entry.get("saved_at", 0)) > self.ttl:
+            return None
+        return {f: entry[f] for f in _FIELDS}
+
+    def store(self, key: str, config: dict):
+        data = self._read()
+        now = time.time()
+        # Drop expired entries of other tokens/URLs while we are rewriting anyway
+        data = {k: v for k, v in data.items()
+                if isinstance(v, dict) and now - float(v.get("saved_at", 0)) <= self.ttl}
+        data[key] = {**{f: config[f] for f in _FIELDS}, "saved_at": now}
+        self._write(data)
+
+    def invalidate(self, key: str):
+        data = self._read()
+        if data.pop(key, None) is not None:
+            self._write(data)
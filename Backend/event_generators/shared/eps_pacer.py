@@ -0,0 +1,96 @@
+"""Token-bucket EPS pacer for hec_sender.py continuous mode.
+
+Replaces the per-event ``time.sleep(random.uniform(min_delay, max_delay))``
+with a monotonic-clock token bucket. Tokens accrue at the target rate; events
+are released without sleeping while tokens are available, and the pacer only
+sleeps once the bucket is empty, for at least ~1ms worth of events. Events are
+therefore released in micro-batches and the achieved rate tracks the target at
+anything from 1 EPS to tens of thousands of EPS.
+
+An optional byte-rate cap uses a second bucket charged with the size of each
+released event.
+"""
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+class TokenBucketPacer:
+    """Release events at ``eps`` per second, optionally capped at ``bytes_per_sec``."""
+
+    def __init__(self, eps: float, bytes_per_sec: float | None = None,
+                 burst_seconds: float = 0.02,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if eps <= 0:
+            raise ValueError("eps must be positive")
+        self.eps = float(eps)
+        self.bytes_per_sec = float(bytes_per_sec) if bytes_per_sec else None
+        # Bucket depth: enough to absorb sleep overshoot without losing tokens
+        self.burst = max(2.0, self.eps * burst_seconds)
+        # Minimum sleep chunk: ~1ms of events, so high rates don't sleep per event
+        self.min_release = min(self.burst, max(1.0, self.eps * 0.001))
+        self.byte_burst = (self.bytes_per_sec or 0.0) * burst_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+        now = clock()
+        self.started = now
+        self._last = now
+        self._tokens = 1.0
+        self._byte_tokens = self.byte_burst
+        self.released = 0
+        self.bytes_released = 0
+        self.sleep_total = 0.0
+        self.byte_limited = 0.0
+        # EWMA of how far released events are from the ideal schedule, in ms
+        self.lag_ms = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - self._last
+        self._last = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.eps)
+        if self.bytes_per_sec:
+            self._byte_tokens = min(self.byte_burst, self._byte_tokens + elapsed * self.bytes_per_sec)
+
+    def wait(self):
+        """Block until one event may be released."""
+        if self._tokens < 1.0:
+            now = self._clock()
+            self._refill(now)
+            if self._tokens < 1.0:
+                delay = (self.min_release - self._tokens) / self.eps
+                self._sleep(delay)
+                self.sleep_total += delay
+                now = self._clock()
+                self._refill(now)
+            # Sample cumulative schedule lag once per micro-batch
+            lag_ms = abs(self.released - (now - self.started) * self.eps) / self.eps * 1000
+            self.lag_ms = 0.9 * self.lag_ms + 0.1 * lag_ms
+        self._tokens -= 1.0
+        self.released += 1
+
+    def charge_bytes(self, nbytes: int):
+        """Account for ``nbytes`` just released; sleeps while over the byte-rate cap."""
+        self.bytes_released += nbytes
+        if not self.bytes_per_sec:
+            return
+        self._byte_tokens -= nbytes
+        if self._byte_tokens < 0:
+            delay = -self._byte_tokens / self.bytes_per_sec
+            self._sleep(delay)
+            self.byte_limited += delay
+            self._refill(self._clock())
+
+    def achieved_eps(self) -> float:
+        elapsed = self._clock() - self.started
+        return self.released / elapsed if elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        achieved = self.achieved_eps()
+        error = (achieved - self.eps) / self.eps * 100
+        text = f"pacer {achieved:.1f}/{self.eps:g} EPS ({error:+.1f}%, lag {self.lag_ms:.1f}ms)"
+        if self.bytes_per_sec:
+            text += f", byte cap {self.bytes_per_sec / 1024:.0f}KB/s ({self.byte_limited:.1f}s limited)"
+        return text
@@ -0,0 +1,207 @@
+"""Shared event clock: the current event time in common log layouts.
+
+Generators ask for a layout instead of calling ``datetime.now(...)`` and
+``strftime`` per event::
+
+    event_clock.stamp("iso")        # 2025-01-31T12:00:00Z
+    event_clock.stamp("iso_ms")     # 2025-01-31T12:00:00.123Z
+    event_clock.stamp("epoch_ms")   # 1738324800123
+    event_clock.stamp("rfc3164")    # Jan 31 12:00:00
+    event_clock.stamp("%Y/%m/%d %H:%M:%S")   # any strftime pattern
+
+The whole-second part of each layout is rendered once per second and
+cached; only the fraction is formatted per call. ``epoch*`` layouts are
+plain integer division.
+
+The clock can also run on a virtual timeline. ``set_now(start, rate)`` (or the
+``virtual_now`` context manager) makes ``now_ns``/``utcnow``/``stamp`` -- and
+the HEC envelope time -- start at ``start`` and advance at ``rate`` times real
+time (``rate=0`` freezes it), so backfills and scenarios produce events with
+the intended time instead of rewriting fields afterwards.
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+UTC = timezone.utc
+_NS = 1_000_000_000
+_EPOCH_DT = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+When = Union[datetime, float, int]
+
+
+class Layout(NamedTuple):
+    """Whole-second ``pattern`` (strftime text or a callable, including any "."
+    before the fraction), then ``digits`` of fractional second, then ``suffix``."""
+    pattern: Union[str, Callable[[datetime], str]]
+    digits: int = 0
+    suffix: str = ""
+
+
+def _rfc3164(dt: datetime) -> str:
+    # Day of month is space-padded ("Jan  5"), which strftime can't do portably
+    return f"{dt:%b} {dt.day:2d} {dt:%H:%M:%S}"
+
+
+LAYOUTS: Dict[str, Layout] = {
+    "iso": Layout("%Y-%m-%dT%H:%M:%S", 0, "Z"),
+    "iso_ms": Layout("%Y-%m-%dT%H:%M:%S.", 3, "Z"),
+    "iso_us": Layout("%Y-%m-%dT%H:%M:%S.", 6, "Z"),
+    "iso_offset": Layout("%Y-%m-%dT%H:%M:%S", 0, "+00:00"),
+    "rfc3164": Layout(_rfc3164),
+    "cef": Layout("%b %d %Y %H:%M:%S"),
+    # Windows event SystemTime: 100 ns ticks
+    "windows": Layout("%Y-%m-%dT%H:%M:%S.", 7, "Z"),
+}
+
+# Integer layouts: nanoseconds per unit
+EPOCH_LAYOUTS: Dict[str, int] = {"epoch": _NS, "epoch_ms": 1_000_000, "epoch_us": 1_000}
+
+BUILTIN_LAYOUTS = (*LAYOUTS, *EPOCH_LAYOUTS)
+
+_DIVISORS = {digits: 10 ** (9 - digits) for digits in range(10)}
+_FRACTION_FORMATS = {digits: f"%s%0{digits}d%s" for digits in range(10)}
+
+
+def _layout(name: str) -> Layout:
+    layout = LAYOUTS.get(name)
+    if layout is not None:
+        return layout
+    if "%" not in name:
+        raise ValueError(f"unknown timestamp layout {name!r} "
+                         f"(expected one of {', '.join(BUILTIN_LAYOUTS)} or a strftime pattern)")
+    head, sep, tail = name.partition("%f")
+    if sep:
+        if "%" in tail:
+            raise ValueError(f"%f must be the last field in {name!r}")
+        layout = Layout(head, 6, tail)
+    else:
+        layout = Layout(name)
+    LAYOUTS[name] = layout
+    return layout
+
+
+def to_ns(when: When) -> int:
+    """Epoch nanoseconds for a datetime (naive means UTC), epoch seconds, or ns passed through."""
+    if isinstance(when, datetime):
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        return (when - _EPOCH_DT) // _MICROSECOND * 1_000
+    if isinstance(when, int) and when > 10 ** 14:
+        return when
+    return int(when * _NS)
+
+
+def parse_when(text: str) -> When:
+    """Command-line time: epoch seconds, or ISO 8601 (``Z`` suffix allowed, naive means UTC)."""
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    text = text.strip()
+    if text[-1:] in ("Z", "z"):
+        text = text[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"expected ISO 8601 or epoch seconds, got {text!r}") from None
+
+
+def to_datetime(ns: int) -> datetime:
+    """Aware UTC datetime for epoch nanoseconds (microsecond precision)."""
+    return _EPOCH_DT + timedelta(microseconds=ns // 1_000)
+
+
+class EventClock:
+    """Real or virtual event time with a per-layout cache of the current second."""
+
+    def __init__(self):
+        self._anchor: Optional[Tuple[int, int, float]] = None  # (virtual_ns, real_ns, rate)
+        self._cache: Dict[str, Tuple[int, str]] = {}
+
+    @property
+    def virtual(self) -> bool:
+        return self._anchor is not None
+
+    @property
+    def anchor(self) -> Optional[Tuple[int, int, float]]:
+        """``(virtual_ns, real_ns, rate)`` of the virtual timeline, or None; assignable,
+        so another process can continue the same timeline."""
+        return self._anchor
+
+    @anchor.setter
+    def anchor(self, value: Optional[Tuple[int, int, float]]):
+        self._anchor = value
+
+    def set_now(self, start: When, rate: float = 1.0):
+        """Run on a virtual timeline from ``start``, advancing ``rate`` x real time."""
+        self._anchor = (to_ns(start), time.time_ns(), rate)
+
+    def reset(self):
+        """Back to real time."""
+        self._anchor = None
+
+    def now_ns(self) -> int:
+        anchor = self._anchor
+        if anchor is None:
+            return time.time_ns()
+        start, real, rate = anchor
+        return start + int((time.time_ns() - real) * rate)
+
+    def now(self) -> float:
+        """Epoch seconds, like ``time.time()``."""
+        return self.now_ns() / _NS
+
+    def utcnow(self) -> datetime:
+        """Aware UTC datetime, like ``datetime.now(timezone.utc)``."""
+        if self._anchor is None:
+            return datetime.now(UTC)
+        return to_datetime(self.now_ns())
+
+    def stamp(self, layout: str = "iso", when: Optional[When] = None) -> str:
+        """``when`` (default: now) rendered in ``layout``."""
+        ns = self.now_ns() if when is None else to_ns(when)
+        unit = EPOCH_LAYOUTS.get(layout)
+        if unit is not None:
+            return str(ns // unit)
+        spec = _layout(layout)
+        second, fraction = divmod(ns, _NS)
+        cached = self._cache.get(layout)
+        if cached is not None and cached[0] == second:
+            text = cached[1]
+        else:
+            dt = datetime.fromtimestamp(second, UTC)
+            pattern = spec.pattern
+            text = pattern(dt) if callable(pattern) else dt.strftime(pattern)
+            # Explicit times are cached too: callers stamping one ``now_ns()``
+            # in several layouts, or walking a backfill, stay within a second
+            self._cache[layout] = (second, text)
+        digits = spec.digits
+        if digits:
+            return _FRACTION_FORMATS[digits] % (text, fraction // _DIVISORS[digits], spec.suffix)
+        return text + spec.suffix if spec.suffix else text
+
+
+CLOCK = EventClock()
+
+now_ns = CLOCK.now_ns
+now = CLOCK.now
+utcnow = CLOCK.utcnow
+stamp = CLOCK.stamp
+set_now = CLOCK.set_now
+reset = CLOCK.reset
+
+
+@contextmanager
+def virtual_now(start: When, rate: float = 0.0) -> Iterator[EventClock]:
+    """Temporarily run the shared clock from ``start`` (frozen by default)."""
+    previous = CLOCK.anchor
+    CLOCK.set_now(start, rate)
+    try:
+        yield CLOCK
+    finally:
+        CLOCK.anchor = previous
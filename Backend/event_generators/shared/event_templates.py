@@ -0,0 +1,330 @@
+"""Template pools for hec_sender.py ``--speed-mode``.
+
+Speed mode used to pre-generate 1,000 events and replay them, patching a few
+timestamp fields in place (and not at all above ~10k EPS). Downstream saw the
+same 1,000 events over and over, with stale times, and the patching mutated
+dicts that queued batches could still reference.
+
+A ``TemplatePool`` still pre-generates a sample, but compiles each event into
+a template with typed variable slots:
+
+- timestamps (ISO 8601, syslog ``Mon dd HH:MM:SS``, epoch seconds / ms) are
+  re-rendered from the current (``event_clock``) time on every event, keeping each slot's
+  original offset from generation time and its exact text layout;
+- IPv4 addresses, UUIDs, long hex ids and port fields (``port``, ``src_port``,
+  ``dport``, ``sourcePort``, ...) are filled from
+  precomputed random pools (private IPs stay in their network, hex ids keep
+  their length and case), so repeated templates do not produce repeated events.
+
+Strings (raw lines and JSON text) are split into literal runs and slots once.
+Dicts are rendered copy-on-path: only the containers on the way to a slot are
+copied, the rest is shared with the template and never modified.
+"""
+from __future__ import annotations
+
+import random
+import re
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+import event_clock  # type: ignore
+
+POOL_BITS = 12  # 4096 values per pool
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_EPOCH_MIN, _EPOCH_MAX = 1_500_000_000, 2_000_000_000  # plausible "recent" epoch seconds
+
+_SLOT_RE = re.compile(r"""
+    (?P<iso>\d{4}-\d{2}-\d{2}(?P<sep>[T ])\d{2}:\d{2}:\d{2}(?:\.(?P<frac>\d{1,9}))?(?P<tz>Z|[+-]\d{2}:?\d{2})?)
+  | (?P<syslog>\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\ (?P<day>[ \d]\d)\ \d{2}:\d{2}:\d{2}\b)
+  | (?P<uuid>\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b)
+  | (?P<ipv4>\b(?:\d{1,3}\.){3}\d{1,3}\b)
+  | (?P<hex>\b[0-9a-fA-F]{16,}\b)
+  | (?P<epoch_ms>(?<![\d.])1[5-9]\d{11}(?![\d.]))
+  | (?P<epoch>(?<![\d.])1[5-9]\d{8}(?![\d.]))
+""", re.X)
+# Keys that hold a port number; "report_count", "ReportId" or "transport" do not
+_PORT_KEY_RE = re.compile(r"(?i:(?:\w*[_.-])?(?:nat|c|s)?(?:s|d|src|dst)?port)|\w*[a-z0-9]Port")
+
+
+# ---------------------------------------------------------------- random pools
+
+_POOLS: Dict[tuple, list] = {}
+
+
+def _pool(key: tuple, make: Callable[[random.Random], object]) -> list:
+    """Shared pool of ``2**POOL_BITS`` values per ``key``, built on first use."""
+    pool = _POOLS.get(key)
+    if pool is None:
+        rng = random.Random()
+        pool = _POOLS[key] = [make(rng) for _ in range(1 << POOL_BITS)]
+    return pool
+
+
+def _pool_slot(pool: list) -> Callable[[float], object]:
+    bits = random.getrandbits
+    return lambda now: pool[bits(POOL_BITS)]
+
+
+def _random_public_ipv4(rng: random.Random) -> str:
+    while True:
+        first = rng.randrange(1, 224)
+        if first not in (10, 127, 169, 172, 192):
+            return f"{first}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+
+
+def _ipv4_slot(value: str) -> Optional[Callable]:
+    octets = [int(o) for o in value.split(".")]
+    if any(o > 255 for o in octets):
+        return None
+    first, second = octets[0], octets[1]
+    # Private / special ranges keep their network; everything else draws from one public pool
+    if first in (10, 127):
+        prefix = f"{first}."
+        make = lambda rng: f"{prefix}{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+    elif (first, second) in ((192, 168), (169, 254)) or (first == 172 and 16 <= second <= 31):
+        prefix = f"{first}.{second}."
+        make = lambda rng: f"{prefix}{rng.randrange(256)}.{rng.randrange(1, 255)}"
+    elif first == 0 or first >= 224:
+        return None  # 0.0.0.0, multicast, broadcast: keep as written
+    else:
+        prefix, make = "public", _random_public_ipv4
+    return _pool_slot(_pool(("ipv4", prefix), make))
+
+
+def _uuid_slot(value: str) -> Callable:
+    upper = value.isupper()
+    return _pool_slot(_pool(("uuid", upper),
+                            lambda rng: (str(uuid.UUID(int=rng.getrandbits(128), version=4)).upper()
+                                         if upper else str(uuid.UUID(int=rng.getrandbits(128), version=4)))))
+
+
+def _hex_slot(value: str) -> Callable:
+    length = len(value)
+    if value.isdigit():
+        alphabet = "0123456789"
+    elif value.upper() == value:
+        alphabet = "0123456789ABCDEF"
+    else:
+        alphabet = "0123456789abcdef"
+    return _pool_slot(_pool(("hex", length, alphabet),
+                            lambda rng: "".join(rng.choice(alphabet) for _ in range(length))))
+
+
+def _port_slot(as_text: bool) -> Callable:
+    return _pool_slot(_pool(("port", as_text),
+                            lambda rng: (str if as_text else int)(rng.randint(1024, 65535))))
+
+
+# ---------------------------------------------------------------- timestamps
+
+def _iso_slot(match, generated_at: float) -> Callable:
+    text, sep, frac, tz = match.group("iso"), match.group("sep"), match.group("frac"), match.group("tz")
+    offset = 0
+    if tz and tz != "Z":
+        sign = -1 if tz[0] == "-" else 1
+        digits = tz[1:].replace(":", "")
+        offset = sign * (int(digits[:2]) * 3600 + int(digits[2:]) * 60)
+    try:
+        parsed = datetime.strptime(text[:19].replace("T", " "), "%Y-%m-%d %H:%M:%S")
+        delta = parsed.replace(tzinfo=timezone.utc).timestamp() - offset - int(generated_at)
+    except ValueError:
+        delta = 0
+    layout = f"%Y-%m-%d{sep}%H:%M:%S"
+    scale = 10 ** len(frac) if frac else 0
+    suffix = tz or ""
+    strftime, gmtime = time.strftime, time.gmtime
+
+    def render(now: float) -> str:
+        t = now + delta + offset
+        out = strftime(layout, gmtime(t))
+        if scale:
+            out += "." + str(int((t % 1) * scale)).zfill(len(frac))
+        return out + suffix
+    return render
+
+
+def _syslog_slot(match, generated_at: float) -> Callable:
+    text, day = match.group("syslog"), match.group("day")
+    year = time.gmtime(generated_at).tm_year
+    try:
+        parsed = datetime.strptime(f"{year} {text}", "%Y %b %d %H:%M:%S")
+        delta = parsed.replace(tzinfo=timezone.utc).timestamp() - int(generated_at)
+    except ValueError:
+        delta = 0
+    day_format = "{:2d}" if day.startswith(" ") else "{:02d}"
+    gmtime = time.gmtime
+
+    def render(now: float) -> str:
+        tm = gmtime(now + delta)
+        return (f"{_MONTHS[tm.tm_mon - 1]} {day_format.format(tm.tm_mday)} "
+                f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}")
+    return render
+
+
+def _epoch_slot(value: float, scale: int, generated_at: float, as_text: bool, as_float: bool) -> Callable:
+    delta = value / scale - generated_at
+
+    def render(now: float):
+        t = (now + delta) * scale
+        t = t if as_float else int(t)
+        return str(t) if as_text else t
+    return render
+
+
+def _text_slot(match, generated_at: float) -> Optional[Callable]:
+    kind = next(name for name in ("iso", "syslog", "uuid", "ipv4", "hex", "epoch_ms", "epoch")
+                if match.group(name) is not None)
+    value = match.group(kind)
+    if kind == "iso":
+        return _iso_slot(match, generated_at)
+    if kind == "syslog":
+        return _syslog_slot(match, generated_at)
+    if kind == "uuid":
+        return _uuid_slot(value)
+    if kind == "ipv4":
+        return _ipv4_slot(value)
+    if kind == "hex":
+        return _hex_slot(value)
+    if kind == "epoch_ms":
+        return _epoch_slot(int(value), 1000, generated_at, True, False)
+    return _epoch_slot(int(value), 1, generated_at, True, False)
+
+
+# ---------------------------------------------------------------- templates
+
+class StringTemplate:
+    """A string split into literal runs and variable slots."""
+
+    __slots__ = ("head", "pieces")
+
+    def __init__(self, text: str, generated_at: float):
+        self.head = None
+        self.pieces = []  # (slot, literal that follows it)
+        pos = 0
+        literal = []
+        for match in _SLOT_RE.finditer(text):
+            slot = _text_slot(match, generated_at)
+            if slot is None:
+                continue
+            literal.append(text[pos:match.start()])
+            if self.head is None:
+                self.head = "".join(literal)
+            else:
+                self.pieces[-1] = (self.pieces[-1][0], "".join(literal))
+            self.pieces.append((slot, ""))
+            literal = []
+            pos = match.end()
+        tail = text[pos:]
+        if self.head is None:
+            self.head = text
+        else:
+            self.pieces[-1] = (self.pieces[-1][0], tail)
+
+    @property
+    def slots(self) -> int:
+        return len(self.pieces)
+
+    def render(self, now: float) -> str:
+        out = [self.head]
+        for slot, literal in self.pieces:
+            out.append(slot(now))
+            out.append(literal)
+        return "".join(out)
+
+
+def _is_epoch(value) -> int:
+    """1 for epoch seconds, 1000 for epoch milliseconds, 0 otherwise."""
+    if _EPOCH_MIN <= value <= _EPOCH_MAX:
+        return 1
+    if _EPOCH_MIN * 1000 <= value <= _EPOCH_MAX * 1000:
+        return 1000
+    return 0
+
+
+def _compile(value, key, generated_at: float):
+    """Slot callable or container plan for ``value``, or None when it never changes."""
+    if isinstance(value, str):
+        if key and _PORT_KEY_RE.fullmatch(key) and value.isdigit() and 0 < int(value) < 65536:
+            return _port_slot(True)
+        template = StringTemplate(value, generated_at)
+        return template.render if template.slots else None
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        if key and _PORT_KEY_RE.fullmatch(key) and isinstance(value, int) and 0 < value < 65536:
+            return _port_slot(False)
+        scale = _is_epoch(value)
+        if scale:
+            return _epoch_slot(value, scale, generated_at, False, isinstance(value, float))
+        return None
+    if isinstance(value, dict):
+        items = [(k, _compile(v, k, generated_at)) for k, v in value.items()]
+        items = [(k, plan) for k, plan in items if plan is not None]
+        return _ContainerPlan(value, items) if items else None
+    if isinstance(value, list):
+        items = [(i, _compile(v, key, generated_at)) for i, v in enumerate(value)]
+        items = [(i, plan) for i, plan in items if plan is not None]
+        return _ContainerPlan(value, items) if items else None
+    return None
+
+
+class _ContainerPlan:
+    """Copy of one dict/list with its variable children re-rendered."""
+
+    __slots__ = ("source", "items", "copy")
+
+    def __init__(self, source, items: list):
+        self.source = source
+        self.items = items
+        self.copy = dict if isinstance(source, dict) else list
+
+    def __call__(self, now: float):
+        out = self.copy(self.source)
+        for key, plan in self.items:
+            out[key] = plan(now)
+        return out
+
+
+def _count_slots(plan) -> int:
+    if isinstance(plan, _ContainerPlan):
+        return sum(_count_slots(p) for _, p in plan.items)
+    owner = getattr(plan, "__self__", None)
+    return owner.slots if isinstance(owner, StringTemplate) else 1
+
+
+class EventTemplate:
+    """One sample event compiled into a renderer (the event itself when it has no slots)."""
+
+    __slots__ = ("event", "plan", "slots")
+
+    def __init__(self, event, generated_at: Optional[float] = None):
+        generated_at = event_clock.now() if generated_at is None else generated_at
+        self.event = event
+        self.plan = _compile(event, None, generated_at)
+        self.slots = _count_slots(self.plan) if self.plan is not None else 0
+
+    def render(self, now: Optional[float] = None):
+        if self.plan is None:
+            return self.event
+        return self.plan(event_clock.now() if now is None else now)
+
+
+class TemplatePool:
+    """Round-robin over compiled templates of pre-generated sample events."""
+
+    def __init__(self, events: Sequence, generated_at: Optional[float] = None):
+        generated_at = event_clock.now() if generated_at is None else generated_at
+        self.templates: List[EventTemplate] = [EventTemplate(e, generated_at) for e in events]
+        self.slots = sum(t.slots for t in self.templates)
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def render(self, now: Optional[float] = None):
+        """The next template, rendered with fresh timestamps and pool values."""
+        template = self.templates[self._next]
+        self._next = (self._next + 1) % len(self.templates)
+        return template.render(now)
@@ -0,0 +1,143 @@
+"""Precompiled line layouts for text generators (``kv``, ``csv``, ``syslog``).
+
+Most text generators rebuild the same line every event: merge a constant
+field dict with a few fresh values, then ``" ".join(f"{k}={v}" ...)``. Only a
+handful of slots (timestamps, ports, ids) actually change. A ``FieldTemplate``
+does the constant work once: adjacent fixed fields are pre-joined into single
+literal segments, so rendering is a slice assignment of the slot values into
+a copy of the segment list and one ``"".join``.
+
+``compile_kv``        ``key=value`` records from a template dict
+``compile_delimited`` CSV-style records from a column list
+``compile_text``      any line with ``{name}`` placeholders (syslog headers)
+
+Slot values passed to ``render`` must already be ``str``; ``render_map``
+converts for callers that have a mapping of arbitrary values.
+"""
+from __future__ import annotations
+
+from string import Formatter
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+
+class Slot(NamedTuple):
+    """Marks a variable column in ``compile_delimited``."""
+    name: str
+
+
+Segment = Union[str, Slot]
+
+
+class FieldTemplate:
+    """Literal text segments with named slots between them."""
+
+    __slots__ = ("slots", "_parts", "_order")
+
+    def __init__(self, segments: Sequence[Segment], slots: Optional[Sequence[str]] = None):
+        parts: List[Optional[str]] = [""]
+        occurrences: List[str] = []
+        for segment in segments:
+            if isinstance(segment, Slot):
+                occurrences.append(segment.name)
+                parts.extend((None, ""))
+            else:
+                parts[-1] += segment
+        names = tuple(dict.fromkeys(occurrences))
+        if slots is not None:
+            if sorted(slots) != sorted(names):
+                raise ValueError(f"slot order {tuple(slots)} does not match template slots {names}")
+            names = tuple(slots)
+        self.slots: Tuple[str, ...] = names
+        self._parts = parts
+        # Only needed when a slot appears more than once or out of declared order
+        order = [names.index(name) for name in occurrences]
+        self._order = None if order == list(range(len(names))) else order
+
+    def render(self, *values: str) -> str:
+        """The line with ``values`` (strings, in ``slots`` order) filled in."""
+        parts = self._parts.copy()
+        if self._order is None:
+            parts[1::2] = values
+        else:
+            parts[1::2] = [values[i] for i in self._order]
+        return "".join(parts)
+
+    def render_map(self, values: Mapping[str, Any]) -> str:
+        """``render`` from a mapping; values are converted with ``str``."""
+        return self.render(*[str(values[name]) for name in self.slots])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(slots={self.slots!r})"
+
+
+class KVTemplate(FieldTemplate):
+    """``FieldTemplate`` for ``key=value`` records that keeps its source fields.
+
+    ``render_overrides`` rebuilds the line the uncompiled way so callers can
+    still override or add arbitrary keys.
+    """
+
+    __slots__ = ("fields", "sep", "assign")
+
+    def __init__(self, fields: Mapping[str, Any], slots: Sequence[str] = (),
+                 sep: str = " ", assign: str = "="):
+        self.fields: Dict[str, Any] = dict(fields)
+        self.sep = sep
+        self.assign = assign
+        keys = list(self.fields) + [name for name in slots if name not in self.fields]
+        segments: List[Segment] = []
+        wanted = set(slots)
+        for idx, key in enumerate(keys):
+            lead = sep if idx else ""
+            if key in wanted:
+                segments.extend((f"{lead}{key}{assign}", Slot(key)))
+            else:
+                segments.append(f"{lead}{key}{assign}{self.fields[key]}")
+        super().__init__(segments, slots)
+
+    def render_overrides(self, overrides: Optional[Mapping[str, Any]], *values: str) -> str:
+        """Like ``render``, then ``overrides`` replace keys in place or append new ones."""
+        if not overrides:
+            return self.render(*values)
+        record = {**self.fields, **dict(zip(self.slots, values)), **overrides}
+        assign = self.assign
+        return self.sep.join(f"{k}{assign}{v}" for k, v in record.items())
+
+
+def compile_kv(fields: Mapping[str, Any], slots: Sequence[str] = (),
+               sep: str = " ", assign: str = "=") -> KVTemplate:
+    """Compile ``fields`` into a ``key=value`` layout.
+
+    Keys listed in ``slots`` become variable: in place when ``fields`` has
+    them, appended in ``slots`` order otherwise, exactly like
+    ``{**fields, **fresh_values}``.
+    """
+    return KVTemplate(fields, slots, sep, assign)
+
+
+def compile_delimited(columns: Sequence[Union[Any, Slot]], sep: str = ",") -> FieldTemplate:
+    """Compile a column list where ``Slot(name)`` entries vary and the rest are fixed."""
+    segments: List[Segment] = []
+    for idx, column in enumerate(columns):
+        if idx:
+            segments.append(sep)
+        segments.append(column if isinstance(column, Slot) else str(column))
+    return FieldTemplate(segments)
+
+
+def compile_text(pattern: str, slots: Optional[Sequence[str]] = None) -> FieldTemplate:
+    """Compile a ``str.format``-style pattern of bare ``{name}`` placeholders.
+
+    ``slots`` fixes the positional order for ``render``; by default it is the
+    order of first appearance. A name may appear more than once.
+    """
+    segments: List[Segment] = []
+    for literal, name, spec, conversion in Formatter().parse(pattern):
+        if literal:
+            segments.append(literal)
+        if name is None:
+            continue
+        if not name or spec or conversion:
+            raise ValueError(f"only bare named placeholders are supported, got {{{name}}} in {pattern!r}")
+        segments.append(Slot(name))
+    return FieldTemplate(segments, slots)
@@ -0,0 +1,71 @@
+"""Deadline heap for time-based batch flushes in hec_sender.py.
+
+Instead of a thread that wakes every 200ms and scans every buffer under a
+global lock, each batch schedules its own flush deadline when it receives its
+first event. One background thread sleeps until the earliest deadline, pops
+every entry that is due and hands it to the callback outside the heap lock.
+Entries for batches that were already flushed by size are simply ignored by
+the callback.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, List, Tuple
+
+
+class FlushTimer:
+    """Min-heap of ``(deadline, item)`` served by one background thread."""
+
+    def __init__(self, callback: Callable[[Any], None], clock: Callable[[], float] = time.time,
+                 name: str = "hec-batch-timer"):
+        self._callback = callback
+        self._clock = clock
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._seq = itertools.count()  # tie-breaker: items themselves are not comparable
+        self._cond = threading.Condition()
+        self._stopped = False
+        self.fired = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def schedule(self, deadline: float, item: Any):
+        """Call ``callback(item)`` at ``deadline`` (same clock as ``clock``)."""
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._seq), item))
+            # Only wake the thread when this deadline is now the earliest
+            if self._heap[0][2] is item:
+                self._cond.notify()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - self._clock()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self._stopped:
+                    return
+                _, _, item = heapq.heappop(self._heap)
+            try:
+                self._callback(item)
+            except Exception as e:  # keep the timer alive; the callback reports its own errors
+                print(f"[BATCH] Timed flush failed: {e}", flush=True)
+            self.fired += 1
+
+    def close(self):
+        """Stop the thread, dropping pending deadlines; waits for a callback in progress."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
@@ -0,0 +1,108 @@
+"""Output contract for event generators.
+
+Each generator module declares what its ``<product>_log()`` functions return
+with a module-level ``OUTPUT_KIND``:
+
+- ``json`` - a dict, or JSON text
+- ``kv`` - ``key=value`` text (FortiGate, Akamai, F5 ...)
+- ``csv`` - one comma-separated record
+- ``syslog`` - a line with a syslog header (``<PRI>`` or timestamp/host prefix)
+- ``cef`` - ``CEF:0|...``
+- ``text`` - any other single line or message
+
+A generator may also define ``<func>_bytes()`` returning the same event as
+wire-ready UTF-8: the JSON document for ``json``, the line itself otherwise.
+``render_bytes(func)`` returns that companion, or a wrapper that encodes
+``func()``'s result, so callers that only need bytes never parse or
+re-serialise an event. ``to_object`` goes the other way for callers that need
+a dict (the API), parsing only what the declared kind says is JSON.
+"""
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from hec_json import dumps_bytes, loads  # type: ignore
+
+KINDS = ("json", "kv", "csv", "syslog", "cef", "text")
+BYTES_SUFFIX = "_bytes"
+
+
+def module_kind(namespace) -> Optional[str]:
+    """``OUTPUT_KIND`` of a module (or its globals dict); None when undeclared."""
+    if not isinstance(namespace, dict):
+        namespace = vars(namespace)
+    kind = namespace.get("OUTPUT_KIND")
+    if kind is None:
+        return None
+    if kind not in KINDS:
+        raise ValueError(f"unknown OUTPUT_KIND {kind!r} in {namespace.get('__name__', '?')} "
+                         f"(expected one of {', '.join(KINDS)})")
+    return kind
+
+
+def output_kind(func: Callable) -> Optional[str]:
+    """Declared output kind of a generator function's module."""
+    namespace = getattr(func, "__globals__", None)
+    return module_kind(namespace) if namespace is not None else None
+
+
+def infer_kind(event) -> str:
+    """Best guess for an event from an undeclared generator."""
+    if isinstance(event, (dict, list)):
+        return "json"
+    text = event.decode("utf-8", "replace") if isinstance(event, bytes) else str(event)
+    head = text.lstrip()[:4]
+    if head[:1] in ("{", "["):
+        return "json"
+    if head == "CEF:":
+        return "cef"
+    if head[:1] == "<":
+        return "syslog"
+    return "text"
+
+
+def bytes_function(func: Callable) -> Optional[Callable[[], bytes]]:
+    """The ``<name>_bytes`` companion of ``func``, or None."""
+    namespace = getattr(func, "__globals__", None)
+    name = getattr(func, "__name__", None)
+    if namespace is None or name is None:
+        return None
+    companion = namespace.get(name + BYTES_SUFFIX)
+    return companion if callable(companion) else None
+
+
+def to_bytes(event) -> bytes:
+    """Wire form of one event: dicts as compact JSON, text as UTF-8."""
+    if isinstance(event, bytes):
+        return event
+    if isinstance(event, str):
+        return event.encode("utf-8")
+    return dumps_bytes(event)
+
+
+def render_bytes(func: Callable) -> Callable[[], bytes]:
+    """Zero-argument callable producing ``func``'s events as bytes."""
+    companion = bytes_function(func)
+    if companion is not None:
+        return companion
+
+    def render() -> bytes:
+        return to_bytes(func())
+    render.__name__ = getattr(func, "__name__", "render") + BYTES_SUFFIX
+    return render
+
+
+def to_object(event, kind: Optional[str] = None):
+    """Event as a dict: JSON is parsed, other kinds are wrapped as ``{"raw": text}``."""
+    if isinstance(event, (dict, list)):
+        return event
+    if kind is None:
+        kind = infer_kind(event)
+    if kind == "json":
+        try:
+            return loads(event)
+        except ValueError:
+            pass
+    if isinstance(event, bytes):
+        event = event.decode("utf-8", "replace")
+    return {"raw": event}
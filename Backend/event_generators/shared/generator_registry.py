@@ -0,0 +1,91 @@
+"""Generator module registry for hec_sender.py.
+
+Generators live in one directory per category (``cloud_infrastructure``,
+``network_security``, ...). Instead of pushing every category onto
+``sys.path`` at import time, ``install()`` adds one finder to
+``sys.meta_path`` that maps a top-level module name to
+``<category>/<name>.py`` when nothing on ``sys.path`` provides it. Nothing is
+listed or imported up front: a name costs at most one ``stat`` per category
+the first time it is looked up, and the answer is remembered.
+
+``load_generator(name)`` is the explicit entry point; plain ``import
+fortinet_fortigate`` statements (the scenario modules use them) resolve
+through the same finder.
+
+Generators import the shared helpers (``random_pools``, ``event_clock``,
+``bulk_random`` ...) by plain name and do not touch ``sys.path`` themselves:
+``install()`` puts this directory on the path once, for every loader. Code
+that loads generator files some other way (``GeneratorService``, the
+scenario scripts) calls ``install()`` or adds ``SHARED_ROOT`` first.
+"""
+from __future__ import annotations
+
+import importlib
+import importlib.abc
+import importlib.util
+import os
+import sys
+from types import ModuleType
+from typing import Dict, Optional
+
+SHARED_ROOT = os.path.dirname(os.path.abspath(__file__))
+GENERATOR_ROOT = os.path.dirname(SHARED_ROOT)
+
+# Lookup order: the order the categories used to take on sys.path (last inserted first)
+CATEGORIES = (
+    "infrastructure",
+    "web_security",
+    "email_security",
+    "identity_access",
+    "endpoint_security",
+    "network_security",
+    "cloud_infrastructure",
+)
+
+_PATHS: Dict[str, Optional[str]] = {}
+
+
+def generator_path(module_name: str) -> Optional[str]:
+    """Path of ``<category>/<module_name>.py``, or None when no category has it."""
+    try:
+        return _PATHS[module_name]
+    except KeyError:
+        pass
+    path = None
+    for category in CATEGORIES:
+        candidate = os.path.join(GENERATOR_ROOT, category, f"{module_name}.py")
+        if os.path.isfile(candidate):
+            path = candidate
+            break
+    _PATHS[module_name] = path
+    return path
+
+
+class GeneratorFinder(importlib.abc.MetaPathFinder):
+    """Resolves top-level generator module names to their category directory."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if path is not None or "." in fullname:
+            return None
+        location = generator_path(fullname)
+        if location is None:
+            return None
+        return importlib.util.spec_from_file_location(fullname, location)
+
+
+_FINDER = GeneratorFinder()
+
+
+def install():
+    """Put the shared helpers on ``sys.path`` and append the generator finder to
+    ``sys.meta_path`` (idempotent)."""
+    if SHARED_ROOT not in sys.path:
+        sys.path.insert(0, SHARED_ROOT)
+    if _FINDER not in sys.meta_path:
+        sys.meta_path.append(_FINDER)
+
+
+def load_generator(module_name: str) -> ModuleType:
+    """Import a generator module by name (``ModuleNotFoundError`` when it does not exist)."""
+    install()
+    return importlib.import_module(module_name)
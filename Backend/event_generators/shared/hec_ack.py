@@ -0,0 +1,103 @@
+"""HEC indexer acknowledgement tracking for hec_sender.py.
+
+With indexer acknowledgement enabled on the token, every POST carries an
+``X-Splunk-Request-Channel`` header and the collector answers with an
+``ackId``. A 2xx only means the request was received; the ack confirms the
+events were indexed. ``HecAckTracker`` records outstanding ackIds and polls the
+collector's ``/ack`` endpoint for them in the background, counting batches that
+are confirmed and those that time out unconfirmed.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+CHANNEL_HEADER = "X-Splunk-Request-Channel"
+
+
+class HecAckTracker:
+    """Outstanding ackIds for one request channel, polled via ``query(ids) -> {id: bool}``."""
+
+    def __init__(self, query: Callable[[List[int]], Dict[str, bool]],
+                 poll_interval: float = 2.0, timeout: float = 120.0):
+        self.channel = str(uuid.uuid4())
+        self.query = query
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.enabled = True
+        self.confirmed = 0
+        self.timed_out = 0
+        self.poll_errors = 0
+        self._pending: Dict[int, float] = {}  # ackId -> time posted
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def headers(self) -> dict:
+        return {CHANNEL_HEADER: self.channel}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def track(self, ack_id: int):
+        with self._lock:
+            self._pending[int(ack_id)] = time.monotonic()
+
+    def disable(self) -> bool:
+        """Stop tracking (the token has no indexer ack). Returns True the first time."""
+        with self._lock:
+            was_enabled, self.enabled = self.enabled, False
+            self._pending.clear()
+        return was_enabled
+
+    def poll_once(self):
+        with self._lock:
+            ids = list(self._pending)
+        if not ids:
+            return
+        try:
+            acks = self.query(ids)
+        except Exception:
+            self.poll_errors += 1
+            acks = {}
+        now = time.monotonic()
+        with self._lock:
+            for ack_id in ids:
+                if acks.get(str(ack_id)) or acks.get(ack_id):
+                    self._pending.pop(ack_id, None)
+                    self.confirmed += 1
+                elif now - self._pending.get(ack_id, now) > self.timeout:
+                    self._pending.pop(ack_id, None)
+                    self.timed_out += 1
+
+    def start(self):
+        def _run():
+            while not self._stop.wait(self.poll_interval):
+                self.poll_once()
+
+        self._thread = threading.Thread(target=_run, name="hec-ack-poller", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float) -> bool:
+        """Poll until nothing is outstanding or ``timeout`` expires."""
+        deadline = time.monotonic() + timeout
+        while self._pending and time.monotonic() < deadline:
+            self.poll_once()
+            if self._pending:
+                time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+        return not self._pending
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def describe(self) -> str:
+        text = f"acks {self.confirmed} confirmed, {self.pending} pending"
+        if self.timed_out:
+            text += f", {self.timed_out} unconfirmed"
+        return text
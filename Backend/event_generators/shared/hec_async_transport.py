@@ -0,0 +1,270 @@
+"""Asyncio HEC transport with a pool of keep-alive connections.
+
+Used by hec_sender.py when ``--transport async`` is selected. Batches are
+submitted from producer threads and POSTed concurrently on a private event
+loop, bounded by a maximum number of in-flight requests and in-flight bytes.
+Besides the standard library only ``requests`` (already the sender's one
+third-party dependency) is used, for its case-insensitive header dict.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+
+class HecHTTPError(Exception):
+    """Raised by ``HecResponse.raise_for_status`` for 4xx/5xx responses."""
+
+    def __init__(self, response: "HecResponse"):
+        super().__init__(f"{response.status_code} Error for url: {response.url}")
+        self.response = response
+
+
+class HecResponse:
+    """Small subset of ``requests.Response`` used by the sender."""
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes):
+        self.url = url
+        self.status_code = status_code
+        # Looked up like requests' headers (resp.headers.get('Retry-After')), whatever the server's case
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HecHTTPError(self)
+
+
+def make_ssl_context(verify: bool, tls_low: bool) -> ssl.SSLContext:
+    """Build an SSL context matching the sender's verify / SECLEVEL=1 toggles."""
+    ctx = ssl.create_default_context()
+    if tls_low:
+        try:
+            ctx.set_ciphers('DEFAULT@SECLEVEL=1')
+        except ssl.SSLError:
+            pass
+    if not verify:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections per (scheme, host, port)."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, connect_timeout: float):
+        self._ssl = ssl_context
+        self._connect_timeout = connect_timeout
+        self._idle: Dict[Tuple[str, str, int], list] = {}
+
+    async def acquire(self, scheme: str, host: str, port: int):
+        idle = self._idle.get((scheme, host, port))
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        conn = asyncio.open_connection(
+            host, port,
+            ssl=self._ssl if scheme == "https" else None,
+            server_hostname=host if scheme == "https" else None,
+        )
+        reader, writer = await asyncio.wait_for(conn, timeout=self._connect_timeout)
+        return reader, writer, False
+
+    def release(self, scheme: str, host: str, port: int, reader, writer):
+        self._idle.setdefault((scheme, host, port), []).append((reader, writer))
+
+    def close(self):
+        for conns in self._idle.values():
+            for _, writer in conns:
+                writer.close()
+        self._idle.clear()
+
+
+class AsyncHecTransport:
+    """Concurrent HEC POST engine running on a background asyncio loop.
+
+    ``submit()`` is thread-safe and returns immediately unless the in-flight
+    byte budget is exhausted, in which case it blocks the caller until enough
+    earlier requests complete. That gives producers natural backpressure.
+    """
+
+    def __init__(self, max_inflight: int = 8, max_inflight_bytes: int = 64 * 1024 * 1024,
+                 verify: bool = True, tls_low: bool = False, timeout: float = 30.0):
+        self.max_inflight = max(1, int(max_inflight))
+        self.max_inflight_bytes = max(1, int(max_inflight_bytes))
+        self.timeout = timeout
+        self._pool = _ConnectionPool(make_ssl_context(verify, tls_low), timeout)
+        self._cond = threading.Condition()
+        self._inflight_bytes = 0
+        self._pending = 0
+        self.stats = {'requests': 0, 'failures': 0, 'bytes': 0, 'latency_total': 0.0}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+        self._sem = asyncio.run_coroutine_threadsafe(self._make_semaphore(), self._loop).result()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _make_semaphore(self):
+        return asyncio.Semaphore(self.max_inflight)
+
+    # ------------------------------------------------------------------ #
+    #  HTTP/1.1 over asyncio streams
+    # ------------------------------------------------------------------ #
+    async def _request(self, url: str, headers: dict, body: bytes) -> HecResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        head = [f"POST {target} HTTP/1.1", f"Host: {parts.netloc}",
+                f"Content-Length: {len(body)}", "Connection: keep-alive"]
+        head.extend(f"{k}: {v}" for k, v in headers.items())
+        request = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+        # A reused connection may have been closed by the server while idle;
+        # retry once on a fresh connection in that case.
+        for attempt in range(2):
+            reader, writer, reused = await self._pool.acquire(scheme, host, port)
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, resp_headers, content, keep_alive = await self._read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError, EOFError):
+                writer.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                self._pool.release(scheme, host, port, reader, writer)
+            else:
+                writer.close()
+            return HecResponse(url, status, resp_headers, content)
+        raise ConnectionError(f"HEC connection to {host}:{port} failed")
+
+    async def _read_response(self, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise EOFError("connection closed before response")
+        version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+        headers = CaseInsensitiveDict()
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip()] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close" and version != "HTTP/1.0"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            content = b"".join(chunks)
+        elif "content-length" in headers:
+            content = await reader.readexactly(int(headers["content-length"]))
+        else:
+            content = await reader.read()
+            keep_alive = False
+        return int(status), headers, content, keep_alive
+
+    async def _post(self, url: str, headers: dict, body: bytes) -> HecResponse:
+        async with self._sem:
+            start = time.monotonic()
+            try:
+                resp = await asyncio.wait_for(self._request(url, headers, body), timeout=self.timeout)
+            finally:
+                self.stats['latency_total'] += time.monotonic() - start
+            resp.elapsed = time.monotonic() - start
+            return resp
+
+    # ------------------------------------------------------------------ #
+    #  Thread-facing API
+    # ------------------------------------------------------------------ #
+    def submit(self, url: str, headers: dict, body: bytes,
+               on_done: Optional[Callable[[Optional[HecResponse], Optional[BaseException]], None]] = None):
+        """Queue a POST; ``on_done(response, error)`` runs on the loop thread."""
+        nbytes = len(body)
+        with self._cond:
+            while self._pending and self._inflight_bytes + nbytes > self.max_inflight_bytes:
+                self._cond.wait()
+            self._inflight_bytes += nbytes
+            self._pending += 1
+
+        def _complete(fut):
+            resp, err = None, None
+            try:
+                resp = fut.result()
+            except BaseException as e:  # surfaced through on_done
+                err = e
+            self.stats['requests'] += 1
+            self.stats['bytes'] += nbytes
+            if err is not None or resp.status_code >= 400:
+                self.stats['failures'] += 1
+            try:
+                if on_done:
+                    on_done(resp, err)
+            finally:
+                with self._cond:
+                    self._inflight_bytes -= nbytes
+                    self._pending -= 1
+                    self._cond.notify_all()
+
+        fut = asyncio.run_coroutine_threadsafe(self._post(url, headers, body), self._loop)
+        fut.add_done_callback(_complete)
+        return fut
+
+    def post(self, url: str, headers: dict, body: bytes) -> HecResponse:
+        """Blocking POST through the pool (used for one-off requests)."""
+        return self.submit(url, headers, body).result()
+
+    @property
+    def inflight(self) -> int:
+        return self._pending
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted request has completed."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self):
+        self.drain(timeout=self.timeout)
+        self._loop.call_soon_threadsafe(self._pool.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
@@ -0,0 +1,175 @@
+"""Payload codecs for HEC batch bodies.
+
+A codec turns newline-delimited batch text into the request body and names the
+``Content-Encoding`` it is sent with. Codecs are streaming: ``compressor()``
+returns an object with ``compress(data)`` / ``flush()`` so batch buffers can
+encode events as they arrive (see batch_buffer.py).
+
+Specs are ``name[:level]``:
+
+- ``gzip[:1-9]`` (default ``gzip:1``) - accepted by every HEC endpoint
+- ``zstd[:1-22]`` - needs the optional ``zstandard`` package and a collector
+  that accepts ``Content-Encoding: zstd``
+- ``identity`` / ``none`` - uncompressed
+
+``parse_codec_spec`` also accepts per-destination specs such as
+``event=zstd:3,raw=gzip:6`` so /event and /raw can use different codecs.
+"""
+from __future__ import annotations
+
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # optional dependency
+    zstandard = None
+
+DESTINATIONS = ("event", "raw")
+
+
+class _IdentityStream:
+    def compress(self, data) -> bytes:
+        return bytes(data)  # may be a memoryview of a reused buffer
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class Codec:
+    """Uncompressed bodies (no Content-Encoding header)."""
+
+    name = "identity"
+    content_encoding: Optional[str] = None
+    default_level: Optional[int] = None
+    levels: Tuple[int, int] = (0, 0)
+
+    def __init__(self, level: Optional[int] = None):
+        if level is None:
+            level = self.default_level
+        elif not self.levels[0] <= level <= self.levels[1]:
+            raise ValueError(f"{self.name} level must be {self.levels[0]}-{self.levels[1]}, got {level}")
+        self.level = level
+
+    def compressor(self):
+        return _IdentityStream()
+
+    def compress(self, data: bytes) -> bytes:
+        stream = self.compressor()
+        return stream.compress(data) + stream.flush()
+
+    def decompress(self, body: bytes) -> bytes:
+        return body
+
+    def __str__(self) -> str:
+        return self.name if self.level is None else f"{self.name}:{self.level}"
+
+
+class GzipCodec(Codec):
+    name = "gzip"
+    content_encoding = "gzip"
+    # Level 1 is ~10x faster than default level 9, with only ~10% larger output
+    default_level = 1
+    levels = (1, 9)
+
+    def compressor(self):
+        return zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def decompress(self, body: bytes) -> bytes:
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+
+
+class ZstdCodec(Codec):
+    name = "zstd"
+    content_encoding = "zstd"
+    default_level = 3
+    levels = (1, 22)
+
+    def __init__(self, level: Optional[int] = None):
+        if zstandard is None:
+            raise ValueError("zstd codec needs the 'zstandard' package (pip install zstandard)")
+        super().__init__(level)
+        self._cctx = zstandard.ZstdCompressor(level=self.level)
+
+    def compressor(self):
+        return self._cctx.compressobj()
+
+    def decompress(self, body: bytes) -> bytes:
+        # Streamed frames carry no content size, so use a decompression object
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+
+
+_CODECS = {"identity": Codec, "none": Codec, "gzip": GzipCodec, "zstd": ZstdCodec}
+
+
+def get_codec(spec: str) -> Codec:
+    """Build a codec from ``name[:level]``; raises ValueError for unknown/unavailable codecs."""
+    name, _, level = spec.strip().lower().partition(":")
+    if name not in _CODECS:
+        raise ValueError(f"unknown codec '{name}' (choose from gzip, zstd, identity)")
+    try:
+        return _CODECS[name](int(level) if level else None)
+    except ValueError as e:
+        if level and not level.isdigit():
+            raise ValueError(f"invalid codec level '{level}'") from e
+        raise
+
+
+def codec_for_encoding(content_encoding: Optional[str]) -> Codec:
+    """Codec able to decode a body sent with ``content_encoding``."""
+    if not content_encoding:
+        return Codec()
+    return get_codec(content_encoding)
+
+
+def parse_codec_spec(spec: Optional[str]) -> Dict[str, Codec]:
+    """Parse ``gzip:1`` or ``event=zstd:3,raw=gzip:6`` into {destination: codec}."""
+    codecs = {dest: GzipCodec() for dest in DESTINATIONS}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        dest, sep, codec_spec = part.partition("=")
+        if not sep:
+            codec = get_codec(part)
+            codecs = {d: codec for d in DESTINATIONS}
+        elif dest in DESTINATIONS:
+            codecs[dest] = get_codec(codec_spec)
+        else:
+            raise ValueError(f"unknown codec destination '{dest}' (use event= or raw=)")
+    return codecs
+
+
+def available_codecs() -> List[Codec]:
+    """Codecs worth comparing in a benchmark (zstd only when installed)."""
+    codecs = [Codec(), GzipCodec(1), GzipCodec(6), GzipCodec(9)]
+    if zstandard is not None:
+        codecs += [ZstdCodec(1), ZstdCodec(3), ZstdCodec(9)]
+    return codecs
+
+
+def benchmark(codec: Codec, lines: List[bytes], min_seconds: float = 0.5) -> dict:
+    """Stream ``lines`` through ``codec`` in a batch buffer; report MB/s and ratio."""
+    raw = sum(len(line) for line in lines) + max(0, len(lines) - 1)
+    rounds = 0
+    start = time.perf_counter()
+    from batch_buffer import CompressedBatch  # type: ignore  (imports this module)
+    while True:
+        batch = CompressedBatch(codec)
+        for line in lines:
+            batch.add(line)
+        body = batch.finish().body
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            break
+    if codec.decompress(body) != b"\n".join(lines):
+        raise RuntimeError(f"{codec} round-trip mismatch")
+    return {
+        "codec": str(codec),
+        "raw_bytes": raw,
+        "encoded_bytes": len(body),
+        "ratio": raw / len(body) if body else 0.0,
+        "mb_per_sec": raw * rounds / elapsed / (1024 * 1024),
+    }
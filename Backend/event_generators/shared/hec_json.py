@@ -0,0 +1,63 @@
+"""JSON serialization backend for the HEC send path and generators.
+
+``dumps`` / ``dumps_bytes`` / ``loads`` use orjson when it is installed and
+fall back to the stdlib ``json`` module otherwise. Output is always compact
+(``separators=(",", ":")``). Set ``S1_HEC_JSON=json`` to force the stdlib
+backend, or ``S1_HEC_JSON=orjson`` to require orjson.
+
+Differences between backends are limited to formatting: orjson writes
+non-ASCII characters as UTF-8 instead of ``\\uXXXX`` escapes. Objects orjson
+cannot serialize (e.g. integers beyond 64 bits) fall back to the stdlib
+encoder for that call, so switching backends never turns a valid event into an
+error.
+
+Generators that return JSON strings import ``dumps`` from here by plain name,
+after the same short bootstrap that puts ``event_generators/shared`` on
+``sys.path`` for every generator, so they also work when run directly::
+
+    from hec_json import dumps as json_dumps
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Callable, Dict, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional dependency
+    orjson = None
+
+# json.dumps() with non-default separators builds a new JSONEncoder per call; reuse one
+_std_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _std_dumps_bytes(obj) -> bytes:
+    return _std_encode(obj).encode("utf-8")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _orjson_dumps_bytes(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:  # orjson.JSONEncodeError: fall back for this object
+            return _std_dumps_bytes(obj)
+
+    def _orjson_dumps(obj) -> str:
+        return _orjson_dumps_bytes(obj).decode("utf-8")
+
+# name -> (dumps -> str, dumps_bytes -> bytes, loads)
+BACKENDS: Dict[str, Tuple[Callable, Callable, Callable]] = {"json": (_std_encode, _std_dumps_bytes, json.loads)}
+if orjson is not None:
+    BACKENDS["orjson"] = (_orjson_dumps, _orjson_dumps_bytes, orjson.loads)
+
+_requested = os.getenv("S1_HEC_JSON", "auto").lower()
+if _requested == "orjson" and orjson is None:
+    raise RuntimeError("S1_HEC_JSON=orjson but orjson is not installed (pip install orjson)")
+if _requested not in ("auto", "json", "orjson"):
+    raise RuntimeError(f"S1_HEC_JSON must be auto, json or orjson, got '{_requested}'")
+
+BACKEND = "orjson" if orjson is not None and _requested != "json" else "json"
+dumps, dumps_bytes, loads = BACKENDS[BACKEND]
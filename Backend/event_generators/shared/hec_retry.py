@@ -0,0 +1,86 @@
+"""Retry/backoff policy and shared throttle gate for hec_sender.py.
+
+``RetryPolicy`` computes exponential backoff with jitter between attempts and
+honours a collector's ``Retry-After`` header when one is sent. ``ThrottleGate``
+is process-wide: when the collector answers 429 or 503, every sender thread
+(single sends, the batch sender, async retries and the spool drainer) pauses
+until the requested time has passed, instead of each thread retrying on its own
+schedule and adding load to a collector that already asked us to slow down.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Statuses that mean "try again later" rather than "this request is wrong"
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter, capped at ``max_delay`` seconds."""
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.25, max_delay: float = 30.0):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before attempt ``attempt + 1`` (``attempt`` counts from 0)."""
+        if retry_after is not None:
+            # The collector said when; add a little jitter so senders don't return in lockstep
+            return min(self.max_delay, retry_after) * random.uniform(1.0, 1.1)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        # "Equal jitter": at least half the backoff, spread over the other half
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+class ThrottleGate:
+    """Process-wide pause shared by every thread that talks to the collector."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._until = 0.0
+        self.throttled = 0
+        self.paused_s = 0.0
+
+    def hold(self, seconds: float):
+        """Pause all senders for at least ``seconds`` from now."""
+        with self._lock:
+            self.throttled += 1
+            self._until = max(self._until, time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self._until - time.monotonic())
+
+    def wait(self):
+        """Sleep until the current pause (if any) has expired."""
+        delay = self.remaining()
+        while delay > 0:
+            time.sleep(delay)
+            with self._lock:
+                self.paused_s += delay
+            delay = self.remaining()
+
+    def describe(self) -> str:
+        text = f"throttled {self.throttled}x, paused {self.paused_s:.1f}s"
+        if self.remaining() > 0:
+            text += f" (resuming in {self.remaining():.1f}s)"
+        return text
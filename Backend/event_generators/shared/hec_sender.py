@@ -1,28 +1,45 @@
 #!/usr/bin/env python3
 """Send logs from vendor_product generators to SentinelOne AI SIEM (Splunk‑HEC) one‑by‑one."""
-import argparse, json, os, time, random, requests, importlib, sys
-import gzip, io, threading, queue
-from datetime import datetime
+import argparse, json, os, time, random, requests, sys
+import io, threading, queue
 from typing import Callable, Tuple, Optional
 
-# Add generator category paths to sys.path
-import os
-import sys
+# Shared helpers are imported by plain name; generators resolve through generator_registry
 current_dir = os.path.dirname(os.path.abspath(__file__))
 generator_root = os.path.dirname(current_dir)
-for category in ['cloud_infrastructure', 'network_security', 'endpoint_security', 
-                 'identity_access', 'email_security', 'web_security', 'infrastructure']:
-    sys.path.insert(0, os.path.join(generator_root, category))
 sys.path.insert(0, current_dir)  # for local imports like parser_map
+import generator_registry  # type: ignore
+from generator_registry import load_generator  # type: ignore
+generator_registry.install()
+from batch_controller import BatchController, AdaptiveBatchController  # type: ignore
+from batch_buffer import BatchShard, CompressedBatch  # type: ignore
+from flush_timer import FlushTimer  # type: ignore
+from endpoint_cache import EndpointCache, cache_key as endpoint_cache_key  # type: ignore
+from send_metrics import LatencyRecorder  # type: ignore
+from send_queue import BatchSendQueue, POLICIES as BACKPRESSURE_POLICIES  # type: ignore
+from hec_codecs import parse_codec_spec, codec_for_encoding  # type: ignore
+from hec_envelope import EnvelopeTemplate  # type: ignore
+import event_clock  # type: ignore
+from hec_json import dumps_bytes, loads as json_loads, BACKEND as HEC_JSON_BACKEND  # type: ignore
+from eps_pacer import TokenBucketPacer  # type: ignore
+from product_mix import parse_mix, interleave  # type: ignore
+from event_templates import TemplatePool  # type: ignore
+from batch_generation import BatchSource, batch_function, generate_batch  # type: ignore
+from generator_output import bytes_function, module_kind  # type: ignore
+from hec_retry import RetryPolicy, ThrottleGate, parse_retry_after, THROTTLE_STATUSES  # type: ignore
 
-try:
-    # Prefer dynamic sourcetype discovery from the parsers directory
-    from parser_map import load_sourcetypes  # type: ignore
-    _REPO_ROOT = os.path.dirname(generator_root)
-    _PARSERS_DIR = os.path.join(_REPO_ROOT, 'parsers')
-    _LOADED_SOURCETYPE_MAP = load_sourcetypes(_PARSERS_DIR)
-except Exception:
-    _LOADED_SOURCETYPE_MAP = {}
+# Sourcetypes discovered from the parsers directory are only scanned when a product
+# without an explicit override is looked up, and the scan is cached in an index
+# keyed by directory mtimes (S1_HEC_SOURCETYPE_INDEX=<path> moves it, =off disables it).
+from parser_map import SourcetypeMap, load_sourcetypes, load_sourcetypes_cached  # type: ignore
+_REPO_ROOT = os.path.dirname(generator_root)
+_PARSERS_DIR = os.path.join(_REPO_ROOT, 'parsers')
+_SOURCETYPE_INDEX = os.getenv("S1_HEC_SOURCETYPE_INDEX", "")
+
+def _discover_sourcetypes() -> dict:
+    if _SOURCETYPE_INDEX.lower() in ("off", "0", "false", "no"):
+        return load_sourcetypes(_PARSERS_DIR)
+    return load_sourcetypes_cached(_PARSERS_DIR, _SOURCETYPE_INDEX or None)
 
 
 # Marketplace parser mappings to generators
@@ -611,210 +628,514 @@ _CONNECTION_CACHE = {
     'session': None
 }
 
+# Probed endpoint/TLS/auth combination persisted across processes, per token hash and URL.
+# S1_HEC_ENDPOINT_CACHE=<path> moves the file, =off disables it; --probe ignores and refreshes it.
+_ENDPOINT_CACHE_PATH = os.getenv("S1_HEC_ENDPOINT_CACHE", "")
+_ENDPOINT_CACHE = None if _ENDPOINT_CACHE_PATH.lower() in ("off", "0", "false", "no") else EndpointCache(
+    _ENDPOINT_CACHE_PATH or None, ttl=float(os.getenv("S1_HEC_ENDPOINT_CACHE_TTL", "86400")))
+_ENDPOINT_PROBE = False  # --probe: skip the persisted config and probe again
+
 # Batch mode controls
 _BATCH_ENABLED = os.getenv("S1_HEC_BATCH", "").lower() in ("1", "true", "yes")
 _BATCH_MAX_BYTES = int(os.getenv("S1_HEC_BATCH_MAX_BYTES", str(5 * 1024 * 1024)))
 _BATCH_FLUSH_MS = int(os.getenv("S1_HEC_BATCH_FLUSH_MS", "1000"))
-_BATCH_LOCK = threading.Lock()
-_BATCH_BUFFERS = {}  # key: (is_json:bool, product:str) -> {'lines': list[str], 'bytes': int, 'last': float}
-_BATCH_THREAD_STARTED = False
+# S1_HEC_BATCH_ADAPTIVE=true tunes the two thresholds above (as starting points)
+# from POST latency, response codes and send queue depth
+_BATCH_ADAPTIVE = os.getenv("S1_HEC_BATCH_ADAPTIVE", "").lower() in ("1", "true", "yes")
+if _BATCH_ADAPTIVE:
+    _BATCH_CONTROLLER = AdaptiveBatchController(
+        _BATCH_MAX_BYTES, _BATCH_FLUSH_MS,
+        target_latency_ms=int(os.getenv("S1_HEC_BATCH_TARGET_LATENCY_MS", "1000")),
+    )
+else:
+    _BATCH_CONTROLLER = BatchController(_BATCH_MAX_BYTES, _BATCH_FLUSH_MS)
+# S1_HEC_COALESCE=true / --coalesce: raw products are wrapped in /event envelopes that carry
+# their sourcetype, and every product shares one /event batch instead of one batch per product
+_BATCH_COALESCE = os.getenv("S1_HEC_COALESCE", "").lower() in ("1", "true", "yes")
+# key: (is_json:bool, product:str) -> BatchShard, or (True, None) for the coalesced batch.
+# Each shard has its own lock, so there is no global lock on the enqueue path; entries
+# are only ever added (setdefault).
+_BATCH_BUFFERS = {}
+# Payload codec per destination ('event' / 'raw'), set from --codec / S1_HEC_CODEC
+_BATCH_CODECS = parse_codec_spec(None)
+_BATCH_TIMER = None  # FlushTimer: min-heap of batch flush deadlines, started on first batch
+_BATCH_TIMER_LOCK = threading.Lock()
 _VERBOSITY = 'info'  # Global verbosity level, set after arg parsing
-_BATCH_SEND_QUEUE = None  # Queue for pipelined batch sending
+_BATCH_SEND_QUEUE = None  # BatchSendQueue for pipelined batch sending (--backpressure policy)
 _BATCH_SENDER_THREAD = None  # Background thread for sending batches
+_TRANSPORT = None  # AsyncHecTransport when --transport async is selected
+_SPOOL = None  # HecSpool when --spool-dir / S1_HEC_SPOOL_DIR is set
+_ACK = None  # HecAckTracker when --ack / S1_HEC_ACK is set
+
+# Retry policy for transient failures (429/503/5xx, timeouts, connection resets).
+# 429/503 pause every sender via the shared throttle gate, honouring Retry-After.
+_RETRY = RetryPolicy(
+    max_attempts=int(os.getenv("S1_HEC_RETRY_MAX", "5")),
+    base_delay=int(os.getenv("S1_HEC_RETRY_BASE_MS", "250")) / 1000.0,
+    max_delay=int(os.getenv("S1_HEC_RETRY_MAX_MS", "30000")) / 1000.0,
+)
+_THROTTLE = ThrottleGate()
+_POST_LATENCY = LatencyRecorder()  # every HEC POST (batch flush or single event), for --metrics-file
+_ASYNC_RETRY_COND = threading.Condition()
+_ASYNC_RETRIES = 0  # async batches waiting on a backoff timer
 
 def _batch_key(is_json: bool, product: str):
+    if _BATCH_COALESCE and is_json:
+        return (True, None)
     return (is_json, product)
 
-def _batch_enqueue(line_str: str, is_json: bool, product: str, attr_fields: dict):
+def _batch_codec(is_json: bool):
+    return _BATCH_CODECS['event' if is_json else 'raw']
+
+def _batch_enqueue(data: bytes, is_json: bool, product: str, attr_fields: dict):
     key = _batch_key(is_json, product)
-    now = time.time()
-    with _BATCH_LOCK:
-        buf = _BATCH_BUFFERS.get(key)
-        if not buf:
-            buf = {'lines': [], 'bytes': 0, 'last': now}
-            _BATCH_BUFFERS[key] = buf
-        sz = len(line_str.encode('utf-8'))
-        buf['lines'].append(line_str)
-        buf['bytes'] += sz
-        # DON'T update 'last' timestamp - we want to track time since first event in batch
-        # Flush immediately if size threshold reached
-        if buf['bytes'] >= _BATCH_MAX_BYTES:
-            _flush_batch_locked(key)
+    shard = _BATCH_BUFFERS.get(key)
+    if shard is None:
+        shard = _BATCH_BUFFERS.setdefault(key, BatchShard(_batch_codec(is_json)))
+    # Compressed as it is added; only this key's shard lock is held, and only for the add
+    started, full = shard.add(data, _BATCH_CONTROLLER.max_bytes)
+    if started is not None:
+        # Time threshold counts from the batch's first event
+        _batch_timer().schedule(started.last + _BATCH_CONTROLLER.flush_ms / 1000.0,
+                                (shard, started, is_json, product))
+    if full is not None:
+        # Size threshold reached: send it from this thread, with no lock held
+        _dispatch_batch(full, is_json, product)
 
-def _batch_check_and_flush():
-    """Check all buffers and flush expired ones. Call this from main thread."""
-    # Only show detailed batch checks in debug mode
+def _batch_timer() -> FlushTimer:
+    global _BATCH_TIMER
+    if _BATCH_TIMER is None:
+        with _BATCH_TIMER_LOCK:
+            if _BATCH_TIMER is None:
+                _BATCH_TIMER = FlushTimer(_batch_deadline)
+    return _BATCH_TIMER
+
+def _batch_deadline(item):
+    """FlushTimer callback: flush the batch if it is still open (not already flushed by size)."""
+    shard, batch, is_json, product = item
+    batch = shard.detach(batch)
+    if batch is None:
+        return
     if _VERBOSITY == 'debug':
-        print(f"[BATCH] Checking buffers for flush (threshold: {_BATCH_FLUSH_MS}ms)...", flush=True)
-        sys.stdout.flush()
-    
+        print(f"[BATCH] Flush interval reached for {(is_json, product)} ({batch.count} events)", flush=True)
+    _dispatch_batch(batch, is_json, product)
+
+def _batch_check_and_flush():
+    """Flush every buffer older than the flush interval (normally done by the flush timer)."""
     now = time.time()
-    to_flush = []
-    with _BATCH_LOCK:
-        for key, buf in list(_BATCH_BUFFERS.items()):
-            elapsed_ms = (now - buf['last']) * 1000
-            if _VERBOSITY == 'debug':
-                print(f"[BATCH] Buffer {key}: {len(buf['lines'])} lines, {elapsed_ms:.0f}ms elapsed", flush=True)
-                sys.stdout.flush()
-            if buf['lines'] and elapsed_ms >= _BATCH_FLUSH_MS:
-                to_flush.append(key)
-                if _VERBOSITY == 'debug':
-                    print(f"[BATCH] Marking {key} for flush", flush=True)
-                    sys.stdout.flush()
-    
-    if _VERBOSITY == 'debug' and not to_flush:
-        print(f"[BATCH] No buffers ready for flush", flush=True)
-        sys.stdout.flush()
-    
-    for key in to_flush:
-        with _BATCH_LOCK:
-            _flush_batch_locked(key)
+    for (is_json, product), shard in list(_BATCH_BUFFERS.items()):
+        batch = shard.batch
+        if batch is None or (now - batch.last) * 1000 < _BATCH_CONTROLLER.flush_ms:
+            continue
+        batch = shard.detach(batch)
+        if batch is not None:
+            _dispatch_batch(batch, is_json, product)
+
+def _batch_flush_all():
+    """Flush every open buffer regardless of age and stop the flush timer (end of run)."""
+    global _BATCH_TIMER
+    for (is_json, product), shard in list(_BATCH_BUFFERS.items()):
+        batch = shard.detach()
+        if batch is not None:
+            _dispatch_batch(batch, is_json, product)
+    # Let a timed flush that is already sending finish before the process exits
+    with _BATCH_TIMER_LOCK:
+        timer, _BATCH_TIMER = _BATCH_TIMER, None
+    if timer is not None:
+        timer.close()
 
 def _batch_sender_worker():
     """Background worker thread that sends batches from the queue"""
     while True:
         try:
             item = _BATCH_SEND_QUEUE.get(timeout=1)
-            if item is None:  # Poison pill to stop the thread
-                break
-            lines, is_json, product = item
-            _send_batch(lines, is_json, product)
-            _BATCH_SEND_QUEUE.task_done()
         except queue.Empty:
             continue
+        if item is None:  # Poison pill to stop the thread
+            break
+        batch, is_json, product = item
+        try:
+            _send_batch(batch, is_json, product)
         except Exception as e:
-            if _VERBOSITY == 'debug':
-                print(f"[BATCH] Error in sender worker: {e}", flush=True)
-
-def _start_batch_thread():
-    global _BATCH_THREAD_STARTED
-    _BATCH_THREAD_STARTED = True
-    t = threading.Thread(target=_batch_loop, daemon=True)
-    t.start()
+            print(f"[BATCH] Error in sender worker, {batch.count} events lost: {e}", flush=True)
+        finally:
+            _BATCH_SEND_QUEUE.task_done()
 
-def _start_batch_sender(queue_size=10):
+def _start_batch_sender(queue_size=10, policy='block', block_timeout=None):
     """Start background batch sender thread for pipelined sending"""
     global _BATCH_SEND_QUEUE, _BATCH_SENDER_THREAD
-    _BATCH_SEND_QUEUE = queue.Queue(maxsize=queue_size)
+    _BATCH_SEND_QUEUE = BatchSendQueue(queue_size, policy, block_timeout, weight=lambda item: item[0].count)
     _BATCH_SENDER_THREAD = threading.Thread(target=_batch_sender_worker, daemon=True)
     _BATCH_SENDER_THREAD.start()
     if _VERBOSITY == 'debug':
-        print(f"[BATCH] Started background sender thread with queue size {queue_size}", flush=True)
+        print(f"[BATCH] Started background sender thread with queue size {queue_size} ({policy})", flush=True)
 
-def _batch_loop():
-    if DEBUG:
-        print("[BATCH] Background flush thread started", flush=True)
-        sys.stdout.flush()
-    while True:
-        time.sleep(0.2)
-        now = time.time()
-        to_flush = []
-        with _BATCH_LOCK:
-            for key, buf in list(_BATCH_BUFFERS.items()):
-                elapsed_ms = (now - buf['last']) * 1000
-                if buf['lines'] and elapsed_ms >= _BATCH_FLUSH_MS:
-                    to_flush.append(key)
-                    if DEBUG:
-                        print(f"[BATCH] Triggering flush for {key} ({len(buf['lines'])} events, {elapsed_ms:.0f}ms elapsed)", flush=True)
-                        sys.stdout.flush()
-        for key in to_flush:
-            with _BATCH_LOCK:
-                _flush_batch_locked(key)
-
-def _flush_batch_locked(key):
-    buf = _BATCH_BUFFERS.get(key)
-    if not buf or not buf['lines']:
-        return
-    is_json, product = key
-    lines = buf['lines'][::]  # Copy the list to avoid race conditions
-    _BATCH_BUFFERS[key] = {'lines': [], 'bytes': 0, 'last': time.time()}
+def _dispatch_batch(batch: CompressedBatch, is_json: bool, product: str):
+    """Send a detached batch. Never called with a buffer lock held."""
+    # The batch was handed over as-is (no copy); the next event starts a fresh one
+    batch.finish()
     
     # If pipelining is enabled, queue the batch for background sending
     if _BATCH_SEND_QUEUE is not None:
-        try:
-            _BATCH_SEND_QUEUE.put_nowait((lines, is_json, product))
-        except:
-            # Queue full, send synchronously as fallback
-            _send_batch(lines, is_json, product)
+        # A full queue blocks, evicts the oldest batch or returns this one to spill,
+        # per --backpressure; the producer never POSTs on the sender's behalf
+        if _BATCH_SEND_QUEUE.offer((batch, is_json, product)) is not None:
+            _send_batch(batch, is_json, product, spill=True)
     else:
         # Synchronous sending
-        _send_batch(lines, is_json, product)
+        _send_batch(batch, is_json, product)
 
-def _send_batch(lines: list, is_json: bool, product: str):
+def _send_batch(batch: CompressedBatch, is_json: bool, product: str, spill: bool = False):
     if _VERBOSITY == 'debug':
-        print(f"[BATCH] _send_batch called with {len(lines)} lines, is_json={is_json}", flush=True)
+        print(f"[BATCH] _send_batch called with {batch.count} lines, is_json={is_json}", flush=True)
         sys.stdout.flush()
     
-    if not lines:
+    if not batch.count:
         return
     
     # Ensure connection cache is established; if not, send first line via normal path
-    if not _CONNECTION_CACHE['configured']:
+    unsent = batch
+    # While the spool holds batches nobody could deliver, don't re-probe for every batch:
+    # the drainer marks the spool healthy again once the collector answers
+    if not _CONNECTION_CACHE['configured'] and (_SPOOL is None or _SPOOL.healthy):
         if _VERBOSITY == 'debug':
             print(f"[BATCH] Connection not configured, establishing with first event...", flush=True)
             sys.stdout.flush()
+        lines = batch.lines()
         first = lines.pop(0)
         try:
-            if is_json:
-                payload = json.loads(first)
-                result = send_one(payload, product, {})
-                if _VERBOSITY == 'debug':
-                    print(f"[BATCH] First event result: {result}", flush=True)
-                    sys.stdout.flush()
-            else:
-                result = send_one(first, product, {})
-                if _VERBOSITY == 'debug':
-                    print(f"[BATCH] First event result: {result}", flush=True)
-                    sys.stdout.flush()
+            # Probe with the wire-ready line; send_one would queue it again in batch mode
+            resp = _probe_send(first.encode("utf-8"), is_json, product, _endpoint_key() if _ENDPOINT_CACHE is not None else None)
+            if _VERBOSITY == 'debug':
+                print(f"[BATCH] First event result: {resp.status_code}", flush=True)
+                sys.stdout.flush()
         except Exception as e:
             if _VERBOSITY == 'debug':
                 print(f"[BATCH] Error establishing connection: {e}", flush=True)
                 sys.stdout.flush()
             pass
-        if not lines:
+        if lines:
+            batch = CompressedBatch.from_lines(lines, batch.codec)
+        elif _CONNECTION_CACHE['configured']:
             if _VERBOSITY == 'debug':
                 print(f"[BATCH] No more lines after connection setup", flush=True)
                 sys.stdout.flush()
             return
     
-    if not _CONNECTION_CACHE['configured']:
-        if _VERBOSITY == 'debug':
-            print(f"[BATCH] Connection still not configured after setup attempt, skipping batch", flush=True)
-            sys.stdout.flush()
+    if _CONNECTION_CACHE['configured']:
+        event_base, raw_base = _CONNECTION_CACHE['event_base'], _CONNECTION_CACHE['raw_base']
+        auth_scheme = _CONNECTION_CACHE['auth_scheme']
+        if _CONNECTION_CACHE['session'] is None:
+            _CONNECTION_CACHE['session'] = _make_poster(_CONNECTION_CACHE['verify'], _CONNECTION_CACHE['tls_low'])
+    elif _SPOOL is not None:
+        # No endpoint has answered yet (the collector was down at startup). Spool the whole
+        # batch, first event included, addressed to the base a probe tries first; the
+        # drainer replays it once the collector is back.
+        batch = unsent
+        event_base, raw_base = _endpoint_bases()[0]
+        auth_scheme = AUTH_SCHEME
+        spill = True
+    else:
+        print(f"[BATCH] No working HEC endpoint, dropped {unsent.count} events", flush=True)
         return
     
-    if _CONNECTION_CACHE['session'] is None:
-        _CONNECTION_CACHE['session'] = _make_poster(_CONNECTION_CACHE['verify'], _CONNECTION_CACHE['tls_low'])
-    POST = _CONNECTION_CACHE['session']
     headers_auth = {**HEADERS}
-    headers_auth["Authorization"] = f"{_CONNECTION_CACHE['auth_scheme']} {HEC_TOKEN}"
-    # Both endpoints use text/plain with gzip for batched events
-    body = "\n".join(lines).encode('utf-8')
-    
-    # Use fast compression (level 1) for high throughput - trades compression ratio for speed
-    # Level 1 is ~10x faster than default level 9, with only ~10% larger output
-    gz = gzip.compress(body, compresslevel=1)
-    headers = {**headers_auth, "Content-Type": "text/plain", "Content-Encoding": "gzip"}
+    headers_auth["Authorization"] = f"{auth_scheme} {HEC_TOKEN}"
+    # Both endpoints use text/plain, encoded with the destination's codec
+    headers = {**headers_auth, "Content-Type": "text/plain"}
+    if batch.codec.content_encoding:
+        headers["Content-Encoding"] = batch.codec.content_encoding
     
     if is_json:
         # JSON products to /event endpoint
-        url = _CONNECTION_CACHE['event_base']
+        url = event_base
     else:
         # Raw/syslog products to /raw endpoint
-        url = f"{_CONNECTION_CACHE['raw_base']}?{_build_qs(product)}"
+        url = f"{raw_base}?{_build_qs(product)}"
+    
+    # Spool instead of POSTing when asked to, or while the collector is known to be failing
+    if spill or (_SPOOL is not None and not _SPOOL.healthy):
+        _spool_batch(url, headers, batch.body, batch.count)
+        return
     
     # Show batch flush in info mode and above (not debug only)
     if _VERBOSITY in ('info', 'verbose', 'debug'):
-        print(f"[BATCH] Flushing {len(lines)} events ({len(gz)} bytes compressed)", flush=True)
+        print(f"[BATCH] Flushing {batch.count} events ({len(batch.body)} bytes compressed)", flush=True)
         sys.stdout.flush()
     
-    resp = POST(url, headers=headers, data=gz, timeout=30)
+    # Async transport: hand the payload to the connection pool and return
+    if _TRANSPORT is not None:
+        _submit_async_batch(url, headers, batch)
+        return
+    
+    _post_batch(url, headers, batch)
+
+def _split_batch(batch: CompressedBatch) -> Tuple[CompressedBatch, CompressedBatch]:
+    """Halve a batch the collector rejected with 413 Payload Too Large."""
+    if _VERBOSITY in ('info', 'verbose', 'debug'):
+        print(f"[BATCH] 413 Payload Too Large: splitting {batch.count} events into two batches", flush=True)
+    return batch.split()
+
+def _post_batch(url: str, headers: dict, batch: CompressedBatch):
+    """Synchronous batch POST with retry/backoff; a 413 splits the batch in half."""
+    POST = _CONNECTION_CACHE['session']
+    record = lambda latency, status: _BATCH_CONTROLLER.record(latency, status, batch.bytes, _send_queue_ratio())
+    try:
+        # With a spool, failed batches are parked on disk rather than retried in line
+        resp = _post_with_retry(lambda: POST(url, headers=headers, data=batch.body, timeout=30),
+                                record=record, attempts=1 if _SPOOL is not None else None)
+    except Exception:
+        if _SPOOL is not None:
+            _spool_batch(url, headers, batch.body, batch.count)
+            return
+        raise
+    if resp.status_code == 413 and batch.count > 1:
+        for half in _split_batch(batch):
+            _post_batch(url, headers, half)
+        return
+    if _SPOOL is not None and _is_retryable_status(resp.status_code):
+        _spool_batch(url, headers, batch.body, batch.count)
+        return
     resp.raise_for_status()
+    _track_ack(resp)
     
     if _VERBOSITY == 'debug':
         print(f"[BATCH] Response: {resp.status_code} - {resp.text[:200] if resp.text else 'OK'}", flush=True)
         sys.stdout.flush()
 
+def _backoff(attempt: int, resp=None) -> float:
+    """Delay before the next attempt; 429/503 also pause every other sender."""
+    retry_after = parse_retry_after(resp.headers.get('Retry-After')) if resp is not None else None
+    delay = _RETRY.delay(attempt, retry_after)
+    if resp is not None and resp.status_code in THROTTLE_STATUSES:
+        _THROTTLE.hold(delay)
+    return delay
+
+def _post_with_retry(do_post: Callable, record: Optional[Callable] = None, attempts: Optional[int] = None,
+                     retry_errors: bool = True):
+    """Run ``do_post()`` with backoff on 408/429/5xx, timeouts and connection errors.
+
+    Returns the last response (which may still be an error status once attempts
+    run out); re-raises the last connection error. TLS errors are not retried,
+    and neither is any connection error when ``retry_errors`` is False.
+    """
+    attempts = attempts or _RETRY.max_attempts
+    for attempt in range(attempts):
+        _THROTTLE.wait()
+        start = time.monotonic()
+        try:
+            resp = do_post()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if record:
+                record(None, None)
+            if isinstance(e, requests.exceptions.SSLError) or not retry_errors or attempt + 1 >= attempts:
+                raise
+            delay = _backoff(attempt)
+            reason = type(e).__name__
+        else:
+            latency = time.monotonic() - start
+            _POST_LATENCY.record(latency)
+            if record:
+                record(latency, resp.status_code)
+            if not _is_retryable_status(resp.status_code) or attempt + 1 >= attempts:
+                return resp
+            delay = _backoff(attempt, resp)
+            reason = f"HTTP {resp.status_code}"
+        if _VERBOSITY == 'debug' or DEBUG:
+            print(f"[RETRY] {reason}, attempt {attempt + 1}/{attempts}, retrying in {delay:.2f}s", flush=True)
+        if _THROTTLE.remaining() > 0:
+            _THROTTLE.wait()
+        else:
+            time.sleep(delay)
+
+def _send_queue_ratio() -> float:
+    """How full the pipelined send path is (0.0 – 1.0), fed to the batch controller."""
+    if _TRANSPORT is not None:
+        return min(1.0, _TRANSPORT.inflight / _TRANSPORT.max_inflight)
+    if _BATCH_SEND_QUEUE is not None and _BATCH_SEND_QUEUE.maxsize:
+        return _BATCH_SEND_QUEUE.qsize() / _BATCH_SEND_QUEUE.maxsize
+    return 0.0
+
+def _is_retryable_status(status_code: int) -> bool:
+    """Statuses worth replaying later: throttling, timeouts and server errors."""
+    return status_code in (408, 429) or status_code >= 500
+
+def _spool_batch(url: str, headers: dict, body: bytes, count: int):
+    """Append a compressed batch to the disk spool and open the circuit."""
+    _SPOOL.healthy = False
+    if _SPOOL.append(url, headers, body):
+        if _VERBOSITY in ('info', 'verbose', 'debug'):
+            print(f"[SPOOL] Spooled {count} events ({len(body)} bytes compressed)", flush=True)
+    else:
+        print(f"[SPOOL] Spool full, dropped {count} events", flush=True)
+
+def _spool_send(url: str, headers: dict, body: bytes) -> bool:
+    """Drainer callback: replay one spooled batch with the current credentials."""
+    if _CONNECTION_CACHE['session'] is None:
+        _CONNECTION_CACHE['session'] = _make_poster(_CONNECTION_CACHE['verify'], _CONNECTION_CACHE['tls_low'])
+    # Drop the ack channel of the run that spooled the batch; use this run's, if any
+    headers = {k: v for k, v in headers.items() if k != "X-Splunk-Request-Channel"}
+    scheme = _CONNECTION_CACHE['auth_scheme'] or AUTH_SCHEME
+    headers = {**headers, **HEADERS, "Authorization": f"{scheme} {HEC_TOKEN}"}
+    _THROTTLE.wait()
+    resp = _CONNECTION_CACHE['session'](url, headers=headers, data=body, timeout=30)
+    if resp.status_code in THROTTLE_STATUSES:
+        _backoff(0, resp)
+    if _is_retryable_status(resp.status_code):
+        return False
+    if resp.status_code == 413:
+        # Split the spooled batch and replay the halves directly
+        batch = CompressedBatch.from_body(body, codec_for_encoding(headers.get("Content-Encoding")))
+        if batch.count > 1:
+            for half in _split_batch(batch):
+                if not _spool_send(url, headers, half.body):
+                    return False
+            return True
+    if resp.status_code >= 400:
+        # Replaying a rejected payload can never succeed; don't let it block the spool
+        print(f"[SPOOL] Discarding spooled batch rejected with HTTP {resp.status_code}: {resp.text[:200]}", flush=True)
+    else:
+        _track_ack(resp)
+        if _VERBOSITY == 'debug':
+            print(f"[SPOOL] Drained batch ({len(body)} bytes compressed)", flush=True)
+    return True
+
+def _open_spool(directory: str, max_bytes: int):
+    """Open (and lock) the disk spool before anything is sent; exits if another sender owns it."""
+    from hec_spool import HecSpool, SpoolLockedError  # type: ignore
+    try:
+        return HecSpool(directory, max_bytes=max_bytes)
+    except SpoolLockedError as e:
+        print(f"Error: --spool-dir: {e}", flush=True)
+        sys.exit(1)
+
+def _start_spool(spool, drain_rate: float):
+    """Route batches through ``spool`` (resuming any backlog from earlier runs) and start draining it."""
+    global _SPOOL
+    _SPOOL = spool
+    segments, pending = _SPOOL.pending()
+    if _VERBOSITY in ('info', 'verbose', 'debug'):
+        print(f"[SPOOL] Using spool at {_SPOOL.directory}"
+              + (f" (resuming {pending // 1024}KB in {segments} segments)" if pending else ""), flush=True)
+    _SPOOL.start_drainer(_spool_send, rate=drain_rate)
+
+def _submit_async_batch(url: str, headers: dict, batch: CompressedBatch, attempt: int = 0):
+    request = (url, headers, batch, attempt)
+    _TRANSPORT.submit(url, headers, batch.body, on_done=lambda resp, err: _on_async_batch_done(resp, err, request))
+
+def _split_async_batch(url: str, headers: dict, batch: CompressedBatch):
+    for half in _split_batch(batch):
+        _submit_async_batch(url, headers, half)
+
+def _schedule_async_retry(delay: float, fn: Callable, *fn_args):
+    """Run ``fn`` after ``delay`` on a timer thread (submit() may block; the loop thread must not)."""
+    global _ASYNC_RETRIES
+    with _ASYNC_RETRY_COND:
+        _ASYNC_RETRIES += 1
+
+    def _run():
+        global _ASYNC_RETRIES
+        try:
+            _THROTTLE.wait()
+            fn(*fn_args)
+        except Exception as e:
+            print(f"[BATCH] Async retry failed: {e}", flush=True)
+        finally:
+            with _ASYNC_RETRY_COND:
+                _ASYNC_RETRIES -= 1
+                _ASYNC_RETRY_COND.notify_all()
+
+    timer = threading.Timer(delay, _run)
+    timer.daemon = True
+    timer.start()
+
+def _drain_async_transport():
+    """Wait for in-flight async POSTs and any retries they scheduled."""
+    while True:
+        _TRANSPORT.drain()
+        with _ASYNC_RETRY_COND:
+            if not _ASYNC_RETRIES and not _TRANSPORT.inflight:
+                return
+            _ASYNC_RETRY_COND.wait(0.5)
+
+def _on_async_batch_done(resp, err, request: tuple):
+    """Completion callback for batches posted through the async transport."""
+    url, headers, batch, attempt = request
+    _POST_LATENCY.record(getattr(resp, 'elapsed', None))
+    _BATCH_CONTROLLER.record(getattr(resp, 'elapsed', None), getattr(resp, 'status_code', None),
+                             batch.bytes, _send_queue_ratio())
+    if err is not None or _is_retryable_status(resp.status_code):
+        if _SPOOL is not None:
+            _spool_batch(url, headers, batch.body, batch.count)
+            return
+        reason = err if err is not None else f"HTTP {resp.status_code}"
+        if attempt + 1 < _RETRY.max_attempts:
+            delay = _backoff(attempt, resp)
+            if _VERBOSITY == 'debug':
+                print(f"[RETRY] {reason}, attempt {attempt + 1}/{_RETRY.max_attempts}, "
+                      f"retrying in {delay:.2f}s", flush=True)
+            _schedule_async_retry(delay, _submit_async_batch, url, headers, batch, attempt + 1)
+            return
+        print(f"[BATCH] Async send failed after {attempt + 1} attempts, {batch.count} events lost: {reason}", flush=True)
+        return
+    if resp.status_code == 413 and batch.count > 1:
+        _schedule_async_retry(0, _split_async_batch, url, headers, batch)
+        return
+    if resp.status_code >= 400:
+        print(f"[BATCH] Async send failed: HTTP {resp.status_code} - {resp.text[:200]}", flush=True)
+        return
+    _track_ack(resp)
+    if _VERBOSITY == 'debug':
+        print(f"[BATCH] Response: {resp.status_code} - {resp.text[:200] if resp.text else 'OK'} "
+              f"({resp.elapsed * 1000:.0f}ms, {_TRANSPORT.inflight} in flight)", flush=True)
+
+def _start_async_transport(max_inflight: int, max_inflight_bytes: int):
+    """Create the pooled asyncio transport using the discovered TLS settings."""
+    global _TRANSPORT
+    from hec_async_transport import AsyncHecTransport  # type: ignore
+    _TRANSPORT = AsyncHecTransport(
+        max_inflight=max_inflight,
+        max_inflight_bytes=max_inflight_bytes,
+        verify=_CONNECTION_CACHE['verify'],
+        tls_low=_CONNECTION_CACHE['tls_low'],
+    )
+    if _VERBOSITY in ('info', 'verbose', 'debug'):
+        print(f"[BATCH] Async transport enabled: {max_inflight} concurrent requests, "
+              f"{max_inflight_bytes // 1024}KB in-flight limit", flush=True)
+
+def _ack_query(ack_ids: list) -> dict:
+    """Ask the collector's /ack endpoint which of ``ack_ids`` have been indexed."""
+    if not _CONNECTION_CACHE['configured']:
+        return {}
+    url = _CONNECTION_CACHE['event_base'].rstrip('/').rsplit('/', 1)[0] + '/ack'
+    headers = {**HEADERS, "Authorization": f"{_CONNECTION_CACHE['auth_scheme']} {HEC_TOKEN}"}
+    resp = _CONNECTION_CACHE['session'](url, headers=headers, json={"acks": ack_ids}, timeout=10)
+    resp.raise_for_status()
+    return resp.json().get("acks", {})
+
+def _start_ack(timeout: float):
+    """Send on an indexer-ack channel and poll /ack for every accepted request."""
+    global _ACK
+    from hec_ack import HecAckTracker  # type: ignore
+    _ACK = HecAckTracker(_ack_query, timeout=timeout)
+    HEADERS.update(_ACK.headers)
+    _ACK.start()
+    if _VERBOSITY in ('info', 'verbose', 'debug'):
+        print(f"[ACK] Indexer acknowledgement on channel {_ACK.channel}", flush=True)
+
+def _track_ack(resp):
+    """Register the ackId of an accepted request with the ack poller."""
+    if _ACK is None or not _ACK.enabled:
+        return
+    try:
+        ack_id = resp.json().get('ackId')
+    except (ValueError, AttributeError):
+        ack_id = None
+    if ack_id is not None:
+        _ACK.track(ack_id)
+    elif _ACK.disable():
+        print("[ACK] Collector returned no ackId; indexer acknowledgement is not enabled for this token", flush=True)
+
 SOURCETYPE_MAP_OVERRIDES = {
     # ===== FIXED PARSER MAPPINGS (Based on actual parser directory names) =====
     # AWS parsers - use actual directory names
@@ -952,7 +1273,7 @@ SOURCETYPE_MAP_OVERRIDES = {
 
 # Merge dynamically discovered sourcetypes with explicit overrides.
 # Overrides win to preserve intentional non-standard mappings.
-SOURCETYPE_MAP = {**_LOADED_SOURCETYPE_MAP, **SOURCETYPE_MAP_OVERRIDES}
+SOURCETYPE_MAP = SourcetypeMap(_discover_sourcetypes, SOURCETYPE_MAP_OVERRIDES)
 
 # Optional envelope/query hints
 ENV_SOURCE = os.getenv("S1_HEC_SOURCE")
@@ -1088,7 +1409,7 @@ def _envelope(line, product: str, attr_fields: dict, event_time: float | None =
         event_data = line  # Use string for raw products
     
     # If event_time is provided, use it; otherwise current time
-    env_time = round(time.time()) if event_time is None else int(event_time)
+    env_time = round(event_clock.now()) if event_time is None else int(event_time)
     env = {"time": env_time,
            "event": event_data,
            "sourcetype": SOURCETYPE_MAP.get(product, product),
@@ -1101,13 +1422,93 @@ def _envelope(line, product: str, attr_fields: dict, event_time: float | None =
         env["index"] = ENV_INDEX
     return env
 
-def send_one(line, product: str, attr_fields: dict, event_time: float | None = None):
+_ENVELOPE_TEMPLATES = {}  # product -> EnvelopeTemplate (constant envelope fields pre-encoded)
+
+def _envelope_template(product: str, attr_fields: dict) -> EnvelopeTemplate:
+    template = _ENVELOPE_TEMPLATES.get(product)
+    if template is None or template.fields is not attr_fields:
+        template = EnvelopeTemplate(SOURCETYPE_MAP.get(product, product), attr_fields,
+                                    ENV_SOURCE, ENV_HOST, ENV_INDEX)
+        _ENVELOPE_TEMPLATES[product] = template
+    return template
+
+_OUTPUT_KINDS = {}  # product -> declared OUTPUT_KIND of its generator module (None if undeclared)
+
+def _output_kind(product: str) -> Optional[str]:
+    try:
+        return _OUTPUT_KINDS[product]
+    except KeyError:
+        pass
+    kind = None
+    if product in PROD_MAP:
+        try:
+            kind = module_kind(load_generator(PROD_MAP[product][0]))
+        except Exception:
+            kind = None
+    _OUTPUT_KINDS[product] = kind
+    return kind
+
+def _json_text(line, product: str) -> Optional[bytes]:
+    """UTF-8 JSON when a text/bytes event already is the event's JSON document, else None.
+
+    Trusted for generators declaring ``OUTPUT_KIND = "json"`` once it starts like a JSON
+    document; text from undeclared generators is parsed once to make sure it is valid
+    before being spliced in.
     """
-    Route JSON‑structured products to the /event endpoint and all
-    raw / CSV / syslog products to the /raw endpoint.
-    Uses cached connection config after first successful send for performance.
+    kind = _output_kind(product)
+    if kind is not None and kind != "json":
+        return None
+    data = line if isinstance(line, bytes) else line.encode('utf-8')
+    if data.lstrip()[:1] not in (b'{', b'['):
+        return None
+    if kind is None:
+        try:
+            json_loads(data)
+        except ValueError:
+            return None
+    return data
+
+def _batch_line(line, product: str, attr_fields: dict, event_time: float | None = None,
+                coalesce: Optional[bool] = None) -> Tuple[bytes, bool]:
+    """Serialise one event the way batch mode sends it; returns (UTF-8 line, is_json).
+
+    ``line`` may be a dict, text, or wire-ready bytes from a generator's ``_bytes``
+    companion. For /event products, JSON text is spliced into the envelope as the event
+    object rather than re-encoded as a string.
+
+    With ``coalesce`` (default: --coalesce / S1_HEC_COALESCE) a raw product's line becomes
+    the string ``event`` of an /event envelope carrying its sourcetype.
     """
-    # Build endpoint bases to try (env override → us1 → usea1 → global)
+    if product in JSON_PRODUCTS:
+        # Serialised _envelope(...) without re-encoding the constant fields per event
+        template = _envelope_template(product, attr_fields)
+        if isinstance(line, (str, bytes)):
+            data = _json_text(line, product)
+            if data is not None:
+                return template.render_json(data, event_time), True
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+        return template.render(line, event_time), True
+    if _BATCH_COALESCE if coalesce is None else coalesce:
+        if isinstance(line, (dict, list)):
+            raw = dumps_bytes(line).decode('utf-8')
+        else:
+            raw = line.decode('utf-8') if isinstance(line, bytes) else str(line)
+        return _envelope_template(product, attr_fields).render(raw, event_time), True
+    if isinstance(line, bytes):
+        return line, False
+    if isinstance(line, (dict, list)):
+        return dumps_bytes(line), False
+    return str(line).encode('utf-8'), False
+
+def _wire_generator(func: Callable) -> Callable:
+    """``func``'s ``_bytes`` companion when it has one and no batch companion, else ``func``."""
+    if batch_function(func) is None:
+        return bytes_function(func) or func
+    return func
+
+def _env_bases() -> Tuple[Optional[str], Optional[str]]:
+    """(event, raw) URL bases from the environment, or (None, None)."""
     env_event = os.getenv("S1_HEC_EVENT_URL_BASE")
     env_raw = os.getenv("S1_HEC_RAW_URL_BASE")
     # Backward-compat: single URL variable (may point to /raw or /event)
@@ -1124,6 +1525,11 @@ def send_one(line, product: str, attr_fields: dict, event_time: float | None = N
             base = single.rstrip("/")
             env_event = base + "/event"
             env_raw = base + "/raw"
+    return env_event, env_raw
+
+def _endpoint_bases() -> list:
+    """(event, raw) base pairs in probe order: env override → us1 → usea1 → global."""
+    env_event, env_raw = _env_bases()
     bases = []
     if env_event and env_raw:
         bases.append((env_event, env_raw))
@@ -1135,34 +1541,28 @@ def send_one(line, product: str, attr_fields: dict, event_time: float | None = N
         ("https://ingest.sentinelone.net/services/collector/event",
          "https://ingest.sentinelone.net/services/collector/raw"),
     ])
+    return bases
 
-    # Try verification/TLS combinations (secure → low TLS → insecure as last resort)
-    combos = [
-        (DEFAULT_VERIFY_TLS, DEFAULT_TLS_LOW),
-        (True, True),
-    ]
-    if ALLOW_INSECURE_FALLBACK:
-        combos.append((False, True))
-
-    # Attempt auth schemes: Splunk → Bearer
-    auth_schemes = [os.getenv("S1_HEC_AUTH_SCHEME", "Splunk"), "Bearer"]
-
-    last_error: Optional[Exception] = None
-
+def send_one(line, product: str, attr_fields: dict, event_time: float | None = None):
+    """
+    Route JSON‑structured products to the /event endpoint and all
+    raw / CSV / syslog products to the /raw endpoint.
+    Uses cached connection config after first successful send for performance.
+    """
     # Batch mode: enqueue and return
     if _BATCH_ENABLED:
-        if product in JSON_PRODUCTS:
-            payload = _envelope(line, product, attr_fields, event_time)
-            line_str = json.dumps(payload, separators=(",", ":"))
-            _batch_enqueue(line_str, True, product, attr_fields)
-        else:
-            if isinstance(line, (dict, list)):
-                line_str = json.dumps(line, separators=(",", ":"))
-            else:
-                line_str = str(line)
-            _batch_enqueue(line_str, False, product, attr_fields)
+        data, is_json = _batch_line(line, product, attr_fields, event_time)
+        _batch_enqueue(data, is_json, product, attr_fields)
         return {"status": "QUEUED"}
 
+    # New process: reuse the combination an earlier run discovered for this token and URL
+    endpoint_key = None
+    from_disk = False
+    if _ENDPOINT_CACHE is not None and not _CONNECTION_CACHE['configured']:
+        endpoint_key = _endpoint_key()
+        if not _ENDPOINT_PROBE:
+            from_disk = _load_endpoint(endpoint_key)
+
     # Try cached config first (fast path after first successful send)
     if _CONNECTION_CACHE['configured']:
         try:
@@ -1176,30 +1576,64 @@ def send_one(line, product: str, attr_fields: dict, event_time: float | None = N
             headers_auth = {**HEADERS}
             headers_auth["Authorization"] = f"{_CONNECTION_CACHE['auth_scheme']} {HEC_TOKEN}"
             
-            if product in JSON_PRODUCTS:
+            payload, is_json = _batch_line(line, product, attr_fields, event_time, coalesce=False)
+            if is_json:
                 url = _CONNECTION_CACHE['event_base']
-                payload = _envelope(line, product, attr_fields, event_time)
                 headers = {**headers_auth, "Content-Type": "application/json"}
-                resp = POST(url, headers=headers, json=payload, timeout=10)
             else:
                 url = f"{_CONNECTION_CACHE['raw_base']}?{_build_qs(product)}"
-                payload = line
                 headers = {**headers_auth, "Content-Type": "text/plain"}
-                resp = POST(url, headers=headers, data=payload, timeout=10)
+            resp = _post_with_retry(lambda: POST(url, headers=headers, data=payload, timeout=10))
             
             resp.raise_for_status()
+            _track_ack(resp)
             try:
                 return resp.json()
             except ValueError:
                 return {"status": "OK", "code": resp.status_code}
         except Exception as e:
+            if not _needs_reprobe(e) and not from_disk:
+                # Throttling, 5xx or a dropped connection, already retried with backoff:
+                # the cached endpoint/TLS/auth combination is still right
+                raise
             # Cache failed, fall through to full retry logic
             if DEBUG:
                 print(f"[DEBUG] Cached config failed: {e}, trying full retry")
             _CONNECTION_CACHE['configured'] = False
             _CONNECTION_CACHE['session'] = None
+            if endpoint_key is not None:
+                _ENDPOINT_CACHE.invalidate(endpoint_key)
 
     # Full retry logic (slow path for first send or after cache failure)
+    payload, is_json = _batch_line(line, product, attr_fields, event_time, coalesce=False)
+    resp = _probe_send(payload, is_json, product, endpoint_key)
+    try:
+        return resp.json()
+    except ValueError:
+        return {"status": "OK", "code": resp.status_code}
+
+def _endpoint_key() -> str:
+    """Persistent endpoint-cache key for this token and the configured URL bases."""
+    env_event, env_raw = _env_bases()
+    return endpoint_cache_key(HEC_TOKEN, f"{env_event}|{env_raw}" if env_event and env_raw else "default")
+
+def _probe_send(payload: bytes, is_json: bool, product: str, endpoint_key: Optional[str] = None):
+    """POST one wire-ready event, trying every base, TLS and auth combination until one
+    works; caches the working combination and returns its response."""
+    bases = _endpoint_bases()
+
+    # Try verification/TLS combinations (secure → low TLS → insecure as last resort)
+    combos = [
+        (DEFAULT_VERIFY_TLS, DEFAULT_TLS_LOW),
+        (True, True),
+    ]
+    if ALLOW_INSECURE_FALLBACK:
+        combos.append((False, True))
+
+    # Attempt auth schemes: Splunk → Bearer
+    auth_schemes = [os.getenv("S1_HEC_AUTH_SCHEME", "Splunk"), "Bearer"]
+
+    last_error: Optional[Exception] = None
     for event_base, raw_base in bases:
         for verify, tls_low in combos:
             POST = _make_poster(verify=verify, tls_low=tls_low)
@@ -1209,59 +1643,89 @@ def send_one(line, product: str, attr_fields: dict, event_time: float | None = N
                 headers_auth["Authorization"] = f"{scheme} {HEC_TOKEN}"
 
                 try:
-                    if product in JSON_PRODUCTS:
+                    if is_json:
                         # JSON payload → /event
                         url = event_base
-                        payload = _envelope(line, product, attr_fields, event_time)
                         headers = {**headers_auth, "Content-Type": "application/json"}
                         if DEBUG:
                             print(f"[DEBUG] Sending to {url}")
-                            print(f"[DEBUG] Sourcetype: {payload.get('sourcetype')}")
-                            print(f"[DEBUG] Payload: {payload}")
-                        resp = POST(url, headers=headers, json=payload, timeout=10)
+                            print(f"[DEBUG] Sourcetype: {SOURCETYPE_MAP.get(product, product)}")
+                            print(f"[DEBUG] Payload: {payload.decode('utf-8', 'replace')}")
                     else:
                         # Raw payload → /raw
                         url = f"{raw_base}?{_build_qs(product)}"
-                        payload = line
                         headers = {**headers_auth, "Content-Type": "text/plain"}
                         if DEBUG:
                             print(f"[DEBUG] Sending to {url}")
-                            print(f"[DEBUG] Payload (first 200 chars): {str(payload)[:200]}")
-                        resp = POST(url, headers=headers, data=payload, timeout=10)
-
-                    # If unauthorized with Splunk, retry with Bearer (handled by loop)
-                    if resp.status_code in (401, 403) and scheme == auth_schemes[0]:
-                        continue
-
-                    resp.raise_for_status()
-                    
-                    # Success! Cache this config for future sends
-                    _CONNECTION_CACHE['configured'] = True
-                    _CONNECTION_CACHE['event_base'] = event_base
-                    _CONNECTION_CACHE['raw_base'] = raw_base
-                    _CONNECTION_CACHE['verify'] = verify
-                    _CONNECTION_CACHE['tls_low'] = tls_low
-                    _CONNECTION_CACHE['auth_scheme'] = scheme
-                    _CONNECTION_CACHE['session'] = POST
-                    
-                    try:
-                        return resp.json()
-                    except ValueError:
-                        return {"status": "OK", "code": resp.status_code}
+                            print(f"[DEBUG] Payload (first 200 chars): {payload[:200].decode('utf-8', 'replace')}")
+                    # Connection errors move on to the next combination straight away
+                    resp = _post_with_retry(lambda: POST(url, headers=headers, data=payload, timeout=10),
+                                            retry_errors=False)
                 except Exception as e:
                     last_error = e
                     # On SSL/connection errors, continue to next combo/base
                     continue
 
+                # If unauthorized with Splunk, retry with Bearer (handled by loop)
+                if resp.status_code in (401, 403) and scheme == auth_schemes[0]:
+                    continue
+                try:
+                    resp.raise_for_status()
+                except requests.HTTPError as e:
+                    if _is_retryable_status(resp.status_code):
+                        # The collector answered and backoff (Retry-After included) ran out:
+                        # throttling or a 5xx is no reason to try other bases or drop TLS checks
+                        raise
+                    last_error = e
+                    continue
+
+                # Success! Cache this config for future sends
+                _CONNECTION_CACHE['configured'] = True
+                _CONNECTION_CACHE['event_base'] = event_base
+                _CONNECTION_CACHE['raw_base'] = raw_base
+                _CONNECTION_CACHE['verify'] = verify
+                _CONNECTION_CACHE['tls_low'] = tls_low
+                _CONNECTION_CACHE['auth_scheme'] = scheme
+                _CONNECTION_CACHE['session'] = POST
+                if endpoint_key is not None:
+                    _ENDPOINT_CACHE.store(endpoint_key, _CONNECTION_CACHE)
+                _track_ack(resp)
+                return resp
+
     # If all attempts failed, raise last error for visibility
     if last_error:
         raise last_error
     raise RuntimeError("HEC send failed with unknown error")
-    resp.raise_for_status()
-    try:
-        return resp.json()
-    except ValueError:
-        return {"status": "OK", "code": resp.status_code}
+
+def _load_endpoint(key: str) -> bool:
+    """Fill _CONNECTION_CACHE from the persistent endpoint cache; True on a usable hit."""
+    config = _ENDPOINT_CACHE.load(key)
+    if config is None:
+        return False
+    if not config['verify'] and DEFAULT_VERIFY_TLS and not ALLOW_INSECURE_FALLBACK:
+        # Found through the insecure fallback, which this process does not allow
+        return False
+    _CONNECTION_CACHE.update(config, configured=True, session=None)
+    if DEBUG:
+        print(f"[DEBUG] Using cached endpoint {config['event_base']} ({config['auth_scheme']})")
+    return True
+
+def _needs_reprobe(error: Exception) -> bool:
+    """Whether a cached-path failure means the endpoint/TLS/auth choice is wrong."""
+    if isinstance(error, requests.exceptions.SSLError):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in (401, 403, 404)
+    return False
+
+def _generate_events(generators: list, count: int, offset: int = 0) -> list:
+    """``count`` events cycling through ``generators`` from ``offset``, each generator drawn as one batch."""
+    events = [None] * count
+    step = len(generators)
+    for k in range(min(step, count)):
+        gen = generators[(offset + k) % step]
+        events[k::step] = generate_batch(gen, len(range(k, count, step)))
+    return events
 
 def send_many_with_spacing(lines, product: str, attr_fields: dict,
                            min_delay=0.020, max_delay=60.0):
@@ -1273,6 +1737,594 @@ def send_many_with_spacing(lines, product: str, attr_fields: dict,
             time.sleep(random.uniform(min_delay, max_delay))
     return results
 
+def _run_continuous(args, product: str, generators: list, attr_fields: dict,
+                    report: Optional[Callable] = None, status_interval: float = 5.0,
+                    streams: Optional[list] = None, schedule: Optional[list] = None) -> dict:
+    """Streaming send loop for continuous/large counts.
+
+    When ``report`` is given (worker shards), it is called with
+    ``(sent, ok, fail, elapsed, detail)`` every ``status_interval`` seconds instead of printing
+    the INFO status line, and the final summary is left to the caller.
+
+    ``streams``/``schedule`` (from ``_load_mix``) replace ``product``/``generators`` with several
+    ``(product, generators)`` streams interleaved in ``schedule`` order.
+    """
+    global _BATCH_ENABLED
+
+    # The async transport only carries batches, so it implies batch mode. Only this
+    # loop starts the transport and flushes on exit, so the implication stops here.
+    if args.transport == 'async':
+        _BATCH_ENABLED = True
+
+    if streams is None:
+        streams, schedule = [(product, generators)], [0]
+    turns = [0] * len(streams)  # events generated per stream
+
+    # Streaming mode for continuous/large counts - generate on the fly
+    if args.eps:
+        # Token-bucket pacing to an exact EPS target
+        high_rate = args.eps >= 1000
+        pacing = f"target {args.eps:g} EPS"
+    else:
+        # Legacy per-event random spacing
+        high_rate = args.min_delay < 0.001
+        pacing = f"spacing {args.min_delay}s – {args.max_delay}s"
+    if report is None:
+        print(f"Starting continuous send mode ({pacing})…", flush=True)
+    
+    # Indexer acknowledgement: every request (including the first) carries the channel
+    if args.ack:
+        _start_ack(args.ack_timeout)
+    
+    # Establish connection with first event BEFORE enabling batch mode
+    # This prevents blocking during the first batch flush
+    if _BATCH_ENABLED:
+        # Take the spool lock first so a second sender on the same directory stops before sending
+        spool = _open_spool(args.spool_dir, args.spool_max_bytes) if args.spool_dir else None
+        if args.verbosity in ('info', 'verbose', 'debug'):
+            print("[BATCH] Establishing connection with first event...", flush=True)
+        first_stream = schedule[0]
+        first_product, first_generators = streams[first_stream]
+        first_event = first_generators[0]()
+        turns[first_stream] = 1
+        # Temporarily disable batch mode for connection setup
+        original_batch = os.environ.get('S1_HEC_BATCH')
+        os.environ['S1_HEC_BATCH'] = '0'
+        _BATCH_ENABLED = False
+        
+        first_failed = False
+        try:
+            result = send_one(first_event, first_product, attr_fields)
+            if args.verbosity == 'debug':
+                print(f"[BATCH] Connection established: {result}", flush=True)
+        except Exception as e:
+            first_failed = True
+            print(f"[BATCH] Failed to establish connection: {e}", flush=True)
+        finally:
+            # Re-enable batch mode
+            if original_batch:
+                os.environ['S1_HEC_BATCH'] = original_batch
+            _BATCH_ENABLED = True
+        
+        # Async transport replaces the single pipelined sender thread
+        if args.transport == 'async':
+            _start_async_transport(args.max_inflight, args.max_inflight_bytes)
+        # Enable pipelined batch sending for high throughput (>1K EPS)
+        elif high_rate:  # >1K EPS
+            # Allow up to 20 batches in flight; --backpressure decides what a full queue does
+            _start_batch_sender(20, args.backpressure, args.block_timeout or None)
+            if args.verbosity in ('info', 'verbose', 'debug'):
+                print("[BATCH] Enabled pipelined sending for high throughput", flush=True)
+        
+        # Write-ahead spool for batches the collector can't take right now
+        if spool is not None:
+            _start_spool(spool, args.spool_drain_rate)
+            if first_failed:
+                # Queue the first event with the rest; its batch goes to the spool
+                send_one(first_event, first_product, attr_fields)
+        
+        # Start from event 2 since we already sent event 1
+        start_idx = 1
+    else:
+        start_idx = 0
+    
+    # Speed mode: pre-generate 1K events as templates whose timestamps, IPs and ids
+    # are re-rendered per event, and loop through them
+    speed_pools = None
+    if args.speed_mode:
+        if args.verbosity in ('info', 'verbose', 'debug'):
+            print("[SPEED] Pre-generating 1000 event templates for maximum throughput...", flush=True)
+        per_stream = [0] * len(streams)
+        for k in range(1000):
+            per_stream[schedule[k % len(schedule)]] += 1
+        samples_per_stream = [_generate_events(stream_generators, count, turns[stream])
+                              for stream, ((_, stream_generators), count) in enumerate(zip(streams, per_stream))]
+        speed_pools = [TemplatePool(sample) if sample else None for sample in samples_per_stream]
+        if args.verbosity in ('info', 'verbose', 'debug'):
+            slots = sum(pool.slots for pool in speed_pools if pool)
+            print(f"[SPEED] Compiled 1000 templates with {slots} variable fields, looping continuously", flush=True)
+    
+    elif high_rate:
+        # Draw events in chunks through each generator's batch path; at low rates
+        # the chunk's lead time would show up as stale timestamps
+        streams = [(stream_product, [BatchSource(_wire_generator(gen)) for gen in stream_generators])
+                   for stream_product, stream_generators in streams]
+        if args.verbosity in ('info', 'verbose', 'debug'):
+            vectorised = sum(gen.vectorised for _, gens in streams for gen in gens)
+            total = sum(len(gens) for _, gens in streams)
+            print(f"[BATCH] Generating in chunks of {streams[0][1][0].chunk} "
+                  f"({vectorised}/{total} generators vectorised)", flush=True)
+    else:
+        # Generators with a _bytes companion hand over wire-ready UTF-8
+        streams = [(stream_product, [_wire_generator(gen) for gen in stream_generators])
+                   for stream_product, stream_generators in streams]
+    
+    ok = 0
+    fail = 0
+    samples = []
+    pacer = TokenBucketPacer(args.eps, bytes_per_sec=args.max_bytes_per_sec) if args.eps else None
+    last_status_time = time.time()
+    start_time = time.time()
+    i = start_idx - 1
+    
+    def _status_extras() -> list:
+        extras = []
+        if _TRANSPORT is not None:
+            extras.append(f"{_TRANSPORT.inflight} in flight")
+        if _BATCH_SEND_QUEUE is not None:
+            extras.append(_BATCH_SEND_QUEUE.describe())
+        if _BATCH_ENABLED and _BATCH_CONTROLLER.adaptive:
+            extras.append(_BATCH_CONTROLLER.describe())
+        if pacer is not None:
+            extras.append(pacer.describe())
+        if _SPOOL is not None and (_SPOOL.spooled or not _SPOOL.healthy):
+            extras.append(_SPOOL.describe())
+        if _THROTTLE.throttled:
+            extras.append(_THROTTLE.describe())
+        if _ACK is not None and _ACK.enabled:
+            extras.append(_ACK.describe())
+        return extras
+    
+    for i in range(start_idx, args.count):
+        try:
+            if pacer is not None:
+                pacer.wait()
+            # Render a speed-mode template, otherwise generate on the fly
+            stream = schedule[i % len(schedule)]
+            if speed_pools is not None:
+                event = speed_pools[stream].render()
+            else:
+                stream_generators = streams[stream][1]
+                event = stream_generators[turns[stream] % len(stream_generators)]()
+            turns[stream] += 1
+            if pacer is not None and pacer.bytes_per_sec:
+                # The cap is on wire bytes: encode str events rather than counting characters
+                if isinstance(event, str):
+                    pacer.charge_bytes(len(event.encode("utf-8")))
+                else:
+                    pacer.charge_bytes(len(event) if isinstance(event, bytes) else len(dumps_bytes(event)))
+            result = send_one(event, streams[stream][0], attr_fields)
+            
+            # Verbose mode: print every response
+            if args.verbosity == 'verbose':
+                print(f"Response {i+1 if start_idx == 0 else i}:", result, flush=True)
+            
+            if isinstance(result, dict) and (result.get('code') == 0 or result.get('status') in ('OK', 'QUEUED')):
+                ok += 1
+            else:
+                fail += 1
+                if len(samples) < 3:
+                    samples.append(result)
+            
+            # Info mode: periodic status updates every 5 seconds
+            current_time = time.time()
+            if (current_time - last_status_time) >= status_interval:
+                total_sent = i + 1 - start_idx
+                if report is not None:
+                    report(total_sent, ok, fail, current_time - start_time, " | ".join(_status_extras()))
+                elif args.verbosity == 'info':
+                    elapsed = current_time - start_time
+                    actual_eps = total_sent / elapsed if elapsed > 0 else 0
+                    success_rate = (ok / total_sent * 100) if total_sent > 0 else 0
+                    status = f"INFO: {total_sent} events sent | {actual_eps:.1f} EPS | {ok} success ({success_rate:.1f}%) | {fail} failed"
+                    print(" | ".join([status] + _status_extras()), flush=True)
+                last_status_time = current_time
+            
+            # Sleep between events (skip for ultra-high EPS where sleep overhead dominates)
+            # Python's time.sleep() has ~1ms overhead, so skip for delays < 0.001s (>1000 EPS)
+            if pacer is None and args.min_delay >= 0.001:
+                time.sleep(random.uniform(args.min_delay, args.max_delay))
+                
+        except KeyboardInterrupt:
+            print(f"\nStopped by user after {i+1} events", flush=True)
+            break
+        except Exception as e:
+            print(f"Error at event {i+1}: {e}", flush=True)
+            fail += 1
+    
+    # Flush any remaining batches
+    if _BATCH_ENABLED:
+        if args.verbosity in ('info', 'verbose', 'debug'):
+            print("\n[BATCH] Flushing remaining batches...", flush=True)
+        _batch_flush_all()
+        
+        # Wait for pipelined batches to complete
+        if _BATCH_SEND_QUEUE is not None:
+            if args.verbosity in ('info', 'verbose', 'debug'):
+                print("[BATCH] Waiting for pipelined batches to complete...", flush=True)
+            _BATCH_SEND_QUEUE.join()  # Wait for all queued batches to be sent
+            if args.verbosity in ('info', 'verbose', 'debug'):
+                print("[BATCH] All batches sent", flush=True)
+            if _BATCH_SEND_QUEUE.dropped:
+                print(f"[BATCH] Backpressure ({_BATCH_SEND_QUEUE.policy}) dropped "
+                      f"{_BATCH_SEND_QUEUE.dropped_events} events in {_BATCH_SEND_QUEUE.dropped} batches", flush=True)
+        
+        # Wait for concurrent async POSTs to complete
+        if _TRANSPORT is not None:
+            if args.verbosity in ('info', 'verbose', 'debug'):
+                print(f"[BATCH] Waiting for {_TRANSPORT.inflight} in-flight requests...", flush=True)
+            _drain_async_transport()
+            _TRANSPORT.close()
+        
+        # Give the spool a chance to drain; anything left is resumed by the next run
+        if _SPOOL is not None:
+            if _SPOOL.pending()[1]:
+                print(f"[SPOOL] Draining {_SPOOL.describe()} (up to {args.spool_exit_wait:g}s)...", flush=True)
+                _SPOOL.wait_drained(args.spool_exit_wait)
+            segments, pending = _SPOOL.pending()
+            if pending:
+                print(f"[SPOOL] {pending // 1024}KB left in {args.spool_dir}; it will be resent on the next run", flush=True)
+            _SPOOL.close()
+    
+    # Wait for the indexer to confirm what was accepted
+    if _ACK is not None:
+        if _ACK.enabled and _ACK.pending:
+            print(f"[ACK] Waiting for {_ACK.pending} acknowledgements (up to {args.ack_timeout:g}s)...", flush=True)
+            _ACK.wait(args.ack_timeout)
+        if _ACK.enabled:
+            print(f"[ACK] {_ACK.describe()}", flush=True)
+        _ACK.close()
+    
+    sent = i + 1
+    mix = {streams[s][0]: turns[s] for s in range(len(streams))} if len(streams) > 1 else None
+    if args.metrics_file:
+        _write_metrics(args.metrics_file, args, product, sent, ok, fail, time.time() - start_time, mix)
+    if report is None:
+        print(f"\nDone. Delivered {ok}/{sent} successfully. Failures: {fail}.")
+        if mix:
+            print("Events per product: " + ", ".join(f"{p} {n}" for p, n in mix.items()))
+        if samples:
+            print("Sample failure responses:")
+            for s in samples:
+                print("  -", s)
+    return {'sent': sent, 'ok': ok, 'fail': fail, 'samples': samples}
+
+def _write_metrics(path: str, args, product: str, sent: int, ok: int, fail: int, elapsed: float,
+                   mix: Optional[dict] = None):
+    """Write a JSON summary of this run (for utilities/hec_benchmark.py and CI)."""
+    metrics = {
+        'product': product,
+        'batch': _BATCH_ENABLED,
+        'transport': args.transport,
+        'codec': {dest: str(codec) for dest, codec in _BATCH_CODECS.items()},
+        'json_backend': HEC_JSON_BACKEND,
+        'sent': sent,
+        'ok': ok,
+        'fail': fail,
+        'elapsed_s': round(elapsed, 3),
+        'events_per_sec': round(sent / elapsed, 1) if elapsed > 0 else 0.0,
+        'post_latency_ms': _POST_LATENCY.summary_ms(),
+    }
+    if mix:
+        metrics['events_per_product'] = mix
+    if _BATCH_SEND_QUEUE is not None:
+        metrics['dropped_events'] = _BATCH_SEND_QUEUE.dropped_events
+        metrics['blocked_s'] = round(_BATCH_SEND_QUEUE.blocked_s, 3)
+    try:
+        with open(path, 'w') as fh:
+            json.dump(metrics, fh, indent=2)
+    except OSError as e:
+        print(f"Warning: could not write --metrics-file {path}: {e}", flush=True)
+
+def _load_mix(spec: str) -> Tuple[list, list]:
+    """``--mix`` streams ``[(product, generators), ...]`` and their interleaving schedule."""
+    mix = parse_mix(spec)
+    unknown = [p for p, _ in mix if p not in PROD_MAP]
+    if unknown:
+        raise ValueError(f"unknown product(s): {', '.join(unknown)}")
+    streams = []
+    for mix_product, _ in mix:
+        mod_name, func_names = PROD_MAP[mix_product]
+        gen_mod = load_generator(mod_name)
+        streams.append((mix_product, [getattr(gen_mod, fn) for fn in func_names]))
+    return streams, interleave([weight for _, weight in mix])
+
+def _worker_main(shard: int, args, product: str, attr_fields: dict, sourcetype: str, stats_queue):
+    """Entry point for one --workers shard: its own generators, buffers and connection."""
+    global _VERBOSITY, _ENDPOINT_PROBE, _BATCH_COALESCE
+    import signal
+    # The parent forwards stop requests as SIGTERM; Ctrl-C is handled by the parent only
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    def _stop(signum, frame):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, _stop)
+
+    _VERBOSITY = args.verbosity
+    _ENDPOINT_PROBE = args.probe
+    _BATCH_COALESCE = _BATCH_COALESCE or args.coalesce
+    event_clock.CLOCK.anchor = args.clock_anchor
+    streams = schedule = None
+    if args.mix:
+        streams, schedule = _load_mix(args.mix)
+        generators = []
+    else:
+        SOURCETYPE_MAP[product] = sourcetype
+        mod_name, func_names = PROD_MAP[product]
+        gen_mod = load_generator(mod_name)
+        generators = [getattr(gen_mod, fn) for fn in func_names]
+
+    def _report(sent, ok, fail, elapsed, detail):
+        stats_queue.put(('progress', shard, sent, ok, fail, (elapsed, detail)))
+
+    stats = _run_continuous(args, product, generators, attr_fields, report=_report, status_interval=1.0,
+                            streams=streams, schedule=schedule)
+    stats_queue.put(('done', shard, stats['sent'], stats['ok'], stats['fail'], stats['samples']))
+
+def _run_workers(args, product: str, attr_fields: dict, status_interval: float = 5.0):
+    """Fork ``args.workers`` sender shards, split the EPS target and merge their counters."""
+    import multiprocessing, signal
+    n = args.workers
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    stats_queue = ctx.Queue()
+
+    pacing = f"target {args.eps:g} EPS" if args.eps else f"spacing {args.min_delay}s – {args.max_delay}s"
+    print(f"Starting continuous send mode with {n} workers ({pacing} overall)…", flush=True)
+
+    procs = []
+    for shard in range(n):
+        shard_args = argparse.Namespace(**vars(args))
+        shard_args.workers = 1
+        shard_args.count = args.count // n + (1 if shard < args.count % n else 0)
+        # Each shard runs at 1/N of the target rate
+        shard_args.min_delay = args.min_delay * n
+        shard_args.max_delay = args.max_delay * n
+        if args.eps:
+            shard_args.eps = args.eps / n
+        if args.max_bytes_per_sec:
+            shard_args.max_bytes_per_sec = args.max_bytes_per_sec / n
+        if args.spool_dir:
+            shard_args.spool_dir = os.path.join(args.spool_dir, f"shard-{shard}")
+        if args.metrics_file:
+            shard_args.metrics_file = f"{args.metrics_file}.shard-{shard}"
+        # Shards continue the parent's virtual timeline (needed when not forked)
+        shard_args.clock_anchor = event_clock.CLOCK.anchor
+        p = ctx.Process(
+            target=_worker_main,
+            args=(shard, shard_args, product, attr_fields, SOURCETYPE_MAP.get(product, product), stats_queue),
+            name=f"hec-worker-{shard}",
+        )
+        p.start()
+        procs.append(p)
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, _stop)
+
+    progress = {shard: (0, 0, 0) for shard in range(n)}
+    rates = {}
+    details = {}
+    done = set()
+    samples = []
+    start_time = time.time()
+    last_status_time = start_time
+
+    def _collect(deadline: Optional[float] = None):
+        nonlocal last_status_time
+        while len(done) < n:
+            if deadline is not None and time.time() >= deadline:
+                return
+            try:
+                kind, shard, sent, ok, fail, extra = stats_queue.get(timeout=0.5)
+                progress[shard] = (sent, ok, fail)
+                if kind == 'done':
+                    done.add(shard)
+                    samples.extend(extra[:3 - len(samples)])
+                else:
+                    elapsed, detail = extra
+                    rates[shard] = sent / elapsed if elapsed > 0 else 0
+                    if detail:
+                        details[shard] = detail
+            except queue.Empty:
+                if not any(p.is_alive() for p in procs):
+                    return
+            current_time = time.time()
+            if args.verbosity == 'info' and (current_time - last_status_time) >= status_interval:
+                total_sent = sum(v[0] for v in progress.values())
+                ok = sum(v[1] for v in progress.values())
+                fail = sum(v[2] for v in progress.values())
+                # Sum per-shard rates so fork/probe time and report lag don't skew the total
+                actual_eps = sum(rates.values())
+                success_rate = (ok / total_sent * 100) if total_sent > 0 else 0
+                status = (f"INFO: {total_sent} events sent | {actual_eps:.1f} EPS | {ok} success ({success_rate:.1f}%) | "
+                          f"{fail} failed | {n - len(done)}/{n} workers")
+                if args.eps:
+                    status += f" | target {args.eps:g} EPS ({(actual_eps - args.eps) / args.eps * 100:+.1f}%)"
+                if details:
+                    status += f" | shard 0: {details.get(0, next(iter(details.values())))}"
+                print(status, flush=True)
+                last_status_time = current_time
+
+    try:
+        _collect()
+    except KeyboardInterrupt:
+        print(f"\nStopping {n} workers...", flush=True)
+        for p in procs:
+            if p.is_alive():
+                p.terminate()  # SIGTERM → KeyboardInterrupt in the shard, which flushes its batches
+        _collect(deadline=time.time() + 30)
+
+    for p in procs:
+        p.join(timeout=5)
+        if p.is_alive():
+            p.kill()
+
+    total_sent = sum(v[0] for v in progress.values())
+    ok = sum(v[1] for v in progress.values())
+    fail = sum(v[2] for v in progress.values())
+    print(f"\nDone. Delivered {ok}/{total_sent} successfully across {n} workers. Failures: {fail}.")
+    if samples:
+        print("Sample failure responses:")
+        for s in samples:
+            print("  -", s)
+
+def _run_codec_bench(products: list, events: int, attr_fields: dict):
+    """Compress real generator output with every available codec and print MB/s and ratio."""
+    from hec_codecs import available_codecs, benchmark  # type: ignore
+    codecs = available_codecs()
+    print(f"Codec benchmark: {events} events per product, streamed through each codec "
+          f"(MB/s of uncompressed input, single core)")
+    print(f"{'product':<36} {'codec':<10} {'ratio':>7} {'MB/s':>9} {'bytes':>11}")
+    totals = {str(c): [0, 0, 0.0] for c in codecs}  # raw bytes, encoded bytes, seconds
+    for product in products:
+        try:
+            mod_name, func_names = PROD_MAP[product]
+            gen_mod = load_generator(mod_name)
+            generators = [getattr(gen_mod, fn) for fn in func_names]
+            lines = [_batch_line(event, product, attr_fields)[0]
+                     for event in _generate_events(generators, events)]
+        except Exception as e:
+            print(f"{product:<36} skipped: {e}")
+            continue
+        for codec in codecs:
+            result = benchmark(codec, lines)
+            print(f"{product:<36} {result['codec']:<10} {result['ratio']:>6.2f}x "
+                  f"{result['mb_per_sec']:>9.1f} {result['encoded_bytes']:>11}")
+            total = totals[result['codec']]
+            total[0] += result['raw_bytes']
+            total[1] += result['encoded_bytes']
+            total[2] += result['raw_bytes'] / (result['mb_per_sec'] * 1024 * 1024)
+    if len(products) > 1:
+        for name, (raw, encoded, seconds) in totals.items():
+            if encoded:
+                print(f"{'ALL':<36} {name:<10} {raw / encoded:>6.2f}x "
+                      f"{raw / seconds / (1024 * 1024):>9.1f} {encoded:>11}")
+
+def _run_json_bench(products: list, events: int, attr_fields: dict, min_seconds: float = 0.5):
+    """Serialise generator output the way batch mode does under each JSON backend; print events/s."""
+    from hec_json import BACKENDS, BACKEND  # type: ignore
+    print(f"JSON backend benchmark: {events} events per product, batch-mode serialisation "
+          f"(active backend: {BACKEND})")
+    names = list(BACKENDS)
+    print(f"{'product':<36} " + " ".join(f"{name + ' ev/s':>14}" for name in names)
+          + ("   speedup" if len(names) > 1 else ""))
+    for product in products:
+        try:
+            mod_name, func_names = PROD_MAP[product]
+            gen_mod = load_generator(mod_name)
+            generators = [getattr(gen_mod, fn) for fn in func_names]
+            sample = _generate_events(generators, events)
+        except Exception as e:
+            print(f"{product:<36} skipped: {e}")
+            continue
+        rates = []
+        for name in names:
+            dumps_fn = BACKENDS[name][1]
+            if product in JSON_PRODUCTS:
+                template = EnvelopeTemplate(SOURCETYPE_MAP.get(product, product), attr_fields,
+                                            ENV_SOURCE, ENV_HOST, ENV_INDEX, dumps_bytes=dumps_fn)
+                encode = template.render
+            else:
+                encode = lambda e: dumps_fn(e) if isinstance(e, (dict, list)) else str(e).encode('utf-8')
+            done = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < min_seconds:
+                for event in sample:
+                    encode(event)
+                done += len(sample)
+            rates.append(done / (time.perf_counter() - start))
+        line = f"{product:<36} " + " ".join(f"{rate:>14,.0f}" for rate in rates)
+        if len(rates) > 1:
+            line += f"   {rates[-1] / rates[0]:>6.2f}x"
+        print(line)
+
+def _simulate_batches(stream: list, eps: float, coalesce: bool) -> dict:
+    """Replay ``(product, line, is_json)`` at ``eps`` through batch-mode size/time flushing."""
+    max_bytes, flush_s = _BATCH_CONTROLLER.max_bytes, _BATCH_CONTROLLER.flush_ms / 1000.0
+    open_batches = {}  # key -> (started, CompressedBatch)
+    totals = {'requests': 0, 'events': 0, 'bytes': 0, 'compressed': 0}
+
+    def _flush(key):
+        started, batch = open_batches.pop(key)
+        batch.finish()
+        totals['requests'] += 1
+        totals['events'] += batch.count
+        totals['bytes'] += batch.bytes
+        totals['compressed'] += len(batch.body)
+
+    for k, (product, line, is_json) in enumerate(stream):
+        now = k / eps
+        for key in [key for key, (started, _) in open_batches.items() if now - started >= flush_s]:
+            _flush(key)
+        key = (True, None) if coalesce and is_json else (is_json, product)
+        if key not in open_batches:
+            open_batches[key] = (now, CompressedBatch(_batch_codec(is_json)))
+        batch = open_batches[key][1]
+        batch.add(line)
+        if batch.bytes >= max_bytes:
+            _flush(key)
+    for key in list(open_batches):
+        _flush(key)
+    return totals
+
+def _run_coalesce_bench(products: list, events: int, attr_fields: dict, eps: float):
+    """Compare HEC requests and bytes for per-product batches against one coalesced /event batch."""
+    streams = []
+    for product in products:
+        try:
+            mod_name, func_names = PROD_MAP[product]
+            gen_mod = load_generator(mod_name)
+            generators = [getattr(gen_mod, fn) for fn in func_names]
+            streams.append((product, _generate_events(generators, events)))
+        except Exception as e:
+            print(f"{product:<36} skipped: {e}")
+    if not streams:
+        return
+    # Round-robin interleaving, as --mix with equal weights would send them
+    interleaved = [(product, sample[i]) for i in range(events) for product, sample in streams]
+    raw_products = sum(1 for product, _ in streams if product not in JSON_PRODUCTS)
+    print(f"Coalesce benchmark: {len(streams)} products ({raw_products} raw), {events} events each, "
+          f"replayed at {eps:g} EPS with {_BATCH_CONTROLLER.max_bytes // 1024}KB / "
+          f"{_BATCH_CONTROLLER.flush_ms}ms flush thresholds")
+    print(f"{'layout':<28} {'requests':>9} {'events/req':>11} {'MB':>9} {'MB sent':>9} {'KB/req':>9}")
+    results = {}
+    for label, coalesce in (("per product (/event + /raw)", False), ("coalesced (/event only)", True)):
+        stream = [(product, *_batch_line(event, product, attr_fields, coalesce=coalesce))
+                  for product, event in interleaved]
+        totals = results[label] = _simulate_batches(stream, eps, coalesce)
+        print(f"{label:<28} {totals['requests']:>9} {totals['events'] / totals['requests']:>11.1f} "
+              f"{totals['bytes'] / 1048576:>9.2f} {totals['compressed'] / 1048576:>9.2f} "
+              f"{totals['compressed'] / totals['requests'] / 1024:>9.1f}")
+    split, merged = results.values()
+    print(f"Coalescing: {merged['requests'] / split['requests']:.2f}x requests, "
+          f"{merged['compressed'] / split['compressed']:.2f}x bytes sent")
+
+def _bench_products(spec: str, product: str) -> list:
+    """Products for the --*-bench modes: --product, a comma-separated list, or 'all'."""
+    if spec == 'all':
+        products = sorted(PROD_MAP)
+    elif spec:
+        products = [p.strip() for p in spec.split(',') if p.strip()]
+    else:
+        products = [product]
+    unknown = [p for p in products if p not in PROD_MAP]
+    if unknown:
+        print(f"Error: Unknown product(s) for benchmark: {', '.join(unknown)}")
+        sys.exit(1)
+    return products
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Generate & send security events from various vendors (one‑by‑one) to S1"
@@ -1402,9 +2454,79 @@ if __name__ == "__main__":
     parser.add_argument("--print-responses", action="store_true",
                         help="(Deprecated: use --verbosity verbose) Print all HEC responses")
     parser.add_argument("--speed-mode", action="store_true",
-                        help="Speed mode: pre-generate 1K events and loop for max throughput")
+                        help="Speed mode: pre-generate 1K event templates and re-render their timestamps, IPs and ids per event")
     parser.add_argument("--metadata", type=str, default=None,
                         help="Custom metadata fields as JSON object (e.g., '{\"scenario.trace_id\":\"abc-123\",\"environment\":\"test\"}')")
+    parser.add_argument("--transport", choices=['sync', 'async'], default='sync',
+                        help="Batch transport: sync (one request at a time) or async (pooled concurrent POSTs)")
+    parser.add_argument("--max-inflight", type=int, default=8,
+                        help="Async transport: maximum concurrent batch POSTs (default 8)")
+    parser.add_argument("--max-inflight-bytes", type=int, default=64 * 1024 * 1024,
+                        help="Async transport: maximum compressed bytes in flight (default 64MB)")
+    parser.add_argument("--eps", type=float, default=None,
+                        help="Continuous mode: exact events/sec target via token-bucket pacing (overrides --min/--max-delay)")
+    parser.add_argument("--max-bytes-per-sec", type=float, default=None,
+                        help="Continuous mode with --eps: cap generated event bytes per second")
+    parser.add_argument("--spool-dir", type=str, default=os.getenv("S1_HEC_SPOOL_DIR"),
+                        help="Batch mode: spool failed/backed-up batches to this directory and replay them (env S1_HEC_SPOOL_DIR)")
+    parser.add_argument("--spool-max-bytes", type=int,
+                        default=int(os.getenv("S1_HEC_SPOOL_MAX_BYTES", str(1024 * 1024 * 1024))),
+                        help="Maximum spool size on disk (default 1GB, env S1_HEC_SPOOL_MAX_BYTES)")
+    parser.add_argument("--spool-drain-rate", type=float, default=5.0,
+                        help="Batches per second replayed from the spool once the collector recovers (default 5)")
+    parser.add_argument("--spool-exit-wait", type=float, default=60.0,
+                        help="Seconds to wait for the spool to drain before exiting (default 60)")
+    parser.add_argument("--backpressure", choices=BACKPRESSURE_POLICIES,
+                        default=os.getenv("S1_HEC_BACKPRESSURE") or None,
+                        help="Pipelined sending: what a full send queue does to producers - block (wait, "
+                             "see --block-timeout), drop-oldest (evict and count the oldest queued batch) "
+                             "or spill (write to --spool-dir). Default: spill with --spool-dir, else block")
+    parser.add_argument("--block-timeout", type=float,
+                        default=float(os.getenv("S1_HEC_BLOCK_TIMEOUT", "0")),
+                        help="With --backpressure block: seconds a producer waits for queue space before "
+                             "the batch is dropped and counted (default 0 = wait indefinitely)")
+    parser.add_argument("--metrics-file", default=os.getenv("S1_HEC_METRICS_FILE"),
+                        help="Continuous mode: write a JSON run summary (events, EPS, POST latency p50/p90/p99) "
+                             "to this path on exit (with --workers, one file per shard)")
+    parser.add_argument("--probe", action="store_true",
+                        help="Ignore the persisted endpoint/TLS/auth discovery cache and probe again "
+                             "(the result refreshes the cache; env S1_HEC_ENDPOINT_CACHE, S1_HEC_ENDPOINT_CACHE_TTL)")
+    parser.add_argument("--ack", action="store_true",
+                        default=os.getenv("S1_HEC_ACK", "").lower() in ("1", "true", "yes"),
+                        help="Continuous mode: poll HEC indexer acknowledgement for every accepted request (env S1_HEC_ACK)")
+    parser.add_argument("--ack-timeout", type=float, default=120.0,
+                        help="Seconds to wait for an ackId to be confirmed before counting it unconfirmed (default 120)")
+    parser.add_argument("--codec", type=str, default=os.getenv("S1_HEC_CODEC"),
+                        help="Batch payload codec: gzip[:1-9] (default gzip:1), zstd[:1-22], identity; "
+                             "per destination as event=zstd:3,raw=gzip:6 (env S1_HEC_CODEC)")
+    parser.add_argument("--codec-bench", nargs="?", const="", default=None, metavar="PRODUCTS",
+                        help="Benchmark codecs on generator output and exit: --product by default, "
+                             "a comma-separated product list, or 'all'")
+    parser.add_argument("--json-bench", nargs="?", const="", default=None, metavar="PRODUCTS",
+                        help="Benchmark batch-mode JSON serialisation per backend (stdlib json, orjson if "
+                             "installed) and exit; same product selection as --codec-bench")
+    parser.add_argument("--coalesce", action="store_true",
+                        help="Batch mode: send raw products to /event as envelopes with a per-event sourcetype, "
+                             "so all products share one batch (fewer, larger requests; env S1_HEC_COALESCE)")
+    parser.add_argument("--coalesce-bench", nargs="?", const="", default=None, metavar="PRODUCTS",
+                        help="Compare request count and bytes of per-product batches against --coalesce "
+                             "for an interleaved stream at --eps (default 1000) and exit; products from "
+                             "--mix, else as for --codec-bench")
+    parser.add_argument("--bench-events", type=int, default=2000,
+                        help="Events per product for --codec-bench / --json-bench / --coalesce-bench (default 2000)")
+    parser.add_argument("--mix", default=None, metavar="SPEC",
+                        help="Send a weighted interleaving of several products from this one process, e.g. "
+                             "'fortinet_fortigate:5,zscaler:3,crowdstrike_falcon:1' (weight defaults to 1), or a "
+                             "mix file (JSON object or 'product weight' lines). Replaces --product; always "
+                             "streams, so it works with every continuous-mode option")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Continuous mode: number of sender processes sharing the EPS target (default 1)")
+    parser.add_argument("--start-time", default=None, metavar="TIME",
+                        help="Backfill: stamp events and envelopes on a virtual clock starting at TIME "
+                             "(ISO 8601, e.g. 2025-01-31T00:00:00Z, or epoch seconds) instead of now")
+    parser.add_argument("--time-rate", type=float, default=1.0,
+                        help="With --start-time: virtual seconds per real second, e.g. 60 replays an "
+                             "hour per minute (default 1.0)")
     args = parser.parse_args()
     
     # Backward compatibility: --print-responses sets verbosity to verbose
@@ -1413,6 +2535,43 @@ if __name__ == "__main__":
     
     # Set module-level verbosity for batch logging (no global needed since it's already module-level)
     _VERBOSITY = args.verbosity
+    _ENDPOINT_PROBE = args.probe
+    _BATCH_COALESCE = _BATCH_COALESCE or args.coalesce
+
+    try:
+        _BATCH_CODECS = parse_codec_spec(args.codec)
+    except ValueError as e:
+        print(f"Error: --codec: {e}")
+        sys.exit(1)
+
+    if args.backpressure is None:
+        args.backpressure = 'spill' if args.spool_dir else 'block'
+    elif args.backpressure not in BACKPRESSURE_POLICIES:  # from S1_HEC_BACKPRESSURE
+        print(f"Error: --backpressure must be one of {', '.join(BACKPRESSURE_POLICIES)}")
+        sys.exit(1)
+    if args.backpressure == 'spill' and not args.spool_dir:
+        print("Error: --backpressure spill needs --spool-dir (or S1_HEC_SPOOL_DIR)")
+        sys.exit(1)
+    if args.eps is not None and not 0 < args.eps < float("inf"):
+        print("Error: --eps must be a positive number of events per second")
+        sys.exit(1)
+    if args.max_bytes_per_sec is not None:
+        if args.eps is None:
+            print("Error: --max-bytes-per-sec needs --eps")
+            sys.exit(1)
+        if not 0 < args.max_bytes_per_sec < float("inf"):
+            print("Error: --max-bytes-per-sec must be a positive number")
+            sys.exit(1)
+
+    if args.start_time is not None:
+        try:
+            event_clock.set_now(event_clock.parse_when(args.start_time), args.time_rate)
+        except ValueError as e:
+            print(f"Error: --start-time: {e}")
+            sys.exit(1)
+    elif args.time_rate != 1.0:
+        print("Error: --time-rate needs --start-time")
+        sys.exit(1)
 
     # Handle marketplace parser name
     if args.marketplace_parser:
@@ -1429,14 +2588,24 @@ if __name__ == "__main__":
     else:
         product = args.product
 
-    # Check if generator exists
-    if product not in PROD_MAP:
-        print(f"Error: Generator for product '{product}' not yet implemented")
-        sys.exit(1)
+    if args.codec_bench is not None:
+        _run_codec_bench(_bench_products(args.codec_bench, product), args.bench_events, {})
+        sys.exit(0)
+    if args.json_bench is not None:
+        _run_json_bench(_bench_products(args.json_bench, product), args.bench_events, {})
+        sys.exit(0)
+    if args.coalesce_bench is not None:
+        if args.mix and not args.coalesce_bench:
+            try:
+                bench_products = [p for p, _ in parse_mix(args.mix)]
+            except (OSError, ValueError) as e:
+                print(f"Error: --mix: {e}")
+                sys.exit(1)
+        else:
+            bench_products = _bench_products(args.coalesce_bench, product)
+        _run_coalesce_bench(bench_products, args.bench_events, {}, args.eps or 1000.0)
+        sys.exit(0)
 
-    mod_name, func_names = PROD_MAP[product]
-    gen_mod = importlib.import_module(mod_name)
-    
     # Parse custom metadata fields if provided
     attr_fields = {}
     if args.metadata:
@@ -1450,169 +2619,50 @@ if __name__ == "__main__":
             print(f"Error: Invalid JSON in --metadata argument: {e}")
             sys.exit(1)
     
+    if args.mix:
+        try:
+            streams, schedule = _load_mix(args.mix)
+        except (OSError, ValueError) as e:
+            print(f"Error: --mix: {e}")
+            sys.exit(1)
+        mix_label = "+".join(p for p, _ in streams)
+        if args.workers > 1:
+            _run_workers(args, mix_label, attr_fields)
+        else:
+            _run_continuous(args, mix_label, [], attr_fields, streams=streams, schedule=schedule)
+        sys.exit(0)
+
+    # Check if generator exists
+    if product not in PROD_MAP:
+        print(f"Error: Generator for product '{product}' not yet implemented")
+        sys.exit(1)
+
+    mod_name, func_names = PROD_MAP[product]
+    gen_mod = load_generator(mod_name)
     generators = [getattr(gen_mod, fn) for fn in func_names]
 
     # For large counts (continuous mode), stream events instead of pre-generating
     STREAMING_THRESHOLD = 10000
     
+    if args.count <= STREAMING_THRESHOLD:
+        if args.transport == 'async':
+            print(f"Note: --transport async only applies to continuous mode (-n > {STREAMING_THRESHOLD}); "
+                  f"sending synchronously", flush=True)
+        # Only the continuous loop flushes batch buffers before exit, so S1_HEC_BATCH
+        # would leave these events queued: send them one request each
+        _BATCH_ENABLED = False
+
     if args.count == 1:
         event = generators[0]()
         print("HEC response:", send_one(event, product, attr_fields))
     elif args.count > STREAMING_THRESHOLD:
-        # Streaming mode for continuous/large counts - generate on the fly
-        print(f"Starting continuous send mode (spacing {args.min_delay}s – {args.max_delay}s)…", flush=True)
-        
-        # Establish connection with first event BEFORE enabling batch mode
-        # This prevents blocking during the first batch flush
-        if _BATCH_ENABLED:
-            if args.verbosity in ('info', 'verbose', 'debug'):
-                print("[BATCH] Establishing connection with first event...", flush=True)
-            first_event = generators[0]()
-            # Temporarily disable batch mode for connection setup
-            import os
-            original_batch = os.environ.get('S1_HEC_BATCH')
-            os.environ['S1_HEC_BATCH'] = '0'
-            globals()['_BATCH_ENABLED'] = False
-            
-            try:
-                result = send_one(first_event, product, attr_fields)
-                if args.verbosity == 'debug':
-                    print(f"[BATCH] Connection established: {result}", flush=True)
-            except Exception as e:
-                print(f"[BATCH] Failed to establish connection: {e}", flush=True)
-            finally:
-                # Re-enable batch mode
-                if original_batch:
-                    os.environ['S1_HEC_BATCH'] = original_batch
-                globals()['_BATCH_ENABLED'] = True
-            
-            # Enable pipelined batch sending for high throughput (>1K EPS)
-            if args.min_delay < 0.001:  # >1K EPS
-                _start_batch_sender(queue_size=20)  # Allow up to 20 batches in flight
-                if args.verbosity in ('info', 'verbose', 'debug'):
-                    print("[BATCH] Enabled pipelined sending for high throughput", flush=True)
-            
-            # Start from event 2 since we already sent event 1
-            start_idx = 1
+        if args.workers > 1:
+            _run_workers(args, product, attr_fields)
         else:
-            start_idx = 0
-        
-        # Speed mode: pre-generate 1K events and loop through them
-        speed_events = None
-        if args.speed_mode:
-            if args.verbosity in ('info', 'verbose', 'debug'):
-                print("[SPEED] Pre-generating 1000 events for maximum throughput...", flush=True)
-            speed_events = [generators[i % len(generators)]() for i in range(1000)]
-            if args.verbosity in ('info', 'verbose', 'debug'):
-                print(f"[SPEED] Pre-generated {len(speed_events)} events, looping continuously", flush=True)
-        
-        ok = 0
-        fail = 0
-        samples = []
-        last_status_time = time.time()
-        status_interval = 5.0  # seconds
-        start_time = time.time()
-        
-        for i in range(start_idx, args.count):
-            try:
-                # Use pre-generated events in speed mode, otherwise generate on the fly
-                if args.speed_mode:
-                    # Get pre-generated event
-                    # For ultra-high EPS (>10K), skip timestamp updates to reduce overhead
-                    # Timestamps will be slightly stale but throughput is prioritized
-                    event = speed_events[i % len(speed_events)]
-                    
-                    # Only update timestamps for moderate EPS (<10K)
-                    if args.min_delay >= 0.0001:  # ~10K EPS threshold
-                        # Update timestamps for JSON events
-                        if isinstance(event, dict):
-                            current_time = time.time()
-                            current_time_ms = int(current_time * 1000)
-                            current_time_s = int(current_time)
-                            # Update common timestamp fields
-                            for ts_field in ['eventtime', 'timestamp', 'time', '@timestamp', 'event_time', 'logTime', 'createdAt', 'datetime']:
-                                if ts_field in event:
-                                    # Handle different timestamp formats
-                                    if isinstance(event[ts_field], int):
-                                        # Check if milliseconds (>1e12) or seconds
-                                        if event[ts_field] > 1e12:
-                                            event[ts_field] = current_time_ms
-                                        else:
-                                            event[ts_field] = current_time_s
-                                    elif isinstance(event[ts_field], float):
-                                        event[ts_field] = current_time
-                                    elif isinstance(event[ts_field], str):
-                                        # ISO format timestamp
-                                        event[ts_field] = datetime.utcnow().isoformat() + 'Z'
-                else:
-                    event = generators[i % len(generators)]()
-                result = send_one(event, product, attr_fields)
-                
-                # Verbose mode: print every response
-                if args.verbosity == 'verbose':
-                    print(f"Response {i+1 if start_idx == 0 else i}:", result, flush=True)
-                
-                if isinstance(result, dict) and (result.get('code') == 0 or result.get('status') in ('OK', 'QUEUED')):
-                    ok += 1
-                else:
-                    fail += 1
-                    if len(samples) < 3:
-                        samples.append(result)
-                
-                # Check and flush batches periodically (in batch mode)
-                # At high EPS, check less frequently to reduce overhead
-                check_interval = 1000 if args.min_delay < 0.001 else 10  # Every 1000 events for >1K EPS, else every 10
-                if _BATCH_ENABLED and (i + 1) % check_interval == 0:
-                    _batch_check_and_flush()
-                
-                # Info mode: periodic status updates every 5 seconds
-                current_time = time.time()
-                if args.verbosity == 'info' and (current_time - last_status_time) >= status_interval:
-                    elapsed = current_time - start_time
-                    total_sent = i + 1 - start_idx
-                    actual_eps = total_sent / elapsed if elapsed > 0 else 0
-                    success_rate = (ok / total_sent * 100) if total_sent > 0 else 0
-                    print(f"INFO: {total_sent} events sent | {actual_eps:.1f} EPS | {ok} success ({success_rate:.1f}%) | {fail} failed", flush=True)
-                    last_status_time = current_time
-                
-                # Sleep between events (skip for ultra-high EPS where sleep overhead dominates)
-                # Python's time.sleep() has ~1ms overhead, so skip for delays < 0.001s (>1000 EPS)
-                if args.min_delay >= 0.001:
-                    time.sleep(random.uniform(args.min_delay, args.max_delay))
-                    
-            except KeyboardInterrupt:
-                print(f"\nStopped by user after {i+1} events", flush=True)
-                break
-            except Exception as e:
-                print(f"Error at event {i+1}: {e}", flush=True)
-                fail += 1
-        
-        # Flush any remaining batches
-        if _BATCH_ENABLED:
-            if args.verbosity in ('info', 'verbose', 'debug'):
-                print("\n[BATCH] Flushing remaining batches...", flush=True)
-            _batch_check_and_flush()
-            # Force flush all buffers
-            with _BATCH_LOCK:
-                for key in list(_BATCH_BUFFERS.keys()):
-                    _flush_batch_locked(key)
-            
-            # Wait for pipelined batches to complete
-            if _BATCH_SEND_QUEUE is not None:
-                if args.verbosity in ('info', 'verbose', 'debug'):
-                    print("[BATCH] Waiting for pipelined batches to complete...", flush=True)
-                _BATCH_SEND_QUEUE.join()  # Wait for all queued batches to be sent
-                if args.verbosity in ('info', 'verbose', 'debug'):
-                    print("[BATCH] All batches sent", flush=True)
-        
-        print(f"\nDone. Delivered {ok}/{i+1} successfully. Failures: {fail}.")
-        if samples:
-            print("Sample failure responses:")
-            for s in samples:
-                print("  -", s)
+            _run_continuous(args, product, generators, attr_fields)
     else:
         # Original batch mode for reasonable counts
-        events = [generators[i % len(generators)]() for i in range(args.count)]
+        events = _generate_events(generators, args.count)
         print(f"Sending {args.count} events one-by-one "
               f"(spacing {args.min_delay}s – {args.max_delay}s)…", flush=True)
         results = send_many_with_spacing(
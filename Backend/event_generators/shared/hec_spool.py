@@ -0,0 +1,233 @@
+"""Durable on-disk spool (write-ahead queue) for HEC batches.
+
+When a batch POST fails or the collector is backed up, hec_sender.py appends
+the already-compressed payload to a spool directory instead of dropping it.
+A background drainer replays spooled batches oldest-first at a controlled rate
+once the collector answers again.
+
+Layout: ``spool-<seq>.seg`` segment files holding length-prefixed records
+(header JSON with url and non-secret headers, then the body). The drain
+position of the oldest segment is persisted in ``<segment>.pos`` so a run
+that is killed resumes where it left off; fully drained segments are deleted.
+The Authorization header is never written to disk; the drainer re-applies it.
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from eps_pacer import TokenBucketPacer  # type: ignore
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking
+    fcntl = None
+
+_RECORD_HEAD = struct.Struct(">II")  # header length, body length
+_SECRET_HEADERS = {"authorization"}
+
+
+class SpoolLockedError(RuntimeError):
+    """Another sender process already owns the spool directory."""
+
+
+class HecSpool:
+    """Append-only segment spool with a resumable read position."""
+
+    def __init__(self, directory: str, max_bytes: int = 1024 * 1024 * 1024,
+                 segment_bytes: int = 64 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock_file = open(os.path.join(directory, "spool.lock"), "a+")
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                raise SpoolLockedError(f"spool directory {directory} is in use by another sender")
+
+        self._lock = threading.Lock()
+        self._writer = None
+        self._writer_seq = None
+        self.spooled = 0
+        self.drained = 0
+        self.rejected = 0
+        # Circuit state: False after a failed send until a drain succeeds
+        self.healthy = True
+        self._drainer = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------ #
+    #  Segment bookkeeping
+    # ------------------------------------------------------------------ #
+    def _segments(self) -> list:
+        names = [n for n in os.listdir(self.directory) if n.startswith("spool-") and n.endswith(".seg")]
+        return sorted(os.path.join(self.directory, n) for n in names)
+
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.directory, f"spool-{seq:012d}.seg")
+
+    @staticmethod
+    def _read_pos(segment: str) -> int:
+        try:
+            with open(segment + ".pos") as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    @staticmethod
+    def _write_pos(segment: str, pos: int):
+        tmp = segment + ".pos.tmp"
+        with open(tmp, "w") as f:
+            f.write(str(pos))
+        os.replace(tmp, segment + ".pos")
+
+    def pending(self) -> Tuple[int, int]:
+        """Return (segments, bytes) still waiting to be drained."""
+        segments = self._segments()
+        total = 0
+        for seg in segments:
+            try:
+                total += os.path.getsize(seg) - self._read_pos(seg)
+            except OSError:
+                continue
+        return len(segments), total
+
+    # ------------------------------------------------------------------ #
+    #  Write side
+    # ------------------------------------------------------------------ #
+    def append(self, url: str, headers: dict, body: bytes) -> bool:
+        """Durably append one batch. Returns False if the spool is full."""
+        header = json.dumps({
+            "url": url,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _SECRET_HEADERS},
+            "ts": time.time(),
+        }, separators=(",", ":")).encode("utf-8")
+        record = _RECORD_HEAD.pack(len(header), len(body)) + header + body
+
+        with self._lock:
+            if self.pending()[1] + len(record) > self.max_bytes:
+                self.rejected += 1
+                return False
+            if self._writer is None or self._writer.tell() + len(record) > self.segment_bytes:
+                self._roll()
+            self._writer.write(record)
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self.spooled += 1
+        return True
+
+    def _roll(self):
+        if self._writer is not None:
+            self._writer.close()
+        segments = self._segments()
+        last = int(os.path.basename(segments[-1])[6:-4]) if segments else 0
+        self._writer_seq = last + 1
+        self._writer = open(self._path(self._writer_seq), "ab")
+
+    # ------------------------------------------------------------------ #
+    #  Read side
+    # ------------------------------------------------------------------ #
+    def peek(self) -> Optional[Tuple[str, int, str, dict, bytes, int]]:
+        """Return the oldest undrained record as (segment, pos, url, headers, body, next_pos)."""
+        with self._lock:
+            for seg in self._segments():
+                pos = self._read_pos(seg)
+                with open(seg, "rb") as f:
+                    f.seek(pos)
+                    head = f.read(_RECORD_HEAD.size)
+                    if len(head) == _RECORD_HEAD.size:
+                        hlen, blen = _RECORD_HEAD.unpack(head)
+                        header = f.read(hlen)
+                        body = f.read(blen)
+                        if len(header) == hlen and len(body) == blen:
+                            meta = json.loads(header)
+                            next_pos = pos + _RECORD_HEAD.size + hlen + blen
+                            return seg, pos, meta["url"], meta["headers"], body, next_pos
+                # Segment exhausted (or truncated tail from a crash mid-write)
+                if self._writer is not None and seg == self._path(self._writer_seq):
+                    return None
+                self._remove(seg)
+        return None
+
+    def commit(self, segment: str, next_pos: int):
+        """Mark the record ending at ``next_pos`` as delivered."""
+        with self._lock:
+            self._write_pos(segment, next_pos)
+            self.drained += 1
+            if self._writer is None or segment != self._path(self._writer_seq):
+                if next_pos >= os.path.getsize(segment):
+                    self._remove(segment)
+
+    def _remove(self, segment: str):
+        for path in (segment, segment + ".pos"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------ #
+    #  Drainer
+    # ------------------------------------------------------------------ #
+    def start_drainer(self, send: Callable[[str, dict, bytes], bool], rate: float = 5.0,
+                      max_backoff: float = 30.0):
+        """Replay spooled batches via ``send(url, headers, body) -> bool`` at ``rate`` batches/sec."""
+        def _run():
+            pacer = TokenBucketPacer(rate)
+            backoff = 1.0
+            while not self._stop.is_set():
+                record = self.peek()
+                if record is None:
+                    self._stop.wait(1.0)
+                    continue
+                segment, _, url, headers, body, next_pos = record
+                pacer.wait()
+                try:
+                    ok = send(url, headers, body)
+                except Exception:
+                    ok = False
+                if ok:
+                    self.commit(segment, next_pos)
+                    self.healthy = True
+                    backoff = 1.0
+                else:
+                    self.healthy = False
+                    self._stop.wait(backoff)
+                    backoff = min(max_backoff, backoff * 2)
+
+        self._drainer = threading.Thread(target=_run, name="hec-spool-drainer", daemon=True)
+        self._drainer.start()
+
+    def wait_drained(self, timeout: float) -> bool:
+        """Block until the spool is empty or ``timeout`` expires."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.pending()[1] == 0:
+                return True
+            time.sleep(0.5)
+        return self.pending()[1] == 0
+
+    def close(self):
+        self._stop.set()
+        if self._drainer is not None:
+            self._drainer.join(timeout=5)
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        self._lock_file.close()
+
+    def describe(self) -> str:
+        segments, nbytes = self.pending()
+        text = f"spool {nbytes / 1024:.0f}KB in {segments} seg"
+        if self.rejected:
+            text += f", {self.rejected} rejected (full)"
+        if not self.healthy:
+            text += ", collector unhealthy"
+        return text
@@ -5,11 +5,28 @@ Builds a map of product name -> sourcetype using directory names:
 - marketplace: marketplace-<name>-latest
 
 Falls back gracefully if folders are missing.
+
+Listing every parser folder costs a few milliseconds per process, so
+``load_sourcetypes_cached`` keeps the result in a small JSON index keyed by
+the mtimes of the scanned directories (adding or removing a parser folder
+changes its parent's mtime), and ``SourcetypeMap`` defers even that until a
+product without an explicit override is looked up.
 """
 from __future__ import annotations
 
+import json
 import os
-from typing import Dict, Iterable
+import tempfile
+import threading
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+_SUBDIRS = (
+    "community",
+    "marketplace",
+    "community_new",
+    "sentinelone",  # marketplace and official bundles under sentinelone/
+)
 
 
 def _scan_root(root: str, subdirs: Iterable[str]) -> Dict[str, str]:
@@ -46,15 +63,108 @@ def load_sourcetypes(parsers_dir: str) -> Dict[str, str]:
         return {}
 
     # Known parser groups to scan. Include *_new variants if present.
-    subdirs = []
-    for name in (
-        "community",
-        "marketplace",
-        "community_new",
-        "sentinelone",  # marketplace and official bundles under sentinelone/
-    ):
-        if os.path.isdir(os.path.join(parsers_dir, name)):
-            subdirs.append(name)
+    subdirs = [name for name in _SUBDIRS if os.path.isdir(os.path.join(parsers_dir, name))]
 
     mapping = _scan_root(parsers_dir, subdirs)
     return mapping
+
+
+def default_index_path() -> str:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "jarvis_coding", "sourcetype_index.json")
+
+
+def _fingerprint(parsers_dir: str) -> Dict[str, float]:
+    """mtime of the parsers directory and of each parser group that exists."""
+    stamps: Dict[str, float] = {}
+    for name in ("", *_SUBDIRS):
+        try:
+            stamps[name or "."] = os.stat(os.path.join(parsers_dir, name)).st_mtime
+        except OSError:
+            continue
+    return stamps
+
+
+def load_sourcetypes_cached(parsers_dir: str, index_path: Optional[str] = None) -> Dict[str, str]:
+    """``load_sourcetypes`` backed by a JSON index that is reused while the tree is unchanged.
+
+    The index holds one entry per parsers directory. A missing, corrupt or
+    stale entry triggers a rescan and rewrite; a failed write is ignored.
+    """
+    index_path = index_path or default_index_path()
+    parsers_dir = os.path.abspath(parsers_dir)
+    stamps = _fingerprint(parsers_dir)
+    try:
+        with open(index_path, "r", encoding="utf-8") as fh:
+            index = json.load(fh)
+        if not isinstance(index, dict):
+            index = {}
+    except (OSError, ValueError):
+        index = {}
+    entry = index.get(parsers_dir)
+    if isinstance(entry, dict) and entry.get("mtimes") == stamps and isinstance(entry.get("map"), dict):
+        return entry["map"]
+
+    mapping = load_sourcetypes(parsers_dir)
+    index[parsers_dir] = {"mtimes": stamps, "map": mapping}
+    directory = os.path.dirname(index_path) or "."
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".sourcetype_index.", dir=directory)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(index, fh, sort_keys=True)
+        os.replace(tmp, index_path)
+    except OSError:
+        pass  # read-only home etc.: the index is an optimisation only
+    return mapping
+
+
+class SourcetypeMap(MutableMapping):
+    """Explicit sourcetypes layered over a discovered map that is loaded on first miss.
+
+    Lookups of products in ``overrides`` (and anything assigned later) never
+    touch the parsers tree. The first lookup of any other product, or any
+    iteration, calls ``loader`` once; overrides keep winning over the result.
+    """
+
+    def __init__(self, loader: Callable[[], Dict[str, str]], overrides: Optional[Dict[str, str]] = None):
+        self._loader = loader
+        self._overrides: Dict[str, str] = dict(overrides or {})
+        self._loaded: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    def _discovered(self) -> Dict[str, str]:
+        if self._loaded is None:
+            with self._lock:
+                if self._loaded is None:
+                    try:
+                        self._loaded = dict(self._loader())
+                    except Exception:
+                        self._loaded = {}
+        return self._loaded
+
+    def __getitem__(self, product: str) -> str:
+        try:
+            return self._overrides[product]
+        except KeyError:
+            return self._discovered()[product]
+
+    def __setitem__(self, product: str, sourcetype: str):
+        self._overrides[product] = sourcetype
+
+    def __delitem__(self, product: str):
+        found = self._overrides.pop(product, None) is not None
+        if self._discovered().pop(product, None) is None and not found:
+            raise KeyError(product)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter({**self._discovered(), **self._overrides})
+
+    def __len__(self) -> int:
+        return len({**self._discovered(), **self._overrides})
+
+    def __contains__(self, product) -> bool:
+        return product in self._overrides or product in self._discovered()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
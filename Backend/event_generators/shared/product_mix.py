@@ -0,0 +1,95 @@
+"""Weighted multi-product stream for hec_sender.py ``--mix``.
+
+A mix is a list of ``(product, weight)`` pairs, given inline as
+``fortinet_fortigate:5,zscaler:3,crowdstrike_falcon:1`` (weight defaults to 1)
+or as a file: a JSON object ``{"product": weight}`` or one ``product weight``
+/ ``product:weight`` pair per line, ``#`` comments allowed.
+
+``interleave`` turns the weights into a fixed cycle of stream indices using
+smooth weighted round-robin, so products are spread evenly through the cycle
+(``a a a b`` becomes ``a a b a``) rather than sent in runs, and the send loop
+only indexes a list per event instead of drawing a random number. Every
+product gets at least one slot per cycle, however small its weight.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+from typing import List, Sequence, Tuple
+
+DEFAULT_CYCLE = 1000
+MAX_CYCLE = 100_000  # longest cycle interleave() grows to for a small share
+
+
+def _parse_pair(item: str) -> Tuple[str, float]:
+    item = item.strip()
+    if ":" in item:
+        product, weight = item.rsplit(":", 1)
+    elif " " in item or "\t" in item:
+        product, weight = item.split(None, 1)
+    else:
+        product, weight = item, "1"
+    try:
+        value = float(weight)
+    except ValueError:
+        raise ValueError(f"bad weight {weight.strip()!r} for {product.strip()!r}") from None
+    return product.strip(), value
+
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    """``[(product, weight), ...]`` from an inline spec or a mix file path.
+
+    Raises ``ValueError`` for an empty mix, a non-numeric, non-finite or
+    non-positive weight, or a product listed twice.
+    """
+    if os.path.isfile(spec):
+        with open(spec, "r", encoding="utf-8") as fh:
+            text = fh.read()
+        if text.lstrip().startswith("{"):
+            pairs = [(str(k), float(v)) for k, v in json.loads(text).items()]
+        else:
+            lines = (line.split("#", 1)[0].strip() for line in text.splitlines())
+            pairs = [_parse_pair(line) for line in lines if line]
+    else:
+        pairs = [_parse_pair(item) for item in spec.split(",") if item.strip()]
+
+    if not pairs:
+        raise ValueError("empty mix")
+    seen = set()
+    for product, weight in pairs:
+        if not 0 < weight < math.inf:  # also rejects nan
+            raise ValueError(f"weight for {product!r} must be a positive number")
+        if product in seen:
+            raise ValueError(f"{product!r} listed more than once")
+        seen.add(product)
+    return pairs
+
+
+def interleave(weights: Sequence[float], length: int = DEFAULT_CYCLE) -> List[int]:
+    """A cycle of at least ``length`` stream indices, each appearing in proportion to its weight.
+
+    The cycle grows (up to ``MAX_CYCLE``) until the smallest weight earns a slot;
+    a stream still below one slot takes a slot from the largest stream instead.
+    """
+    total = float(sum(weights))
+    length = max(length, min(MAX_CYCLE, math.ceil(total / min(weights))))
+    current = [0.0] * len(weights)
+    cycle = []
+    for _ in range(length):
+        for idx, weight in enumerate(weights):
+            current[idx] += weight
+        best = max(range(len(weights)), key=current.__getitem__)
+        current[best] -= total
+        cycle.append(best)
+
+    missing = sorted(set(range(len(weights))) - set(cycle))
+    if missing:
+        largest = max(range(len(weights)), key=weights.__getitem__)
+        for k, idx in enumerate(missing):
+            # Spread the borrowed slots through the cycle
+            pos = k * length // len(missing)
+            while cycle[pos] != largest:
+                pos = (pos + 1) % length
+            cycle[pos] = idx
+    return cycle
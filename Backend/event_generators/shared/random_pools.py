@@ -0,0 +1,167 @@
+"""Pre-formatted random values for scalar generators, refilled in bulk.
+
+``uuid.uuid4()``, fake ``hashlib`` digests, f-string IPv4 addresses and
+``":".join(f"{random.randint(0, 255):02x}" ...)`` MACs cost microseconds
+each and most generators draw several per event. A ``Pool`` hands out one
+ready-made string per call from a buffer that ``bulk_random`` refills
+``size`` values at a time (one ``os.urandom`` read or NumPy draw per refill).
+
+Pools are per thread: the module-level helpers (``uuid4()``, ``mac()``,
+``sha256()``, ``external_ipv4()`` ...) use the calling thread's
+``RandomPools``, so sender threads never share a buffer, and forked worker
+processes start with empty pools and a reseeded generator instead of
+replaying their parent's values.
+
+Addresses follow ``bulk_random``'s plans: ``internal_ipv4`` is RFC 1918,
+``external_ipv4`` is any unicast 1.0.0.1-223.255.255.254 (the range most
+generators already use), ``public_ipv4`` excludes private, loopback,
+link-local and CGNAT space.
+"""
+from __future__ import annotations
+
+import os
+import random
+import threading
+from typing import Callable, Dict
+
+import bulk_random  # type: ignore
+
+DEFAULT_SIZE = 512
+
+
+class Pool:
+    """Zero-argument callable returning one value per call, refilled ``size`` at a time."""
+
+    __slots__ = ("fill", "size", "_items")
+
+    def __init__(self, fill: Callable[[int], list], size: int = DEFAULT_SIZE):
+        self.fill = fill
+        self.size = size
+        self._items: list = []
+
+    def __call__(self):
+        items = self._items
+        if not items:
+            items = self._items = self.fill(self.size)
+        return items.pop()
+
+    def take(self, n: int) -> list:
+        """``n`` values at once (drains the buffer first)."""
+        items = self._items
+        if n <= len(items):
+            out = items[-n:] if n else []
+            del items[len(items) - n:]
+            return out
+        self._items = []
+        return items + self.fill(n - len(items))
+
+    def clear(self):
+        self._items = []
+
+
+class RandomPools:
+    """One thread's set of pools; use ``local()`` rather than constructing directly."""
+
+    def __init__(self, size: int = DEFAULT_SIZE):
+        self.size = size
+        self._hex: Dict[int, Pool] = {}
+        self.uuid4 = Pool(bulk_random.uuid4_strings, size)
+        self.mac = Pool(bulk_random.mac_addresses, size)
+        self.internal_ipv4 = Pool(bulk_random.internal_ipv4, size)
+        self.external_ipv4 = Pool(bulk_random.external_ipv4, size)
+        self.public_ipv4 = Pool(bulk_random.public_ipv4, size)
+        self.md5 = self.hex_pool(32)
+        self.sha1 = self.hex_pool(40)
+        self.sha256 = self.hex_pool(64)
+
+    def hex_pool(self, length: int) -> Pool:
+        """Pool of lowercase hex strings of ``length`` characters (shared per length)."""
+        pool = self._hex.get(length)
+        if pool is None:
+            pool = self._hex[length] = Pool(lambda n: bulk_random.hex_strings(n, length), self.size)
+        return pool
+
+    def ipv4(self, internal_probability: float = 0.5) -> str:
+        """Internal address with ``internal_probability``, external otherwise."""
+        if random.random() < internal_probability:
+            return self.internal_ipv4()
+        return self.external_ipv4()
+
+    def clear(self):
+        """Drop every buffered value."""
+        for value in vars(self).values():
+            if isinstance(value, Pool):
+                value.clear()
+        for pool in self._hex.values():
+            pool.clear()
+
+
+_local = threading.local()
+
+
+def local() -> RandomPools:
+    """The calling thread's pools, created on first use."""
+    try:
+        return _local.pools
+    except AttributeError:
+        pools = _local.pools = RandomPools()
+        return pools
+
+
+def seed(value=None):
+    """Seed ``bulk_random`` and drop this thread's buffered values."""
+    bulk_random.seed(value)
+    local().clear()
+
+
+def _after_fork():
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+# ── thread-local shortcuts ──────────────────────────────────────────────────
+def uuid4() -> str:
+    """Version-4 UUID string, as ``str(uuid.uuid4())``."""
+    return local().uuid4()
+
+
+def mac() -> str:
+    """Colon-separated lowercase MAC address."""
+    return local().mac()
+
+
+def md5() -> str:
+    return local().md5()
+
+
+def sha1() -> str:
+    return local().sha1()
+
+
+def sha256() -> str:
+    return local().sha256()
+
+
+def hex_string(length: int) -> str:
+    """Random lowercase hex string of ``length`` characters (32 stands in for ``uuid4().hex``)."""
+    return local().hex_pool(length)()
+
+
+def internal_ipv4() -> str:
+    return local().internal_ipv4()
+
+
+def external_ipv4() -> str:
+    return local().external_ipv4()
+
+
+def public_ipv4() -> str:
+    return local().public_ipv4()
+
+
+def ipv4(internal_probability: float = 0.5) -> str:
+    return local().ipv4(internal_probability)
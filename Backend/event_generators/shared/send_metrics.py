@@ -0,0 +1,56 @@
+"""POST latency recording for hec_sender.py run metrics (``--metrics-file``).
+
+Keeps a bounded uniform sample (reservoir sampling) of request latencies so
+percentiles stay cheap and memory stays flat on multi-hour runs.
+"""
+from __future__ import annotations
+
+import math
+import random
+import threading
+from typing import List, Optional
+
+
+class LatencyRecorder:
+    """Thread-safe latency sample with count/max and nearest-rank percentiles."""
+
+    def __init__(self, capacity: int = 50000):
+        self.capacity = capacity
+        self.count = 0
+        self.max_s = 0.0
+        self._samples: List[float] = []
+        self._lock = threading.Lock()
+
+    def record(self, latency_s: Optional[float]):
+        if latency_s is None:
+            return
+        with self._lock:
+            self.count += 1
+            if latency_s > self.max_s:
+                self.max_s = latency_s
+            if len(self._samples) < self.capacity:
+                self._samples.append(latency_s)
+            else:
+                slot = random.randrange(self.count)
+                if slot < self.capacity:
+                    self._samples[slot] = latency_s
+
+    def percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = min(len(samples), max(1, math.ceil(pct / 100.0 * len(samples)))) - 1
+        return samples[rank]
+
+    def summary_ms(self) -> dict:
+        """``{count, p50, p90, p99, max}`` in milliseconds (None without samples)."""
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+        return {
+            "count": self.count,
+            "p50": ms(self.percentile(50)),
+            "p90": ms(self.percentile(90)),
+            "p99": ms(self.percentile(99)),
+            "max": ms(self.max_s) if self.count else None,
+        }
@@ -0,0 +1,103 @@
+"""Bounded pipelined send queue with an explicit backpressure policy.
+
+hec_sender.py hands finished batches to a background sender thread through this
+queue. When the collector falls behind and the queue fills up, the policy
+decides what happens to the producer instead of silently sending from its
+thread:
+
+- ``block`` - wait for space, up to ``block_timeout`` seconds (None waits
+  indefinitely); a batch that still finds no room is dropped and counted
+- ``drop-oldest`` - never wait: evict the oldest queued batch to make room and
+  count it as dropped, so the freshest events win
+- ``spill`` - never wait: hand the batch back to the caller, which appends it
+  to the on-disk spool (hec_spool.py) for later replay
+
+Queue depth, time producers spent blocked and drop/spill counts are kept for
+the ``INFO:`` status line.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+POLICIES = ("block", "drop-oldest", "spill")
+
+
+class BatchSendQueue(queue.Queue):
+    """``queue.Queue`` whose producers go through ``offer()`` and a backpressure policy."""
+
+    def __init__(self, maxsize: int, policy: str = "block", block_timeout: Optional[float] = None,
+                 weight: Callable[[Any], int] = lambda item: 1):
+        if policy not in POLICIES:
+            raise ValueError(f"backpressure policy must be one of {', '.join(POLICIES)}, got '{policy}'")
+        super().__init__(maxsize)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self._weight = weight  # events per item, for the drop counters
+        self._stats_lock = threading.Lock()
+        self.peak = 0
+        self.blocked = 0  # offers that had to wait
+        self.blocked_s = 0.0
+        self.dropped = 0  # batches
+        self.dropped_events = 0
+        self.spilled = 0
+
+    def offer(self, item) -> Optional[Any]:
+        """Enqueue ``item`` under the policy; returns it back only if the caller must spill it."""
+        try:
+            self.put_nowait(item)
+        except queue.Full:
+            if self.policy == "spill":
+                with self._stats_lock:
+                    self.spilled += 1
+                return item
+            if self.policy == "drop-oldest":
+                self._put_evicting(item)
+            else:
+                self._put_blocking(item)
+        self._note_depth()
+        return None
+
+    def _put_blocking(self, item):
+        start = time.monotonic()
+        try:
+            self.put(item, timeout=self.block_timeout)
+        except queue.Full:
+            self._count_drop(item)
+        finally:
+            with self._stats_lock:
+                self.blocked += 1
+                self.blocked_s += time.monotonic() - start
+
+    def _put_evicting(self, item):
+        with self.not_full:
+            while self.maxsize > 0 and self._qsize() >= self.maxsize:
+                evicted = self._get()
+                # The evicted item will never reach task_done(); keep join() balanced
+                self.unfinished_tasks -= 1
+                self._count_drop(evicted)
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def _count_drop(self, item):
+        with self._stats_lock:
+            self.dropped += 1
+            self.dropped_events += self._weight(item)
+
+    def _note_depth(self):
+        depth = self.qsize()
+        if depth > self.peak:
+            self.peak = depth
+
+    def describe(self) -> str:
+        text = f"queue {self.qsize()}/{self.maxsize} (peak {self.peak}, {self.policy})"
+        if self.blocked:
+            text += f", blocked {self.blocked_s:.1f}s"
+        if self.dropped:
+            text += f", dropped {self.dropped_events} events in {self.dropped} batches"
+        if self.spilled:
+            text += f", spilled {self.spilled} batches"
+        return text
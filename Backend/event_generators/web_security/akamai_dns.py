@@ -4,7 +4,16 @@ Akamai DNS query log event generator
 Generates synthetic Akamai DNS logs in syslog format
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "kv"
 
 # DNS record types
 RECORD_TYPES = ["A", "AAAA", "CNAME", "MX", "NS", "TXT", "SRV"]
@@ -27,7 +36,7 @@ EDGE_SERVERS = [
 
 def generate_client_ip() -> str:
     """Generate client IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def generate_resolver_ip() -> str:
     """Generate resolver IP address"""
@@ -54,7 +63,7 @@ def generate_answer(record_type: str, response_code: str, domain: str) -> str:
 
 def akamai_dns_log() -> str:
     """Generate a single Akamai DNS query log in syslog format"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 1440))
     
     timestamp = event_time.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -5,8 +5,17 @@ Generates synthetic Akamai SiteDefender WAF security events
 """
 import json
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # WAF rule types and messages
 WAF_RULES = [
@@ -35,11 +44,11 @@ def get_random_ip():
     elif random.random() < 0.5:  # Some other suspicious ranges
         return f"198.51.100.{random.randint(1, 255)}"
     else:  # Normal IPs
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def akamai_sitedefender_log() -> Dict:
     """Generate a single Akamai SiteDefender WAF event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 60))
     
     # Determine if this is an attack or clean traffic
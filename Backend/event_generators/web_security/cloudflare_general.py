@@ -6,8 +6,17 @@ Generates synthetic Cloudflare security and performance events
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # HTTP methods
 HTTP_METHODS = ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH"]
@@ -44,11 +53,11 @@ SECURITY_RULES = [
 
 def generate_ip() -> str:
     """Generate a random IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def cloudflare_general_log() -> Dict:
     """Generate a single Cloudflare event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     # Use recent timestamps (last 10 minutes)
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
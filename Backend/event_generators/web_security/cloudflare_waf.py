@@ -2,8 +2,16 @@
 """Generate synthetic Cloudflare WAF logs in GRON format."""
 import json
 import random
-from datetime import datetime, timezone
 import time
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "text"
 
 # Cloudflare WAF event types and fields
 USER_AGENTS = [
@@ -48,7 +56,7 @@ EDGE_COLOS = ["LAX", "SFO", "ORD", "JFK", "LHR", "FRA", "NRT", "SIN", "SYD", "GR
 
 def get_random_ip():
     """Generate a random IP address."""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def generate_ray_id():
     """Generate a Cloudflare Ray ID."""
@@ -123,7 +131,7 @@ def json_to_gron(obj, prefix="json"):
 
 def cloudflare_waf_log(overrides: dict | None = None) -> str:
     """Generate a single Cloudflare WAF log entry in GRON format."""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     timestamp = now.isoformat() + "Z"
     
     # Generate request details
@@ -4,7 +4,15 @@ Imperva Sonar event generator
 Generates synthetic Imperva Sonar database security events
 """
 import random
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import event_clock  # event_generators/shared
+
+OUTPUT_KIND = "json"
 
 EVENT_TYPES = ["DB_LOGIN", "SQL_QUERY", "POLICY_VIOLATION"]
 DB_USERS = ["report_user", "admin_user", "contractor_user", "app_user", "backup_user"]
@@ -27,7 +35,7 @@ def get_random_ip():
 
 def imperva_sonar_log() -> dict:
     """Generate a single Imperva Sonar event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 60))
     
     event_type = random.choice(EVENT_TYPES)
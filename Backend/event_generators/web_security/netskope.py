@@ -3,13 +3,20 @@
 Netskope cloud security event generator (JSON format)
 """
 from __future__ import annotations
-import json
 import random
 import time
-import uuid
-import hashlib
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict, List, Optional
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+from hec_json import dumps as json_dumps, dumps_bytes as json_dumps_bytes  # orjson-backed when installed
+
+OUTPUT_KIND = "json"
 
 # Event types and activities
 EVENT_TYPES = [
@@ -100,20 +107,19 @@ BROWSERS = ["Chrome", "Firefox", "Safari", "Edge", "Internet Explorer"]
 
 def _generate_hash(hash_type="md5"):
     """Generate a hash"""
-    random_data = str(random.random()).encode()
     if hash_type == "md5":
-        return hashlib.md5(random_data).hexdigest()
+        return random_pools.md5()
     elif hash_type == "sha256":
-        return hashlib.sha256(random_data).hexdigest()
+        return random_pools.sha256()
     else:
-        return hashlib.sha1(random_data).hexdigest()
+        return random_pools.sha1()
 
 def _generate_ip(internal=False):
     """Generate IP address"""
     if internal:
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
     else:
-        return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        return random_pools.external_ipv4()
 
 def _generate_coordinates(country):
     """Generate approximate coordinates for a country"""
@@ -150,13 +156,8 @@ def _generate_location_info():
         "zipcode": str(random.randint(10000, 99999)) if country == "United States" else ""
     }
 
-def netskope_log(overrides: dict | None = None) -> str:
-    """
-    Return a single Netskope event as JSON string.
-    
-    Pass `overrides` to force any field to a specific value:
-        netskope_log({"event_type": "malware"})
-    """
+def _build_event(overrides: dict | None = None) -> Dict:
+    """Event dict behind ``netskope_log()``."""
     # Select event type and activity
     event_type = random.choice(EVENT_TYPES)
     activity = random.choice(ACTIVITIES[event_type])
@@ -174,16 +175,16 @@ def netskope_log(overrides: dict | None = None) -> str:
     dst_location = _generate_location_info()
     
     # Generate timestamps
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     src_time = now - timedelta(seconds=random.randint(0, 300))
     
     # Base event structure
     event = {
-        "_id": str(uuid.uuid4()),
+        "_id": random_pools.uuid4(),
         "_event_id": str(random.randint(1000000, 9999999)),
         "_category_id": random.randint(1000, 9999),
         "_category_tags": [event_type, app_category.lower().replace(" ", "_")],
-        "_correlation_id": str(uuid.uuid4()),
+        "_correlation_id": random_pools.uuid4(),
         "_detection_name": f"Netskope {activity} Detection",
         "_nshostname": f"netskope-{random.randint(1, 10)}.company.com",
         "_resource_name": f"ns-resource-{random.randint(100, 999)}",
@@ -193,7 +194,7 @@ def netskope_log(overrides: dict | None = None) -> str:
         "event_type": event_type,
         "activity": activity,
         "user": user,
-        "user_id": str(uuid.uuid4()),
+        "user_id": random_pools.uuid4(),
         "userkey": f"{user}_key_{random.randint(1000, 9999)}",
         "account_name": user.split('.')[0].title(),
         "app_name": app_name,
@@ -219,10 +220,10 @@ def netskope_log(overrides: dict | None = None) -> str:
         "dst_longitude": dst_location["longitude"],
         "dst_timezone": dst_location["timezone"],
         "dst_zipcode": dst_location["zipcode"],
-        "request_id": str(uuid.uuid4()),
+        "request_id": random_pools.uuid4(),
         "connection_id": str(random.randint(100000, 999999)),
-        "transaction_id": str(uuid.uuid4()),
-        "instance_id": str(uuid.uuid4()),
+        "transaction_id": random_pools.uuid4(),
+        "instance_id": random_pools.uuid4(),
         "count": random.randint(1, 10),
         "severity": random.choice(["low", "medium", "high", "critical"]),
         "severity_id": random.randint(1, 4),
@@ -232,7 +233,7 @@ def netskope_log(overrides: dict | None = None) -> str:
     
     # Add URL if web-related activity
     if event_type in ["page", "download", "upload"]:
-        event["url"] = f"https://{app_name.lower().replace(' ', '')}.com/{random.choice(['documents', 'files', 'drive', 'share'])}/{uuid.uuid4()}"
+        event["url"] = f"https://{app_name.lower().replace(' ', '')}.com/{random.choice(['documents', 'files', 'drive', 'share'])}/{random_pools.uuid4()}"
     
     # Add file information for file-related activities
     if event_type in ["download", "upload", "create", "edit", "delete", "copy", "move"]:
@@ -254,7 +255,7 @@ def netskope_log(overrides: dict | None = None) -> str:
         dlp_rule = random.choice(DLP_RULES)
         event.update({
             "dlp_file": event.get("file_name", f"sensitive_file_{random.randint(100, 999)}.txt"),
-            "dlp_incident_id": str(uuid.uuid4()),
+            "dlp_incident_id": random_pools.uuid4(),
             "dlp_rule": dlp_rule,
             "dlp_rule_count": random.randint(1, 5),
             "matched_username": user if random.random() > 0.3 else random.choice(USERS)
@@ -273,7 +274,7 @@ def netskope_log(overrides: dict | None = None) -> str:
     # Add breach information for breach events
     if event_type == "breach" or (event_type == "dlp" and random.random() > 0.5):
         event.update({
-            "breach_id": str(uuid.uuid4()),
+            "breach_id": random_pools.uuid4(),
             "breach_score": random.randint(0, 100),
             "breach_date": (now - timedelta(days=random.randint(0, 30))).strftime("%Y-%m-%d"),
             "breach_description": f"Potential data breach detected: {random.choice(DLP_RULES)} exposure"
@@ -283,10 +284,10 @@ def netskope_log(overrides: dict | None = None) -> str:
     if event.get("severity") in ["high", "critical"] or event_type in ["breach", "malware", "dlp"]:
         alert_types = ["DLP Violation", "Malware Detection", "Policy Violation", "Anomalous Activity"]
         event.update({
-            "alert_id": str(uuid.uuid4()),
+            "alert_id": random_pools.uuid4(),
             "alert_name": f"Netskope Alert: {random.choice(alert_types)}",
             "alert_type": random.choice(alert_types),
-            "incident_id": str(uuid.uuid4())
+            "incident_id": random_pools.uuid4()
         })
     
     # Add policy information
@@ -307,7 +308,20 @@ def netskope_log(overrides: dict | None = None) -> str:
     if overrides:
         event.update(overrides)
     
-    return json.dumps(event)
+    return event
+
+def netskope_log(overrides: dict | None = None) -> str:
+    """
+    Return a single Netskope event as JSON string.
+    
+    Pass `overrides` to force any field to a specific value:
+        netskope_log({"event_type": "malware"})
+    """
+    return json_dumps(_build_event(overrides))
+
+def netskope_log_bytes(overrides: dict | None = None) -> bytes:
+    """``netskope_log()`` as UTF-8 JSON bytes, without the intermediate ``str``."""
+    return json_dumps_bytes(_build_event(overrides))
 
 if __name__ == "__main__":
     # Generate sample logs for different event types
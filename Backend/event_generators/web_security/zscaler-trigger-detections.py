@@ -3,11 +3,18 @@
 """
 Generates synthetic Zscaler firewall and security events
 """
-import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+from hec_json import dumps as json_dumps  # orjson-backed when installed
 
 # Actions taken by firewall
 ACTIONS = ["Allow"]
@@ -37,11 +44,11 @@ DEPARTMENTS = ["IT", "Sales", "Marketing", "Finance", "HR", "Engineering", "Lega
 
 def generate_ip() -> str:
     """Generate a random IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def zscaler_firewall_log() -> str:
     """Generate a single Zscaler Firewall event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 5))
     
     action = random.choice(ACTIONS)
@@ -184,7 +191,7 @@ def zscaler_firewall_log() -> str:
     })
     
     # Return JSON for the proven Cisco Duo-style parser
-    return json.dumps(event)
+    return json_dumps(event)
 
 if __name__ == "__main__":
     # Generate sample events
@@ -6,8 +6,17 @@ Generates synthetic Zscaler Internet Access DNS firewall logs
 import json
 import random
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from typing import Dict
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # DNS query types
 QUERY_TYPES = ["A", "AAAA", "MX", "NS", "PTR", "SOA", "TXT", "CNAME", "SRV"]
@@ -53,15 +62,15 @@ DEVICE_IDS = [
 
 def generate_ip() -> str:
     """Generate source IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def generate_answer_ip() -> str:
     """Generate DNS answer IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def zscaler_dns_firewall_log() -> Dict:
     """Generate a single Zscaler DNS Firewall event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     # Use recent timestamps (last 10 minutes)
     event_time = now - timedelta(minutes=random.randint(0, 10))
     
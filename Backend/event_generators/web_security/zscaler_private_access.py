@@ -7,14 +7,23 @@ Generates synthetic ZPA zero-trust network access events for testing
 import random
 import time
 import json
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
+import os
+import sys
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+
+OUTPUT_KIND = "json"
 
 # SentinelOne AI-SIEM specific field attributes
 def zscaler_private_access_log():
     """Generate a synthetic Zscaler Private Access log event in JSON format."""
     
     # Generate timestamp
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     
     # ZPA event types
     event_types = ["UserActivity", "AppConnectorStatus", "UserStatus", "PolicyViolation", "Authentication"]
@@ -22,7 +31,7 @@ def zscaler_private_access_log():
     
     # Generate common fields
     user_email = f"user{random.randint(1000,9999)}@company.com"
-    client_ip = f"{random.randint(1,223)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}"
+    client_ip = random_pools.external_ipv4()
     
     # Build the JSON log entry matching marketplace parser expectations
     zpa_event = {
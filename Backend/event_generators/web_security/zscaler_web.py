@@ -3,11 +3,18 @@
 Zscaler Firewall event generator  
 Generates synthetic Zscaler firewall and security events
 """
-import json
+import os
 import random
+import sys
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from typing import Dict
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shared")
+if _SHARED not in sys.path:  # direct runs and package imports; loaders add it too
+    sys.path.insert(0, _SHARED)
+import random_pools  # event_generators/shared
+import event_clock
+from hec_json import dumps as json_dumps  # orjson-backed when installed
 
 # Actions taken by firewall
 ACTIONS = ["Allow", "Block", "Drop", "Redirect"]
@@ -47,11 +54,11 @@ RULES = ["Recommended Firewall Rule", "Default Firewall Filtering Rule", "Block
 
 def generate_ip() -> str:
     """Generate a random IP address"""
-    return f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    return random_pools.external_ipv4()
 
 def zscaler_firewall_log() -> str:
     """Generate a single Zscaler Firewall event log"""
-    now = datetime.now(timezone.utc)
+    now = event_clock.utcnow()
     event_time = now - timedelta(minutes=random.randint(0, 5))
     
     action = random.choice(ACTIONS)
@@ -118,7 +125,7 @@ def zscaler_firewall_log() -> str:
     })
     
     # Return JSON for the proven Cisco Duo-style parser
-    return json.dumps(event)
+    return json_dumps(event)
 
 if __name__ == "__main__":
     # Generate sample events
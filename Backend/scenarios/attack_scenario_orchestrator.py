@@ -28,6 +28,9 @@ import os
 
 # Add the current directory to Python path to import our generators
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'event_generators', 'shared'))
+import generator_registry  # generator modules by name, shared helpers on sys.path
+generator_registry.install()
 
 # Import all our generators
 from proofpoint import proofpoint_log
@@ -24,6 +24,10 @@ from datetime import datetime, timezone, timedelta
 
 # Add the event_python_writer directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'event_generators', 'shared'))
+import generator_registry  # generator modules by name, shared helpers on sys.path
+generator_registry.install()
+from event_clock import virtual_now
 
 # Import all generators
 from fortinet_fortigate import forward_log
@@ -74,7 +78,9 @@ def set_event_timestamp(event_data, timestamp):
 def create_timed_event(generator_func, source, phase, timestamp_minutes):
     """Create an event with proper timeline timestamp"""
     attack_timestamp = get_attack_time(timestamp_minutes)
-    event_data = generator_func()
+    # Generators stamp the attack time themselves, raw lines included
+    with virtual_now(BASE_TIME + timedelta(minutes=timestamp_minutes)):
+        event_data = generator_func()
     event_data = set_event_timestamp(event_data, attack_timestamp)
     return {
         "timestamp": attack_timestamp,
@@ -32,10 +32,10 @@ import random
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List
 
-# Add event_generators to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'event_generators'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'event_generators', 'identity_access'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'event_generators', 'cloud_infrastructure'))
+# Make the generators importable by name
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'event_generators', 'shared'))
+import generator_registry  # generator modules by name, shared helpers on sys.path
+generator_registry.install()
 
 # Import generators
 from okta_authentication import okta_authentication_log
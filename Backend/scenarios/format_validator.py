@@ -16,6 +16,7 @@ from typing import Dict, List, Any, Optional, Tuple
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "event_generators" / "shared"))  # helpers generators import by name
 
 class FormatValidator:
     def __init__(self):
@@ -21,6 +21,7 @@ from datetime import datetime, timezone
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "event_generators" / "shared"))  # helpers generators import by name
 
 class GeneratorFixer:
     def __init__(self):
@@ -15,6 +15,7 @@ sys.path.insert(0, '../event_generators/email_security')
 sys.path.insert(0, '../event_generators/endpoint_security')
 sys.path.insert(0, '../event_generators/identity_access')
 sys.path.insert(0, '../event_generators/web_security')
+sys.path.insert(0, '../event_generators/shared')
 
 # Star Trek users to replace hardcoded names
 STARFLEET_USERS = [
@@ -20,6 +20,7 @@ from typing import Dict, List, Optional
 
 # Import the existing hec_sender functionality
 from hec_sender import send_one
+from hec_json import dumps_bytes
 
 class ScenarioHECSender:
     def __init__(self):
@@ -170,10 +171,11 @@ class ScenarioHECSender:
                 print("⚠️  Event missing 'source' field; skipping")
                 return False
 
-            # Build raw event body from 'event' field (dict -> JSON, str -> as-is)
+            # Build raw event body from 'event' field (dict -> UTF-8 JSON, str -> as-is);
+            # send_one splices JSON bytes into the /event envelope without re-encoding
             payload = event.get('event', {})
             if isinstance(payload, dict):
-                raw_event = json.dumps(payload, separators=(',', ':'))
+                raw_event = dumps_bytes(payload)
             else:
                 raw_event = str(payload)
 
@@ -202,7 +204,7 @@ class ScenarioHECSender:
                     ts = event['timestamp']
                     # Set _time to scenario timestamp for HEC/Splunk indexing
                     payload_copy.setdefault('_time', ts)
-                    raw_event = json.dumps(payload_copy, separators=(',', ':'))
+                    raw_event = dumps_bytes(payload_copy)
                 except Exception:
                     pass
 
@@ -26,6 +26,9 @@ from datetime import datetime, timezone, timedelta
 
 # Add the event_python_writer directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'event_generators', 'shared'))
+import generator_registry  # generator modules by name, shared helpers on sys.path
+generator_registry.install()
 
 # Import generators (using actual function signatures)
 from fortinet_fortigate import forward_log
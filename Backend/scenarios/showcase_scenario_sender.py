@@ -8,7 +8,6 @@ for demonstration of advanced multi-platform correlation capabilities.
 """
 
 import os
-import json
 import sys
 import requests
 import time
@@ -78,8 +77,7 @@ def send_to_hec(event_data, source, trace_id=None, phase=None):
     
     try:
         # Use the send_one function from hec_sender which handles routing correctly
-        result = send_one(json.dumps(event_data) if isinstance(event_data, dict) else event_data, 
-                         product, attr_fields)
+        result = send_one(event_data, product, attr_fields)
         return True
     except Exception as e:
         print(f" Error: {str(e)}", end="")
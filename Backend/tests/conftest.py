@@ -0,0 +1,14 @@
+"""Put ``event_generators/shared`` on the path and resolve generator modules by name."""
+import os
+import sys
+
+# hec_sender refuses to import without a token; tests only talk to the local mock
+os.environ.setdefault("S1_HEC_TOKEN", "test-token")
+
+SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "event_generators", "shared")
+if SHARED not in sys.path:
+    sys.path.insert(0, SHARED)
+
+import generator_registry  # noqa: E402
+
+generator_registry.install()
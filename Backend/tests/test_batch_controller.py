@@ -0,0 +1,54 @@
+"""Static and AIMD batch thresholds."""
+from batch_controller import KB, MB, AdaptiveBatchController, BatchController
+
+
+def test_static_controller_ignores_feedback():
+    controller = BatchController(512 * KB, 500)
+    controller.record(5.0, 503, 512 * KB)
+    assert (controller.max_bytes, controller.flush_ms) == (512 * KB, 500)
+
+
+def test_initial_values_are_clamped():
+    controller = AdaptiveBatchController(1, 10_000)
+    assert controller.max_bytes == controller.min_bytes
+    assert controller.flush_ms == controller.max_flush_ms
+
+
+def test_congestion_halves_size_and_stretches_interval():
+    controller = AdaptiveBatchController(1 * MB, 400, cooldown_s=0)
+    controller.record(0.1, 503, 1 * MB)
+    assert controller.max_bytes == 512 * KB
+    assert controller.flush_ms == 600
+    assert controller.decreases == 1
+
+
+def test_decrease_once_per_cooldown():
+    controller = AdaptiveBatchController(1 * MB, 400, cooldown_s=60)
+    controller.record(None, None, 1 * MB)
+    controller.record(None, None, 1 * MB)
+    assert controller.max_bytes == 512 * KB
+    assert controller.decreases == 1
+
+
+def test_413_caps_growth_below_rejected_size():
+    controller = AdaptiveBatchController(2 * MB, 400, cooldown_s=0)
+    controller.record(0.1, 413, 2 * MB)
+    assert controller.ceiling_bytes == 1 * MB
+    assert controller.max_bytes == 1 * MB
+    for _ in range(10):
+        controller.record(0.1, 200, controller.max_bytes)
+    assert controller.max_bytes == 1 * MB
+
+
+def test_size_filled_batches_grow_and_shorten_interval():
+    controller = AdaptiveBatchController(1 * MB, 400)
+    controller.record(0.1, 200, 1 * MB)
+    assert controller.max_bytes == 1 * MB + controller.step_bytes
+    assert controller.flush_ms == 400 - controller.step_ms
+
+
+def test_tiny_timed_batches_stretch_interval():
+    controller = AdaptiveBatchController(1 * MB, 400)
+    controller.record(0.1, 200, 10 * KB)
+    assert controller.max_bytes == 1 * MB
+    assert controller.flush_ms == 400 + controller.step_ms
@@ -0,0 +1,46 @@
+"""generate_batch uses a module's ``*_batch`` companion and falls back to looping."""
+from itertools import count
+
+from batch_generation import BatchSource, batch_function, generate_batch
+
+_scalar_calls = count()
+
+
+def plain_log():
+    return next(_scalar_calls)
+
+
+def paired_log():
+    return "scalar"
+
+
+def paired_log_batch(n):
+    return ["batch"] * n
+
+
+def test_fallback_loops_the_scalar_function():
+    assert batch_function(plain_log) is None
+    events = generate_batch(plain_log, 3)
+    assert len(events) == 3 and events == sorted(set(events))
+
+
+def test_companion_is_used_when_defined():
+    assert batch_function(paired_log) is paired_log_batch
+    assert generate_batch(paired_log, 4) == ["batch"] * 4
+
+
+def test_non_positive_count_is_empty():
+    assert generate_batch(paired_log, 0) == []
+    assert generate_batch(plain_log, -1) == []
+
+
+def test_objects_without_globals_fall_back():
+    assert batch_function(len) is None
+
+
+def test_batch_source_refills_in_chunks_and_keeps_order():
+    source = BatchSource(plain_log, chunk=4)
+    assert not source.vectorised
+    events = [source() for _ in range(10)]
+    assert events == sorted(events)
+    assert BatchSource(paired_log).vectorised
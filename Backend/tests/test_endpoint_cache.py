@@ -0,0 +1,47 @@
+"""EndpointCache: hashed keys, TTL and tolerance of bad files."""
+import json
+
+from endpoint_cache import EndpointCache, cache_key
+
+CONFIG = {"event_base": "https://hec.example/services/collector", "raw_base": None,
+          "verify": True, "tls_low": False, "auth_scheme": "Splunk"}
+
+
+def test_round_trip(tmp_path):
+    cache = EndpointCache(str(tmp_path / "cache.json"))
+    key = cache_key("token", "https://hec.example")
+    assert cache.load(key) is None
+    cache.store(key, {**CONFIG, "extra": "ignored"})
+    assert EndpointCache(cache.path).load(key) == CONFIG
+
+
+def test_key_never_contains_the_token(tmp_path):
+    cache = EndpointCache(str(tmp_path / "cache.json"))
+    cache.store(cache_key("s3cret-token", "u"), CONFIG)
+    assert "s3cret-token" not in (tmp_path / "cache.json").read_text()
+    assert cache_key("a", "u") != cache_key("b", "u")
+
+
+def test_expired_entries_miss_and_are_pruned(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps({"old": {**CONFIG, "saved_at": 0}}))
+    cache = EndpointCache(str(path), ttl=60)
+    assert cache.load("old") is None
+    cache.store("new", CONFIG)
+    assert set(json.loads(path.read_text())) == {"new"}
+
+
+def test_invalidate(tmp_path):
+    cache = EndpointCache(str(tmp_path / "cache.json"))
+    cache.store("k", CONFIG)
+    cache.invalidate("k")
+    assert cache.load("k") is None
+
+
+def test_corrupt_or_unwritable_file_is_a_miss(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    assert EndpointCache(str(path)).load("k") is None
+    blocked = EndpointCache(str(path / "nested" / "cache.json"))
+    blocked.store("k", CONFIG)  # parent is a file: the write fails quietly
+    assert blocked.load("k") is None
@@ -0,0 +1,88 @@
+"""TokenBucketPacer against a fake clock."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from eps_pacer import TokenBucketPacer
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+        self.slept = 0.0
+
+    def __call__(self):
+        return self.t
+
+    def sleep(self, seconds):
+        self.t += seconds
+        self.slept += seconds
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucketPacer(0)
+
+
+@pytest.mark.parametrize("eps", [1, 100, 50_000])
+def test_achieved_rate_tracks_target(eps):
+    clock = FakeClock()
+    pacer = TokenBucketPacer(eps, clock=clock, sleep=clock.sleep)
+    for _ in range(max(100, eps // 2)):
+        pacer.wait()
+    assert pacer.achieved_eps() == pytest.approx(eps, rel=0.05)
+
+
+def test_high_rates_sleep_in_micro_batches():
+    clock = FakeClock()
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock.sleep(seconds)
+
+    pacer = TokenBucketPacer(10_000, clock=clock, sleep=sleep)
+    for _ in range(10_000):
+        pacer.wait()
+    # ~1ms of events per sleep, not one sleep per event
+    assert len(sleeps) <= 1_100
+
+
+def test_describe_reports_schedule_lag():
+    clock = FakeClock()
+    pacer = TokenBucketPacer(100, clock=clock, sleep=clock.sleep)
+    for _ in range(200):
+        pacer.wait()
+    clock.t += 0.5  # a stall behind the ideal schedule shows up as lag
+    pacer.wait()
+    assert pacer.lag_ms > 0
+    assert f"lag {pacer.lag_ms:.1f}ms" in pacer.describe()
+
+
+def test_byte_cap_limits_throughput():
+    clock = FakeClock()
+    pacer = TokenBucketPacer(1_000_000, bytes_per_sec=10_000, clock=clock, sleep=clock.sleep)
+    for _ in range(100):
+        pacer.wait()
+        pacer.charge_bytes(1_000)
+    assert pacer.bytes_released == 100_000
+    assert clock.t == pytest.approx(10.0, rel=0.05)
+    assert pacer.byte_limited > 0
+
+
+@pytest.mark.parametrize("args, message", [
+    (["--eps", "-5"], "--eps must be a positive"),
+    (["--eps", "0"], "--eps must be a positive"),
+    (["--max-bytes-per-sec", "1000"], "--max-bytes-per-sec needs --eps"),
+    (["--eps", "10", "--max-bytes-per-sec", "0"], "--max-bytes-per-sec must be a positive"),
+])
+def test_sender_rejects_bad_pacing_options(args, message):
+    sender = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "event_generators", "shared", "hec_sender.py")
+    result = subprocess.run([sys.executable, sender, "--product", "okta_authentication", "-n", "20000", *args],
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 1
+    assert message in result.stdout
+    assert "Traceback" not in result.stderr
@@ -0,0 +1,68 @@
+"""Event clock layouts and the virtual timeline."""
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+import event_clock
+from event_clock import EventClock, parse_when, to_ns, virtual_now
+
+WHEN = datetime(2025, 1, 5, 12, 0, 7, 123456, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("layout, expected", [
+    ("iso", "2025-01-05T12:00:07Z"),
+    ("iso_ms", "2025-01-05T12:00:07.123Z"),
+    ("iso_us", "2025-01-05T12:00:07.123456Z"),
+    ("iso_offset", "2025-01-05T12:00:07+00:00"),
+    ("rfc3164", "Jan  5 12:00:07"),
+    ("cef", "Jan 05 2025 12:00:07"),
+    ("windows", "2025-01-05T12:00:07.1234560Z"),
+    ("epoch", "1736078407"),
+    ("epoch_ms", "1736078407123"),
+    ("epoch_us", "1736078407123456"),
+    ("%Y/%m/%d %H:%M:%S.%f", "2025/01/05 12:00:07.123456"),
+])
+def test_layouts_match_strftime(layout, expected):
+    assert EventClock().stamp(layout, WHEN) == expected
+
+
+def test_cached_second_keeps_fraction_fresh():
+    clock = EventClock()
+    base = to_ns(WHEN)
+    assert clock.stamp("iso_ms", base) == "2025-01-05T12:00:07.123Z"
+    assert clock.stamp("iso_ms", base + 500_000_000) == "2025-01-05T12:00:07.623Z"
+    assert clock.stamp("iso_ms", base + 1_000_000_000) == "2025-01-05T12:00:08.123Z"
+
+
+def test_unknown_layout_is_rejected():
+    with pytest.raises(ValueError):
+        EventClock().stamp("nope")
+
+
+def test_parse_when():
+    assert parse_when("1736078407") == 1736078407.0
+    assert to_ns(parse_when("2025-01-05T12:00:07Z")) == to_ns(WHEN.replace(microsecond=0))
+    with pytest.raises(ValueError):
+        parse_when("yesterday")
+
+
+def test_virtual_now_freezes_and_restores():
+    with virtual_now(WHEN):
+        assert event_clock.utcnow() == WHEN
+        assert event_clock.now() == pytest.approx(WHEN.timestamp())
+        assert event_clock.stamp("iso") == "2025-01-05T12:00:07Z"
+        time.sleep(0.01)
+        assert event_clock.utcnow() == WHEN
+    assert not event_clock.CLOCK.virtual
+    assert abs(event_clock.now() - time.time()) < 1
+
+
+def test_virtual_time_advances_at_rate():
+    clock = EventClock()
+    clock.set_now(WHEN, rate=100.0)
+    time.sleep(0.05)
+    elapsed = clock.now() - WHEN.timestamp()
+    assert 4.0 <= elapsed < 60.0
+    clock.reset()
+    assert not clock.virtual
@@ -0,0 +1,72 @@
+"""Speed-mode templates re-render times and randomise identifiers."""
+import json
+import re
+
+from event_templates import EventTemplate, StringTemplate, TemplatePool
+
+GENERATED = 1_700_000_000.0  # 2023-11-14T22:13:20Z
+LATER = GENERATED + 3600
+
+
+def test_iso_and_syslog_timestamps_keep_offset_and_layout():
+    text = "2023-11-14T22:13:15.250Z host Nov 14 22:13:20 msg"
+    template = StringTemplate(text, GENERATED)
+    assert template.slots == 2
+    # The fraction comes from the render time, the whole seconds keep their offset
+    assert template.render(LATER + 0.5).split(" host ") == [
+        "2023-11-14T23:13:15.500Z", "Nov 14 23:13:20 msg"]
+
+
+def test_epoch_fields_follow_now():
+    event = {"ts": int(GENERATED) - 5, "ts_ms": int(GENERATED * 1000), "count": 7}
+    rendered = EventTemplate(event, GENERATED).render(LATER)
+    assert rendered == {"ts": int(LATER) - 5, "ts_ms": int(LATER * 1000), "count": 7}
+
+
+def test_identifiers_are_redrawn_in_kind():
+    event = {"src": "10.1.2.3", "dst": "8.8.8.8", "id": "0123456789abcdef0123",
+             "uuid": "6F9619FF-8B86-4011-B42D-00CF4FC964FF", "srcport": 51515, "dport": "443"}
+    template = EventTemplate(event, GENERATED)
+    seen = {template.render(LATER)["src"] for _ in range(50)}
+    assert len(seen) > 1 and all(ip.startswith("10.") for ip in seen)
+    out = template.render(LATER)
+    assert re.fullmatch(r"[0-9a-f]{20}", out["id"])
+    assert re.fullmatch(r"[0-9A-F-]{36}", out["uuid"])
+    assert 1024 <= out["srcport"] <= 65535
+    assert out["dport"].isdigit()
+
+
+def test_only_port_keys_get_random_ports():
+    ports = ["port", "Port", "src_port", "srcport", "dstPort", "sourcePort", "sport", "natdport", "ServerPort"]
+    others = ["report_count", "ReportId", "reportid", "transport", "teleport", "port_scan", "ports_scanned"]
+    event = {key: 8080 for key in ports + others}
+    template = EventTemplate(event, GENERATED)
+    changed = set()
+    for _ in range(20):
+        out = template.render(LATER)
+        changed.update(key for key in event if out[key] != 8080)
+    assert changed == set(ports)
+
+
+def test_render_copies_only_changed_containers():
+    shared = {"static": "unchanged"}
+    event = {"meta": shared, "inner": {"ip": "10.0.0.1"}}
+    template = EventTemplate(event, GENERATED)
+    out = template.render(LATER)
+    assert out["meta"] is shared
+    assert out["inner"] is not event["inner"]
+    assert event["inner"]["ip"] == "10.0.0.1"
+
+
+def test_constant_events_are_returned_as_is():
+    event = {"action": "allow", "flag": True}
+    assert EventTemplate(event, GENERATED).render(LATER) is event
+
+
+def test_pool_round_robins_json_text():
+    events = [json.dumps({"n": i, "time": "2023-11-14T22:13:20Z"}) for i in range(3)]
+    pool = TemplatePool(events, GENERATED)
+    assert len(pool) == 3
+    rendered = [json.loads(pool.render(LATER)) for _ in range(4)]
+    assert [r["n"] for r in rendered] == [0, 1, 2, 0]
+    assert rendered[0]["time"] == "2023-11-14T23:13:20Z"
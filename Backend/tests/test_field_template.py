@@ -0,0 +1,40 @@
+"""Compiled layouts render the same lines as the naive formatting they replace."""
+import pytest
+
+from field_template import FieldTemplate, Slot, compile_delimited, compile_kv, compile_text
+
+
+def test_kv_matches_dict_merge():
+    fields = {"devname": "fw01", "srcport": 0, "action": "accept"}
+    template = compile_kv(fields, slots=("srcport", "sessionid"))
+    assert template.slots == ("srcport", "sessionid")
+    expected = " ".join(f"{k}={v}" for k, v in {**fields, "srcport": "443", "sessionid": "7"}.items())
+    assert template.render("443", "7") == expected
+
+
+def test_kv_overrides_replace_in_place_and_append():
+    template = compile_kv({"a": 1, "b": 2}, slots=("b",), sep="|", assign=":")
+    assert template.render("x") == "a:1|b:x"
+    assert template.render_overrides({"a": 9, "c": 3}, "x") == "a:9|b:x|c:3"
+    assert template.render_overrides(None, "x") == "a:1|b:x"
+
+
+def test_delimited_columns():
+    template = compile_delimited(["2", Slot("ts"), "TRAFFIC", Slot("src"), 0])
+    assert template.render("t0", "10.0.0.1") == "2,t0,TRAFFIC,10.0.0.1,0"
+    assert template.render_map({"ts": 1, "src": "h"}) == "2,1,TRAFFIC,h,0"
+
+
+def test_text_repeated_and_reordered_slots():
+    template = compile_text("<{pri}>{host} {msg} host={host}", slots=("host", "pri", "msg"))
+    assert template.render("web", "13", "up") == "<13>web up host=web"
+
+
+def test_text_rejects_format_specs():
+    with pytest.raises(ValueError):
+        compile_text("{n:>5}")
+
+
+def test_slot_order_must_match_template():
+    with pytest.raises(ValueError):
+        FieldTemplate(["a=", Slot("a")], slots=("b",))
@@ -0,0 +1,56 @@
+"""FlushTimer fires each scheduled item once, earliest deadline first."""
+import threading
+import time
+
+from flush_timer import FlushTimer
+
+
+def test_fires_in_deadline_order():
+    fired = []
+    done = threading.Event()
+
+    def callback(item):
+        fired.append(item)
+        if len(fired) == 3:
+            done.set()
+
+    timer = FlushTimer(callback)
+    try:
+        now = time.time()
+        timer.schedule(now + 0.06, "late")
+        timer.schedule(now + 0.02, "early")
+        timer.schedule(now + 0.04, "middle")
+        assert done.wait(2)
+    finally:
+        timer.close()
+    assert fired == ["early", "middle", "late"]
+    assert timer.fired == 3
+    assert len(timer) == 0
+
+
+def test_failing_callback_keeps_timer_alive():
+    fired = []
+    done = threading.Event()
+
+    def callback(item):
+        if item == "bad":
+            raise RuntimeError("boom")
+        fired.append(item)
+        done.set()
+
+    timer = FlushTimer(callback)
+    try:
+        timer.schedule(time.time(), "bad")
+        timer.schedule(time.time() + 0.01, "good")
+        assert done.wait(2)
+    finally:
+        timer.close()
+    assert fired == ["good"]
+
+
+def test_close_drops_pending_deadlines():
+    fired = []
+    timer = FlushTimer(fired.append)
+    timer.schedule(time.time() + 60, "never")
+    timer.close()
+    assert fired == []
@@ -0,0 +1,58 @@
+"""Scalar generators and their ``*_batch`` companions follow the shared event clock."""
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from batch_generation import batch_function
+from event_clock import virtual_now
+from generator_registry import load_generator
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+START_S = START.timestamp()
+
+
+def _generators():
+    from hec_sender import PROD_MAP
+    for product, (module, funcs) in sorted(PROD_MAP.items()):
+        for func in funcs:
+            yield pytest.param(module, func, id=f"{product}.{func}")
+
+
+def test_corelight_conn_scalar_and_batch_agree():
+    corelight = load_generator("corelight_conn")
+    with virtual_now(START):
+        scalar = corelight.corelight_conn_log()
+        batch = corelight.corelight_conn_log_batch(20)
+    # Connections start up to five minutes before "now"
+    for event in [scalar, *batch]:
+        assert START_S - 300 <= event["ts"] <= START_S
+
+
+def test_vpcflow_scalar_and_batch_agree():
+    vpcflow = load_generator("aws_vpcflowlogs")
+    with virtual_now(START):
+        events = [vpcflow.vpcflow_log(), *vpcflow.vpcflow_log_batch(20)]
+    for event in events:
+        assert event["end"] == int(START_S)
+        assert int(START_S) - 60 <= event["start"] <= int(START_S)
+
+
+@pytest.mark.parametrize("module,func", list(_generators()))
+def test_no_wall_clock_under_virtual_now(module, func):
+    try:
+        generator = getattr(load_generator(module), func)
+    except (ImportError, SyntaxError) as e:
+        pytest.skip(f"{module}: {e}")
+    today = datetime.now(timezone.utc)
+    # Today's date in the layouts generators use, and the leading digits of epoch seconds
+    needles = {today.strftime(p) for p in ("%Y-%m-%d", "%Y/%m/%d", "%b %d %Y", "%d-%b-%Y", "%m/%d/%y", "%Y%m%d")}
+    needles.add(str(int(today.timestamp()))[:6])
+    with virtual_now(START):
+        events = [generator() for _ in range(3)]
+        batch = batch_function(generator)
+        if batch is not None:
+            events += batch(3)
+    for event in events:
+        text = event if isinstance(event, str) else json.dumps(event, default=str)
+        assert not [n for n in needles if n in text], text[:200]
@@ -0,0 +1,64 @@
+"""Generator output kinds and the bytes render path."""
+import json
+import types
+
+import pytest
+
+from generator_output import infer_kind, module_kind, output_kind, render_bytes, to_bytes, to_object
+
+
+def _module(**attrs):
+    module = types.ModuleType("fake_generator")
+    vars(module).update(attrs)
+    return module
+
+
+def test_declared_kind():
+    module = _module(OUTPUT_KIND="kv")
+    assert module_kind(module) == "kv"
+    assert module_kind(vars(module)) == "kv"
+    assert module_kind(_module()) is None
+    with pytest.raises(ValueError):
+        module_kind(_module(OUTPUT_KIND="xml"))
+
+
+def test_output_kind_of_generator_function():
+    exec("def fake_log():\n    return 'a=1'", vars(module := _module(OUTPUT_KIND="kv")))
+    assert output_kind(module.fake_log) == "kv"
+
+
+@pytest.mark.parametrize("event, kind", [
+    ({"a": 1}, "json"),
+    ('  {"a": 1}', "json"),
+    ("CEF:0|Vendor|Product", "cef"),
+    ("<134>Jan  1 00:00:00 host app: msg", "syslog"),
+    ("date=2024-01-01 devname=fw", "text"),
+    (b"[1, 2]", "json"),
+])
+def test_infer_kind(event, kind):
+    assert infer_kind(event) == kind
+
+
+def test_to_bytes():
+    assert json.loads(to_bytes({"msg": "héllo"})) == {"msg": "héllo"}
+    assert to_bytes("héllo") == "héllo".encode("utf-8")
+    assert to_bytes(b"raw") == b"raw"
+
+
+def test_render_bytes_prefers_companion():
+    namespace = vars(_module())
+    exec("def fake_log():\n    return {'a': 1}\n"
+         "def fake_log_bytes():\n    return b'companion'\n"
+         "def plain_log():\n    return 'line'", namespace)
+    assert render_bytes(namespace["fake_log"])() == b"companion"
+    wrapped = render_bytes(namespace["plain_log"])
+    assert wrapped() == b"line"
+    assert wrapped.__name__ == "plain_log_bytes"
+
+
+def test_to_object():
+    assert to_object('{"a": 1}', "json") == {"a": 1}
+    assert to_object("a=1", "kv") == {"raw": "a=1"}
+    assert to_object("{broken", "json") == {"raw": "{broken"}
+    event = {"a": 1}
+    assert to_object(event) is event
@@ -0,0 +1,53 @@
+"""Generator modules resolve by name from their category directory."""
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+import generator_registry
+from generator_registry import GeneratorFinder, generator_path, load_generator
+
+
+def test_generator_path():
+    path = generator_path("fortinet_fortigate")
+    assert path.endswith(os.path.join("network_security", "fortinet_fortigate.py"))
+    assert generator_path("no_such_generator") is None
+
+
+def test_load_generator():
+    module = load_generator("okta_authentication")
+    assert callable(module.okta_authentication_log)
+    assert importlib.import_module("okta_authentication") is module
+
+
+def test_missing_generator_raises():
+    with pytest.raises(ModuleNotFoundError):
+        load_generator("no_such_generator")
+
+
+def test_finder_ignores_dotted_and_package_lookups():
+    finder = GeneratorFinder()
+    assert finder.find_spec("fortinet_fortigate") is not None
+    assert finder.find_spec("pkg.fortinet_fortigate") is None
+    assert finder.find_spec("fortinet_fortigate", path=["/elsewhere"]) is None
+
+
+def test_install_is_idempotent():
+    generator_registry.install()
+    generator_registry.install()
+    assert sum(isinstance(f, GeneratorFinder) for f in sys.meta_path) == 1
+
+
+@pytest.mark.parametrize("args", [
+    [os.path.join("event_generators", "identity_access", "okta_authentication.py")],
+    ["-c", "import importlib; importlib.import_module("
+           "'event_generators.identity_access.okta_authentication')"],
+])
+def test_generator_runs_without_a_loader(args):
+    backend = os.path.dirname(generator_registry.GENERATOR_ROOT)
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    result = subprocess.run([sys.executable, *args], cwd=backend, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
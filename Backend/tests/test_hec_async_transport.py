@@ -0,0 +1,122 @@
+"""AsyncHecTransport against a local HTTP/1.1 server."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from hec_async_transport import AsyncHecTransport, HecHTTPError, HecResponse
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        with server.lock:
+            server.bodies.append(body)
+            server.peers.add(self.client_address)
+        status = server.status
+        payload = b'{"text":"Success","code":0}' if status < 400 else b'{"text":"Server busy","code":9}'
+        self.send_response(status)
+        if status in (429, 503):
+            self.send_header("Retry-After", "2")
+        if server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(payload), payload))
+        else:
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.bodies = []
+    httpd.peers = set()
+    httpd.status = 200
+    httpd.chunked = False
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/services/collector"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def transport():
+    transport = AsyncHecTransport(max_inflight=4, timeout=5)
+    yield transport
+    transport.close()
+
+
+def test_concurrent_batches_all_arrive(server, transport):
+    done = []
+    for i in range(40):
+        transport.submit(server.url, {"Authorization": "Splunk t"}, b"batch-%d" % i,
+                         lambda resp, err: done.append((resp.status_code, err)))
+    assert transport.drain(timeout=10)
+    assert sorted(server.bodies) == sorted(b"batch-%d" % i for i in range(40))
+    assert done == [(200, None)] * 40
+    assert transport.stats["requests"] == 40 and transport.stats["failures"] == 0
+    assert transport.inflight == 0
+
+
+def test_connections_are_kept_alive(server, transport):
+    for _ in range(10):
+        assert transport.post(server.url, {}, b"x").json() == {"text": "Success", "code": 0}
+    # Sequential posts reuse one pooled connection
+    assert len(server.peers) == 1
+
+
+def test_chunked_response_body(server, transport):
+    server.chunked = True
+    assert transport.post(server.url, {}, b"x").json()["code"] == 0
+
+
+def test_error_status_is_reported_not_raised(server, transport):
+    server.status = 503
+    resp = transport.post(server.url, {}, b"x")
+    assert resp.status_code == 503
+    assert transport.stats["failures"] == 1
+    with pytest.raises(HecHTTPError):
+        resp.raise_for_status()
+
+
+def test_response_headers_are_case_insensitive(server, transport):
+    server.status = 429
+    resp = transport.post(server.url, {}, b"x")
+    assert resp.headers.get("Retry-After") == "2"
+    assert resp.headers["retry-after"] == "2"
+    assert HecResponse("u", 200, {"Content-Type": "x"}, b"").headers.get("content-type") == "x"
+
+
+def test_connection_failure_reaches_on_done(transport):
+    errors = []
+    fut = transport.submit("http://127.0.0.1:9/services/collector", {}, b"x",
+                           lambda resp, err: errors.append(err))
+    with pytest.raises(OSError):
+        fut.result(timeout=10)
+    assert transport.drain(timeout=10)
+    assert len(errors) == 1 and isinstance(errors[0], OSError)
+
+
+def test_inflight_byte_budget_blocks_producers(server):
+    transport = AsyncHecTransport(max_inflight=8, max_inflight_bytes=10, timeout=5)
+    try:
+        for _ in range(5):
+            transport.submit(server.url, {}, b"0123456789")
+            # Each 10-byte batch fills the budget, so the next submit waits for it
+            assert transport.inflight <= 1
+        assert transport.drain(timeout=10)
+    finally:
+        transport.close()
+    assert len(server.bodies) == 5
@@ -0,0 +1,51 @@
+"""Retry-After parsing and backoff bounds."""
+import time
+from email.utils import formatdate
+
+import pytest
+
+from hec_retry import RetryPolicy, ThrottleGate, parse_retry_after
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("5", 5.0),
+    (" 2.5 ", 2.5),
+    ("-3", 0.0),
+    ("", None),
+    (None, None),
+    ("soon", None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    header = formatdate(time.time() + 30, usegmt=True)
+    assert parse_retry_after(header) == pytest.approx(30, abs=2)
+
+
+def test_parse_retry_after_past_date_is_zero():
+    assert parse_retry_after(formatdate(time.time() - 3600, usegmt=True)) == 0.0
+
+
+def test_backoff_grows_and_caps():
+    policy = RetryPolicy(base_delay=1.0, max_delay=8.0)
+    for attempt in range(6):
+        ceiling = min(8.0, 2 ** attempt)
+        assert ceiling / 2 <= policy.delay(attempt) <= ceiling
+
+
+def test_retry_after_is_honoured_and_capped():
+    policy = RetryPolicy(max_delay=10.0)
+    assert 3.0 <= policy.delay(0, retry_after=3.0) <= 3.3
+    assert policy.delay(0, retry_after=600) <= 11.0
+
+
+def test_throttle_gate_pauses_until_hold_expires():
+    gate = ThrottleGate()
+    gate.hold(0.05)
+    started = time.monotonic()
+    gate.wait()
+    assert time.monotonic() - started >= 0.04
+    assert gate.throttled == 1
+    assert gate.remaining() == 0.0
@@ -0,0 +1,108 @@
+"""hec_sender send-path behaviour that needs the module itself, not a subprocess."""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import hec_sender
+from batch_buffer import CompressedBatch
+from hec_async_transport import AsyncHecTransport
+from hec_retry import ThrottleGate
+
+
+class _SequenceHandler(BaseHTTPRequestHandler):
+    """Answers with the server's queued statuses in order, then 200."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        with server.lock:
+            status = server.statuses.pop(0) if server.statuses else 200
+            server.seen.append((time.monotonic(), status))
+        payload = b'{"text":"Success","code":0,"ackId":7}'
+        self.send_response(status)
+        if status in (429, 503):
+            # Mixed case on purpose: lookups must not depend on the server's spelling
+            self.send_header("retry-AFTER", "1")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def collector():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SequenceHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.statuses = []
+    server.seen = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/services/collector/raw"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_async_retry_waits_for_retry_after(monkeypatch, collector, status):
+    collector.statuses = [status]
+    transport = AsyncHecTransport(timeout=5)
+    monkeypatch.setattr(hec_sender, "_TRANSPORT", transport)
+    monkeypatch.setattr(hec_sender, "_THROTTLE", ThrottleGate())
+    monkeypatch.setattr(hec_sender, "_SPOOL", None)
+    try:
+        batch = CompressedBatch.from_lines(["event one", "event two"])
+        hec_sender._submit_async_batch(collector.url, {"Content-Type": "text/plain"}, batch)
+        hec_sender._drain_async_transport()
+    finally:
+        transport.close()
+    (first, first_status), (retry, retry_status) = collector.seen
+    assert (first_status, retry_status) == (status, 200)
+    # Retry-After: 1 paused every sender for about a second (plus jitter)
+    assert retry - first >= 0.95
+    assert hec_sender._THROTTLE.throttled == 1
+
+
+class _FakeAck:
+    enabled = True
+
+    def __init__(self):
+        self.tracked = []
+
+    def track(self, ack_id):
+        self.tracked.append(ack_id)
+
+
+@pytest.fixture
+def probe(monkeypatch, collector):
+    """Point the probe at the local collector only, with a fresh connection cache."""
+    base = collector.url.rsplit("/", 1)[0]
+    monkeypatch.setattr(hec_sender, "_endpoint_bases", lambda: [(f"{base}/event", collector.url)])
+    monkeypatch.setattr(hec_sender, "_CONNECTION_CACHE", dict(hec_sender._CONNECTION_CACHE, configured=False))
+    monkeypatch.setattr(hec_sender, "_THROTTLE", ThrottleGate())
+    monkeypatch.setattr(hec_sender, "ALLOW_INSECURE_FALLBACK", True)
+    monkeypatch.setattr(hec_sender, "_ACK", _FakeAck())
+    return lambda: hec_sender._probe_send(b"event one", False, "cisco_asa")
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_probe_waits_out_throttling_on_the_same_endpoint(collector, probe, status):
+    collector.statuses = [status]
+    resp = probe()
+    assert resp.status_code == 200
+    (first, _), (retry, _) = collector.seen
+    assert retry - first >= 0.95
+    # Retried in place: the secure combination is cached, no insecure fallback was tried
+    assert hec_sender._CONNECTION_CACHE["verify"] == hec_sender.DEFAULT_VERIFY_TLS
+    assert len(collector.seen) == 2
+
+
+def test_probe_tracks_the_first_ack_id(collector, probe):
+    probe()
+    assert hec_sender._ACK.tracked == [7]
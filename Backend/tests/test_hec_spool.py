@@ -0,0 +1,68 @@
+"""HecSpool round trip: append, peek, commit, resume."""
+import pytest
+
+from hec_spool import HecSpool, SpoolLockedError
+
+URL = "http://127.0.0.1:8088/services/collector"
+
+
+def test_round_trip_strips_authorization(tmp_path):
+    spool = HecSpool(str(tmp_path))
+    try:
+        headers = {"Authorization": "Splunk secret", "Content-Encoding": "gzip"}
+        assert spool.append(URL, headers, b"first")
+        assert spool.append(URL, headers, b"second")
+        assert spool.pending()[0] == 1
+
+        bodies = []
+        while (record := spool.peek()) is not None:
+            seg, _, url, sent_headers, body, next_pos = record
+            assert url == URL
+            assert sent_headers == {"Content-Encoding": "gzip"}
+            bodies.append(body)
+            spool.commit(seg, next_pos)
+        assert bodies == [b"first", b"second"]
+        assert spool.drained == 2
+    finally:
+        spool.close()
+    assert b"secret" not in b"".join(p.read_bytes() for p in tmp_path.glob("*.seg"))
+
+
+def test_resumes_from_committed_position(tmp_path):
+    spool = HecSpool(str(tmp_path))
+    for body in (b"a", b"b", b"c"):
+        spool.append(URL, {}, body)
+    seg, _, _, _, _, next_pos = spool.peek()
+    spool.commit(seg, next_pos)
+    spool.close()
+
+    reopened = HecSpool(str(tmp_path))
+    try:
+        bodies = []
+        while (record := reopened.peek()) is not None:
+            bodies.append(record[4])
+            reopened.commit(record[0], record[5])
+        assert bodies == [b"b", b"c"]
+        assert reopened.pending() == (0, 0)
+    finally:
+        reopened.close()
+
+
+def test_full_spool_rejects(tmp_path):
+    spool = HecSpool(str(tmp_path), max_bytes=200)
+    try:
+        assert spool.append(URL, {}, b"x" * 50)
+        assert not spool.append(URL, {}, b"x" * 500)
+        assert spool.rejected == 1
+    finally:
+        spool.close()
+
+
+def test_second_owner_is_refused(tmp_path):
+    pytest.importorskip("fcntl")
+    spool = HecSpool(str(tmp_path))
+    try:
+        with pytest.raises(SpoolLockedError):
+            HecSpool(str(tmp_path))
+    finally:
+        spool.close()
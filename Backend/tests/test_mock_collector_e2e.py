@@ -0,0 +1,95 @@
+"""hec_sender against the local mock collector: every event arrives, in every mode."""
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SENDER = os.path.join(BACKEND, "event_generators", "shared", "hec_sender.py")
+sys.path.insert(0, os.path.join(BACKEND, "utilities"))
+
+from mock_hec_server import MockHecServer  # noqa: E402
+
+# -n above hec_sender.STREAMING_THRESHOLD takes the continuous (paced, batched) path
+CONTINUOUS = 20_000
+
+
+@pytest.fixture(scope="module")
+def collector():
+    server = MockHecServer(port=0)
+    server.start_background()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _send(collector, tmp_path, count, transport, batch):
+    env = dict(os.environ, S1_HEC_URL=collector.url, S1_HEC_TOKEN="test-token",
+               XDG_CACHE_HOME=str(tmp_path))
+    env.pop("S1_HEC_BATCH", None)
+    if batch:
+        env["S1_HEC_BATCH"] = "1"
+    cmd = [sys.executable, SENDER, "--product", "cisco_asa", "-n", str(count), "--transport", transport,
+           "--min-delay", "0", "--max-delay", "0"]
+    if count > 10_000:
+        cmd += ["--eps", "1000000", "--verbosity", "quiet"]
+    collector.stats.reset()
+    result = subprocess.run(cmd, env=env, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return collector.stats.snapshot()["events"]
+
+
+@pytest.mark.parametrize("transport", ["sync", "async"])
+@pytest.mark.parametrize("batch", [False, True], ids=["single", "batch"])
+@pytest.mark.parametrize("count", [1, 50, CONTINUOUS])
+def test_delivered_event_count(collector, tmp_path, transport, batch, count):
+    assert _send(collector, tmp_path, count, transport, batch) == count
+
+
+def test_outage_at_startup_is_spooled_and_replayed(tmp_path):
+    # Reserve a port, start the sender while nothing listens on it, bring the collector up later
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    env = dict(os.environ, S1_HEC_URL=f"http://127.0.0.1:{port}/services/collector", S1_HEC_TOKEN="test-token",
+               XDG_CACHE_HOME=str(tmp_path), S1_HEC_BATCH="1")
+    cmd = [sys.executable, SENDER, "--product", "cisco_asa", "-n", str(CONTINUOUS), "--eps", "5000",
+           "--spool-dir", str(tmp_path / "spool"), "--spool-drain-rate", "50"]
+    sender = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    try:
+        time.sleep(2.5)
+        server = MockHecServer(port=port)
+        server.start_background()
+        output, _ = sender.communicate(timeout=300)
+    finally:
+        sender.kill()
+    try:
+        assert sender.returncode == 0, output
+        assert "[SPOOL] Spooled" in output
+        assert server.stats.snapshot()["events"] == CONTINUOUS
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_locked_spool_stops_before_sending(collector, tmp_path):
+    from hec_spool import HecSpool
+
+    held = HecSpool(str(tmp_path / "spool"))
+    env = dict(os.environ, S1_HEC_URL=collector.url, S1_HEC_TOKEN="test-token",
+               XDG_CACHE_HOME=str(tmp_path), S1_HEC_BATCH="1")
+    cmd = [sys.executable, SENDER, "--product", "cisco_asa", "-n", str(CONTINUOUS), "--eps", "5000",
+           "--spool-dir", str(tmp_path / "spool")]
+    collector.stats.reset()
+    try:
+        result = subprocess.run(cmd, env=env, capture_output=True, text=True, timeout=60)
+    finally:
+        held.close()
+    assert result.returncode == 1
+    assert "in use by another sender" in result.stdout
+    assert "Traceback" not in result.stderr
+    assert collector.stats.snapshot()["events"] == 0
@@ -0,0 +1,64 @@
+"""Sourcetype discovery: cached index and the lazily loaded SourcetypeMap."""
+import os
+
+import pytest
+
+from parser_map import SourcetypeMap, load_sourcetypes, load_sourcetypes_cached
+
+
+@pytest.fixture
+def parsers(tmp_path):
+    root = tmp_path / "parsers"
+    (root / "community" / "fortigate-latest").mkdir(parents=True)
+    (root / "marketplace" / "okta-latest").mkdir(parents=True)
+    (root / "community" / "README.md").write_text("not a parser")
+    return root
+
+
+def test_scan(parsers):
+    assert load_sourcetypes(str(parsers)) == {
+        "fortigate": "community-fortigate-latest",
+        "okta": "marketplace-okta-latest",
+    }
+    assert load_sourcetypes(str(parsers / "missing")) == {}
+
+
+def test_index_is_reused_until_the_tree_changes(parsers, tmp_path):
+    index = str(tmp_path / "index.json")
+    first = load_sourcetypes_cached(str(parsers), index)
+    assert first == load_sourcetypes(str(parsers))
+    assert os.path.exists(index)
+
+    new = parsers / "community" / "zscaler-latest"
+    new.mkdir()
+    os.utime(parsers / "community", (1, 1))  # force a distinct mtime on coarse filesystems
+    assert "zscaler" in load_sourcetypes_cached(str(parsers), index)
+
+
+def test_map_defers_loading_until_a_miss():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"okta": "marketplace-okta-latest", "fortigate": "community-fortigate-latest"}
+
+    mapping = SourcetypeMap(loader, {"fortigate": "custom"})
+    assert mapping["fortigate"] == "custom"
+    mapping["cisco_asa"] = "explicit"
+    assert mapping["cisco_asa"] == "explicit"
+    assert calls == []
+
+    assert mapping["okta"] == "marketplace-okta-latest"
+    assert "okta" in mapping and "missing" not in mapping
+    assert dict(mapping) == {"okta": "marketplace-okta-latest", "fortigate": "custom",
+                             "cisco_asa": "explicit"}
+    assert calls == [1]
+
+
+def test_failing_loader_means_no_discovered_products():
+    def loader():
+        raise OSError("parsers tree unreadable")
+
+    mapping = SourcetypeMap(loader, {"a": "b"})
+    assert mapping.get("other") is None
+    assert len(mapping) == 1
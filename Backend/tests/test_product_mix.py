@@ -0,0 +1,47 @@
+"""--mix parsing and the interleaved product cycle."""
+from collections import Counter
+
+import pytest
+
+from product_mix import interleave, parse_mix
+
+
+def test_inline_spec_defaults_weight_to_one():
+    assert parse_mix("fortinet_fortigate:5, zscaler:3,okta_authentication") == [
+        ("fortinet_fortigate", 5.0), ("zscaler", 3.0), ("okta_authentication", 1.0)]
+
+
+def test_line_and_json_files(tmp_path):
+    lines = tmp_path / "mix.txt"
+    lines.write_text("# weights\nfortinet_fortigate 5\nzscaler:2  # proxy\n\n")
+    assert parse_mix(str(lines)) == [("fortinet_fortigate", 5.0), ("zscaler", 2.0)]
+    doc = tmp_path / "mix.json"
+    doc.write_text('{"a": 1, "b": 0.5}')
+    assert parse_mix(str(doc)) == [("a", 1.0), ("b", 0.5)]
+
+
+@pytest.mark.parametrize("spec", ["", "a:x", "a:0", "a:-1", "a:1,a:2", "a:nan", "a:inf", "a:1,b:-inf"])
+def test_invalid_mixes(spec):
+    with pytest.raises(ValueError):
+        parse_mix(spec)
+
+
+def test_interleave_matches_weights_and_spreads_products():
+    cycle = interleave([3, 1], length=8)
+    assert Counter(cycle) == {0: 6, 1: 2}
+    # Smooth round-robin: no run of the minority product, no long run of the majority
+    assert cycle[:4] == [0, 0, 1, 0]
+
+
+def test_interleave_default_cycle():
+    counts = Counter(interleave([5, 3, 2]))
+    assert counts == {0: 500, 1: 300, 2: 200}
+
+
+def test_interleave_gives_small_shares_a_slot():
+    # 1/2000 of the mix: the cycle grows past the default length to fit it
+    counts = Counter(interleave([1999, 1]))
+    assert counts[1] == 1 and sum(counts.values()) == 2000
+    # Below 1/MAX_CYCLE: the stream borrows one slot from the largest
+    counts = Counter(interleave([1e9, 5, 1]))
+    assert counts[1] >= 1 and counts[2] == 1
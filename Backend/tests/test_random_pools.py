@@ -0,0 +1,85 @@
+"""Bulk random columns and the per-thread pools built on them."""
+import ipaddress
+import re
+import threading
+import uuid
+
+import pytest
+
+import bulk_random
+import random_pools
+from random_pools import Pool
+
+NON_PUBLIC = [ipaddress.ip_network(n) for n in
+              ("10.0.0.0/8", "127.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16", "169.254.0.0/16", "100.64.0.0/10")]
+
+
+def _public(ip):
+    address = ipaddress.ip_address(ip)
+    return not any(address in network for network in NON_PUBLIC)
+
+
+def test_integer_columns_are_inclusive():
+    values = bulk_random.integers(2000, 1, 3)
+    assert set(values) == {1, 2, 3}
+    assert all(1 <= v <= 5 for v in bulk_random.integers_in([1] * 100, [5] * 100))
+    assert all(0.0 <= v < 1.0 for v in bulk_random.uniform(100, 0.0, 1.0))
+
+
+def test_weighted_choice_and_chance():
+    assert set(bulk_random.choice(["a", "b"], 200, weights=[1, 0])) == {"a"}
+    assert bulk_random.chance(50, 0.0) == [False] * 50
+    assert bulk_random.chance(50, 1.0) == [True] * 50
+
+
+def test_address_plans():
+    for ip in bulk_random.internal_ipv4(500):
+        assert ipaddress.ip_address(ip).is_private
+    for ip in bulk_random.public_ipv4(2000):
+        assert _public(ip), ip
+    assert bulk_random.ipv4(3, 10, 0, 0, (1, 1)) == ["10.0.0.1"] * 3
+    with pytest.raises(ValueError):
+        bulk_random.ipv4(1, 10, 0, 0)
+    flags = [True, False] * 50
+    mixed = bulk_random.ipv4_where(flags)
+    assert all(ipaddress.ip_address(ip).is_private for ip, inside in zip(mixed, flags) if inside)
+
+
+def test_string_formats():
+    assert all(re.fullmatch(r"[0-9a-f]{7}", h) for h in bulk_random.hex_strings(20, 7))
+    assert all(re.fullmatch(r"([0-9a-f]{2}:){5}[0-9a-f]{2}", m) for m in bulk_random.mac_addresses(20))
+    for text in bulk_random.uuid4_strings(100):
+        parsed = uuid.UUID(text)
+        assert parsed.version == 4 and parsed.variant == uuid.RFC_4122 and str(parsed) == text
+
+
+def test_pool_refills_in_bulk():
+    fills = []
+
+    def fill(n):
+        fills.append(n)
+        return list(range(n))
+
+    pool = Pool(fill, size=4)
+    assert [pool() for _ in range(6)] == [3, 2, 1, 0, 3, 2]
+    assert fills == [4, 4]
+    assert pool.take(5) == [0, 1] + [0, 1, 2]
+    assert fills == [4, 4, 3]
+
+
+def test_pools_are_per_thread():
+    mine = random_pools.local()
+    theirs = []
+    thread = threading.Thread(target=lambda: theirs.append(random_pools.local()))
+    thread.start()
+    thread.join()
+    assert theirs[0] is not mine
+    assert random_pools.local() is mine
+
+
+def test_shortcuts():
+    assert uuid.UUID(random_pools.uuid4()).version == 4
+    assert len(random_pools.sha256()) == 64 and len(random_pools.md5()) == 32
+    assert len(random_pools.hex_string(12)) == 12
+    assert ipaddress.ip_address(random_pools.internal_ipv4()).is_private
+    assert _public(random_pools.public_ipv4())
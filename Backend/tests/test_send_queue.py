@@ -0,0 +1,52 @@
+"""BatchSendQueue backpressure policies."""
+import threading
+
+import pytest
+
+from send_queue import BatchSendQueue
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        BatchSendQueue(2, policy="discard")
+
+
+def test_drop_oldest_evicts_and_keeps_join_balanced():
+    q = BatchSendQueue(2, policy="drop-oldest", weight=len)
+    for batch in (["a"], ["b", "b"], ["c"], ["d"]):
+        assert q.offer(batch) is None
+    assert q.dropped == 2 and q.dropped_events == 3
+    assert [q.get(), q.get()] == [["c"], ["d"]]
+    q.task_done()
+    q.task_done()
+    # join() returns only if eviction removed the dropped batches from unfinished_tasks
+    joined = threading.Thread(target=q.join, daemon=True)
+    joined.start()
+    joined.join(timeout=2)
+    assert not joined.is_alive()
+    assert q.unfinished_tasks == 0
+
+
+def test_spill_hands_the_batch_back():
+    q = BatchSendQueue(1, policy="spill")
+    assert q.offer("a") is None
+    assert q.offer("b") == "b"
+    assert q.spilled == 1 and q.qsize() == 1
+
+
+def test_block_times_out_and_counts_drop():
+    q = BatchSendQueue(1, policy="block", block_timeout=0.05)
+    q.offer("a")
+    assert q.offer("b") is None
+    assert q.dropped == 1 and q.blocked == 1
+    assert q.blocked_s >= 0.04
+
+
+def test_block_waits_for_consumer():
+    q = BatchSendQueue(1, policy="block", block_timeout=5)
+    q.offer("a")
+    threading.Timer(0.05, q.get).start()
+    q.offer("b")
+    assert q.dropped == 0
+    assert q.get() == "b"
+    assert q.peak == 1
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+HEC sender throughput benchmark - every product in PROD_MAP, batch and single-event modes.
+
+Each (product, mode) pair runs ``event_generators/shared/hec_sender.py`` as a
+subprocess at full speed against a local mock collector (utilities/mock_hec_server.py,
+started in-process on a free port) or against ``--collector URL``. For every run
+it records:
+
+- events/s and bytes/s accepted by the collector (decoded payload bytes)
+- sender CPU time per event (user + sys of the child process)
+- p50/p99 POST latency (a batch flush in batch mode, one event otherwise),
+  from the sender's ``--metrics-file``
+
+Results are written as JSON or CSV (by extension) and can be compared against
+a previous baseline; regressions beyond ``--threshold`` percent exit with status 1.
+
+Usage:
+    python utilities/hec_benchmark.py --products fortinet_fortigate,okta_authentication --output baseline.json
+    python utilities/hec_benchmark.py --output current.json --compare baseline.json --threshold 10
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import datetime, timezone
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHARED_DIR = os.path.join(BACKEND_DIR, "event_generators", "shared")
+SENDER = os.path.join(SHARED_DIR, "hec_sender.py")
+BENCH_TOKEN = "benchmark-token"
+
+MODES = ("batch", "single")
+# Continuous (streaming) mode starts above 10,000 events
+MIN_EVENTS = 10001
+
+# metric -> True when higher is better
+METRICS = {
+    "events_per_sec": True,
+    "bytes_per_sec": True,
+    "cpu_us_per_event": False,
+    "flush_p50_ms": False,
+    "flush_p99_ms": False,
+}
+CSV_FIELDS = ["product", "mode", "events", "bytes", "wall_s", *METRICS, "requests", "fail", "error"]
+
+
+def load_products(spec: str) -> list:
+    """``all`` or a comma-separated list, validated against hec_sender.PROD_MAP."""
+    os.environ.setdefault("S1_HEC_TOKEN", BENCH_TOKEN)  # hec_sender refuses to import without one
+    sys.path.insert(0, SHARED_DIR)
+    from hec_sender import PROD_MAP  # type: ignore
+
+    if spec == "all":
+        return sorted(PROD_MAP)
+    products = [p.strip() for p in spec.split(",") if p.strip()]
+    unknown = [p for p in products if p not in PROD_MAP]
+    if unknown:
+        raise SystemExit(f"Unknown product(s): {', '.join(unknown)}")
+    return products
+
+
+def _http_json(url: str, data: bytes = None) -> dict:
+    with urllib.request.urlopen(urllib.request.Request(url, data=data), timeout=10) as resp:
+        return json.loads(resp.read())
+
+
+def run_one(product: str, mode: str, events: int, collector: str, stats_url: str,
+            token: str, timeout: float, workdir: str) -> dict:
+    """Run one sender subprocess and measure it."""
+    metrics_path = os.path.join(workdir, f"{product}-{mode}.json")
+    env = {
+        **os.environ,
+        "S1_HEC_URL": collector,
+        "S1_HEC_TOKEN": token,
+        "S1_HEC_BATCH": "true" if mode == "batch" else "",
+        "S1_HEC_ENDPOINT_CACHE": os.path.join(workdir, "endpoints.json"),
+    }
+    cmd = [sys.executable, SENDER, "--product", product, "-n", str(events),
+           "--min-delay", "0", "--max-delay", "0", "--verbosity", "quiet", "--metrics-file", metrics_path]
+    result = {"product": product, "mode": mode, "error": ""}
+
+    _http_json(f"{stats_url}/reset", data=b"")
+    usage_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, env=env, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        result["error"] = f"timeout after {timeout:g}s"
+        return result
+    wall = time.perf_counter() - start
+    usage_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    stats = _http_json(stats_url)
+
+    if proc.returncode != 0 or not os.path.exists(metrics_path):
+        lines = (proc.stderr or proc.stdout).strip().splitlines()
+        result["error"] = lines[-1][:200] if lines else f"exit status {proc.returncode}"
+        return result
+    with open(metrics_path) as fh:
+        sender = json.load(fh)
+
+    cpu = (usage_after.ru_utime - usage_before.ru_utime) + (usage_after.ru_stime - usage_before.ru_stime)
+    accepted = stats["events"]
+    latency = sender.get("post_latency_ms", {})
+    result.update({
+        "events": accepted,
+        "bytes": stats["bytes"],
+        "wall_s": round(wall, 3),
+        "events_per_sec": round(accepted / wall, 1),
+        "bytes_per_sec": round(stats["bytes"] / wall, 1),
+        "cpu_us_per_event": round(cpu / accepted * 1e6, 2) if accepted else None,
+        "flush_p50_ms": latency.get("p50"),
+        "flush_p99_ms": latency.get("p99"),
+        "requests": stats["requests"],
+        "fail": sender.get("fail", 0),
+    })
+    if accepted < events:
+        result["error"] = f"collector accepted {accepted}/{events} events"
+    return result
+
+
+def save_results(path: str, results: list, meta: dict):
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(path, "w") as fh:
+            json.dump({"meta": meta, "results": results}, fh, indent=2)
+
+
+def load_results(path: str) -> list:
+    if path.endswith(".csv"):
+        with open(path, newline="") as fh:
+            rows = list(csv.DictReader(fh))
+        for row in rows:
+            for metric in METRICS:
+                row[metric] = float(row[metric]) if row.get(metric) not in (None, "") else None
+        return rows
+    with open(path) as fh:
+        return json.load(fh)["results"]
+
+
+def compare(baseline: list, current: list, threshold: float) -> list:
+    """Rows of (product, mode, metric, old, new, change %) worse than ``threshold`` percent."""
+    previous = {(r["product"], r["mode"]): r for r in baseline}
+    regressions = []
+    for row in current:
+        old_row = previous.get((row["product"], row["mode"]))
+        if old_row is None or row.get("error"):
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = old_row.get(metric), row.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            worse = -change if higher_is_better else change
+            if worse > threshold:
+                regressions.append((row["product"], row["mode"], metric, old, new, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hec_sender.py for every product against a mock collector")
+    parser.add_argument("--products", default="all", help="'all' (default) or a comma-separated product list")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated: batch, single (default both)")
+    parser.add_argument("--events", type=int, default=20001, help="Events per batch-mode run (default 20001)")
+    parser.add_argument("--single-events", type=int, default=MIN_EVENTS,
+                        help=f"Events per single-event run (default {MIN_EVENTS})")
+    parser.add_argument("--collector", help="Use this HEC URL (…/services/collector) instead of a local mock; "
+                                            "it must serve the mock's /stats endpoints")
+    parser.add_argument("--token", default=BENCH_TOKEN, help="HEC token sent to the collector")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds allowed per run (default 600)")
+    parser.add_argument("--output", "-o", help="Write results to this .json or .csv file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a previous .json/.csv result file")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Percent change counted as a regression in --compare mode (default 10)")
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    if any(m not in MODES for m in modes):
+        parser.error(f"--modes must be a subset of {', '.join(MODES)}")
+    if min(args.events, args.single_events) < MIN_EVENTS:
+        parser.error(f"--events and --single-events must be at least {MIN_EVENTS} (continuous mode)")
+    products = load_products(args.products)
+
+    server = None
+    if args.collector:
+        collector = args.collector.rstrip("/")
+        stats_url = collector.split("/services/collector")[0] + "/stats"
+    else:
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        from mock_hec_server import MockHecServer
+
+        server = MockHecServer(port=0)
+        server.start_background()
+        collector = server.url
+        host, port = server.server_address[:2]
+        stats_url = f"http://{host}:{port}/stats"
+
+    print(f"Benchmarking {len(products)} products x {'/'.join(modes)} against {collector}", flush=True)
+    print(f"{'product':<45} {'mode':<7} {'EPS':>10} {'MB/s':>8} {'CPU us/ev':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="hec-bench-") as workdir:
+        for product in products:
+            for mode in modes:
+                events = args.events if mode == "batch" else args.single_events
+                row = run_one(product, mode, events, collector, stats_url, args.token, args.timeout, workdir)
+                results.append(row)
+                if row.get("events_per_sec") is None:
+                    print(f"{product:<45} {mode:<7} ERROR: {row['error']}", flush=True)
+                    continue
+                print(f"{product:<45} {mode:<7} {row['events_per_sec']:>10.1f} "
+                      f"{row['bytes_per_sec'] / 1048576:>8.2f} {row['cpu_us_per_event'] or 0:>10.1f} "
+                      f"{row['flush_p50_ms'] or 0:>8.2f} {row['flush_p99_ms'] or 0:>8.2f}"
+                      + (f"  ({row['error']})" if row["error"] else ""), flush=True)
+    if server is not None:
+        server.shutdown()
+
+    if args.output:
+        meta = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "events": args.events,
+            "single_events": args.single_events,
+            "collector": "mock" if server is not None else collector,
+        }
+        save_results(args.output, results, meta)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = compare(load_results(args.compare), results, args.threshold)
+        if not regressions:
+            print(f"\nNo regressions beyond {args.threshold:g}% against {args.compare}")
+            return 0
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}% against {args.compare}:")
+        for product, mode, metric, old, new, change in regressions:
+            print(f"  {product} [{mode}] {metric}: {old:g} -> {new:g} ({change:+.1f}%)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
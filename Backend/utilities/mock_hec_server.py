@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Mock HEC collector - a local stand-in for SentinelOne/Splunk HEC ingest.
+
+Accepts the same traffic as the real collector so hec_sender.py, scenarios and
+uploads can be benchmarked and tested offline:
+
+- ``POST /services/collector/event`` (also ``/services/collector``): one or more
+  JSON envelopes, newline-delimited or concatenated; counted per ``sourcetype``
+- ``POST /services/collector/raw?sourcetype=...``: newline-delimited raw lines
+- ``POST /services/collector/ack``: indexer acknowledgement (every ack is indexed)
+- ``GET /services/collector/health``
+- ``GET /stats``: request/event/byte counters, per sourcetype; ``POST /stats/reset``
+
+Authorization must be ``Splunk <token>`` or ``Bearer <token>``. Bodies may be
+gzip, or zstd when the ``zstandard`` package is installed. Latency, 5xx errors,
+429 throttling and 413 size limits can be injected for testing the sender.
+
+Usage:
+    python utilities/mock_hec_server.py --port 8088 --token test
+    export S1_HEC_URL=http://127.0.0.1:8088/services/collector S1_HEC_TOKEN=test
+    curl -s http://127.0.0.1:8088/stats
+"""
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # optional: zstd bodies are rejected with 415 without it
+    zstandard = None
+
+# Splunk HEC status codes returned in the JSON body
+HEC_SUCCESS = {"text": "Success", "code": 0}
+HEC_TOKEN_REQUIRED = {"text": "Token is required", "code": 2}
+HEC_INVALID_AUTH = {"text": "Invalid authorization", "code": 3}
+HEC_INVALID_TOKEN = {"text": "Invalid token", "code": 4}
+HEC_NO_DATA = {"text": "No data", "code": 5}
+HEC_INVALID_DATA = {"text": "Invalid data format", "code": 6}
+HEC_BUSY = {"text": "Server is busy", "code": 9}
+HEC_HEALTHY = {"text": "HEC is healthy", "code": 17}
+
+_decoder = json.JSONDecoder()
+
+
+def decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """Undo Content-Encoding; raises ValueError for unsupported or corrupt bodies."""
+    encoding = (content_encoding or "identity").strip().lower()
+    if encoding in ("identity", ""):
+        return body
+    if encoding == "gzip":
+        try:
+            return gzip.decompress(body)
+        except (OSError, EOFError, zlib.error) as e:
+            raise ValueError(f"invalid gzip body: {e}")
+    if encoding == "zstd" and zstandard is not None:
+        try:
+            return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"invalid zstd body: {e}")
+    raise ValueError(f"unsupported Content-Encoding '{encoding}'")
+
+
+def parse_envelopes(text: str):
+    """Split an /event body into envelopes (newline-delimited or concatenated JSON)."""
+    envelopes = []
+    pos, end = 0, len(text)
+    while pos < end:
+        while pos < end and text[pos] in " \t\r\n":
+            pos += 1
+        if pos >= end:
+            break
+        obj, pos = _decoder.raw_decode(text, pos)
+        if not isinstance(obj, dict) or "event" not in obj:
+            raise ValueError("envelope without 'event'")
+        envelopes.append(obj)
+    return envelopes
+
+
+class HecStats:
+    """Thread-safe counters, overall and per sourcetype."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.requests = 0
+            self.events = 0
+            self.wire_bytes = 0  # as received (compressed)
+            self.bytes = 0  # after Content-Encoding is undone
+            self.statuses: Dict[str, int] = {}
+            self.encodings: Dict[str, int] = {}
+            self.acks = 0
+            self.sourcetypes: Dict[str, Dict[str, int]] = {}
+
+    def status(self, code: int):
+        with self._lock:
+            self.statuses[str(code)] = self.statuses.get(str(code), 0) + 1
+
+    def accepted(self, endpoint: str, encoding: str, wire_bytes: int, counts: Dict[str, list]):
+        """Record one accepted request; ``counts`` maps sourcetype -> [events, bytes]."""
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += wire_bytes
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+            for sourcetype, (events, nbytes) in counts.items():
+                self.events += events
+                self.bytes += nbytes
+                st = self.sourcetypes.setdefault(
+                    sourcetype, {"events": 0, "bytes": 0, "requests": 0, "event": 0, "raw": 0})
+                st["events"] += events
+                st["bytes"] += nbytes
+                st["requests"] += 1
+                st[endpoint] += events
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            elapsed = max(time.time() - self.started, 1e-9)
+            return {
+                "uptime_s": round(elapsed, 3),
+                "requests": self.requests,
+                "events": self.events,
+                "bytes": self.bytes,
+                "wire_bytes": self.wire_bytes,
+                "events_per_sec": round(self.events / elapsed, 1),
+                "bytes_per_sec": round(self.bytes / elapsed, 1),
+                "statuses": dict(self.statuses),
+                "encodings": dict(self.encodings),
+                "acks": self.acks,
+                "sourcetypes": {k: dict(v) for k, v in self.sourcetypes.items()},
+            }
+
+
+class MockHecHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real collector
+    disable_nagle_algorithm = True  # headers and body are separate writes; avoid delayed-ACK stalls
+    server: "MockHecServer"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, code: int, body: dict, headers: Optional[dict] = None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        self.server.stats.status(code)
+
+    def _authorized(self) -> bool:
+        auth = self.headers.get("Authorization")
+        if not auth:
+            self._reply(401, HEC_TOKEN_REQUIRED)
+            return False
+        scheme, _, token = auth.partition(" ")
+        if scheme not in ("Splunk", "Bearer") or not token:
+            self._reply(401, HEC_INVALID_AUTH)
+            return False
+        if self.server.tokens and token.strip() not in self.server.tokens:
+            self._reply(403, HEC_INVALID_TOKEN)
+            return False
+        return True
+
+    def do_GET(self):
+        path = urlsplit(self.path).path.rstrip("/")
+        if path == "/stats":
+            self._reply(200, self.server.stats.snapshot())
+        elif path.startswith("/services/collector/health"):
+            self._reply(200, HEC_HEALTHY)
+        else:
+            self._reply(404, {"text": "Not found", "code": 404})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/")
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        if path == "/stats/reset":
+            self.server.stats.reset()
+            return self._reply(200, HEC_SUCCESS)
+        if not path.startswith("/services/collector"):
+            return self._reply(404, {"text": "Not found", "code": 404})
+        if not self._authorized():
+            return
+        if path.startswith("/services/collector/ack"):
+            return self._ack(body)
+
+        server = self.server
+        if server.latency_ms or server.latency_jitter_ms:
+            time.sleep((server.latency_ms + random.uniform(0, server.latency_jitter_ms)) / 1000.0)
+        if server.throttle_rate and random.random() < server.throttle_rate:
+            return self._reply(429, HEC_BUSY, {"Retry-After": str(server.retry_after)})
+        if server.error_rate and random.random() < server.error_rate:
+            return self._reply(503, HEC_BUSY)
+        if server.max_bytes and len(body) > server.max_bytes:
+            return self._reply(413, {"text": "Content too large", "code": 413})
+
+        encoding = (self.headers.get("Content-Encoding") or "identity").lower()
+        try:
+            data = decode_body(body, encoding)
+        except ValueError as e:
+            status = 415 if "unsupported" in str(e) else 400
+            return self._reply(status, {"text": str(e), "code": 6})
+        if not data.strip():
+            return self._reply(400, HEC_NO_DATA)
+
+        query = parse_qs(url.query)
+        default_sourcetype = (query.get("sourcetype") or ["unknown"])[0]
+        if path.startswith("/services/collector/raw"):
+            endpoint = "raw"
+            lines = [line for line in data.split(b"\n") if line.strip()]
+            counts = {default_sourcetype: [len(lines), len(data)]}
+            events = len(lines)
+        else:
+            endpoint = "event"
+            try:
+                envelopes = parse_envelopes(data.decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                return self._reply(400, HEC_INVALID_DATA)
+            counts = {}
+            per_event = len(data) / max(len(envelopes), 1)
+            for envelope in envelopes:
+                entry = counts.setdefault(str(envelope.get("sourcetype") or default_sourcetype), [0, 0])
+                entry[0] += 1
+                entry[1] += per_event
+            counts = {k: [n, int(b)] for k, (n, b) in counts.items()}
+            events = len(envelopes)
+
+        if server.max_events and events > server.max_events:
+            return self._reply(413, {"text": "Content too large", "code": 413})
+
+        server.stats.accepted(endpoint, encoding, len(body), counts)
+        reply = dict(HEC_SUCCESS)
+        if self.headers.get("X-Splunk-Request-Channel"):
+            reply["ackId"] = server.next_ack_id()
+        self._reply(200, reply)
+
+    def _ack(self, body: bytes):
+        try:
+            ack_ids = json.loads(body or b"{}").get("acks", [])
+        except ValueError:
+            return self._reply(400, HEC_INVALID_DATA)
+        with self.server.stats._lock:
+            self.server.stats.acks += len(ack_ids)
+        self._reply(200, {"acks": {str(ack_id): True for ack_id in ack_ids}})
+
+
+class MockHecServer(ThreadingHTTPServer):
+    """HTTP server holding the injection settings and counters."""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8088, tokens=(), latency_ms: float = 0.0,
+                 latency_jitter_ms: float = 0.0, error_rate: float = 0.0, throttle_rate: float = 0.0,
+                 retry_after: int = 1, max_events: int = 0, max_bytes: int = 0, verbose: bool = False):
+        super().__init__((host, port), MockHecHandler)
+        self.tokens = set(tokens)
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.verbose = verbose
+        self.stats = HecStats()
+        self._ack_lock = threading.Lock()
+        self._ack_id = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/services/collector"
+
+    def next_ack_id(self) -> int:
+        with self._ack_lock:
+            self._ack_id += 1
+            return self._ack_id
+
+    def start_background(self) -> threading.Thread:
+        """Serve from a daemon thread (for benchmarks and tests); stop with ``shutdown()``."""
+        thread = threading.Thread(target=self.serve_forever, name="mock-hec", daemon=True)
+        thread.start()
+        return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock HEC collector for offline testing and benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--token", action="append", default=[],
+                        help="Accepted HEC token (repeatable); any token is accepted when omitted")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per request")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="Random extra latency (0..N ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="Fraction of requests answered 429 with Retry-After")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429 (default 1)")
+    parser.add_argument("--max-events", type=int, default=0, help="Answer 413 above this many events per request")
+    parser.add_argument("--max-bytes", type=int, default=0, help="Answer 413 above this many body bytes")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server = MockHecServer(args.host, args.port, args.token, args.latency_ms, args.latency_jitter_ms,
+                           args.error_rate, args.throttle_rate, args.retry_after, args.max_events,
+                           args.max_bytes, args.verbose)
+    print(f"Mock HEC listening on {server.url} (stats: http://{args.host}:{args.port}/stats)")
+    print(f"  export S1_HEC_URL={server.url}")
+    if not args.token:
+        print("  any token is accepted")
+    if zstandard is None:
+        print("  zstd bodies disabled (pip install zstandard)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped.")
+        print(json.dumps(server.stats.snapshot(), indent=2))
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1546,7 +1546,10 @@ def generate_logs():
                 if continuous:
                     # Batch mode for continuous
                     env['S1_HEC_BATCH'] = '1'
-                    # Optimize batch size based on EPS
+                    # Let the sender tune batch size/flush interval from collector feedback;
+                    # the EPS tiers below are only its starting point
+                    env['S1_HEC_BATCH_ADAPTIVE'] = '1'
+                    # Initial batch size based on EPS
                     if eps >= 10000:
                         # High EPS: larger batches, faster flush
                         env['S1_HEC_BATCH_MAX_BYTES'] = str(2 * 1024 * 1024)  # 2MB batches for high throughput
@@ -1574,6 +1577,9 @@ def generate_logs():
                 # Use --verbosity info for periodic status updates instead of per-event output
                 command = ['python3', '-u', hec_sender_path, '--product', product_id, '-n', str(log_count), 
                            '--min-delay', str(delay), '--max-delay', str(delay), '--verbosity', 'info']
+                # Continuous runs are paced by a token bucket so the EPS field is exact
+                if continuous and eps > 0:
+                    command.extend(['--eps', str(eps)])
                 
                 # Add metadata fields if provided
                 if metadata_fields:
@@ -1589,6 +1595,10 @@ def generate_logs():
                 if speed_mode:
                     command.append('--speed-mode')
                 
+                # Pooled concurrent POSTs so high EPS isn't capped by round-trip latency
+                if continuous and eps >= 10000:
+                    command.extend(['--transport', 'async', '--max-inflight', '8'])
+                
                 command_str = ' '.join(command)
                 logger.info(f"Executing HEC sender: {command_str}")
                 yield f"DEBUG: Running command: {command_str}\n"